@@ -0,0 +1,120 @@
+"""
+Plan de animación compilado para el preview por frame de TypeAnimator.
+
+Resuelve una sola vez todo lo que el handler de frame necesita (letras, lote
+de escritura, curvas por etapa ya horneadas, timing y canales) y lo guarda en
+un ``AnimationPlan``. El handler solo consume el plan; este se reconstruye
+cuando cambian sus entradas: callbacks ``update=`` de las propiedades,
+ediciones de curvas detectadas en el depsgraph, undo o carga de archivo, todo
+a través del bus de ``invalidation``.
+
+Las curvas llegan por ``curve_provider`` (``curves.get_stage_curves`` en el
+addon), así el plan no depende de los nodos de curva de Blender.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from . import evaluation
+    from . import invalidation
+    from .invalidation import InvalidationEvent
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    import evaluation
+    import invalidation
+    from invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_NAME = 'DebugObj'
+
+# Nombre base -> curvas por etapa ({'in', 'mid', 'out'}) o None si falta alguna
+CurveProvider = Callable[[str], Optional[Dict[str, Any]]]
+
+class AnimationPlan:
+    """Entradas resueltas del preview para un ``TA_LetterAnimProperties``."""
+
+    __slots__ = ('owner', 'version', 'enabled', 'letters', 'count', 'batch',
+                 'curves', 'static_mid', 'timing', 'channels')
+
+    def __init__(self, owner: int, version: int, enabled: bool, letters, curves: Optional[Dict[str, Any]],
+                 timing: Dict[str, float], channels: Dict[str, Any]):
+        self.owner = owner
+        self.version = version
+        self.enabled = enabled
+        self.letters = letters
+        self.count = len(letters)
+        self.batch = evaluation.get_letter_batch(letters) if self.count else None
+        self.curves = curves
+        self.static_mid = curves is not None and evaluation.is_static_curve(curves['mid'])
+        self.timing = timing
+        self.channels = channels
+
+    @property
+    def ready(self) -> bool:
+        """El plan tiene letras y curvas para evaluar."""
+        return self.enabled and self.count > 0 and self.curves is not None
+
+_plan: Optional[AnimationPlan] = None
+_version = 0
+_dirty = True
+
+def _owner_key(props) -> int:
+    try:
+        return props.as_pointer()
+    except AttributeError:
+        return id(props)
+
+def build_plan(props, curve_provider: CurveProvider) -> AnimationPlan:
+    """Resuelve curvas, letras, timing y canales a partir de las propiedades."""
+    global _version
+    _version += 1
+    enabled = bool(getattr(props, 'enable_live_preview', True))
+    letters = list(getattr(props, 'individual_letters', []))
+    curves = None
+    if enabled and letters:
+        curves = curve_provider(getattr(props, 'base_name', DEFAULT_BASE_NAME))
+    plan = AnimationPlan(
+        owner=_owner_key(props),
+        version=_version,
+        enabled=enabled,
+        letters=letters,
+        curves=curves,
+        timing=evaluation.read_timing(props),
+        channels=evaluation.read_channel_settings(props),
+    )
+    logger.debug(f"Plan de animación #{plan.version}: {plan.count} letras, listo={plan.ready}")
+    return plan
+
+def get_plan(props, curve_provider: CurveProvider) -> AnimationPlan:
+    """
+    Devuelve el plan vigente, reconstruyéndolo solo si sus entradas cambiaron.
+
+    Fuera de las invalidaciones explícitas, la única comprobación por frame
+    es que el plan sea del mismo grupo de propiedades y número de letras.
+    """
+    global _plan, _dirty
+    if (_dirty or _plan is None or _plan.owner != _owner_key(props)
+            or _plan.count != len(getattr(props, 'individual_letters', ()))):
+        _plan = build_plan(props, curve_provider)
+        _dirty = False
+    return _plan
+
+def invalidate_plan(*_args) -> None:
+    """
+    Marca el plan para reconstruirse en el próximo frame.
+
+    Acepta cualquier argumento para poder suscribirse a cualquier evento
+    del bus de invalidación.
+    """
+    global _dirty
+    _dirty = True
+
+def clear_plan() -> None:
+    """Descarta el plan (p. ej. al desregistrar handlers)."""
+    global _plan, _dirty
+    _plan = None
+    _dirty = True
+
+invalidation.subscribe((InvalidationEvent.TIMING_CHANGED, InvalidationEvent.CURVE_EDITED,
+                        InvalidationEvent.LETTERS_CHANGED, InvalidationEvent.FILE_LOADED), invalidate_plan)
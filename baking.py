@@ -0,0 +1,413 @@
+"""
+Horneado en bloque de la animación de letras a keyframes para TypeAnimator.
+
+El rango completo de frames se evalúa para todas las letras a la vez con el
+motor vectorizado de ``evaluation`` y cada canal se escribe en su F-Curve con
+un único ``keyframe_points.add`` + ``foreach_set('co', ...)``. El coste de
+escritura depende del número de F-Curves, no de frames × letras × canales.
+Opcionalmente los keyframes se reducen con ``keyframe_reduction``.
+
+En modo de acción compartida se hornea una sola acción por animación (sobre
+los canales delta) y cada letra la referencia con una tira NLA desplazada por
+su retardo de escalonado: el coste ya no depende del número de letras.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from . import evaluation
+    from . import keyframe_reduction
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    import evaluation
+    import keyframe_reduction
+
+logger = logging.getLogger(__name__)
+
+# Valores del enum Keyframe.interpolation para foreach_set
+INTERPOLATION_CONSTANT = 0
+INTERPOLATION_LINEAR = 1
+INTERPOLATION_BEZIER = 2
+# Valor del enum Keyframe.handle_*_type para handles libres
+HANDLE_FREE = 0
+
+BAKE_ACTION_SUFFIX = "_TA_Bake"
+BAKE_GROUP_NAME = "TypeAnimator"
+SHARED_ACTION_SUFFIX = "_TA_Shared"
+SHARED_TRACK_NAME = "TA_Stagger"
+
+# Canales absolutos -> canales delta que anima la acción compartida
+DELTA_DATA_PATHS = {
+    'location': 'delta_location',
+    'rotation_euler': 'delta_rotation_euler',
+    'scale': 'delta_scale',
+}
+
+# === RANGO Y ORDEN ===
+
+def bake_frame_range(timing: Dict[str, float]):
+    """Frames inicial y final que cubren la animación completa (con sus loops)."""
+    start = int(math.floor(timing['start_frame']))
+    length = timing['duration'] * max(int(timing['loop_count']), 1)
+    return start, start + int(math.ceil(length))
+
+def sort_letters(letters: Sequence[Any]) -> List[Any]:
+    """Letras en orden de escalonado (``letter_index``, luego orden original)."""
+    indexed = list(enumerate(letters))
+    indexed.sort(key=lambda item: (item[1].get("letter_index", item[0]), item[0]))
+    return [letter for _position, letter in indexed]
+
+# === EVALUACIÓN ===
+
+def _stage_curves(props) -> Optional[Dict[str, Any]]:
+    """Curvas IN/MID/OUT del nombre base de las propiedades (necesita bpy)."""
+    from .curves import get_stage_curves
+    return get_stage_curves(getattr(props, 'base_name', 'DebugObj'))
+
+def compute_bake(letters: Sequence[Any], frames: np.ndarray, timing: Dict[str, float],
+                 curves: Dict[str, Any], channels: Dict[str, Any],
+                 batch: Optional[evaluation.LetterBatch] = None) -> Dict[str, Optional[np.ndarray]]:
+    """Transforms de todas las letras en todos los frames, de forma ``(frames, letters, 3)``."""
+    if batch is None:
+        batch = evaluation.LetterBatch(letters)
+    values = evaluation.evaluate_frames(frames, len(letters), timing, curves)
+    return evaluation.compute_transforms(values, batch, channels)
+
+def channel_tracks(transforms: Dict[str, Optional[np.ndarray]]):
+    """
+    F-Curves a escribir: ``(data_path, index, valores (frames, letras), interpolación)``.
+
+    Solo se hornean los componentes que el motor modifica; el resto queda en
+    su valor base.
+    """
+    tracks = []
+    if transforms['location'] is not None:
+        tracks.append(('location', 0, transforms['location'][..., 0], INTERPOLATION_BEZIER))
+    if transforms['rotation'] is not None:
+        tracks.append(('rotation_euler', 2, transforms['rotation'][..., 2], INTERPOLATION_BEZIER))
+    if transforms['scale'] is not None:
+        for axis in range(3):
+            tracks.append(('scale', axis, transforms['scale'][..., axis], INTERPOLATION_BEZIER))
+    if transforms['hidden'] is not None:
+        hidden = transforms['hidden'].astype(np.float64)
+        tracks.append(('hide_viewport', -1, hidden, INTERPOLATION_CONSTANT))
+        tracks.append(('hide_render', -1, hidden, INTERPOLATION_CONSTANT))
+    return tracks
+
+# === ESCRITURA ===
+
+def write_fcurve(action, data_path: str, index: int, frames: np.ndarray, values: np.ndarray,
+                 interpolation: int = INTERPOLATION_BEZIER, group: str = BAKE_GROUP_NAME,
+                 handle_left: Optional[np.ndarray] = None, handle_right: Optional[np.ndarray] = None):
+    """
+    Reemplaza una F-Curve con todos sus keyframes en una sola escritura en bloque.
+
+    Si se pasan ``handle_left``/``handle_right`` (arrays ``(n, 2)``) los handles
+    quedan libres (FREE) en esas posiciones; si no, Blender los calcula.
+    """
+    remove_fcurve(action, data_path, index)
+    fcurve = action.fcurves.new(data_path, index=max(index, 0), action_group=group)
+
+    count = len(frames)
+    points = fcurve.keyframe_points
+    points.add(count)
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    points.foreach_set('co', co)
+    points.foreach_set('interpolation', np.full(count, interpolation, dtype=np.int32))
+    if handle_left is not None and handle_right is not None:
+        free = np.full(count, HANDLE_FREE, dtype=np.int32)
+        points.foreach_set('handle_left_type', free)
+        points.foreach_set('handle_right_type', free)
+        points.foreach_set('handle_left', np.asarray(handle_left, dtype=np.float32).ravel())
+        points.foreach_set('handle_right', np.asarray(handle_right, dtype=np.float32).ravel())
+    fcurve.update()
+    return fcurve
+
+def remove_fcurve(action, data_path: str, index: int) -> None:
+    """Elimina la F-Curve de un canal si existe."""
+    existing = action.fcurves.find(data_path, index=max(index, 0))
+    if existing is not None:
+        action.fcurves.remove(existing)
+
+def _set_static_value(letter, data_path: str, index: int, value: float) -> None:
+    """Fija el valor de un canal que no necesita F-Curve."""
+    if index < 0:
+        setattr(letter, data_path, bool(value) if data_path.startswith('hide_') else value)
+    else:
+        getattr(letter, data_path)[index] = value
+
+def write_reduced_track(letter, action, data_path: str, index: int, frames: np.ndarray,
+                        values: np.ndarray, interpolation: int, tolerance: float) -> int:
+    """
+    Escribe un canal reducido con ``keyframe_reduction``.
+
+    Un canal constante no genera F-Curve: su valor se fija en el objeto. Si
+    ``letter`` es None (acción compartida) queda en un único keyframe.
+
+    Returns:
+        int: Número de keyframes escritos
+    """
+    if keyframe_reduction.is_constant(values, tolerance):
+        if letter is not None:
+            remove_fcurve(action, data_path, index)
+            _set_static_value(letter, data_path, index, float(values[0]))
+            return 0
+        write_fcurve(action, data_path, index, frames[:1], values[:1], interpolation)
+        return 1
+
+    if interpolation == INTERPOLATION_CONSTANT:
+        keep = keyframe_reduction.reduce_constant(values)
+        write_fcurve(action, data_path, index, frames[keep], values[keep], interpolation)
+        return len(keep)
+
+    keep, co, handle_left, handle_right = keyframe_reduction.reduce_bezier(frames, values, tolerance)
+    write_fcurve(action, data_path, index, co[:, 0], co[:, 1], interpolation,
+                 handle_left=handle_left, handle_right=handle_right)
+    return len(keep)
+
+def clear_action(action) -> set:
+    """
+    Elimina todas las F-Curves de una acción propia antes de volver a hornearla.
+
+    Returns:
+        set: ``data_path`` de las F-Curves eliminadas
+    """
+    removed = set()
+    for fcurve in list(action.fcurves):
+        removed.add(fcurve.data_path)
+        action.fcurves.remove(fcurve)
+    return removed
+
+def _letter_action(letter):
+    """
+    Acción ``<letra>_TA_Bake`` de la letra, vacía y asignada.
+
+    Nunca se escribe en una acción del usuario: si la letra tenía otra, se
+    conserva con fake user y se sustituye por la de horneado. Vaciarla
+    descarta los canales de un horneado anterior que ya no están activos.
+
+    Returns:
+        Tuple: ``(acción, data_paths del horneado anterior)``
+    """
+    name = letter.name + BAKE_ACTION_SUFFIX
+    anim = letter.animation_data_create()
+    previous = anim.action
+    if previous is not None and previous.name != name:
+        previous.use_fake_user = True
+        logger.info(f"Acción '{previous.name}' de {letter.name} conservada y sustituida por '{name}'")
+    action = bpy.data.actions.get(name) or bpy.data.actions.new(name)
+    removed = clear_action(action)
+    anim.action = action
+    return action, removed
+
+def bake_letters(letters: Sequence[Any], props, frame_step: int = 1, simplify: bool = False,
+                 tolerance: float = keyframe_reduction.DEFAULT_TOLERANCE) -> Optional[Dict[str, Any]]:
+    """
+    Hornea la animación de las letras a keyframes.
+
+    Args:
+        letters: Objetos de letra
+        props: ``TA_LetterAnimProperties`` de la escena
+        frame_step: Paso entre frames horneados
+        simplify: Reducir los keyframes dentro de ``tolerance``
+        tolerance: Error máximo de la reducción respecto a los valores horneados
+
+    Returns:
+        Optional[Dict[str, Any]]: Estadísticas del horneado o None si falló
+    """
+    start_time = time.perf_counter()
+    if not letters:
+        return None
+
+    curves = _stage_curves(props)
+    if curves is None:
+        logger.error("No se puede hornear: faltan curvas de etapa")
+        return None
+
+    letters = sort_letters(letters)
+    timing = evaluation.read_timing(props)
+    channels = evaluation.read_channel_settings(props)
+    first, last = bake_frame_range(timing)
+    frames = np.arange(first, last + 1, max(int(frame_step), 1), dtype=np.float64)
+
+    batch = evaluation.LetterBatch(letters)
+    transforms = compute_bake(letters, frames, timing, curves, channels, batch)
+    tracks = channel_tracks(transforms)
+    evaluate_time = time.perf_counter() - start_time
+
+    # Los canales desactivados vuelven al transform base al perder su F-Curve
+    batch.write(location=batch.base_location, rotation=batch.base_rotation, scale=batch.base_scale)
+    baked_paths = {track[0] for track in tracks}
+    keyframes = 0
+    for column, letter in enumerate(letters):
+        remove_shared_strips(letter)
+        action, previous_paths = _letter_action(letter)
+        for data_path in ('hide_viewport', 'hide_render'):
+            if data_path in previous_paths and data_path not in baked_paths:
+                setattr(letter, data_path, False)
+        for data_path, index, values, interpolation in tracks:
+            if simplify:
+                keyframes += write_reduced_track(letter, action, data_path, index, frames,
+                                                 values[:, column], interpolation, tolerance)
+            else:
+                write_fcurve(action, data_path, index, frames, values[:, column], interpolation)
+                keyframes += len(frames)
+
+    stats = {
+        'letters': len(letters),
+        'frames': len(frames),
+        'fcurves': len(letters) * len(tracks),
+        'keyframes': keyframes,
+        'sampled_keyframes': len(letters) * len(tracks) * len(frames),
+        'evaluate_time': evaluate_time,
+        'total_time': time.perf_counter() - start_time,
+    }
+    logger.info(f"Bake: {stats['letters']} letras, {stats['frames']} frames, {stats['keyframes']}/"
+                f"{stats['sampled_keyframes']} keyframes en {stats['total_time']:.3f}s "
+                f"(evaluación {evaluate_time:.3f}s)")
+    return stats
+
+# === ACCIÓN COMPARTIDA (NLA) ===
+
+class _RestBase:
+    """Base neutra para calcular los valores delta de la acción compartida."""
+    base_location = np.zeros((1, 3))
+    base_rotation = np.zeros((1, 3))
+    base_scale = np.ones((1, 3))
+
+def shared_tracks(values: np.ndarray, channels: Dict[str, Any]):
+    """
+    Canales de la acción compartida a partir de los valores de curva ``(frames,)``.
+
+    Mismo formato que ``channel_tracks`` pero sobre los canales delta, de modo
+    que la acción no depende del transform base de ninguna letra.
+    """
+    transforms = evaluation.compute_transforms(values[:, np.newaxis], _RestBase, channels)
+    tracks = []
+    for data_path, index, track_values, interpolation in channel_tracks(transforms):
+        tracks.append((DELTA_DATA_PATHS.get(data_path, data_path), index, track_values[:, 0], interpolation))
+    return tracks
+
+def stagger_offsets(count: int, timing: Dict[str, float]) -> np.ndarray:
+    """Desplazamiento en frames de cada letra (mismo escalonado que ``evaluation``)."""
+    per_char_delay = timing['overlap'] / max(count, 1)
+    return np.arange(count, dtype=np.float64) * per_char_delay * timing['duration']
+
+def _shared_action_name(letters: Sequence[Any]) -> str:
+    parent = getattr(letters[0], 'parent', None)
+    owner = parent.name if parent is not None else BAKE_GROUP_NAME
+    return owner + SHARED_ACTION_SUFFIX
+
+def remove_shared_strips(letter) -> None:
+    """Quita la pista NLA de escalonado de una letra, si la tiene."""
+    anim = letter.animation_data
+    if anim is None:
+        return
+    track = anim.nla_tracks.get(SHARED_TRACK_NAME)
+    if track is not None:
+        anim.nla_tracks.remove(track)
+        # Sin la tira, los deltas conservarían el último valor evaluado
+        letter.delta_location = (0.0, 0.0, 0.0)
+        letter.delta_rotation_euler = (0.0, 0.0, 0.0)
+        letter.delta_scale = (1.0, 1.0, 1.0)
+
+def add_shared_strip(letter, action, start: int, offset: float, duration: float, loops: int):
+    """
+    Referencia la acción compartida desde una letra con una tira NLA.
+
+    La tira empieza en ``start`` para todas las letras; el retardo va en el
+    rango de la acción (``offset`` frames antes), así la letra se queda en el
+    primer valor hasta su turno y se corta al final de cada loop igual que en
+    la evaluación en vivo.
+    """
+    remove_shared_strips(letter)
+    anim = letter.animation_data_create()
+    anim.action = None
+    track = anim.nla_tracks.new()
+    track.name = SHARED_TRACK_NAME
+    strip = track.strips.new(action.name, start, action)
+    strip.action_frame_start = start - offset
+    strip.action_frame_end = start - offset + duration
+    strip.repeat = max(int(loops), 1)
+    strip.extrapolation = 'HOLD'
+    return strip
+
+def bake_shared_action(letters: Sequence[Any], props, frame_step: int = 1, simplify: bool = False,
+                       tolerance: float = keyframe_reduction.DEFAULT_TOLERANCE) -> Optional[Dict[str, Any]]:
+    """
+    Hornea una única acción compartida y la instancia en cada letra por NLA.
+
+    Todas las letras siguen la misma curva desplazada por su retardo, así que
+    basta hornear un ciclo sobre los canales delta (``delta_location``...) y
+    desplazar una tira NLA por letra. Editar la acción re-temporiza todas las
+    letras a la vez.
+
+    Returns:
+        Optional[Dict[str, Any]]: Estadísticas del horneado o None si falló
+    """
+    start_time = time.perf_counter()
+    if not letters:
+        return None
+
+    curves = _stage_curves(props)
+    if curves is None:
+        logger.error("No se puede hornear: faltan curvas de etapa")
+        return None
+
+    letters = sort_letters(letters)
+    timing = evaluation.read_timing(props)
+    channels = evaluation.read_channel_settings(props)
+    start = int(math.floor(timing['start_frame']))
+    duration = float(timing['duration'])
+
+    # Un ciclo sin escalonado: t de la letra 0
+    cycle = dict(timing, loop_count=1)
+    frames = np.arange(start, start + int(math.ceil(duration)) + 1, max(int(frame_step), 1), dtype=np.float64)
+    values = evaluation.evaluate_frames(frames, 1, cycle, curves)[:, 0]
+    tracks = shared_tracks(values, channels)
+    evaluate_time = time.perf_counter() - start_time
+
+    name = _shared_action_name(letters)
+    action = bpy.data.actions.get(name) or bpy.data.actions.new(name)
+    # Los canales de un horneado compartido anterior que ya no están activos no deben quedar en la tira
+    clear_action(action)
+    keyframes = 0
+    for data_path, index, track_values, interpolation in tracks:
+        if simplify:
+            keyframes += write_reduced_track(None, action, data_path, index, frames,
+                                             track_values, interpolation, tolerance)
+        else:
+            write_fcurve(action, data_path, index, frames, track_values, interpolation)
+            keyframes += len(frames)
+
+    # Las letras quedan en su transform base; la acción anima solo los deltas
+    batch = evaluation.LetterBatch(letters)
+    batch.write(location=batch.base_location, rotation=batch.base_rotation, scale=batch.base_scale)
+    offsets = stagger_offsets(len(letters), timing)
+    for letter, offset in zip(letters, offsets.tolist()):
+        add_shared_strip(letter, action, start, offset, duration, timing['loop_count'])
+
+    stats = {
+        'letters': len(letters),
+        'frames': len(frames),
+        'fcurves': len(tracks),
+        'keyframes': keyframes,
+        'strips': len(letters),
+        'action': action.name,
+        'evaluate_time': evaluate_time,
+        'total_time': time.perf_counter() - start_time,
+    }
+    logger.info(f"Bake compartido: {stats['fcurves']} F-Curves, {stats['keyframes']} keyframes, "
+                f"{stats['strips']} tiras NLA en {stats['total_time']:.3f}s")
+    return stats
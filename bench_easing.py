@@ -0,0 +1,47 @@
+"""
+Benchmark de los easings escalares frente a las variantes vectorizadas.
+
+Evalúa cada easing de ``easing_library.easings`` sobre 1e6 muestras con la
+función escalar (bucle de Python) y con su versión NumPy, y muestra la
+aceleración. No necesita Blender.
+
+    python bench_easing.py
+"""
+
+import time
+
+import numpy as np
+
+from easing_library import easings, easings_array
+
+SAMPLE_COUNT = 1_000_000
+
+
+def bench(sample_count=SAMPLE_COUNT):
+    """Tiempos escalar/vectorizado por easing."""
+    ts = np.linspace(0.0, 1.0, sample_count)
+    samples = ts.tolist()
+    total_scalar = total_array = 0.0
+
+    for name, scalar in easings.items():
+        start = time.perf_counter()
+        for t in samples:
+            scalar(t)
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        easings_array[name](ts)
+        array_time = time.perf_counter() - start
+
+        total_scalar += scalar_time
+        total_array += array_time
+        print(f"   {name:22s} escalar {scalar_time * 1000:8.1f}ms  "
+              f"numpy {array_time * 1000:6.1f}ms  x{scalar_time / max(array_time, 1e-9):6.1f}")
+
+    print(f"📊 Total: escalar {total_scalar:.2f}s, numpy {total_array:.3f}s "
+          f"(x{total_scalar / max(total_array, 1e-9):.1f})")
+
+
+if __name__ == "__main__":
+    print(f"🚀 BENCHMARK DE EASINGS ({SAMPLE_COUNT} muestras)")
+    bench()
@@ -0,0 +1,108 @@
+"""
+Benchmark de la separación de texto para TypeAnimator.
+
+Dentro de Blender (con el addon habilitado) crea un texto de 10.000 caracteres
+y mide ``core.separate_text`` completo (conversión, islas, agrupado, orden y
+creación de objetos) en cada modo. Fuera de Blender mide las etapas puras
+sobre una malla sintética equivalente (un quad por glifo, dos islas para la "i").
+
+    blender -b --python bench_separation.py
+    python bench_separation.py
+"""
+
+import time
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+CHAR_COUNT = 10000
+LINE_WIDTH = 80
+MODES = ('LETTERS', 'WORDS', 'LINES')
+
+
+def make_body(char_count=CHAR_COUNT, line_width=LINE_WIDTH):
+    """Texto de prueba con palabras y saltos de línea."""
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+    text = " ".join(words[i % len(words)] for i in range(char_count // 4))[:char_count]
+    return "\n".join(text[i:i + line_width] for i in range(0, len(text), line_width))
+
+
+def make_synthetic_mesh(body):
+    """Arrays de malla con un quad por carácter visible (y dos para la "i")."""
+    import numpy as np
+
+    boxes = []
+    for row, line in enumerate(body.split("\n")):
+        y = -1.2 * row
+        for column, char in enumerate(line):
+            if char.isspace():
+                continue
+            x = 0.6 * column
+            if char == "i":
+                boxes.append((x, y, x + 0.15, y + 0.5))
+                boxes.append((x, y + 0.58, x + 0.15, y + 0.7))
+            else:
+                boxes.append((x, y, x + 0.5, y + 0.7))
+
+    boxes = np.asarray(boxes, dtype=np.float32)
+    count = len(boxes)
+    coords = np.zeros((count, 4, 3), dtype=np.float32)
+    coords[:, :, 0] = boxes[:, [0, 2, 2, 0]]
+    coords[:, :, 1] = boxes[:, [1, 1, 3, 3]]
+    first = np.arange(count)[:, None] * 4
+    quad = first + np.arange(4)
+    edges = np.stack((quad, np.roll(quad, -1, axis=1)), axis=2)
+    return {
+        'coords': coords.reshape(-1, 3),
+        'edges': edges.reshape(-1, 2),
+        'loop_vertices': quad.ravel(),
+        'loop_start': np.arange(count) * 4,
+        'loop_total': np.full(count, 4),
+        'material_index': np.zeros(count, dtype=np.int64),
+    }
+
+
+def bench_layout():
+    """Etapas puras (islas, agrupado, orden, partición) sobre la malla sintética."""
+    from separation import compute_layout
+
+    body = make_body()
+    arrays = make_synthetic_mesh(body)
+    print(f"📊 Malla sintética: {len(body)} caracteres, {len(arrays['coords'])} vértices")
+
+    for mode in MODES:
+        layout = compute_layout(mode=mode, grouping_tolerance=0.1, body=body, **arrays)
+        start = time.perf_counter()
+        for _fragment in layout.fragments():
+            pass
+        partition = time.perf_counter() - start
+        stages = ", ".join(f"{stage} {duration * 1000:.1f}ms" for stage, duration in layout.timings.items())
+        print(f"   {mode:8s} {layout.fragment_count:6d} fragmentos: {stages}, partition {partition * 1000:.1f}ms")
+
+
+def bench_blender():
+    """Separación completa de un texto real de 10.000 caracteres."""
+    from typeanimator import core
+
+    body = make_body()
+    for mode in MODES:
+        curve = bpy.data.curves.new(f"Bench_{mode}", 'FONT')
+        curve.body = body
+        text_obj = bpy.data.objects.new(f"Bench_{mode}", curve)
+        bpy.context.scene.collection.objects.link(text_obj)
+
+        core.clear_letter_separation_cache()
+        start = time.perf_counter()
+        root, letters = core.separate_text(text_obj, mode, 0.1)
+        elapsed = time.perf_counter() - start
+        print(f"   {mode:8s} {len(letters):6d} objetos en {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    print(f"🚀 BENCHMARK DE SEPARACIÓN ({CHAR_COUNT} caracteres)")
+    if bpy is not None:
+        bench_blender()
+    else:
+        bench_layout()
@@ -0,0 +1,90 @@
+"""
+Benchmark del lector de subtítulos en streaming.
+
+Genera un SRT/VTT/ASS sintético de ``CUE_COUNT`` cues (CRLF) y compara la
+antigua regex sobre el archivo completo con ``subtitles.read_cues``: tiempo
+y memoria pico (tracemalloc), con y sin filtrado por rango. No necesita
+Blender.
+
+    python bench_subtitles.py
+"""
+
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from subtitles import cue_frames, parse_timestamp, read_cues, to_frame
+
+CUE_COUNT = 50_000
+LEGACY_PATTERN = re.compile(r"\d+\s+([0-9:,]+)\s+-->\s+([0-9:,]+)\s+(.*?)(?=\n\n|$)", re.S)
+
+
+def _stamp(seconds, separator=','):
+    hours, rest = divmod(seconds, 3600)
+    minutes, rest = divmod(rest, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{rest:06.3f}".replace('.', separator)
+
+
+def write_samples(directory, cue_count=CUE_COUNT):
+    """Escribe el mismo contenido en SRT, VTT y ASS; devuelve sus rutas."""
+    paths = {fmt: os.path.join(directory, f"sample.{fmt}") for fmt in ('srt', 'vtt', 'ass')}
+    with open(paths['srt'], 'w', encoding='utf-8', newline='\r\n') as srt, \
+            open(paths['vtt'], 'w', encoding='utf-8', newline='\r\n') as vtt, \
+            open(paths['ass'], 'w', encoding='utf-8', newline='\r\n') as ass:
+        vtt.write("WEBVTT\n\n")
+        ass.write("[Script Info]\nTitle: bench\n\n[Events]\n"
+                  "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
+        for i in range(cue_count):
+            start, end = i * 2.0, i * 2.0 + 1.5
+            srt.write(f"{i + 1}\n{_stamp(start)} --> {_stamp(end)}\nSubtítulo número {i}\nsegunda línea\n\n")
+            vtt.write(f"{_stamp(start, '.')} --> {_stamp(end, '.')}\n<i>Subtítulo número {i}</i>\n\n")
+            ass.write(f"Dialogue: 0,{_stamp(start, '.')[1:-1]},{_stamp(end, '.')[1:-1]},Default,,0,0,0,,"
+                      f"{{\\i1}}Subtítulo número {i}\\Nsegunda línea\n")
+    return paths
+
+
+def measure(label, func):
+    """Tiempo (sin trazar) y memoria pico (con tracemalloc) de ``func``."""
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"   {label:34s} {count:7d} cues  {elapsed * 1000:8.1f}ms  pico {peak / 1e6:7.2f} MB")
+    return elapsed, peak
+
+
+def legacy_srt(path, fps=24):
+    """Lectura anterior: archivo completo, una regex y conversión de tiempos por cue."""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = LEGACY_PATTERN.findall(f.read())
+    frames = [(to_frame(parse_timestamp(start), fps), to_frame(parse_timestamp(end), fps))
+              for start, end, _body in entries]
+    return len(frames)
+
+
+def bench(cue_count=CUE_COUNT):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_samples(directory, cue_count)
+        window = (cue_count * 0.9, cue_count * 1.0)  # últimos ~5% de la película
+
+        legacy_time, legacy_peak = measure("SRT regex sobre el archivo", lambda: legacy_srt(paths['srt']))
+        stream_time, stream_peak = measure("SRT streaming (contar)",
+                                           lambda: sum(1 for _cue in read_cues(paths['srt'])))
+        measure("SRT streaming (a frames)", lambda: len(cue_frames(list(read_cues(paths['srt'])), 24)))
+        measure("SRT streaming (lista)", lambda: len(list(read_cues(paths['srt']))))
+        measure("SRT streaming + rango", lambda: len(list(read_cues(paths['srt'], time_range=window))))
+        measure("VTT streaming (lista)", lambda: len(list(read_cues(paths['vtt']))))
+        measure("ASS streaming (lista)", lambda: len(list(read_cues(paths['ass']))))
+
+    print(f"📊 Streaming frente a regex: tiempo x{legacy_time / max(stream_time, 1e-9):.2f}, "
+          f"memoria pico x{legacy_peak / max(stream_peak, 1):.1f} menor")
+
+
+if __name__ == "__main__":
+    print(f"🚀 BENCHMARK DE SUBTÍTULOS ({CUE_COUNT} cues)")
+    bench()
@@ -11,6 +11,8 @@ EXPORT_BUNDLE_VERSION = 1
 # === NOMBRES DE NODE GROUPS ===
 CURVE_NODE_GROUP_NAME = "txFxCurveData"
 CURVE_NODE_BASE_NAME = "txFxCurve"
+GEONODES_TREE_PREFIX = "txFxLetterAnim_"
+GEONODES_MODIFIER_NAME = "TypeAnimator"
 
 # === PREFIJOS DE OPERADORES ===
 OPERATOR_PREFIX = "typeanimator"
@@ -81,6 +83,7 @@ ANIMATION_MODES = {
 FRAGMENT_MODES = {
     'LETTERS': "Letters",
     'WORDS': "Words", 
+    'LINES': "Lines",
     'SYLLABLES': "Syllables"
 }
 
@@ -146,7 +149,52 @@ INFO_MESSAGES = {
 CACHE_CONFIG = {
     'MAX_SIZE': 100,
     'CLEANUP_THRESHOLD': 80,
-    'TTL_HOURS': 24
+    'TTL_HOURS': 24,
+    'MAX_WEIGHT': 20000  # Entradas + objetos de letra retenidos
+}
+
+# === CONFIGURACIÓN DE LUTs DE CURVAS ===
+CURVE_LUT_CONFIG = {
+    'ENABLED': True,
+    'RESOLUTION': 256,
+    'INTERPOLATION': 'LINEAR'  # LINEAR, CUBIC
+}
+
+# === CONFIGURACIÓN DE DIAGNÓSTICO ===
+DIAGNOSTICS_CONFIG = {
+    'REFRESH_INTERVAL': 2.0,  # Segundos máximos entre instantáneas
+    'POLL_INTERVAL': 0.25     # Tick del timer para atender invalidaciones
+}
+
+# === CONFIGURACIÓN DE DRIVERS DE PREVIEW ===
+PREVIEW_DRIVER_CONFIG = {
+    'FUNCTION_NAME': 'ta_preview',  # Función registrada en bpy.app.driver_namespace
+    'PRECISION': 3                  # Decimales del frame usados como clave del memo
+}
+
+# === CONFIGURACIÓN DE SUBTÍTULOS ===
+SUBTITLE_CONFIG = {
+    'COLLECTION_PREFIX': 'TA_Subtitles_',   # Colección con los cues importados
+    'BACKGROUND_MESH': 'TA_LowerThird',     # Malla del fondo compartida por todos los cues
+    'BACKGROUND_SIZE': 3.0,
+    'BACKGROUND_Y': -1.1,
+    'TEXT_Y': -1.0,
+    'MAX_SHARDS': 32                        # Procesos máximos al construir en paralelo
+}
+
+# === CONFIGURACIÓN DE ARRANQUE ===
+STARTUP_CONFIG = {
+    'DEFER_INTERVAL': 0.1,  # Segundos hasta ejecutar el trabajo diferido (con la UI ya activa)
+    'SLOW_STEP': 0.05       # Pasos más lentos que esto se avisan en el log
+}
+
+# === CONFIGURACIÓN DEL PROFILER ===
+PROFILER_CONFIG = {
+    'ENABLED': False,        # Apagado: las secciones instrumentadas no miden nada
+    'CAPACITY': 1024,        # Muestras recientes por sección (percentiles)
+    'TRACE_CAPACITY': 20000, # Eventos recientes para la traza de Chrome
+    'SLOW_SECTION': 0.016,   # Secciones más lentas que esto van al log de rendimiento
+    'UI_ROWS': 8             # Secciones mostradas en el tab de diagnóstico
 }
 
 # === CONFIGURACIÓN DE LOGGING ===
@@ -163,7 +211,8 @@ PERFORMANCE_CONFIG = {
     'MAX_LETTERS_PREVIEW': 500,
     'SKIP_FRAMES_PREVIEW': 2,
     'CACHE_ENABLED': True,
-    'LIVE_PREVIEW_ENABLED': True
+    'LIVE_PREVIEW_ENABLED': True,
+    'BULK_WRITE_MIN_SHARE': 0.5  # foreach_set sobre bpy.data.objects solo si las letras a escribir son al menos esta fracción
 }
 
 # === CONFIGURACIÓN DE EXPORT BUNDLE ===
@@ -251,6 +300,7 @@ TRANSLATIONS = {
         # Fragment Modes
         'LETTERS': 'Letters',
         'WORDS': 'Words',
+        'LINES': 'Lines',
         'SYLLABLES': 'Syllables',
         
         # Timing
@@ -349,6 +399,7 @@ TRANSLATIONS = {
         # Fragment Modes
         'LETTERS': 'Letras',
         'WORDS': 'Palabras',
+        'LINES': 'Líneas',
         'SYLLABLES': 'Sílabas',
         
         # Timing
@@ -447,6 +498,7 @@ TRANSLATIONS = {
         # Fragment Modes
         'LETTERS': 'Lettres',
         'WORDS': 'Mots',
+        'LINES': 'Lignes',
         'SYLLABLES': 'Syllabes',
         
         # Timing
@@ -581,6 +633,11 @@ LIVE_PREVIEW_FRAME_SKIP = 2  # Skip frames for performance
 import os
 PRESETS_DIR = os.path.join(os.path.dirname(__file__), 'presets')
 USER_PRESETS_DIR = os.path.join(os.path.dirname(__file__), 'user_presets')
+# Archivos generados: en la carpeta de configuración del usuario (ver utils.get_user_data_path)
+ADDON_DATA_DIR = 'typeanimator'
+PRESET_CATALOG_FILE = 'preset_catalog.json'  # Índice cacheado (solo sesiones con UI)
+STARTUP_PROFILE_FILE = 'startup_profile.json'  # Último arranque interactivo
+PROFILER_TRACE_FILE = 'profiler_trace.json'  # Última traza exportada (con PID en background)
 
 # === PRESET PRIORITY ENUM ===
 from enum import Enum
@@ -12,214 +12,25 @@ from .constants import (
     ORIG_LOCATION, ORIG_ROTATION, ORIG_SCALE, ROOT_NAME,
     MIN_FRAME, MAX_FRAME, MIN_DURATION, MAX_DURATION, MIN_OVERLAP, MAX_OVERLAP,
     DEFAULT_START_FRAME, DEFAULT_END_FRAME, DEFAULT_DURATION, DEFAULT_OVERLAP,
-    ANIMATION_STAGES, STAGE_NAMES, ANIMATION_MODES, FRAGMENT_MODES
+    ANIMATION_STAGES, STAGE_NAMES, ANIMATION_MODES, FRAGMENT_MODES, CACHE_CONFIG
 )
 from .utils import is_valid_object, validate_animation_properties
+from .separation_cache import OptimizedLetterSeparationCache
+from .curve_lut import clear_lut_cache
+from . import separation
+from . import baking
+from . import preview_drivers
+from . import invalidation
+from .profiler import profiled
+from .invalidation import InvalidationEvent
+from .letter_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
 # === CACHE SYSTEM OPTIMIZATION ===
 
-class OptimizedLetterSeparationCache:
-    """Optimized cache system for letter separation with performance monitoring."""
-    
-    def __init__(self, max_size=100, cleanup_threshold=80):
-        self.cache = {}
-        self.max_size = max_size
-        self.cleanup_threshold = cleanup_threshold
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'sets': 0,
-            'clears': 0,
-            'last_cleanup': time.time()
-        }
-        self.performance_data = {
-            'avg_set_time': 0.0,
-            'avg_get_time': 0.0,
-            'total_operations': 0
-        }
-    
-    def _generate_key(self, text_obj, fragment_mode, grouping_tolerance):
-        """Generate a unique cache key with optimized hashing."""
-        try:
-            # Optimized key generation
-            text_content = text_obj.data.body if text_obj.data else ""
-            key_parts = [
-                text_obj.name,
-                text_content[:100],  # Limit content length for performance
-                str(fragment_mode),
-                str(grouping_tolerance),
-                str(hash(text_obj.location)),
-                str(hash(text_obj.rotation_euler)),
-                str(hash(text_obj.scale))
-            ]
-            return hash(tuple(key_parts))
-        except Exception as e:
-            logger.warning(f"Error generating cache key: {e}")
-            return None
-    
-    def get(self, text_obj, fragment_mode, grouping_tolerance):
-        """Get cached result with performance monitoring."""
-        start_time = time.time()
-        
-        try:
-            key = self._generate_key(text_obj, fragment_mode, grouping_tolerance)
-            if key is None:
-                self.stats['misses'] += 1
-                return None
-            
-            result = self.cache.get(key)
-            if result is not None:
-                self.stats['hits'] += 1
-                self._update_performance_stats('get', time.time() - start_time)
-                return result
-            
-            self.stats['misses'] += 1
-            self._update_performance_stats('get', time.time() - start_time)
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error in cache get: {e}")
-            self.stats['misses'] += 1
-            return None
-    
-    def set(self, text_obj, fragment_mode, grouping_tolerance, result):
-        """Set cache result with automatic cleanup."""
-        start_time = time.time()
-        
-        try:
-            key = self._generate_key(text_obj, fragment_mode, grouping_tolerance)
-            if key is None:
-                return False
-            
-            # Check if cleanup is needed
-            if len(self.cache) >= self.cleanup_threshold:
-                self._cleanup()
-            
-            self.cache[key] = result
-            self.stats['sets'] += 1
-            self._update_performance_stats('set', time.time() - start_time)
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error in cache set: {e}")
-            return False
-    
-    def _cleanup(self):
-        """Intelligent cache cleanup based on usage patterns."""
-        try:
-            if len(self.cache) <= self.max_size:
-                return
-            
-            # Remove oldest entries (simple LRU-like behavior)
-            items_to_remove = len(self.cache) - self.max_size
-            keys_to_remove = list(self.cache.keys())[:items_to_remove]
-            
-            for key in keys_to_remove:
-                del self.cache[key]
-            
-            self.stats['clears'] += items_to_remove
-            self.stats['last_cleanup'] = time.time()
-            
-            logger.debug(f"Cache cleanup: removed {items_to_remove} entries")
-            
-        except Exception as e:
-            logger.error(f"Error in cache cleanup: {e}")
-    
-    def _update_performance_stats(self, operation_type, duration):
-        """Update performance statistics."""
-        try:
-            self.performance_data['total_operations'] += 1
-            
-            if operation_type == 'get':
-                current_avg = self.performance_data['avg_get_time']
-                self.performance_data['avg_get_time'] = (
-                    (current_avg * (self.performance_data['total_operations'] - 1) + duration) / 
-                    self.performance_data['total_operations']
-                )
-            elif operation_type == 'set':
-                current_avg = self.performance_data['avg_set_time']
-                self.performance_data['avg_set_time'] = (
-                    (current_avg * (self.performance_data['total_operations'] - 1) + duration) / 
-                    self.performance_data['total_operations']
-                )
-                
-        except Exception as e:
-            logger.warning(f"Error updating performance stats: {e}")
-    
-    def get_stats(self):
-        """Get comprehensive cache statistics."""
-        total_requests = self.stats['hits'] + self.stats['misses']
-        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-        
-        return {
-            'size': len(self.cache),
-            'max_size': self.max_size,
-            'hit_rate': hit_rate,
-            'hits': self.stats['hits'],
-            'misses': self.stats['misses'],
-            'sets': self.stats['sets'],
-            'clears': self.stats['clears'],
-            'avg_get_time': self.performance_data['avg_get_time'],
-            'avg_set_time': self.performance_data['avg_set_time'],
-            'total_operations': self.performance_data['total_operations'],
-            'last_cleanup': self.stats['last_cleanup']
-        }
-    
-    def clear(self):
-        """Clear all cache entries."""
-        self.cache.clear()
-        self.stats['clears'] += len(self.cache)
-        logger.info("Cache cleared")
-    
-    def optimize(self):
-        """Optimize cache performance."""
-        try:
-            # Remove invalid entries
-            invalid_keys = []
-            for key, value in self.cache.items():
-                if not self._is_valid_cache_entry(value):
-                    invalid_keys.append(key)
-            
-            for key in invalid_keys:
-                del self.cache[key]
-            
-            # Force cleanup if needed
-            if len(self.cache) > self.cleanup_threshold:
-                self._cleanup()
-            
-            logger.info(f"Cache optimized: removed {len(invalid_keys)} invalid entries")
-            return len(invalid_keys)
-            
-        except Exception as e:
-            logger.error(f"Error optimizing cache: {e}")
-            return 0
-    
-    def _is_valid_cache_entry(self, entry):
-        """Check if a cache entry is still valid."""
-        try:
-            if not isinstance(entry, (list, tuple)) or len(entry) != 2:
-                return False
-            
-            root, letters = entry
-            
-            # Check if root is still valid
-            if not is_valid_object(root):
-                return False
-            
-            # Check if letters are still valid
-            for letter in letters:
-                if not is_valid_object(letter):
-                    return False
-            
-            return True
-            
-        except Exception:
-            return False
-
 # Global cache instance
-_letter_separation_cache = OptimizedLetterSeparationCache()
+_letter_separation_cache = OptimizedLetterSeparationCache(object_validator=is_valid_object)
 
 # === OPTIMIZED HANDLERS ===
 
@@ -236,6 +47,11 @@ class OptimizedAnimationHandler:
             'last_slow_frame': 0
         }
         self.frame_skip_threshold = 0.016  # 60 FPS threshold
+        self._letters_dirty = True
+    
+    def invalidate_letters(self, _payload=None):
+        """Force a rescan of the letter objects on the next frame."""
+        self._letters_dirty = True
     
     def handle_frame_change(self, scene):
         """Handle frame change with performance optimization."""
@@ -275,14 +91,11 @@ class OptimizedAnimationHandler:
     def _get_active_letters(self, scene):
         """Get active letters for animation with caching."""
         try:
-            # Use cached letter selection for performance
-            if not hasattr(self, '_cached_letters') or scene.frame_current % 10 == 0:
-                self._cached_letters = []
-                for obj in scene.objects:
-                    if (is_valid_object(obj) and 
-                        hasattr(obj, LETTER_PROPERTY) and 
-                        getattr(obj, LETTER_PROPERTY, False)):
-                        self._cached_letters.append(obj)
+            # Re-query only after the invalidation bus reported added/removed objects
+            if self._letters_dirty or not hasattr(self, '_cached_letters'):
+                self._letters_dirty = False
+                self._cached_letters = [obj for obj in get_registry().all_letters(scene)
+                                        if is_valid_object(obj)]
             
             return self._cached_letters
             
@@ -397,25 +210,46 @@ class OptimizedAnimationHandler:
 # Global handler instance
 _animation_handler = OptimizedAnimationHandler()
 
+# === CACHE INVALIDATION ===
+
+def _on_text_changed(text_name):
+    if text_name:
+        _letter_separation_cache.invalidate_source(text_name)
+
+def _on_curves_changed(_payload=None):
+    clear_lut_cache()
+
+invalidation.subscribe(InvalidationEvent.TEXT_CHANGED, _on_text_changed)
+invalidation.subscribe((InvalidationEvent.CURVE_EDITED, InvalidationEvent.FILE_LOADED), _on_curves_changed)
+invalidation.subscribe((InvalidationEvent.LETTERS_CHANGED, InvalidationEvent.FILE_LOADED),
+                       _animation_handler.invalidate_letters)
+
 # === OPTIMIZED CORE FUNCTIONS ===
 
+@profiled('core.separate_text')
 def separate_text(text_obj, fragment_mode='LETTERS', grouping_tolerance=0.1):
-    """Separate text with optimized caching."""
+    """
+    Separate a text object into one mesh object per letter, word or line.
+    
+    An existing separation of the same content is reused as is; a stale one
+    is replaced. The geometry layout is cached by content, so identical text
+    setups on other objects skip conversion and island detection.
+    """
     start_time = time.time()
     
     try:
-        # Check cache first
-        cached_result = _letter_separation_cache.get(text_obj, fragment_mode, grouping_tolerance)
-        if cached_result is not None:
-            logger.debug(f"Cache hit for text separation: {text_obj.name}")
-            return cached_result
+        separation_key = _letter_separation_cache._generate_key(text_obj, fragment_mode, grouping_tolerance)
         
-        # Perform separation
-        result = _perform_text_separation(text_obj, fragment_mode, grouping_tolerance)
+        existing = separation.get_existing_separation(text_obj, separation_key)
+        if existing is not None:
+            logger.debug(f"Reusing existing separation for {text_obj.name}")
+            return existing
         
-        # Cache result
-        if result:
-            _letter_separation_cache.set(text_obj, fragment_mode, grouping_tolerance, result)
+        stale_root = bpy.data.objects.get(text_obj.name + ROOT_SUFFIX)
+        if stale_root is not None and stale_root.get(separation.SOURCE_TEXT_PROPERTY) == text_obj.name:
+            separation.remove_separation(stale_root)
+        
+        result = _perform_text_separation(text_obj, fragment_mode, grouping_tolerance, separation_key)
         
         separation_time = time.time() - start_time
         logger.debug(f"Text separation completed in {separation_time:.3f}s")
@@ -426,20 +260,42 @@ def separate_text(text_obj, fragment_mode='LETTERS', grouping_tolerance=0.1):
         logger.error(f"Error in separate_text: {e}")
         return None, []
 
-def _perform_text_separation(text_obj, fragment_mode, grouping_tolerance):
-    """Perform actual text separation with optimization."""
+def _perform_text_separation(text_obj, fragment_mode, grouping_tolerance, separation_key=None):
+    """Convert the text once, split it into fragments and build the letter objects."""
     try:
-        # Implementation of text separation
-        # This would contain the actual logic for separating text into letters
-        # For now, returning a placeholder
-        return None, []
+        # Check cache first
+        layout = _letter_separation_cache.get(text_obj, fragment_mode, grouping_tolerance)
+        if layout is not None:
+            logger.debug(f"Cache hit for text separation: {text_obj.name}")
+        else:
+            layout = separation.separate_text_layout(text_obj, fragment_mode, grouping_tolerance)
+            if layout.fragment_count:
+                _letter_separation_cache.set(text_obj, fragment_mode, grouping_tolerance, layout)
+        
+        if not layout.fragment_count:
+            logger.warning(f"Text {text_obj.name} produced no geometry to separate")
+            return None, []
+        
+        root, letters = separation.build_objects(text_obj, layout, separation_key)
+        
+        timings = ", ".join(f"{stage} {duration * 1000:.1f}ms" for stage, duration in layout.timings.items())
+        logger.info(f"Separated {text_obj.name} into {len(letters)} {layout.mode.lower()} ({timings})")
+        return root, letters
         
     except Exception as e:
         logger.error(f"Error in text separation: {e}")
         return None, []
 
-def animate_letters(letters, props, preview=True):
-    """Animate letters with performance optimization."""
+@profiled('core.animate_letters')
+def animate_letters(letters, props, preview=True, simplify=False, simplify_tolerance=None,
+                    shared_action=False):
+    """Animate letters with performance optimization.
+
+    When baking (``preview=False``) ``simplify`` reduces the baked keyframes
+    to the fewest that stay within ``simplify_tolerance`` of the samples, and
+    ``shared_action`` bakes one action that every letter references through
+    an NLA strip shifted by its stagger delay.
+    """
     start_time = time.time()
     
     try:
@@ -452,13 +308,19 @@ def animate_letters(letters, props, preview=True):
             logger.error("Invalid animation properties")
             return
         
-        # Animate each letter
-        for letter in letters:
-            if is_valid_object(letter):
-                _animate_single_letter_optimized(letter, props, preview)
+        result = None
+        valid_letters = [letter for letter in letters if is_valid_object(letter)]
+        if preview:
+            # One batch of drivers reading a shared per-frame evaluation
+            _setup_preview_drivers(valid_letters, props)
+        else:
+            # Bake all letters at once: one bulk write per fcurve
+            result = _setup_keyframe_animation(valid_letters, props, simplify, simplify_tolerance,
+                                               shared_action)
         
         animation_time = time.time() - start_time
         logger.debug(f"Animation completed in {animation_time:.3f}s for {len(letters)} letters")
+        return result
         
     except Exception as e:
         logger.error(f"Error in animate_letters: {e}")
@@ -469,38 +331,46 @@ def _animate_single_letter_optimized(letter, props, preview):
         # Apply animation with performance monitoring
         if preview:
             # Use drivers for preview
-            _setup_preview_drivers(letter, props)
+            _setup_preview_drivers([letter], props)
         else:
             # Use keyframes for final animation
-            _setup_keyframe_animation(letter, props)
+            _setup_keyframe_animation([letter], props)
             
     except Exception as e:
         logger.error(f"Error animating letter {letter.name}: {e}")
 
-def _setup_preview_drivers(letter, props):
-    """Setup preview drivers with optimization."""
+def _setup_preview_drivers(letters, props):
+    """Setup preview drivers that share one driver namespace function.
+
+    Every driver calls the function registered by ``preview_drivers``, which
+    evaluates the whole group of letters once per frame; each driver only
+    reads its own slot from that result.
+    """
     try:
-        # Implementation of preview driver setup
-        pass
+        created = preview_drivers.setup_preview_drivers(letters, props)
+        logger.debug(f"{created} preview drivers set up for {len(letters)} letters")
     except Exception as e:
         logger.error(f"Error setting up preview drivers: {e}")
 
-def _setup_keyframe_animation(letter, props):
-    """Setup keyframe animation with optimization."""
+def _setup_keyframe_animation(letters, props, simplify=False, tolerance=None, shared_action=False):
+    """Bake the animation of all letters to keyframes in bulk."""
     try:
-        # Implementation of keyframe animation setup
-        pass
+        options = {'simplify': simplify}
+        if tolerance is not None:
+            options['tolerance'] = tolerance
+        if shared_action:
+            return baking.bake_shared_action(letters, props, **options)
+        return baking.bake_letters(letters, props, **options)
     except Exception as e:
         logger.error(f"Error setting up keyframe animation: {e}")
+        return None
 
 def remove_preview_drivers(letters):
     """Remove preview drivers with optimization."""
     try:
-        for letter in letters:
-            if is_valid_object(letter):
-                # Remove drivers
-                if letter.animation_data:
-                    letter.animation_data_clear()
+        # Remove only the preview drivers; baked keyframes are kept
+        preview_drivers.remove_preview_drivers(
+            [letter for letter in letters if is_valid_object(letter)])
         
         logger.debug(f"Preview drivers removed for {len(letters)} letters")
         
@@ -566,5 +436,6 @@ def unregister():
     
     # Clear cache
     clear_letter_separation_cache()
+    clear_lut_cache()
     
     logger.debug("Core module unregistered")
@@ -0,0 +1,122 @@
+"""
+Tablas de búsqueda (LUT) precalculadas para las curvas de etapa IN/MID/OUT.
+
+Cada curva (``CurveMap`` de un ``ShaderNodeRGBCurve``) se muestrea una sola vez
+en una tabla densa de floats. La evaluación pasa a ser una búsqueda en la
+tabla, escalar o vectorizada con NumPy, sin cruzar a RNA. Las búsquedas no
+vuelven a leer los puntos: la tabla se descarta cuando el bus de
+``invalidation`` publica CURVE_EDITED o FILE_LOADED (``core``) y cuando
+``easing_library.write_points`` reescribe la curva.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INTERPOLATION_MODES = ('LINEAR', 'CUBIC')
+
+# === TABLA ===
+
+class CurveLUT:
+    """Tabla de muestras uniformes de una curva en el rango [0, 1]."""
+
+    def __init__(self, samples, interpolation: str = 'LINEAR'):
+        if interpolation not in INTERPOLATION_MODES:
+            raise ValueError(f"Interpolación no soportada: {interpolation}")
+        self.samples = np.asarray(samples, dtype=np.float64)
+        if self.samples.ndim != 1 or len(self.samples) < 2:
+            raise ValueError("Una LUT necesita al menos 2 muestras")
+        self.interpolation = interpolation
+        self.resolution = len(self.samples)
+        self._last = self.resolution - 1
+        # Muestras con un margen a cada lado para Catmull-Rom sin ramas
+        self._padded = np.concatenate((self.samples[:1], self.samples, self.samples[-1:]))
+
+    @classmethod
+    def bake(cls, evaluate: Callable[[float], float], resolution: int = 256,
+             interpolation: str = 'LINEAR') -> 'CurveLUT':
+        """Muestrea ``evaluate`` en ``resolution`` puntos uniformes de [0, 1]."""
+        resolution = max(int(resolution), 2)
+        xs = np.linspace(0.0, 1.0, resolution)
+        samples = np.fromiter((evaluate(x) for x in xs.tolist()), dtype=np.float64, count=resolution)
+        return cls(samples, interpolation)
+
+    def evaluate(self, t: float) -> float:
+        """Evalúa la tabla en un ``t`` escalar."""
+        return float(self.evaluate_array(np.asarray([t], dtype=np.float64))[0])
+
+    def evaluate_array(self, ts) -> np.ndarray:
+        """Evalúa la tabla para un array de ``t`` (fuera de [0, 1] se recorta)."""
+        position = np.clip(np.asarray(ts, dtype=np.float64), 0.0, 1.0) * self._last
+        index = np.minimum(position.astype(np.int64), self._last - 1)
+        frac = position - index
+
+        if self.interpolation == 'LINEAR':
+            p1 = self.samples[index]
+            p2 = self.samples[index + 1]
+            return p1 + (p2 - p1) * frac
+
+        # Catmull-Rom uniforme sobre las muestras vecinas
+        p0 = self._padded[index]
+        p1 = self._padded[index + 1]
+        p2 = self._padded[index + 2]
+        p3 = self._padded[index + 3]
+        frac2 = frac * frac
+        frac3 = frac2 * frac
+        return 0.5 * (
+            2.0 * p1 +
+            (p2 - p0) * frac +
+            (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * frac2 +
+            (3.0 * p1 - p0 - 3.0 * p2 + p3) * frac3
+        )
+
+# === CACHE DE LUTs ===
+
+_lut_cache: Dict[Any, Tuple[Tuple[Any, ...], CurveLUT]] = {}
+_lut_stats = {
+    'hits': 0,
+    'bakes': 0,
+}
+
+def _curve_key(curve):
+    as_pointer = getattr(curve, 'as_pointer', None)
+    return as_pointer() if as_pointer is not None else id(curve)
+
+def get_curve_lut(curve, resolution: int = 256, interpolation: str = 'LINEAR') -> CurveLUT:
+    """
+    Devuelve la LUT de una curva, horneándola la primera vez que se usa.
+
+    La tabla se reutiliza mientras no se invalide y la resolución y el modo
+    de interpolación no cambien; un acierto no toca la curva.
+    """
+    key = _curve_key(curve)
+    signature = (resolution, interpolation)
+    cached = _lut_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        _lut_stats['hits'] += 1
+        return cached[1]
+
+    lut = CurveLUT.bake(curve.evaluate, resolution, interpolation)
+    _lut_cache[key] = (signature, lut)
+    _lut_stats['bakes'] += 1
+    logger.debug(f"LUT horneada para curva {key} ({resolution} muestras, {interpolation})")
+    return lut
+
+def invalidate_curve_lut(curve) -> None:
+    """Descarta la LUT de una curva concreta."""
+    _lut_cache.pop(_curve_key(curve), None)
+
+def clear_lut_cache() -> None:
+    """Descarta todas las LUTs."""
+    _lut_cache.clear()
+
+def get_lut_cache_stats() -> Dict[str, int]:
+    """Estadísticas del cache de LUTs."""
+    return {
+        'size': len(_lut_cache),
+        'hits': _lut_stats['hits'],
+        'bakes': _lut_stats['bakes'],
+    }
@@ -9,14 +9,39 @@ from .constants import (
     CURVE_NODE_GROUP_NAME, CURVE_NODE_BASE_NAME, FONT_TYPE, LETTER_PROPERTY,
     BLEND_WIDTH, BLEND_MODE, OVERSHOOT_ENABLED, OVERSHOOT_LIMIT,
     AUDIT_AUTO_REPAIR, AUDIT_LOG_DETAILS, NODE_NAME_SEPARATOR, 
-    CURVE_NODE_PREFIX, STAGE_SEPARATOR, generate_curve_node_name,
+    CURVE_NODE_PREFIX, STAGE_SEPARATOR, CURVE_LUT_CONFIG, ANIMATION_STAGES, generate_curve_node_name,
     generate_base_name_from_object
 )
+from . import curve_lut
+from .easing_library import read_points, write_points
+from .letter_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
 # === ENHANCED CURVE EVALUATION ===
 
+def get_stage_curve(curve_node):
+    """Return the evaluator for a stage curve node: its baked LUT or the raw CurveMap."""
+    curve = curve_node.mapping.curves[0]
+    if not CURVE_LUT_CONFIG['ENABLED']:
+        return curve
+    return curve_lut.get_curve_lut(
+        curve,
+        resolution=CURVE_LUT_CONFIG['RESOLUTION'],
+        interpolation=CURVE_LUT_CONFIG['INTERPOLATION']
+    )
+
+def get_stage_curves(obj) -> Optional[Dict[str, Any]]:
+    """Return the IN/MID/OUT evaluators for an object or base name, or None if any node is missing."""
+    curves = {}
+    for stage in ANIMATION_STAGES:
+        node = get_or_create_curve_node(obj, stage)
+        if not (node and hasattr(node, 'mapping') and hasattr(node.mapping, 'curves') and node.mapping.curves):
+            logger.error(f"No se pudo obtener el nodo de curva para la etapa '{stage}'. Node: {node}")
+            return None
+        curves[stage] = get_stage_curve(node)
+    return curves
+
 def evaluate_staged_curve(obj, stage: str, t: float, props=None) -> float:
     """Centralized function to evaluate curve for a specific stage with blending."""
     try:
@@ -28,8 +53,8 @@ def evaluate_staged_curve(obj, stage: str, t: float, props=None) -> float:
         if not curve_node:
             return t  # Fallback to linear
         
-        # Evaluate the curve
-        result = curve_node.mapping.curves[0].evaluate(t)
+        # Evaluate the curve (table lookup, no RNA call)
+        result = get_stage_curve(curve_node).evaluate(t)
         
         # Apply overshoot handling
         if OVERSHOOT_ENABLED:
@@ -209,6 +234,7 @@ def apply_default_preset(curve_node, stage: str):
         # Set handle types
         for point in curve.points:
             point.handle_type = 'AUTO'
+        curve_lut.invalidate_curve_lut(curve)
             
     except Exception as e:
         logger.error(f"Error applying default preset: {e}")
@@ -224,17 +250,9 @@ def copy_curve_between_stages(obj, source_stage: str, target_stage: str) -> bool
         if not source_node or not target_node:
             return False
         
-        # Copy curve data
-        source_curve = source_node.mapping.curves[0]
-        target_curve = target_node.mapping.curves[0]
-        
-        # Clear target curve
-        target_curve.points.clear()
-        
-        # Copy points
-        for source_point in source_curve.points:
-            target_point = target_curve.points.new(source_point.location[0], source_point.location[1])
-            target_point.handle_type = source_point.handle_type
+        # Copy all points in one bulk read/write
+        write_points(target_node.mapping.curves[0], read_points(source_node.mapping.curves[0]))
+        target_node.mapping.update()
         
         logger.info(f"Copied curve from {source_stage} to {target_stage}")
         return True
@@ -317,24 +335,25 @@ def audit_or_repair_curve_nodegroup() -> Dict[str, Any]:
             'details': []
         }
         
-        # Audit all objects
-        for obj in bpy.data.objects:
-            if obj.type == FONT_TYPE or (obj.type == 'MESH' and hasattr(obj, LETTER_PROPERTY)):
-                audit_results['total_objects'] += 1
-                
-                # Check if object has valid curve setup
-                is_valid, issues = audit_object_curves(obj)
+        # Audit text objects and letter meshes from the registry
+        registry = get_registry()
+        objects = registry.text_objects() + [obj for obj in registry.all_letters() if obj.type == 'MESH']
+        for obj in objects:
+            audit_results['total_objects'] += 1
+            
+            # Check if object has valid curve setup
+            is_valid, issues = audit_object_curves(obj)
+            
+            if is_valid:
+                audit_results['valid_objects'] += 1
+            else:
+                audit_results['warnings'].extend(issues)
                 
-                if is_valid:
-                    audit_results['valid_objects'] += 1
-                else:
-                    audit_results['warnings'].extend(issues)
-                    
-                    # Repair if auto-repair is enabled
-                    if AUDIT_AUTO_REPAIR:
-                        if repair_object_curves(obj):
-                            audit_results['repaired_objects'] += 1
-                            audit_results['details'].append(f"Repaired curves for {obj.name}")
+                # Repair if auto-repair is enabled
+                if AUDIT_AUTO_REPAIR:
+                    if repair_object_curves(obj):
+                        audit_results['repaired_objects'] += 1
+                        audit_results['details'].append(f"Repaired curves for {obj.name}")
         
         # Log audit results
         if AUDIT_LOG_DETAILS:
@@ -425,37 +444,21 @@ def debug_evaluate_curves(obj, test_points: List[float] = None) -> Dict[str, Any
 # === LEGACY SUPPORT ===
 
 def serialize_curve(curve_node) -> Dict[str, Any]:
-    """Serialize curve data for export."""
+    """Serialize curve data for export (flat ``location``/``handle_type`` arrays)."""
     try:
-        curve = curve_node.mapping.curves[0]
-        points = []
-        
-        for point in curve.points:
-            points.append({
-                'x': point.location[0],
-                'y': point.location[1],
-                'handle_type': point.handle_type
-            })
-        
-        return {
-            'points': points,
-            'node_name': curve_node.name
-        }
+        data = read_points(curve_node.mapping.curves[0])
+        data['node_name'] = curve_node.name
+        return data
         
     except Exception as e:
         logger.error(f"Error serializing curve: {e}")
         return {}
 
 def deserialize_curve(curve_node, curve_data: Dict[str, Any]):
-    """Deserialize curve data for import."""
+    """Deserialize curve data for import (flat arrays or the older per-point dicts)."""
     try:
-        curve = curve_node.mapping.curves[0]
-        curve.points.clear()
-        
-        if 'points' in curve_data:
-            for point_data in curve_data['points']:
-                point = curve.points.new(point_data['x'], point_data['y'])
-                point.handle_type = point_data.get('handle_type', 'AUTO')
+        if write_points(curve_node.mapping.curves[0], curve_data):
+            curve_node.mapping.update()
         
     except Exception as e:
         logger.error(f"Error deserializing curve: {e}")
@@ -0,0 +1,226 @@
+"""
+Instantáneas de diagnóstico para la UI de TypeAnimator.
+
+Las estadísticas del sistema (estado de la escena, recuentos de objetos,
+caches, node group, presets y operadores disponibles) se calculan fuera del
+dibujado, en un timer de ``bpy.app.timers``: cada ``REFRESH_INTERVAL``
+segundos o en el siguiente tick tras un evento del bus de ``invalidation``.
+Las funciones ``draw`` solo leen la última instantánea y muestran su edad.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from .constants import CURVE_NODE_GROUP_NAME, DIAGNOSTICS_CONFIG
+    from .letter_registry import get_registry
+    from . import invalidation
+    from .invalidation import InvalidationEvent
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    from constants import CURVE_NODE_GROUP_NAME, DIAGNOSTICS_CONFIG
+    from letter_registry import get_registry
+    import invalidation
+    from invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+# Operadores cuya presencia muestra la checklist del tab de diagnóstico
+CHECKED_OPERATORS = ('create_text_from_input', 'validate_properties', 'comprehensive_test')
+
+# === CÁLCULO ===
+
+def compute_system_status(context) -> Dict[str, Any]:
+    """Estado del sistema para los indicadores de la UI."""
+    status = {
+        'scene_valid': False,
+        'text_objects': 0,
+        'letter_objects': 0,
+        'root_objects': 0,
+        'animation_active': False,
+        'focus_active': False,
+        'errors': [],
+        'warnings': []
+    }
+
+    try:
+        from .utils import validate_scene_state
+
+        # Validar escena
+        scene_valid, scene_msg = validate_scene_state(context)
+        status['scene_valid'] = scene_valid
+
+        if not scene_valid:
+            status['errors'].append(scene_msg)
+
+        # Contar objetos desde el registro de letras
+        counts = get_registry().counts()
+        for key in ('text_objects', 'letter_objects', 'root_objects'):
+            status[key] = counts[key]
+
+        # Verificar foco activo
+        if context.scene.ta_focused_text:
+            status['focus_active'] = True
+
+        # Verificar animación activa (simplificado)
+        if context.scene.frame_current > 1:
+            status['animation_active'] = True
+
+        # Verificar consistencia
+        if status['letter_objects'] > 0 and status['root_objects'] == 0:
+            status['warnings'].append("Letras sin root asociado")
+
+        if status['root_objects'] > 0 and status['letter_objects'] == 0:
+            status['warnings'].append("Roots sin letras asociadas")
+
+    except Exception as e:
+        status['errors'].append(f"Error obteniendo estado: {e}")
+
+    return status
+
+def compute_snapshot(context) -> Dict[str, Any]:
+    """Calcula una instantánea completa de diagnóstico."""
+    start = time.perf_counter()
+    snapshot = {
+        'status': compute_system_status(context),
+        'cache_stats': None,
+        'node_group_present': False,
+        'preset_count': 0,
+        'operators': {},
+        'errors': [],
+    }
+
+    try:
+        from .core import get_cache_stats
+        snapshot['cache_stats'] = get_cache_stats()
+    except Exception as e:
+        snapshot['errors'].append(f"Cache error: {e}")
+
+    try:
+        snapshot['node_group_present'] = CURVE_NODE_GROUP_NAME in bpy.data.node_groups
+    except Exception as e:
+        snapshot['errors'].append(f"Node group error: {e}")
+
+    try:
+        from .presets import get_all_presets
+        snapshot['preset_count'] = len(get_all_presets() or ())
+    except Exception as e:
+        snapshot['errors'].append(f"Preset error: {e}")
+
+    operators = getattr(getattr(bpy, 'ops', None), 'typeanimator', None)
+    snapshot['operators'] = {name: hasattr(operators, name) for name in CHECKED_OPERATORS}
+
+    snapshot['compute_time'] = time.perf_counter() - start
+    snapshot['created'] = time.monotonic()
+    return snapshot
+
+# Claves que cambian en cada instantánea sin que cambie lo que se dibuja
+_VOLATILE_KEYS = ('created', 'compute_time', 'changed')
+
+def _content(snapshot) -> Any:
+    return {key: value for key, value in snapshot.items() if key not in _VOLATILE_KEYS}
+
+# === SERVICIO ===
+
+class DiagnosticsService:
+    """Mantiene la última instantánea y la refresca desde un timer."""
+
+    def __init__(self, interval: Optional[float] = None, poll_interval: Optional[float] = None):
+        self.interval = interval if interval is not None else DIAGNOSTICS_CONFIG['REFRESH_INTERVAL']
+        self.poll_interval = (poll_interval if poll_interval is not None
+                              else DIAGNOSTICS_CONFIG['POLL_INTERVAL'])
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._stale = True
+        self._running = False
+        # Referencia fija: bpy.app.timers compara la función registrada por identidad
+        self._timer = self._tick
+        self.stats = {'refreshes': 0, 'reads': 0}
+
+    def mark_stale(self, _payload=None) -> None:
+        """Pide una instantánea nueva en el próximo tick del timer."""
+        self._stale = True
+
+    def age(self) -> float:
+        """Segundos desde la última instantánea (infinito si no hay)."""
+        if self._snapshot is None:
+            return float('inf')
+        return time.monotonic() - self._snapshot['created']
+
+    def refresh(self, context=None) -> Dict[str, Any]:
+        """Recalcula la instantánea y marca en ``changed`` si su contenido cambió."""
+        if context is None:
+            context = bpy.context
+        previous = self._snapshot
+        self._snapshot = compute_snapshot(context)
+        self._stale = False
+        self.stats['refreshes'] += 1
+        self._snapshot['changed'] = previous is None or _content(previous) != _content(self._snapshot)
+        return self._snapshot
+
+    def get_snapshot(self, context=None) -> Dict[str, Any]:
+        """
+        Última instantánea para el dibujado.
+
+        Solo se calcula aquí la primera vez (antes del primer tick del timer).
+        """
+        self.stats['reads'] += 1
+        if self._snapshot is None:
+            return self.refresh(context)
+        return self._snapshot
+
+    def _tick(self):
+        if not self._running:
+            return None
+        try:
+            if self._stale or self.age() >= self.interval:
+                snapshot = self.refresh()
+                if snapshot.get('changed'):
+                    _tag_redraw()
+        except Exception as e:
+            logger.error(f"Error actualizando diagnóstico: {e}")
+        return self.poll_interval
+
+    def start(self) -> None:
+        """Arranca el timer de refresco."""
+        if self._running or bpy is None:
+            return
+        self._running = True
+        if not bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.register(self._timer, first_interval=self.poll_interval, persistent=True)
+
+    def stop(self) -> None:
+        """Detiene el timer y descarta la instantánea."""
+        self._running = False
+        if bpy is not None and bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.unregister(self._timer)
+        self._snapshot = None
+        self._stale = True
+
+def _tag_redraw() -> None:
+    """Redibuja las regiones de la barra lateral del 3D View."""
+    window_manager = getattr(bpy.context, 'window_manager', None)
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                for region in area.regions:
+                    if region.type == 'UI':
+                        region.tag_redraw()
+
+_service = DiagnosticsService()
+
+def get_diagnostics_service() -> DiagnosticsService:
+    """Servicio compartido por los paneles."""
+    return _service
+
+def get_snapshot(context=None) -> Dict[str, Any]:
+    """Atajo para leer la instantánea vigente."""
+    return _service.get_snapshot(context)
+
+invalidation.subscribe(tuple(InvalidationEvent), _service.mark_stale)
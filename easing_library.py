@@ -1,5 +1,19 @@
 import math
-import bpy
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy no disponible: solo versiones escalares
+    np = None
+
+try:
+    from . import curve_lut
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    import curve_lut
 
 # --- 1. CURVA BÉZIER CENTRALIZADA (global) ---
 # easing_curve = bpy.types.CurveMapping()
@@ -36,30 +50,82 @@ class TA_EasingLibrary:
     preset = 'LINEAR'
 
 # --- 3. SERIALIZACIÓN / EXPORTACIÓN ---
+# Formato plano: todas las coordenadas en un solo array ``location``
+# ([x0, y0, x1, y1, ...], leído/escrito con foreach_get/foreach_set) y los
+# tipos de handle como códigos enteros en ``handle_type``.
+POINTS_FORMAT = 'flat'
+HANDLE_TYPES = ('AUTO', 'AUTO_CLAMPED', 'VECTOR')
+
+def _handle_code(handle_type):
+    if isinstance(handle_type, int):
+        return handle_type if 0 <= handle_type < len(HANDLE_TYPES) else 0
+    return HANDLE_TYPES.index(handle_type) if handle_type in HANDLE_TYPES else 0
+
+def points_to_arrays(points_data):
+    """
+    Convierte puntos serializados a ``(location plano, códigos de handle)``.
+
+    Acepta el formato plano y los formatos anteriores: ``{'points': [{'x', 'y',
+    'handle_type'}]}``, listas de ``{'location': [x, y]}`` y listas de pares ``(x, y)``.
+    """
+    if isinstance(points_data, dict) and 'location' in points_data:
+        location = [float(value) for value in points_data['location']]
+        handles = [_handle_code(code) for code in points_data.get('handle_type', ())]
+    else:
+        if isinstance(points_data, dict):
+            points_data = [(point['x'], point['y'], point.get('handle_type', 'AUTO'))
+                           for point in points_data.get('points', ())]
+        location, handles = [], []
+        for point in points_data:
+            if isinstance(point, dict):
+                point = (point['location'][0], point['location'][1], point.get('handle_type', 'AUTO'))
+            location.extend((float(point[0]), float(point[1])))
+            handles.append(_handle_code(point[2] if len(point) > 2 else 'AUTO'))
+    count = len(location) // 2
+    handles = (handles + [0] * count)[:count]
+    return location[:count * 2], handles
+
+def read_points(curve_map):
+    """Lee todos los puntos de un CurveMap en arrays planos (un foreach_get)."""
+    points = curve_map.points
+    location = [0.0] * (len(points) * 2)
+    points.foreach_get('location', location)
+    return {
+        'format': POINTS_FORMAT,
+        'location': location,
+        'handle_type': [_handle_code(point.handle_type) for point in points],
+    }
+
+def write_points(curve_map, points_data):
+    """
+    Escribe puntos serializados (cualquier formato) en un CurveMap.
+
+    Ajusta el número de puntos y escribe todas las coordenadas con un solo
+    foreach_set. CurveMapPoints no permite altas en bloque ni bajar de dos
+    puntos, así que solo el ajuste de tamaño va punto a punto. La LUT
+    horneada de la curva se descarta.
+    """
+    location, handles = points_to_arrays(points_data)
+    count = len(handles)
+    if count < 2:
+        return False
+    points = curve_map.points
+    while len(points) < count:
+        points.new(0.0, 0.0)
+    while len(points) > count:
+        points.remove(points[-1])
+    points.foreach_set('location', location)
+    for point, code in zip(points, handles):
+        point.handle_type = HANDLE_TYPES[code]
+    curve_lut.invalidate_curve_lut(curve_map)
+    return True
+
 def serialize_curve(curve):
-    points_data = []
-    for pt in curve.curves[0].points:
-        points_data.append({
-            "location": list(pt.location),
-            "handle_left": list(pt.handle_left),
-            "handle_right": list(pt.handle_right)
-        })
-    return points_data
+    return read_points(curve.curves[0])
 
 def deserialize_curve(curve, points_data):
-    pts = curve.curves[0].points
-    # Ajustar número de puntos
-    while len(pts) > len(points_data):
-        pts.remove(pts[-1])
-    while len(pts) < len(points_data):
-        loc = points_data[len(pts)]["location"]
-        pts.new(loc[0], loc[1])
-    for i, pt_data in enumerate(points_data):
-        pt = pts[i]
-        pt.location = pt_data["location"]
-        pt.handle_left = pt_data["handle_left"]
-        pt.handle_right = pt_data["handle_right"]
-    curve.update()
+    if write_points(curve.curves[0], points_data):
+        curve.update()
 
 # --- 4. PLANTILLAS DE PUNTOS PARA PRESETS ---
 def set_easing_preset(preset_name):
@@ -279,7 +345,7 @@ def ease_out_sextic(t):
     return 1 - pow(1 - t, 6)
 
 def ease_in_out_sextic(t):
-    return 64 * t ** 6 if t < 0.5 else 1 - pow(-2 * t + 2, 6) / 2
+    return 32 * t ** 6 if t < 0.5 else 1 - pow(-2 * t + 2, 6) / 2
 
 def ease_in_septic(t):
     return t ** 7
@@ -288,7 +354,7 @@ def ease_out_septic(t):
     return 1 - pow(1 - t, 7)
 
 def ease_in_out_septic(t):
-    return 128 * t ** 7 if t < 0.5 else 1 - pow(-2 * t + 2, 7) / 2
+    return 64 * t ** 7 if t < 0.5 else 1 - pow(-2 * t + 2, 7) / 2
 
 def ease_in_octic(t):
     return t ** 8
@@ -297,7 +363,7 @@ def ease_out_octic(t):
     return 1 - pow(1 - t, 8)
 
 def ease_in_out_octic(t):
-    return 256 * t ** 8 if t < 0.5 else 1 - pow(-2 * t + 2, 8) / 2
+    return 128 * t ** 8 if t < 0.5 else 1 - pow(-2 * t + 2, 8) / 2
 
 # Diccionario de acceso rápido por nombre
 easings = {
@@ -342,3 +408,180 @@ easings = {
     'ease_out_octic': ease_out_octic,
     'ease_in_out_octic': ease_in_out_octic,
 }
+
+# === VARIANTES VECTORIZADAS (NumPy) ===
+# Misma matemática que las funciones escalares, pero array-in / array-out.
+# Las variantes a trozos (in-out, bounce, expo, elastic) evalúan todas las
+# ramas y eligen con np.where / np.select, sin bucles ni ramas por muestra.
+
+BOUNCE_N1 = 7.5625
+BOUNCE_D1 = 2.75
+
+# Exponente de cada familia polinómica
+POWER_EASINGS = {
+    'quad': 2,
+    'cubic': 3,
+    'quart': 4,
+    'quint': 5,
+    'sextic': 6,
+    'septic': 7,
+    'octic': 8,
+}
+
+def _as_array(t):
+    return np.asarray(t, dtype=np.float64)
+
+def _elastic_shift(amplitude, period):
+    return period / (2 * math.pi) * math.asin(1 / amplitude) if amplitude >= 1 else period / 4
+
+def linear_array(t):
+    return _as_array(t).copy()
+
+def ease_in_sine_array(t):
+    return 1 - np.cos((_as_array(t) * math.pi) / 2)
+
+def ease_out_sine_array(t):
+    return np.sin((_as_array(t) * math.pi) / 2)
+
+def ease_in_out_sine_array(t):
+    return -(np.cos(math.pi * _as_array(t)) - 1) / 2
+
+def _power_in_array(power):
+    def ease(t):
+        return _as_array(t) ** power
+    return ease
+
+def _power_out_array(power):
+    def ease(t):
+        return 1 - (1 - _as_array(t)) ** power
+    return ease
+
+def _power_in_out_array(power):
+    def ease(t):
+        t = _as_array(t)
+        return np.where(t < 0.5, 2 ** (power - 1) * t ** power, 1 - (-2 * t + 2) ** power / 2)
+    return ease
+
+def ease_in_expo_array(t):
+    t = _as_array(t)
+    return np.where(t == 0, 0.0, np.exp2(10 * t - 10))
+
+def ease_out_expo_array(t):
+    t = _as_array(t)
+    return np.where(t == 1, 1.0, 1 - np.exp2(-10 * t))
+
+def ease_in_out_expo_array(t):
+    t = _as_array(t)
+    eased = np.where(t < 0.5, np.exp2(20 * t - 10) / 2, (2 - np.exp2(-20 * t + 10)) / 2)
+    return np.where((t == 0) | (t == 1), t, eased)
+
+def ease_in_circ_array(t):
+    t = _as_array(t)
+    return 1 - np.sqrt(np.maximum(1 - t * t, 0.0))
+
+def ease_out_circ_array(t):
+    t = _as_array(t)
+    return np.sqrt(np.maximum(1 - (t - 1) ** 2, 0.0))
+
+def ease_in_out_circ_array(t):
+    t = _as_array(t)
+    first = (1 - np.sqrt(np.maximum(1 - 4 * t * t, 0.0))) / 2
+    second = (np.sqrt(np.maximum(1 - (-2 * t + 2) ** 2, 0.0)) + 1) / 2
+    return np.where(t < 0.5, first, second)
+
+def ease_in_back_array(t, s=1.70158):
+    t = _as_array(t)
+    return s * t * t * ((s + 1) * t - s)
+
+def ease_out_back_array(t, s=1.70158):
+    t = _as_array(t)
+    return 1 + s * (t - 1) ** 3 + s * (t - 1) ** 2
+
+def ease_in_out_back_array(t, s=1.70158):
+    t = _as_array(t)
+    s *= 1.525
+    first = ((2 * t) ** 2 * ((s + 1) * 2 * t - s)) / 2
+    second = ((2 * t - 2) ** 2 * ((s + 1) * (t * 2 - 2) + s) + 2) / 2
+    return np.where(t < 0.5, first, second)
+
+def ease_in_elastic_array(t, amplitude=1, period=0.3):
+    t = _as_array(t)
+    s = _elastic_shift(amplitude, period)
+    eased = -(amplitude * np.exp2(10 * (t - 1)) * np.sin((t - 1 - s) * (2 * math.pi) / period))
+    return np.where((t == 0) | (t == 1), t, eased)
+
+def ease_out_elastic_array(t, amplitude=1, period=0.3):
+    t = _as_array(t)
+    s = _elastic_shift(amplitude, period)
+    eased = amplitude * np.exp2(-10 * t) * np.sin((t - s) * (2 * math.pi) / period) + 1
+    return np.where((t == 0) | (t == 1), t, eased)
+
+def ease_in_out_elastic_array(t, amplitude=1, period=0.45):
+    t = _as_array(t)
+    wave = np.sin((20 * t - 11.125) * (2 * math.pi) / period)
+    first = -0.5 * (amplitude * np.exp2(20 * t - 10) * wave)
+    second = amplitude * np.exp2(-20 * t + 10) * wave * 0.5 + 1
+    return np.where((t == 0) | (t == 1), t, np.where(t < 0.5, first, second))
+
+def ease_out_bounce_array(t):
+    t = _as_array(t)
+    segments = [t < 1 / BOUNCE_D1, t < 2 / BOUNCE_D1, t < 2.5 / BOUNCE_D1]
+    shift = np.select(segments, [0.0, 1.5 / BOUNCE_D1, 2.25 / BOUNCE_D1], 2.625 / BOUNCE_D1)
+    offset = np.select(segments, [0.0, 0.75, 0.9375], 0.984375)
+    t = t - shift
+    return BOUNCE_N1 * t * t + offset
+
+def ease_in_bounce_array(t):
+    return 1 - ease_out_bounce_array(1 - _as_array(t))
+
+def ease_in_out_bounce_array(t):
+    t = _as_array(t)
+    first = (1 - ease_out_bounce_array(1 - 2 * t)) / 2
+    second = (1 + ease_out_bounce_array(2 * t - 1)) / 2
+    return np.where(t < 0.5, first, second)
+
+# Diccionario de acceso rápido por nombre (mismas claves que ``easings``)
+easings_array = {
+    'linear': linear_array,
+    'ease_in_sine': ease_in_sine_array,
+    'ease_out_sine': ease_out_sine_array,
+    'ease_in_out_sine': ease_in_out_sine_array,
+    'ease_in_expo': ease_in_expo_array,
+    'ease_out_expo': ease_out_expo_array,
+    'ease_in_out_expo': ease_in_out_expo_array,
+    'ease_in_circ': ease_in_circ_array,
+    'ease_out_circ': ease_out_circ_array,
+    'ease_in_out_circ': ease_in_out_circ_array,
+    'ease_in_back': ease_in_back_array,
+    'ease_out_back': ease_out_back_array,
+    'ease_in_out_back': ease_in_out_back_array,
+    'ease_in_elastic': ease_in_elastic_array,
+    'ease_out_elastic': ease_out_elastic_array,
+    'ease_in_out_elastic': ease_in_out_elastic_array,
+    'ease_in_bounce': ease_in_bounce_array,
+    'ease_out_bounce': ease_out_bounce_array,
+    'ease_in_out_bounce': ease_in_out_bounce_array,
+}
+for _family, _power in POWER_EASINGS.items():
+    easings_array[f'ease_in_{_family}'] = _power_in_array(_power)
+    easings_array[f'ease_out_{_family}'] = _power_out_array(_power)
+    easings_array[f'ease_in_out_{_family}'] = _power_in_out_array(_power)
+
+def get_array_easing(name):
+    """
+    Devuelve la versión array-in/array-out de un easing.
+
+    Sin NumPy devuelve un envoltorio que aplica la función escalar a cada
+    muestra y devuelve una lista.
+    """
+    if np is not None:
+        return easings_array[name]
+    scalar = easings[name]
+
+    def fallback(t, *args, **kwargs):
+        return [scalar(value, *args, **kwargs) for value in t]
+    return fallback
+
+def ease_array(name, t, *args, **kwargs):
+    """Evalúa el easing ``name`` sobre todas las muestras de ``t``."""
+    return get_array_easing(name)(t, *args, **kwargs)
@@ -0,0 +1,443 @@
+"""
+Motor de evaluación vectorizado para el preview por frame de TypeAnimator.
+
+Calcula en un solo paso, como arrays de NumPy, el tiempo escalonado de cada
+letra, la etapa activa (IN/MID/OUT) y el ``t`` local de la etapa, y escribe
+los transforms resultantes en bloque con ``foreach_set``.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from .constants import ORIG_LOCATION, ORIG_ROTATION, ORIG_SCALE, PERFORMANCE_CONFIG
+    from . import invalidation
+    from .invalidation import InvalidationEvent
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    from constants import ORIG_LOCATION, ORIG_ROTATION, ORIG_SCALE, PERFORMANCE_CONFIG
+    import invalidation
+    from invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+# === ETAPAS ===
+
+STAGE_KEYS = ('in', 'mid', 'out')
+STAGE_IN = 0
+STAGE_MID = 1
+STAGE_OUT = 2
+
+# Umbral bajo el cual una letra se oculta cuando el canal de visibilidad está activo
+VISIBILITY_THRESHOLD = 0.01
+
+# === TIEMPO ===
+
+def global_time(frame: float, start_at: float, duration: float, loop_count: int = 1) -> float:
+    """Tiempo global normalizado (0-1) de la animación para un frame."""
+    duration = max(duration, 1)
+    if loop_count > 1:
+        return ((frame - start_at) % duration) / duration
+    return max(0.0, min(1.0, (frame - start_at) / duration))
+
+def global_times(frames: np.ndarray, start_at: float, duration: float, loop_count: int = 1) -> np.ndarray:
+    """Versión vectorizada de ``global_time`` para un array de frames."""
+    duration = max(duration, 1)
+    frames = np.asarray(frames, dtype=np.float64)
+    if loop_count > 1:
+        return np.mod(frames - start_at, duration) / duration
+    return np.clip((frames - start_at) / duration, 0.0, 1.0)
+
+def letter_times(t_global, count: int, per_char_delay: float, indices: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Tiempo normalizado de cada letra aplicando el escalonado (stagger).
+
+    ``t_global`` puede ser un escalar (resultado de forma ``(count,)``) o un
+    array de frames de forma ``(frames, 1)`` (resultado ``(frames, count)``).
+    Con ``indices`` solo se calculan esas letras.
+    """
+    if indices is None:
+        indices = np.arange(count, dtype=np.float64)
+    offsets = np.asarray(indices, dtype=np.float64) * per_char_delay
+    return np.clip(t_global - offsets, 0.0, 1.0)
+
+def split_stages(t_letters: np.ndarray, in_end: float, out_start: float):
+    """
+    Selecciona la etapa de cada letra y calcula su ``t`` local de etapa.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: códigos de etapa (``STAGE_*``) y ``t`` local (0-1)
+    """
+    stages = np.full(t_letters.shape, STAGE_MID, dtype=np.int8)
+    stages[t_letters < in_end] = STAGE_IN
+    stages[t_letters > out_start] = STAGE_OUT
+
+    t_stage = np.zeros(t_letters.shape, dtype=np.float64)
+
+    mask = stages == STAGE_IN
+    if in_end > 0:
+        t_stage[mask] = t_letters[mask] / in_end
+
+    mask = stages == STAGE_OUT
+    if out_start < 1.0:
+        t_stage[mask] = (t_letters[mask] - out_start) / (1.0 - out_start)
+
+    mask = stages == STAGE_MID
+    if out_start > in_end:
+        t_stage[mask] = (t_letters[mask] - in_end) / (out_start - in_end)
+
+    np.clip(t_stage, 0.0, 1.0, out=t_stage)
+    return stages, t_stage
+
+def evaluate_curve_array(curve, ts: np.ndarray) -> np.ndarray:
+    """Evalúa una curva de etapa para un array de ``t``."""
+    evaluate_array = getattr(curve, 'evaluate_array', None)
+    if evaluate_array is not None:
+        return evaluate_array(ts)
+    return np.fromiter((curve.evaluate(t) for t in ts.tolist()), dtype=np.float64, count=len(ts))
+
+def evaluate_stage_values(stages: np.ndarray, t_stage: np.ndarray, curves: Dict[str, Any]) -> np.ndarray:
+    """Evalúa la curva de la etapa activa de cada letra."""
+    values = np.zeros(t_stage.shape, dtype=np.float64)
+    for code, key in enumerate(STAGE_KEYS):
+        mask = stages == code
+        if mask.any():
+            values[mask] = evaluate_curve_array(curves[key], t_stage[mask])
+    return values
+
+def evaluate_frame(frame: float, count: int, timing: Dict[str, float], curves: Dict[str, Any],
+                   indices: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Evalúa el valor de curva de todas las letras para un frame.
+
+    Args:
+        frame: Frame actual
+        count: Número de letras
+        timing: Diccionario devuelto por ``read_timing``
+        curves: Curvas por etapa (``'in'``, ``'mid'``, ``'out'``)
+        indices: Evaluar solo estas letras (por defecto todas)
+
+    Returns:
+        np.ndarray: Valor de curva por letra (o por índice de ``indices``)
+    """
+    t_global = global_time(frame, timing['start_frame'], timing['duration'], timing['loop_count'])
+    per_char_delay = timing['overlap'] / max(count, 1)
+    t_letters = letter_times(t_global, count, per_char_delay, indices)
+    stages, t_stage = split_stages(t_letters, timing['in_end'], timing['out_start'])
+    return evaluate_stage_values(stages, t_stage, curves)
+
+def evaluate_frames(frames, count: int, timing: Dict[str, float], curves: Dict[str, Any]) -> np.ndarray:
+    """
+    Evalúa el valor de curva de todas las letras en un rango de frames.
+
+    Returns:
+        np.ndarray: Valores de forma ``(len(frames), count)``
+    """
+    t_global = global_times(frames, timing['start_frame'], timing['duration'], timing['loop_count'])
+    per_char_delay = timing['overlap'] / max(count, 1)
+    t_letters = letter_times(t_global[:, np.newaxis], count, per_char_delay)
+    stages, t_stage = split_stages(t_letters, timing['in_end'], timing['out_start'])
+    return evaluate_stage_values(stages, t_stage, curves)
+
+# === VENTANAS DE ACTIVIDAD ===
+
+def is_static_curve(curve) -> bool:
+    """True si la curva (una ``CurveLUT``) da el mismo valor en todo [0, 1]."""
+    samples = getattr(curve, 'samples', None)
+    return samples is not None and len(samples) > 0 and float(np.ptp(samples)) == 0.0
+
+def activity_edges(count: int, timing: Dict[str, float], static_mid: bool = False) -> np.ndarray:
+    """
+    Bordes de los intervalos en que el valor de cada letra cambia.
+
+    La letra ``i`` se mueve entre el inicio de su retardo y el final de la
+    animación; si la curva MID es constante, el tramo MID queda fuera y hay
+    dos ventanas (IN y OUT). Frames en ciclo local (ver ``local_frame``).
+
+    Returns:
+        np.ndarray: Array ``(count, 2)`` o ``(count, 4)`` de bordes crecientes;
+        la letra está activa entre cada par de bordes
+    """
+    start = timing['start_frame']
+    duration = max(timing['duration'], 1)
+    end = start + duration
+    delays = np.arange(count, dtype=np.float64) * (timing['overlap'] / max(count, 1))
+    if static_mid:
+        marks = (0.0, timing['in_end'], timing['out_start'])
+        edges = [start + (delays + mark) * duration for mark in marks]
+        edges.append(np.full(count, end, dtype=np.float64))
+    else:
+        edges = [start + delays * duration, np.full(count, end, dtype=np.float64)]
+    return np.minimum(np.stack(edges, axis=1), end)
+
+def local_frame(frame: float, timing: Dict[str, float]) -> float:
+    """Frame equivalente dentro del primer ciclo cuando la animación hace loop."""
+    if timing['loop_count'] > 1:
+        duration = max(timing['duration'], 1)
+        return timing['start_frame'] + (frame - timing['start_frame']) % duration
+    return frame
+
+def letter_phases(frame: float, edges: np.ndarray, timing: Dict[str, float]) -> np.ndarray:
+    """Número de bordes superados por letra: impar = activa, par = valor constante."""
+    return np.count_nonzero(local_frame(frame, timing) > edges, axis=1)
+
+class ActivityTracker:
+    """
+    Decide qué letras hay que reescribir en cada frame.
+
+    Las letras activas se escriben siempre; las que están fuera de sus
+    ventanas solo cuando cambian de fase (cruzan un borde, saltan de frame o
+    reinicia el loop). Cualquier cambio de ``signature`` fuerza una escritura
+    completa.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._signature = None
+        self._edges = None
+        self._phases = None
+
+    def dirty_indices(self, frame: float, count: int, timing: Dict[str, float],
+                      static_mid: bool, signature: Any) -> np.ndarray:
+        """Índices de las letras a evaluar y escribir en ``frame``."""
+        if signature != self._signature or self._edges is None or len(self._edges) != count:
+            self._signature = signature
+            self._edges = activity_edges(count, timing, static_mid)
+            self._phases = None
+
+        phases = letter_phases(frame, self._edges, timing)
+        if self._phases is None:
+            dirty = np.ones(count, dtype=bool)
+        else:
+            dirty = (phases % 2 == 1) | (phases != self._phases)
+        self._phases = phases
+        return np.flatnonzero(dirty)
+
+_activity_tracker = ActivityTracker()
+
+def get_activity_tracker() -> ActivityTracker:
+    """Tracker compartido por el handler de frame."""
+    return _activity_tracker
+
+# === LECTURA DE PROPIEDADES ===
+
+def read_timing(props) -> Dict[str, float]:
+    """Lee los parámetros de timing y etapas usados por el motor."""
+    timing = props.timing
+    stages = getattr(props, 'stages', None)
+    return {
+        'start_frame': getattr(timing, 'start_frame', 1),
+        'duration': max(getattr(timing, 'duration', 50), 1),
+        'overlap': getattr(timing, 'overlap', 0),
+        'loop_count': getattr(timing, 'loop_count', 1),
+        'in_end': getattr(stages, 'in_end', 0.2),
+        'out_start': getattr(stages, 'out_start', 0.8),
+    }
+
+def read_channel_settings(props) -> Dict[str, Any]:
+    """Lee los flags de canal y sus amplitudes."""
+    return {
+        'loc': bool(getattr(props, 'flags_loc', True)),
+        'loc_amplitude': getattr(props, 'amplitude_loc_x', 1.0),
+        'rot': bool(getattr(props, 'flags_rot', False)),
+        'rot_amplitude': getattr(props, 'amplitude_rot_z', 0.0),
+        'scale': bool(getattr(props, 'flags_scale', False)),
+        'scale_amplitude': getattr(props, 'amplitude_scale', 0.0),
+        'vis': bool(getattr(props, 'flags_vis', False)),
+    }
+
+# === LOTE DE LETRAS ===
+
+def _read_base_vector(letter, key, attr_name, fallback_attr):
+    """Transform base de una letra: propiedad ORIG_* > atributo base_* > valor actual."""
+    try:
+        if key in letter:
+            return tuple(letter[key])
+    except TypeError:
+        pass
+    return tuple(getattr(letter, attr_name, getattr(letter, fallback_attr)))
+
+class LetterBatch:
+    """Letras de un frame con sus transforms base y escritura en bloque."""
+
+    def __init__(self, letters: Sequence[Any]):
+        self.letters = list(letters)
+        self.count = len(self.letters)
+        self.base_location = self._read_bases(ORIG_LOCATION, 'base_location', 'location')
+        self.base_rotation = self._read_bases(ORIG_ROTATION, 'base_rotation', 'rotation_euler')
+        self.base_scale = self._read_bases(ORIG_SCALE, 'base_scale', 'scale')
+        self._slots = None
+        self._slots_size = -1
+
+    def _read_bases(self, key, attr_name, fallback_attr) -> np.ndarray:
+        bases = np.empty((self.count, 3), dtype=np.float64)
+        for i, letter in enumerate(self.letters):
+            bases[i] = _read_base_vector(letter, key, attr_name, fallback_attr)
+        return bases
+
+    def matches(self, letters: Sequence[Any]) -> bool:
+        """Comprobación barata de que el lote sigue describiendo las mismas letras."""
+        try:
+            if len(letters) != self.count:
+                return False
+            if self.count == 0:
+                return True
+            return letters[0] == self.letters[0] and letters[-1] == self.letters[-1]
+        except ReferenceError:
+            return False
+
+    def _resolve_slots(self, objects) -> Optional[np.ndarray]:
+        """Índices de cada letra dentro de ``bpy.data.objects`` para foreach_get/set."""
+        size = len(objects)
+        if self._slots is not None and self._slots_size == size and self._slots_valid(objects):
+            return self._slots
+        # Renombrar objetos reordena la colección sin cambiar su tamaño: se reconstruye
+        index = {name: i for i, name in enumerate(objects.keys())}
+        try:
+            self._slots = np.fromiter(
+                (index[letter.name] for letter in self.letters),
+                dtype=np.int64, count=self.count
+            )
+        except (KeyError, AttributeError, ReferenceError):
+            self._slots = None
+            return None
+        self._slots_size = size
+        if not self._slots_valid(objects):
+            self._slots = None
+        return self._slots
+
+    def _slots_valid(self, objects) -> bool:
+        try:
+            return (objects[int(self._slots[0])] == self.letters[0] and
+                    objects[int(self._slots[-1])] == self.letters[-1])
+        except (IndexError, ReferenceError):
+            return False
+
+    def write(self, location=None, rotation=None, scale=None, hidden=None, indices=None):
+        """
+        Escribe los transforms calculados de todas las letras.
+
+        ``foreach_get``/``foreach_set`` recorren todo ``bpy.data.objects``, así
+        que solo se usan cuando las letras a escribir son al menos
+        ``BULK_WRITE_MIN_SHARE`` de los objetos del archivo; en otro caso (o si
+        las letras no son objetos de Blender) se asignan vectores por letra.
+        Con ``indices`` los valores son solo de esas letras y el resto no se toca.
+        """
+        if not self.count or (indices is not None and len(indices) == 0):
+            return
+        letters = self.letters if indices is None else [self.letters[i] for i in indices]
+        objects = bpy.data.objects if bpy is not None else None
+        slots = None
+        if objects is not None and len(letters) >= len(objects) * PERFORMANCE_CONFIG['BULK_WRITE_MIN_SHARE']:
+            slots = self._resolve_slots(objects)
+        if slots is None:
+            self._write_per_letter(letters, location, rotation, scale, hidden)
+            return
+        if indices is not None:
+            slots = slots[indices]
+
+        size = len(objects)
+        for attr, values in (('location', location), ('rotation_euler', rotation), ('scale', scale)):
+            if values is None:
+                continue
+            buffer = np.empty(size * 3, dtype=np.float32)
+            objects.foreach_get(attr, buffer)
+            buffer = buffer.reshape(size, 3)
+            buffer[slots] = values
+            objects.foreach_set(attr, buffer.ravel())
+
+        if hidden is not None:
+            flags = np.empty(size, dtype=bool)
+            objects.foreach_get('hide_viewport', flags)
+            flags[slots] = hidden
+            objects.foreach_set('hide_viewport', flags)
+
+        # foreach_set no etiqueta el depsgraph
+        for letter in letters:
+            letter.update_tag()
+
+    def _write_per_letter(self, letters, location, rotation, scale, hidden):
+        for i, letter in enumerate(letters):
+            if location is not None:
+                letter.location = location[i]
+            if rotation is not None:
+                letter.rotation_euler = rotation[i]
+            if scale is not None:
+                letter.scale = scale[i]
+            if hidden is not None:
+                letter.hide_viewport = bool(hidden[i])
+
+_letter_batch: Optional[LetterBatch] = None
+
+def get_letter_batch(letters: Sequence[Any]) -> LetterBatch:
+    """Devuelve el lote cacheado si sigue siendo válido o construye uno nuevo."""
+    global _letter_batch
+    if _letter_batch is None or not _letter_batch.matches(letters):
+        _letter_batch = LetterBatch(letters)
+    return _letter_batch
+
+def clear_letter_batch():
+    """Descarta el lote cacheado (p. ej. al desregistrar handlers)."""
+    global _letter_batch
+    _letter_batch = None
+    _activity_tracker.reset()
+
+def _on_letters_changed(_payload=None):
+    clear_letter_batch()
+
+invalidation.subscribe((InvalidationEvent.LETTERS_CHANGED, InvalidationEvent.FILE_LOADED), _on_letters_changed)
+
+# === CANALES ===
+
+def compute_transforms(values: np.ndarray, batch: LetterBatch, channels: Dict[str, Any],
+                       indices: Optional[np.ndarray] = None) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Calcula los transforms de todas las letras según los canales activos.
+
+    ``values`` puede ser ``(count,)`` para un frame o ``(frames, count)`` para
+    un rango; los transforms añaden un último eje de tamaño 3. Con ``indices``
+    los valores corresponden solo a esas letras.
+    """
+    result = {'location': None, 'rotation': None, 'scale': None, 'hidden': None}
+    base_location, base_rotation, base_scale = batch.base_location, batch.base_rotation, batch.base_scale
+    if indices is not None:
+        base_location, base_rotation, base_scale = base_location[indices], base_rotation[indices], base_scale[indices]
+
+    if channels['loc']:
+        location = np.broadcast_to(base_location, values.shape + (3,)).copy()
+        location[..., 0] += values * channels['loc_amplitude']
+        result['location'] = location
+
+    if channels['rot']:
+        rotation = np.broadcast_to(base_rotation, values.shape + (3,)).copy()
+        rotation[..., 2] += values * channels['rot_amplitude']
+        result['rotation'] = rotation
+
+    if channels['scale']:
+        factor = 1.0 + values * channels['scale_amplitude']
+        result['scale'] = base_scale * factor[..., np.newaxis]
+
+    if channels['vis']:
+        result['hidden'] = values < VISIBILITY_THRESHOLD
+
+    return result
+
+def apply_frame(batch: LetterBatch, values: np.ndarray, channels: Dict[str, Any],
+                indices: Optional[np.ndarray] = None):
+    """Calcula y escribe en bloque los transforms de un frame (o de ``indices``)."""
+    transforms = compute_transforms(values, batch, channels, indices)
+    batch.write(
+        location=transforms['location'],
+        rotation=transforms['rotation'],
+        scale=transforms['scale'],
+        hidden=transforms['hidden'],
+        indices=indices,
+    )
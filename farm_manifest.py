@@ -0,0 +1,193 @@
+"""
+Manifiestos de trabajos para el render farm headless de TypeAnimator.
+
+Un manifiesto es un JSON (lista de trabajos u objeto ``{"defaults": {...},
+"jobs": [...]}``) o un NDJSON con un trabajo por línea. Cada trabajo describe
+un texto a separar, animar y hornear::
+
+    {"id": "title_01", "text": "Hola", "preset": "Wave", "font": "fonts/Inter.ttf",
+     "timing": {"start_frame": 1, "duration": 40, "overlap": 5},
+     "output": "out/title_01.blend"}
+
+Este módulo no depende de ``bpy``: el coordinador lo usa para validar y
+repartir los trabajos entre procesos de Blender y para resumir sus informes.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+FRAGMENT_MODES = ('LETTERS', 'WORDS', 'LINES', 'SYLLABLES')
+TIMING_FIELDS = ('start_frame', 'duration', 'overlap')
+RENDER_OUTPUT = 'render'
+BLEND_OUTPUT = 'blend'
+
+class ManifestError(ValueError):
+    """Manifiesto o trabajo inválido (el mensaje indica el trabajo o la línea)."""
+
+def _resolve(path: Optional[str], base_dir: str) -> Optional[str]:
+    if not path:
+        return path
+    path = os.path.expanduser(path)
+    return path if os.path.isabs(path) else os.path.normpath(os.path.join(base_dir, path))
+
+def normalize_job(data: Dict[str, Any], index: int, base_dir: str = '',
+                  defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Valida un trabajo y completa sus valores por defecto.
+
+    Las rutas relativas (``font``, ``output``, ``blend``) se resuelven contra
+    ``base_dir``, el directorio del manifiesto.
+    """
+    if not isinstance(data, dict):
+        raise ManifestError(f"Trabajo {index}: se esperaba un objeto, no {type(data).__name__}")
+    job = dict(defaults or {})
+    job.update(data)
+    job['timing'] = dict((defaults or {}).get('timing', {}), **data.get('timing', {}))
+    job_id = str(job.get('id') or f"job_{index:04d}")
+
+    text = job.get('text')
+    if not isinstance(text, str) or not text.strip():
+        raise ManifestError(f"Trabajo {job_id}: 'text' es obligatorio")
+    if not job.get('output'):
+        raise ManifestError(f"Trabajo {job_id}: 'output' es obligatorio")
+    fragment_mode = str(job.get('fragment_mode', 'LETTERS')).upper()
+    if fragment_mode not in FRAGMENT_MODES:
+        raise ManifestError(f"Trabajo {job_id}: fragment_mode '{fragment_mode}' no válido")
+    unknown = set(job['timing']) - set(TIMING_FIELDS)
+    if unknown:
+        raise ManifestError(f"Trabajo {job_id}: campos de timing desconocidos {sorted(unknown)}")
+
+    output = _resolve(job['output'], base_dir)
+    return {
+        'id': job_id,
+        'index': index,
+        'text': text,
+        'preset': job.get('preset') or None,
+        'font': _resolve(job.get('font'), base_dir),
+        'blend': _resolve(job.get('blend'), base_dir),
+        'timing': job['timing'],
+        'fragment_mode': fragment_mode,
+        'simplify': bool(job.get('simplify', False)),
+        'shared_action': bool(job.get('shared_action', False)),
+        'output': output,
+        'output_type': BLEND_OUTPUT if output.lower().endswith('.blend') else RENDER_OUTPUT,
+    }
+
+def parse_manifest(content: str, ndjson: bool = False, base_dir: str = '') -> List[Dict[str, Any]]:
+    """Parsea el contenido de un manifiesto JSON o NDJSON."""
+    defaults: Dict[str, Any] = {}
+    if ndjson:
+        raw = []
+        for line_number, line in enumerate(content.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                raw.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ManifestError(f"Línea {line_number}: JSON inválido ({e.msg})") from e
+    else:
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ManifestError(f"Manifiesto JSON inválido (línea {e.lineno}: {e.msg})") from e
+        if isinstance(data, dict):
+            defaults = data.get('defaults', {})
+            raw = data.get('jobs', [])
+        else:
+            raw = data
+        if not isinstance(raw, list):
+            raise ManifestError("El manifiesto debe contener una lista de trabajos")
+
+    jobs = [normalize_job(item, index, base_dir, defaults) for index, item in enumerate(raw)]
+    seen = set()
+    for job in jobs:
+        if job['id'] in seen:
+            raise ManifestError(f"Id de trabajo duplicado: {job['id']}")
+        seen.add(job['id'])
+    return jobs
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Lee un manifiesto desde disco (NDJSON según la extensión)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return parse_manifest(content, ndjson=path.lower().endswith(NDJSON_EXTENSIONS),
+                          base_dir=os.path.dirname(os.path.abspath(path)))
+
+# === REPARTO ENTRE WORKERS ===
+
+def job_cost(job: Dict[str, Any]) -> int:
+    """Coste estimado de un trabajo: crece con los caracteres visibles."""
+    return max(len(job['text'].replace(' ', '')), 1)
+
+def shard_jobs(jobs: Iterable[Dict[str, Any]], count: int) -> List[List[Dict[str, Any]]]:
+    """
+    Reparte los trabajos en ``count`` shards equilibrando su coste.
+
+    Asignación voraz (el trabajo más caro va al shard menos cargado); es
+    determinista, así que cada worker puede recalcular su propio shard.
+    """
+    count = max(int(count), 1)
+    shards: List[List[Dict[str, Any]]] = [[] for _ in range(count)]
+    loads = [0] * count
+    for job in sorted(jobs, key=lambda job: (-job_cost(job), job['index'])):
+        target = loads.index(min(loads))
+        shards[target].append(job)
+        loads[target] += job_cost(job)
+    for shard in shards:
+        shard.sort(key=lambda job: job['index'])
+    return shards
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """``"2/4"`` -> ``(2, 4)`` (índice desde 0)."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError as e:
+        raise ManifestError(f"Shard inválido '{value}', se esperaba 'i/N'") from e
+    if count < 1 or not 0 <= index < count:
+        raise ManifestError(f"Shard fuera de rango: {value}")
+    return index, count
+
+# === INFORMES ===
+
+def summarize(results: Iterable[Dict[str, Any]], wall_time: Optional[float] = None) -> Dict[str, Any]:
+    """Resumen de los resultados de todos los workers."""
+    results = sorted(results, key=lambda result: result.get('index', 0))
+    ok = [result for result in results if result.get('status') == 'ok']
+    phases: Dict[str, float] = {}
+    for result in ok:
+        for phase, duration in result.get('timings', {}).items():
+            if phase != 'total':
+                phases[phase] = phases.get(phase, 0.0) + duration
+    job_time = sum(result.get('timings', {}).get('total', 0.0) for result in results)
+    return {
+        'jobs': len(results),
+        'succeeded': len(ok),
+        'failed': len(results) - len(ok),
+        'letters': sum(result.get('letters', 0) for result in ok),
+        'keyframes': sum(result.get('keyframes', 0) for result in ok),
+        'job_time': job_time,
+        'wall_time': wall_time,
+        'phase_time': phases,
+        'slowest': [result['id'] for result in sorted(
+            ok, key=lambda result: -result.get('timings', {}).get('total', 0.0))[:5]],
+        'results': results,
+    }
+
+def format_summary(summary: Dict[str, Any]) -> List[str]:
+    """Líneas legibles del resumen: totales y una línea por trabajo."""
+    lines = [f"TypeAnimator farm: {summary['succeeded']}/{summary['jobs']} trabajos correctos, "
+             f"{summary['letters']} letras, {summary['keyframes']} keyframes"]
+    if summary.get('wall_time') is not None:
+        speedup = summary['job_time'] / summary['wall_time'] if summary['wall_time'] else 0.0
+        lines.append(f"  Tiempo real {summary['wall_time']:.2f}s, suma de trabajos {summary['job_time']:.2f}s "
+                     f"(x{speedup:.1f})")
+    for result in summary['results']:
+        timings = result.get('timings', {})
+        phases = " ".join(f"{phase}={duration:.2f}s" for phase, duration in timings.items() if phase != 'total')
+        status = 'ok' if result.get('status') == 'ok' else f"ERROR: {result.get('error', '')}"
+        lines.append(f"  [{result.get('worker', 0)}] {result['id']:<20} {timings.get('total', 0.0):7.2f}s  "
+                     f"{phases}  {status}")
+    return lines
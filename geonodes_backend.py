@@ -0,0 +1,366 @@
+"""
+Backend de Geometry Nodes para la animación de letras de TypeAnimator.
+
+Alternativa a separar el texto en un objeto por letra: el objeto de texto se
+mantiene como un único objeto con un modificador de Geometry Nodes generado.
+El árbol instancia la geometría de cada carácter (String to Curves + Fill
+Curve) y aplica como math de nodos lo mismo que el motor de ``evaluation``
+hace en el handler de frame: tiempo global, escalonado por ``overlap``,
+selección de etapa IN/MID/OUT, curvas de etapa y amplitudes por canal.
+
+Las curvas del node group ``CURVE_NODE_GROUP_NAME`` se copian a nodos Float
+Curve, y timing/canales se pasan como entradas del modificador. Python solo
+interviene cuando cambian esas entradas (bus de ``invalidation``); la
+reproducción se evalúa íntegramente en C, sin Python por frame.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+from .constants import (
+    ANIMATION_STAGES, CURVE_NODE_GROUP_NAME, GEONODES_TREE_PREFIX, GEONODES_MODIFIER_NAME
+)
+from .animation_plan import DEFAULT_BASE_NAME
+from .letter_registry import get_registry
+from . import evaluation
+from . import invalidation
+from .invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+# Entradas del modificador: (nombre, tipo de socket, valor por defecto)
+INPUTS = (
+    ('Text', 'NodeSocketString', ""),
+    ('Size', 'NodeSocketFloat', 1.0),
+    ('Start Frame', 'NodeSocketFloat', 1.0),
+    ('Duration', 'NodeSocketFloat', 50.0),
+    ('Overlap', 'NodeSocketFloat', 0.0),
+    ('Loop', 'NodeSocketBool', False),
+    ('In End', 'NodeSocketFloat', 0.2),
+    ('Out Start', 'NodeSocketFloat', 0.8),
+    ('Location', 'NodeSocketBool', True),
+    ('Location Amplitude', 'NodeSocketFloat', 1.0),
+    ('Rotation', 'NodeSocketBool', False),
+    ('Rotation Amplitude', 'NodeSocketFloat', 0.0),
+    ('Scale', 'NodeSocketBool', False),
+    ('Scale Amplitude', 'NodeSocketFloat', 0.0),
+    ('Visibility', 'NodeSocketBool', False),
+)
+
+COLUMN_WIDTH = 200
+
+def curve_node_name(stage: str) -> str:
+    """Nombre del nodo Float Curve de una etapa dentro del árbol."""
+    return f"Curve {stage.upper()}"
+
+def tree_name(text_obj) -> str:
+    """Árbol propio por objeto: la fuente y las curvas son por texto."""
+    return f"{GEONODES_TREE_PREFIX}{text_obj.name}"
+
+def input_values(props, text_obj=None) -> Dict[str, Any]:
+    """Valores de las entradas del modificador a partir de las propiedades."""
+    timing = evaluation.read_timing(props)
+    channels = evaluation.read_channel_settings(props)
+    values = {
+        'Start Frame': float(timing['start_frame']),
+        'Duration': float(timing['duration']),
+        'Overlap': float(timing['overlap']),
+        'Loop': timing['loop_count'] > 1,
+        'In End': float(timing['in_end']),
+        'Out Start': float(timing['out_start']),
+        'Location': channels['loc'],
+        'Location Amplitude': float(channels['loc_amplitude']),
+        'Rotation': channels['rot'],
+        'Rotation Amplitude': float(channels['rot_amplitude']),
+        'Scale': channels['scale'],
+        'Scale Amplitude': float(channels['scale_amplitude']),
+        'Visibility': channels['vis'],
+    }
+    if text_obj is not None:
+        values['Text'] = text_obj.data.body
+        values['Size'] = float(text_obj.data.size)
+    return values
+
+# === CONSTRUCCIÓN DEL ÁRBOL ===
+
+def _new_socket(tree, name: str, socket_type: str, in_out: str):
+    if hasattr(tree, 'interface'):  # Blender 4.0+
+        return tree.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    sockets = tree.inputs if in_out == 'INPUT' else tree.outputs
+    return sockets.new(socket_type, name)
+
+def _input_identifiers(tree) -> Dict[str, str]:
+    if hasattr(tree, 'interface'):
+        return {item.name: item.identifier for item in tree.interface.items_tree
+                if item.item_type == 'SOCKET' and item.in_out == 'INPUT'}
+    return {socket.name: socket.identifier for socket in tree.inputs}
+
+class _TreeBuilder:
+    """Crea nodos y enlaces con una disposición por columnas legible."""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def node(self, bl_idname: str, column: int, row: int = 0, **attrs):
+        node = self.tree.nodes.new(bl_idname)
+        node.location = (column * COLUMN_WIDTH, -row * 160)
+        for attr, value in attrs.items():
+            setattr(node, attr, value)
+        return node
+
+    def connect(self, value, socket) -> None:
+        if isinstance(value, (bool, int, float)):
+            socket.default_value = value
+        else:
+            self.tree.links.new(value, socket)
+
+    def math(self, operation: str, a, b=None, column: int = 0, row: int = 0, clamp: bool = False, c=None):
+        node = self.node('ShaderNodeMath', column, row, operation=operation, use_clamp=clamp)
+        for socket, value in zip(node.inputs, (a, b, c)):
+            if value is not None:
+                self.connect(value, socket)
+        return node.outputs[0]
+
+def build_node_tree(name: str, font=None):
+    """
+    Genera el árbol de Geometry Nodes de la animación.
+
+    Los cálculos reproducen ``evaluation.evaluate_frame`` y ``compute_transforms``;
+    la selección de etapa usa máscaras 0/1 (sin nodos Switch) para que el
+    árbol sea el mismo en todas las versiones soportadas.
+    """
+    tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    _new_socket(tree, 'Geometry', 'NodeSocketGeometry', 'INPUT')
+    for socket_name, socket_type, default in INPUTS:
+        socket = _new_socket(tree, socket_name, socket_type, 'INPUT')
+        socket.default_value = default
+    _new_socket(tree, 'Geometry', 'NodeSocketGeometry', 'OUTPUT')
+
+    b = _TreeBuilder(tree)
+    group_in = b.node('NodeGroupInput', 0).outputs
+
+    # Una instancia por carácter
+    strings = b.node('GeometryNodeStringToCurves', 1, 6)
+    if font is not None:
+        strings.font = font
+    b.connect(group_in['Text'], strings.inputs['String'])
+    b.connect(group_in['Size'], strings.inputs['Size'])
+    fill = b.node('GeometryNodeFillCurve', 2, 6)
+    b.connect(strings.outputs['Curve Instances'], fill.inputs['Curve'])
+    glyphs = fill.outputs['Mesh']
+
+    # Tiempo global (0-1), con o sin bucle
+    frame = b.node('GeometryNodeInputSceneTime', 1).outputs['Frame']
+    elapsed = b.math('SUBTRACT', frame, group_in['Start Frame'], 2)
+    once = b.math('DIVIDE', elapsed, group_in['Duration'], 3, clamp=True)
+    wrapped = b.math('WRAP', elapsed, group_in['Duration'], 3, 1, c=0.0)
+    looped = b.math('DIVIDE', wrapped, group_in['Duration'], 4, 1)
+    t_global = b.math('ADD', once, b.math('MULTIPLY', b.math('SUBTRACT', looped, once, 5, 1),
+                                           group_in['Loop'], 6, 1), 7)
+
+    # Escalonado: overlap / número de letras por índice de instancia
+    count = b.node('GeometryNodeAttributeDomainSize', 3, 3, component='INSTANCES')
+    b.connect(glyphs, count.inputs['Geometry'])
+    delay = b.math('DIVIDE', group_in['Overlap'],
+                   b.math('MAXIMUM', count.outputs['Instance Count'], 1.0, 4, 3), 5, 3)
+    index = b.node('GeometryNodeInputIndex', 5, 4).outputs['Index']
+    t_letter = b.math('SUBTRACT', t_global, b.math('MULTIPLY', index, delay, 6, 3), 8, clamp=True)
+
+    # t local de cada etapa y máscara de la etapa activa
+    in_end, out_start = group_in['In End'], group_in['Out Start']
+    stage_t = {
+        'in': b.math('DIVIDE', t_letter, in_end, 9, 0, clamp=True),
+        'mid': b.math('DIVIDE', b.math('SUBTRACT', t_letter, in_end, 9, 1),
+                      b.math('SUBTRACT', out_start, in_end, 9, 2), 10, 1, clamp=True),
+        'out': b.math('DIVIDE', b.math('SUBTRACT', t_letter, out_start, 9, 3),
+                      b.math('SUBTRACT', 1.0, out_start, 9, 4), 10, 3, clamp=True),
+    }
+    is_in = b.math('LESS_THAN', t_letter, in_end, 10, 5)
+    is_out = b.math('GREATER_THAN', t_letter, out_start, 10, 6)
+    masks = {'in': is_in, 'out': is_out,
+             'mid': b.math('SUBTRACT', b.math('SUBTRACT', 1.0, is_in, 11, 5), is_out, 12, 5)}
+
+    value = None
+    for row, stage in enumerate(ANIMATION_STAGES):
+        curve = b.node('ShaderNodeFloatCurve', 11, row * 2, name=curve_node_name(stage),
+                       label=curve_node_name(stage))
+        b.connect(stage_t[stage], curve.inputs['Value'])
+        weighted = b.math('MULTIPLY', curve.outputs['Value'], masks[stage], 13, row)
+        value = weighted if value is None else b.math('ADD', value, weighted, 14, row)
+
+    # Canales: amplitud × flag (un flag apagado anula el canal)
+    def channel(flag, amplitude, row):
+        return b.math('MULTIPLY', b.math('MULTIPLY', value, group_in[amplitude], 15, row),
+                      group_in[flag], 16, row)
+
+    offset = b.node('ShaderNodeCombineXYZ', 17, 0)
+    b.connect(channel('Location', 'Location Amplitude', 0), offset.inputs['X'])
+    turn = b.node('ShaderNodeCombineXYZ', 17, 1)
+    b.connect(channel('Rotation', 'Rotation Amplitude', 1), turn.inputs['Z'])
+    factor = b.math('ADD', 1.0, channel('Scale', 'Scale Amplitude', 2), 17, 2)
+    hidden = b.math('MULTIPLY', b.math('LESS_THAN', value, evaluation.VISIBILITY_THRESHOLD, 15, 3),
+                    group_in['Visibility'], 16, 3)
+
+    translate = b.node('GeometryNodeTranslateInstances', 18, 6)
+    b.connect(glyphs, translate.inputs['Instances'])
+    b.connect(offset.outputs['Vector'], translate.inputs['Translation'])
+    b.connect(False, translate.inputs['Local Space'])
+    rotate = b.node('GeometryNodeRotateInstances', 19, 6)
+    b.connect(translate.outputs['Instances'], rotate.inputs['Instances'])
+    b.connect(turn.outputs['Vector'], rotate.inputs['Rotation'])
+    scale = b.node('GeometryNodeScaleInstances', 20, 6)
+    b.connect(rotate.outputs['Instances'], scale.inputs['Instances'])
+    b.connect(factor, scale.inputs['Scale'])
+    delete = b.node('GeometryNodeDeleteGeometry', 21, 6, domain='INSTANCE')
+    b.connect(scale.outputs['Instances'], delete.inputs['Geometry'])
+    b.connect(hidden, delete.inputs['Selection'])
+
+    group_out = b.node('NodeGroupOutput', 22, 6)
+    b.connect(delete.outputs['Geometry'], group_out.inputs[0])
+    logger.debug(f"Árbol de Geometry Nodes creado: {name} ({len(tree.nodes)} nodos)")
+    return tree
+
+# === SINCRONIZACIÓN ===
+
+def _copy_curve_mapping(source_mapping, target_mapping) -> bool:
+    """Copia puntos y recorte de una CurveMapping; devuelve True si cambió algo."""
+    source, target = source_mapping.curves[0], target_mapping.curves[0]
+    points = [(tuple(point.location), point.handle_type) for point in source.points]
+    if points == [(tuple(point.location), point.handle_type) for point in target.points]:
+        return False
+    while len(target.points) < len(points):
+        target.points.new(0.0, 0.0)
+    while len(target.points) > max(len(points), 2):
+        target.points.remove(target.points[-1])
+    for point, (location, handle_type) in zip(target.points, points):
+        point.location = location
+        point.handle_type = handle_type
+    for attr in ('use_clip', 'clip_min_x', 'clip_min_y', 'clip_max_x', 'clip_max_y'):
+        setattr(target_mapping, attr, getattr(source_mapping, attr))
+    target_mapping.update()
+    return True
+
+def sync_stage_curves(tree, base_name: str = DEFAULT_BASE_NAME) -> bool:
+    """Copia las curvas IN/MID/OUT del node group de curvas a los Float Curve del árbol."""
+    from .curves import get_or_create_curve_node
+    changed = False
+    for stage in ANIMATION_STAGES:
+        source = get_or_create_curve_node(base_name, stage)
+        target = tree.nodes.get(curve_node_name(stage))
+        if source is None or target is None:
+            logger.warning(f"No se pudo sincronizar la curva '{stage}' de {tree.name}")
+            continue
+        changed |= _copy_curve_mapping(source.mapping, target.mapping)
+    return changed
+
+def sync_inputs(text_obj, props) -> bool:
+    """Escribe timing, canales y texto en las entradas del modificador (solo si cambian)."""
+    modifier = text_obj.modifiers.get(GEONODES_MODIFIER_NAME)
+    if modifier is None or modifier.node_group is None:
+        return False
+    identifiers = _input_identifiers(modifier.node_group)
+    changed = False
+    for name, value in input_values(props, text_obj).items():
+        identifier = identifiers.get(name)
+        if identifier is None:
+            continue
+        try:
+            current = modifier[identifier]
+        except KeyError:
+            current = None
+        if current != value:
+            modifier[identifier] = value
+            changed = True
+    if changed:
+        text_obj.update_tag()
+    return changed
+
+# === API PÚBLICA ===
+
+def has_backend(obj) -> bool:
+    """El objeto de texto usa el backend de Geometry Nodes."""
+    return obj is not None and obj.type == 'FONT' and GEONODES_MODIFIER_NAME in obj.modifiers
+
+def backend_objects() -> List[Any]:
+    """Objetos de texto con el modificador del backend."""
+    return [obj for obj in get_registry().text_objects() if has_backend(obj)]
+
+def apply_backend(text_obj, props):
+    """
+    Añade (o actualiza) el modificador de Geometry Nodes en un objeto de texto.
+
+    Returns:
+        El modificador configurado, o None si falló
+    """
+    try:
+        if text_obj is None or text_obj.type != 'FONT':
+            logger.error("El backend de Geometry Nodes requiere un objeto de texto")
+            return None
+        tree = bpy.data.node_groups.get(tree_name(text_obj))
+        if tree is None:
+            tree = build_node_tree(tree_name(text_obj), text_obj.data.font)
+        modifier = text_obj.modifiers.get(GEONODES_MODIFIER_NAME)
+        if modifier is None:
+            modifier = text_obj.modifiers.new(GEONODES_MODIFIER_NAME, 'NODES')
+        modifier.node_group = tree
+        sync_stage_curves(tree, getattr(props, 'base_name', DEFAULT_BASE_NAME))
+        sync_inputs(text_obj, props)
+        logger.info(f"Backend de Geometry Nodes aplicado a {text_obj.name}")
+        return modifier
+    except Exception as e:
+        logger.error(f"Error aplicando el backend de Geometry Nodes: {e}")
+        return None
+
+def remove_backend(text_obj) -> bool:
+    """Quita el modificador y borra el árbol si ya no tiene usuarios."""
+    try:
+        modifier = text_obj.modifiers.get(GEONODES_MODIFIER_NAME)
+        if modifier is None:
+            return False
+        tree = modifier.node_group
+        text_obj.modifiers.remove(modifier)
+        if tree is not None and tree.users == 0:
+            bpy.data.node_groups.remove(tree)
+        return True
+    except Exception as e:
+        logger.error(f"Error quitando el backend de Geometry Nodes: {e}")
+        return False
+
+# === SUSCRIPCIONES ===
+
+def _scene_props():
+    scene = getattr(bpy.context, 'scene', None) if bpy is not None else None
+    return getattr(scene, 'ta_letter_anim_props', None)
+
+def _on_timing_changed(_payload=None) -> None:
+    props = _scene_props()
+    if props is None:
+        return
+    for obj in backend_objects():
+        sync_inputs(obj, props)
+
+def _on_text_changed(name: Optional[str] = None) -> None:
+    obj = bpy.data.objects.get(name) if name else None
+    props = _scene_props()
+    if props is not None and has_backend(obj):
+        sync_inputs(obj, props)
+
+def _on_curve_edited(name: Optional[str] = None) -> None:
+    # Solo se publica para el node group de curvas; el filtro cubre publicaciones manuales
+    if name is not None and name != CURVE_NODE_GROUP_NAME:
+        return
+    props = _scene_props()
+    base_name = getattr(props, 'base_name', DEFAULT_BASE_NAME)
+    for obj in backend_objects():
+        tree = obj.modifiers[GEONODES_MODIFIER_NAME].node_group
+        if tree is not None:
+            sync_stage_curves(tree, base_name)
+
+invalidation.subscribe(InvalidationEvent.TIMING_CHANGED, _on_timing_changed)
+invalidation.subscribe(InvalidationEvent.TEXT_CHANGED, _on_text_changed)
+invalidation.subscribe(InvalidationEvent.CURVE_EDITED, _on_curve_edited)
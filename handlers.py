@@ -1,76 +1,50 @@
 import bpy
-from .curves import get_or_create_curve_node, evaluate_staged_curve
+from .curves import get_or_create_curve_node, evaluate_staged_curve, get_stage_curves
+from . import animation_plan
+from . import diagnostics
+from . import evaluation
+from . import invalidation
+from . import preview_drivers
+from . import subtitle_pool
+from . import profiler
+from .constants import PROFILER_CONFIG
 
 BLEND_WIDTH = 0.05  # Ancho de mezcla entre etapas
 _handler_registered = False
 
 def frame_change_handler(scene):
+    # Subtítulos en pool: texto del cue que empieza en este frame
+    with profiler.section('frame.subtitles'):
+        subtitle_pool.update_pools(scene)
     props = getattr(scene, 'ta_letter_anim_props', None)
-    if not props or not getattr(props, 'enable_live_preview', True):
-        return  # Early exit: preview OFF o sin settings
-    # Recolectar lista de letras
-    letters = getattr(props, 'individual_letters', [])
-    if not letters:
+    if not props:
+        return  # Early exit: sin settings
+    # Plan compilado: curvas, letras, timing y canales ya resueltos
+    with profiler.section('frame.plan'):
+        plan = animation_plan.get_plan(props, get_stage_curves)
+    if not plan.ready:
+        return  # Early exit: preview OFF, sin letras o falta alguna curva
+    frame = scene.frame_current
+    # Solo letras dentro de su ventana de actividad o que acaban de cruzar un borde
+    with profiler.section('frame.activity'):
+        dirty = evaluation.get_activity_tracker().dirty_indices(
+            frame, plan.count, plan.timing, plan.static_mid, plan.version)
+    if not len(dirty):
         return
-    # Curvas por etapa
-    curves = {}
-    for stage in ['in', 'mid', 'out']:
-        node = get_or_create_curve_node(getattr(props, 'base_name', 'DebugObj'), stage)
-        if node and hasattr(node, 'mapping') and hasattr(node.mapping, 'curves') and node.mapping.curves:
-            curves[stage] = node.mapping.curves[0]
-        else:
-            import logging
-            logging.getLogger(__name__).error(f"No se pudo obtener el nodo de curva para la etapa '{stage}' en frame_change_handler. Node: {node}")
-            return  # Early exit si falta alguna curva
-    # Settings de timing
-    start_at = getattr(props.timing, 'start_frame', 1)
-    duration = max(getattr(props.timing, 'duration', 50), 1)
-    overlap = getattr(props.timing, 'overlap', 0)
-    loop_count = getattr(props.timing, 'loop_count', 1)
-    frame_actual = scene.frame_current
-    # Normalización de tiempo
-    t_global = max(0.0, min(1.0, (frame_actual - start_at) / duration))
-    if loop_count > 1:
-        frame_local = (frame_actual - start_at) % duration
-        t_global = frame_local / duration
-    per_char_delay = overlap / max(len(letters), 1)
-    in_end = getattr(props.stages, 'in_end', 0.2)
-    out_start = getattr(props.stages, 'out_start', 0.8)
-    # Caching de transforms iniciales
-    for idx, letter in enumerate(letters):
-        # Stagger/offset
-        t_letra = max(0.0, min(1.0, t_global - (idx * per_char_delay)))
-        # Etapa y t_stage
-        if t_letra < in_end:
-            stage = 'in'
-            t_stage = t_letra / in_end if in_end > 0 else 0.0
-        elif t_letra > out_start:
-            stage = 'out'
-            t_stage = (t_letra - out_start) / (1.0 - out_start) if out_start < 1.0 else 0.0
-        else:
-            stage = 'mid'
-            t_stage = (t_letra - in_end) / (out_start - in_end) if out_start > in_end else 0.0
-        t_stage = max(0.0, min(1.0, t_stage))
-        value = curves[stage].evaluate(t_stage)
-        # Aplicar a canales según flags
-        base_pos = getattr(letter, 'base_location', letter.location.copy())
-        base_rot = getattr(letter, 'base_rotation', letter.rotation_euler.copy())
-        base_scale = getattr(letter, 'base_scale', letter.scale.copy())
-        if getattr(props, 'flags_loc', True):
-            letter.location.x = base_pos.x + value * getattr(props, 'amplitude_loc_x', 1.0)
-        if getattr(props, 'flags_rot', False):
-            letter.rotation_euler.z = base_rot.z + value * getattr(props, 'amplitude_rot_z', 0.0)
-        if getattr(props, 'flags_scale', False):
-            letter.scale = base_scale * (1 + value * getattr(props, 'amplitude_scale', 0.0))
-        if getattr(props, 'flags_vis', False):
-            letter.hide_viewport = value < 0.01
+    # Evaluación vectorizada y escritura en bloque de las letras pendientes
+    with profiler.section('frame.evaluate'):
+        values = evaluation.evaluate_frame(frame, plan.count, plan.timing, plan.curves, dirty)
+    with profiler.section('frame.apply'):
+        evaluation.apply_frame(plan.batch, values, plan.channels, dirty)
     # No keyframes, solo asignación directa
-    # Al cambiar una propiedad relevante, refrescar preview con scene.frame_set(scene.frame_current)
 
 def register_handler():
     global _handler_registered
+    profiler.configure(PROFILER_CONFIG)
     if not _handler_registered and frame_change_handler not in bpy.app.handlers.frame_change_pre:
         bpy.app.handlers.frame_change_pre.append(frame_change_handler)
+        invalidation.register_handlers()
+        preview_drivers.register_namespace()
         _handler_registered = True
 
 def unregister_handler():
@@ -79,6 +53,12 @@ def unregister_handler():
     try:
         if _handler_registered and frame_change_handler in bpy.app.handlers.frame_change_pre:
             bpy.app.handlers.frame_change_pre.remove(frame_change_handler)
+            invalidation.unregister_handlers()
             _handler_registered = False
+        evaluation.clear_letter_batch()
+        animation_plan.clear_plan()
+        subtitle_pool.invalidate()
+        diagnostics.get_diagnostics_service().stop()
+        preview_drivers.unregister_namespace()
     except Exception as e:
         print(f"[typeanimator] handlers.py error: {e}")
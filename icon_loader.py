@@ -18,6 +18,8 @@ def register() -> None:
     if _previews is None:
         logger.debug("bpy.utils.previews not available")
         return
+    if "main" in preview_collections:
+        return
 
     try:
         pcoll = _previews.new()
@@ -47,7 +49,9 @@ def register() -> None:
         ICON_IDS.clear()
 
 def get_icon_id(icon_name: str) -> int:
-    """Get icon ID by name."""
+    """Get icon ID by name (loads the icons on first use)."""
+    if "main" not in preview_collections:
+        register()
     return ICON_IDS.get(icon_name.upper(), 0)
 
 def unregister() -> None:
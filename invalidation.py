@@ -0,0 +1,231 @@
+"""
+Bus de invalidación de caches para TypeAnimator.
+
+Un único handler ``depsgraph_update_post`` (más undo/redo/carga de archivo y
+los callbacks ``update=`` de las propiedades) traduce los cambios de la escena
+a eventos tipados. Cada cache se suscribe a los eventos que le afectan y se
+descarta con precisión en lugar de por heurísticas (claves, escaneos cada N
+frames, búsquedas por nombre).
+"""
+
+import logging
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from .constants import (
+        CURVE_NODE_GROUP_NAME, LETTER_PROPERTY, ANIMATION_GROUP_PROPERTY, ROOT_NAME, ROOT_SUFFIX,
+        EMPTY_TYPE, FONT_TYPE
+    )
+except ImportError:  # Ejecutado fuera del paquete (tests)
+    from constants import (
+        CURVE_NODE_GROUP_NAME, LETTER_PROPERTY, ANIMATION_GROUP_PROPERTY, ROOT_NAME, ROOT_SUFFIX,
+        EMPTY_TYPE, FONT_TYPE
+    )
+
+logger = logging.getLogger(__name__)
+
+class InvalidationEvent(Enum):
+    """Cambios que invalidan caches. El payload es el nombre del datablock o None."""
+    TEXT_CHANGED = 'TEXT_CHANGED'        # Cuerpo o geometría de un objeto de texto
+    CURVE_EDITED = 'CURVE_EDITED'        # Node group con las curvas de etapa (CURVE_NODE_GROUP_NAME)
+    LETTERS_CHANGED = 'LETTERS_CHANGED'  # Letras, roots, textos o grupos añadidos, eliminados o editados
+    TIMING_CHANGED = 'TIMING_CHANGED'    # Propiedades de timing / nombre base
+    FILE_LOADED = 'FILE_LOADED'          # Undo, redo o carga: referencias caducadas
+
+_subscribers: Dict[InvalidationEvent, List[Callable[[Optional[str]], Any]]] = {
+    event: [] for event in InvalidationEvent
+}
+_stats = {event: 0 for event in InvalidationEvent}
+_object_count = -1
+# Puntero -> registro (nombre, padre, marcas) de los objetos indexados vistos en el depsgraph
+_object_records: Dict[int, tuple] = {}
+
+# === SUSCRIPCIÓN ===
+
+def subscribe(events, callback: Callable[[Optional[str]], Any]) -> None:
+    """
+    Suscribe ``callback(payload)`` a uno o varios eventos.
+
+    Suscribir dos veces el mismo callback al mismo evento no tiene efecto.
+    """
+    if isinstance(events, InvalidationEvent):
+        events = (events,)
+    for event in events:
+        if callback not in _subscribers[event]:
+            _subscribers[event].append(callback)
+
+def unsubscribe(events, callback) -> None:
+    """Retira un callback de uno o varios eventos."""
+    if isinstance(events, InvalidationEvent):
+        events = (events,)
+    for event in events:
+        if callback in _subscribers[event]:
+            _subscribers[event].remove(callback)
+
+def publish(event: InvalidationEvent, payload: Optional[str] = None) -> None:
+    """Notifica un evento a todos sus suscriptores; un fallo no detiene al resto."""
+    _stats[event] += 1
+    for callback in list(_subscribers[event]):
+        try:
+            callback(payload)
+        except Exception as e:
+            logger.error(f"Error invalidando cache ({event.value}) en {callback}: {e}")
+
+def get_invalidation_stats() -> Dict[str, int]:
+    """Eventos publicados por tipo."""
+    return {event.value: count for event, count in _stats.items()}
+
+# === CLASIFICACIÓN DEL DEPSGRAPH ===
+
+def _is_curve_node_group(datablock) -> bool:
+    """``True`` para el node group que guarda las curvas de etapa."""
+    if getattr(datablock, 'name', None) != CURVE_NODE_GROUP_NAME:
+        return False
+    node_tree_type = getattr(getattr(bpy, 'types', None), 'NodeTree', None)
+    if node_tree_type is not None:
+        return isinstance(datablock, node_tree_type)
+    return hasattr(datablock, 'nodes')
+
+def _is_object(datablock) -> bool:
+    object_type = getattr(getattr(bpy, 'types', None), 'Object', None)
+    if object_type is not None:
+        return isinstance(datablock, object_type)
+    return hasattr(datablock, 'parent')
+
+def _object_record(obj) -> tuple:
+    """Lo que el registro de letras indexa de un objeto: nombre, padre, tipo y marcas."""
+    parent = obj.parent
+    return (obj.name, parent.name if parent is not None else None, obj.type,
+            bool(obj.get(LETTER_PROPERTY, False)), bool(obj.get(ANIMATION_GROUP_PROPERTY, False)),
+            obj.get(ROOT_NAME))
+
+def _is_indexed(record: tuple) -> bool:
+    name, _parent, obj_type, is_letter, is_group, _root_name = record
+    return is_letter or is_group or obj_type == FONT_TYPE or (obj_type == EMPTY_TYPE and name.endswith(ROOT_SUFFIX))
+
+def _pointer(datablock) -> int:
+    as_pointer = getattr(datablock, 'as_pointer', None)
+    return as_pointer() if as_pointer is not None else id(datablock)
+
+def _letters_changed(obj) -> bool:
+    """
+    ``True`` si un objeto actualizado cambia el índice de letras.
+
+    Cubre lo que el recuento de objetos no ve: renombrados, cambios de padre,
+    marcas de letra nuevas y altas simultáneas a bajas. Las actualizaciones de
+    solo transform (el preview en cada frame) dejan el registro igual.
+    """
+    key = _pointer(obj)
+    record = _object_record(obj)
+    previous = _object_records.get(key)
+    if previous == record:
+        return False
+    indexed = _is_indexed(record)
+    if indexed:
+        _object_records[key] = record
+    else:
+        _object_records.pop(key, None)
+    return indexed or previous is not None
+
+def classify_updates(updates, object_count: int):
+    """
+    Convierte las actualizaciones de un depsgraph en ``(evento, payload)``.
+
+    LETTERS_CHANGED se publica cuando cambia el recuento de objetos o el
+    registro de algún objeto indexado (ver ``_letters_changed``).
+
+    Args:
+        updates: ``depsgraph.updates``
+        object_count: Número actual de objetos (para detectar altas y bajas)
+
+    Returns:
+        List[Tuple[InvalidationEvent, Optional[str]]]: Eventos sin duplicados
+    """
+    global _object_count
+    events = []
+    seen = set()
+
+    def add(event, payload=None):
+        if (event, payload) not in seen:
+            seen.add((event, payload))
+            events.append((event, payload))
+
+    if _object_count >= 0 and object_count != _object_count:
+        add(InvalidationEvent.LETTERS_CHANGED)
+    _object_count = object_count
+
+    for update in updates:
+        datablock = getattr(update, 'id', None)
+        if datablock is None:
+            continue
+        if _is_curve_node_group(datablock):
+            # Solo el node group de las curvas: materiales, árboles animados o los
+            # árboles de Geometry Nodes del addon no invalidan LUTs ni el plan
+            add(InvalidationEvent.CURVE_EDITED, datablock.name)
+            continue
+        if _is_object(datablock) and _letters_changed(datablock):
+            add(InvalidationEvent.LETTERS_CHANGED)
+        if getattr(datablock, 'type', None) == FONT_TYPE and getattr(update, 'is_updated_geometry', False):
+            add(InvalidationEvent.TEXT_CHANGED, getattr(datablock, 'name', None))
+    return events
+
+# === HANDLERS DE BLENDER ===
+
+def _persistent(function):
+    if bpy is None:
+        return function
+    return bpy.app.handlers.persistent(function)
+
+@_persistent
+def depsgraph_update_handler(scene, depsgraph=None):
+    """Publica los eventos de cada actualización del depsgraph."""
+    if depsgraph is None:
+        return
+    try:
+        for event, payload in classify_updates(depsgraph.updates, len(bpy.data.objects)):
+            publish(event, payload)
+    except Exception as e:
+        logger.error(f"Error clasificando actualizaciones del depsgraph: {e}")
+
+@_persistent
+def file_changed_handler(*_args):
+    """Tras undo/redo o cargar un archivo ninguna referencia cacheada es válida."""
+    global _object_count
+    _object_count = -1
+    _object_records.clear()
+    publish(InvalidationEvent.FILE_LOADED)
+
+def on_timing_changed(self, context):
+    """Callback ``update=`` para las propiedades que usa el preview."""
+    publish(InvalidationEvent.TIMING_CHANGED)
+
+_FILE_HANDLERS = ('undo_post', 'redo_post', 'load_post')
+
+def register_handlers() -> None:
+    """Instala los handlers del bus en ``bpy.app.handlers``."""
+    handlers = bpy.app.handlers
+    if depsgraph_update_handler not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(depsgraph_update_handler)
+    for name in _FILE_HANDLERS:
+        handler_list = getattr(handlers, name)
+        if file_changed_handler not in handler_list:
+            handler_list.append(file_changed_handler)
+
+def unregister_handlers() -> None:
+    """Retira los handlers del bus."""
+    global _object_count
+    handlers = bpy.app.handlers
+    if depsgraph_update_handler in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.remove(depsgraph_update_handler)
+    for name in _FILE_HANDLERS:
+        handler_list = getattr(handlers, name)
+        if file_changed_handler in handler_list:
+            handler_list.remove(file_changed_handler)
+    _object_count = -1
+    _object_records.clear()
@@ -0,0 +1,172 @@
+"""
+Reducción de keyframes horneados para TypeAnimator.
+
+Sustituye una muestra por frame por el mínimo de keyframes Bezier que
+reproducen las muestras dentro de una tolerancia: cada tramo se ajusta con
+una cúbica por mínimos cuadrados (handles a 1/3 del tramo, como en las
+F-Curves de Blender) y, si el error máximo supera la tolerancia, se parte en
+la muestra peor ajustada al estilo Ramer–Douglas–Peucker. Los tramos
+constantes quedan en sus dos extremos y una curva constante desaparece.
+
+Solo depende de NumPy y puede probarse fuera de Blender.
+"""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 0.001
+# Fracción de la tolerancia por debajo de la cual un paso entre muestras es plano;
+# baja para no partir en los extremos suaves de una curva, solo en esperas reales
+FLAT_FRACTION = 1e-3
+
+# === TRAMOS ===
+
+def _bernstein(u: np.ndarray) -> np.ndarray:
+    """Base de Bernstein cúbica evaluada en ``u`` (columnas B0..B3)."""
+    v = 1.0 - u
+    return np.stack((v * v * v, 3.0 * v * v * u, 3.0 * v * u * u, u * u * u), axis=1)
+
+def fit_segment(frames: np.ndarray, values: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Ajusta una cúbica Bezier entre la primera y la última muestra.
+
+    Los extremos quedan fijos y solo se ajustan las alturas de los dos
+    handles interiores, situados a 1/3 y 2/3 del tramo en X (así el tiempo es
+    lineal en el parámetro y la curva es exactamente la que evalúa Blender).
+
+    Returns:
+        Tuple[float, float, float]: altura del handle derecho del primer key,
+        altura del handle izquierdo del segundo key y error máximo absoluto
+    """
+    y0, y1 = float(values[0]), float(values[-1])
+    if len(frames) <= 2:
+        return y0 + (y1 - y0) / 3.0, y1 - (y1 - y0) / 3.0, 0.0
+
+    u = (frames - frames[0]) / (frames[-1] - frames[0])
+    v = 1.0 - u
+    b0, b1, b2, b3 = v * v * v, 3.0 * v * v * u, 3.0 * v * u * u, u * u * u
+    target = values - b0 * y0 - b3 * y1
+
+    # Ecuaciones normales 2x2 de mínimos cuadrados para (h1, h2)
+    a11, a12, a22 = float(b1 @ b1), float(b1 @ b2), float(b2 @ b2)
+    r1, r2 = float(b1 @ target), float(b2 @ target)
+    det = a11 * a22 - a12 * a12
+    if abs(det) < 1e-12 * max(a11 * a22, 1e-12):
+        # Muestras simétricas (p. ej. una sola interior): mismo valor en ambos handles
+        h1 = h2 = (r1 + r2) / max(a11 + 2.0 * a12 + a22, 1e-12)
+    else:
+        h1 = (r1 * a22 - r2 * a12) / det
+        h2 = (r2 * a11 - r1 * a12) / det
+    fitted = b0 * y0 + b1 * h1 + b2 * h2 + b3 * y1
+    return h1, h2, float(np.max(np.abs(fitted - values)))
+
+def _segment_error(frames, values, h1, h2) -> np.ndarray:
+    u = (frames - frames[0]) / (frames[-1] - frames[0])
+    fitted = _bernstein(u) @ np.array((values[0], h1, h2, values[-1]))
+    return np.abs(fitted - values)
+
+def is_constant(values: np.ndarray, tolerance: float) -> bool:
+    """Una curva es constante si todas sus muestras caben en la tolerancia."""
+    return len(values) == 0 or float(np.ptp(values)) <= tolerance
+
+def _constant_breaks(values: np.ndarray, tolerance: float) -> List[int]:
+    """Índices que delimitan tramos constantes (inicio y fin de cada uno)."""
+    flat = np.abs(np.diff(values)) <= tolerance * FLAT_FRACTION
+    breaks = {0, len(values) - 1}
+    change = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    breaks.update(change.tolist())
+    return sorted(breaks)
+
+# === REDUCCIÓN ===
+
+def reduce_bezier(frames, values, tolerance: float = DEFAULT_TOLERANCE):
+    """
+    Reduce muestras a keyframes Bezier con error máximo ``tolerance``.
+
+    Args:
+        frames: Frames de las muestras (crecientes)
+        values: Valor horneado en cada frame (la referencia del error)
+        tolerance: Error absoluto máximo permitido en cualquier muestra
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: índices de las
+        muestras conservadas, ``co`` (k, 2), ``handle_left`` (k, 2) y
+        ``handle_right`` (k, 2)
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(frames)
+    if count < 2:
+        keep = np.arange(count)
+        co = np.stack((frames, values), axis=1)
+        return keep, co, co.copy(), co.copy()
+
+    # Los tramos constantes se separan primero: se quedan en sus dos extremos
+    pending = []
+    breaks = _constant_breaks(values, tolerance)
+    for start, end in zip(breaks[:-1], breaks[1:]):
+        pending.append((start, end))
+
+    handles = {}
+    while pending:
+        start, end = pending.pop()
+        segment_frames = frames[start:end + 1]
+        segment_values = values[start:end + 1]
+        h1, h2, error = fit_segment(segment_frames, segment_values)
+        if error <= tolerance or end - start < 2:
+            handles[start] = (h1, h2, end)
+            continue
+        errors = _segment_error(segment_frames, segment_values, h1, h2)
+        split = start + int(np.argmax(errors[1:-1])) + 1
+        pending.append((split, end))
+        pending.append((start, split))
+
+    keep = sorted(set(handles) | {count - 1})
+    keep = np.asarray(keep, dtype=np.int64)
+    co = np.stack((frames[keep], values[keep]), axis=1)
+    handle_left = co.copy()
+    handle_right = co.copy()
+    for position, start in enumerate(keep[:-1].tolist()):
+        h1, h2, end = handles[start]
+        third = (frames[end] - frames[start]) / 3.0
+        handle_right[position] = (frames[start] + third, h1)
+        handle_left[position + 1] = (frames[end] - third, h2)
+
+    # Handles exteriores: prolongan la tangente del tramo contiguo
+    handle_left[0] = 2.0 * co[0] - handle_right[0]
+    handle_right[-1] = 2.0 * co[-1] - handle_left[-1]
+    return keep, co, handle_left, handle_right
+
+def reduce_constant(values, tolerance: float = 0.0) -> np.ndarray:
+    """
+    Índices a conservar de un canal con interpolación CONSTANT.
+
+    Basta el primer frame y cada frame en que el valor cambia.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64)
+    changes = np.flatnonzero(np.abs(np.diff(values)) > tolerance) + 1
+    return np.concatenate(([0], changes)).astype(np.int64)
+
+def evaluate_bezier_keys(co, handle_left, handle_right, frames) -> np.ndarray:
+    """
+    Evalúa keyframes Bezier con handles a 1/3 en los frames dados.
+
+    Sirve para comprobar el error de la reducción contra las muestras.
+    """
+    co = np.asarray(co, dtype=np.float64)
+    frames = np.asarray(frames, dtype=np.float64)
+    if len(co) == 1:
+        return np.full(len(frames), co[0, 1])
+    segment = np.clip(np.searchsorted(co[:, 0], frames, side='right') - 1, 0, len(co) - 2)
+    x0, x1 = co[segment, 0], co[segment + 1, 0]
+    u = np.clip((frames - x0) / (x1 - x0), 0.0, 1.0)
+    basis = _bernstein(u)
+    points = np.stack((co[segment, 1], handle_right[segment, 1],
+                       handle_left[segment + 1, 1], co[segment + 1, 1]), axis=1)
+    return np.einsum('ij,ij->i', basis, points)
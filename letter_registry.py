@@ -0,0 +1,155 @@
+"""
+Registro persistente de letras de TypeAnimator.
+
+Indexa una sola vez los objetos del archivo: textos, roots con su lista de
+letras ordenada por ``letter_index``, letras sueltas y grupos de animación.
+Los redibujados de la UI y los ticks de los handlers consultan el índice
+(coste proporcional a las letras en uso) en lugar de recorrer todos los
+objetos. El índice se reconstruye de forma perezosa cuando el bus de
+``invalidation`` informa de cambios en letras, roots, textos o grupos, undo
+o carga de archivo, o cuando una consulta encuentra un root renombrado.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from .constants import (
+        LETTER_PROPERTY, ANIMATION_GROUP_PROPERTY, ROOT_SUFFIX, ROOT_NAME,
+        EMPTY_TYPE, FONT_TYPE
+    )
+    from . import invalidation
+    from .invalidation import InvalidationEvent
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    from constants import (
+        LETTER_PROPERTY, ANIMATION_GROUP_PROPERTY, ROOT_SUFFIX, ROOT_NAME,
+        EMPTY_TYPE, FONT_TYPE
+    )
+    import invalidation
+    from invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+def _alive(obj) -> bool:
+    try:
+        return obj is not None and obj.name is not None
+    except ReferenceError:
+        return False
+
+def _letter_order(letter):
+    return letter.get("letter_index", 0)
+
+class LetterRegistry:
+    """Índice de roots, letras, textos y grupos de animación del archivo."""
+
+    def __init__(self):
+        self._dirty = True
+        self._roots: Dict[str, Any] = {}
+        self._letters_by_root: Dict[str, List[Any]] = {}
+        self._orphans: List[Any] = []
+        self._texts: List[Any] = []
+        self._groups: List[Any] = []
+        self.stats = {'rebuilds': 0, 'queries': 0}
+
+    def invalidate(self, _payload=None) -> None:
+        """Marca el índice para reconstruirse en la próxima consulta."""
+        self._dirty = True
+
+    def rebuild(self, objects: Optional[Iterable[Any]] = None) -> None:
+        """Recorre los objetos una vez y reconstruye el índice."""
+        if objects is None:
+            objects = bpy.data.objects if bpy is not None else ()
+        roots, letters_by_root, orphans, texts, groups = {}, {}, [], [], []
+        letters = []
+
+        for obj in objects:
+            obj_type = obj.type
+            if obj_type == FONT_TYPE:
+                texts.append(obj)
+            elif obj.get(LETTER_PROPERTY, False):
+                letters.append(obj)
+            elif obj_type == EMPTY_TYPE and obj.name.endswith(ROOT_SUFFIX):
+                roots[obj.name] = obj
+            elif obj_type == EMPTY_TYPE and obj.get(ANIMATION_GROUP_PROPERTY, False):
+                groups.append(obj)
+
+        for letter in letters:
+            parent = letter.parent
+            root_name = parent.name if parent is not None and parent.name in roots else letter.get(ROOT_NAME)
+            if root_name in roots:
+                letters_by_root.setdefault(root_name, []).append(letter)
+            else:
+                orphans.append(letter)
+        for root_letters in letters_by_root.values():
+            root_letters.sort(key=_letter_order)
+
+        self._roots = roots
+        self._letters_by_root = letters_by_root
+        self._orphans = orphans
+        self._texts = texts
+        self._groups = groups
+        self._dirty = False
+        self.stats['rebuilds'] += 1
+        logger.debug(f"Registro de letras reconstruido: {len(roots)} roots, {len(letters)} letras")
+
+    def _roots_renamed(self) -> bool:
+        """Un root renombrado deja sus letras bajo la clave del nombre anterior."""
+        return any(_alive(root) and root.name != name for name, root in self._roots.items())
+
+    def _ensure(self) -> None:
+        self.stats['queries'] += 1
+        if self._dirty or self._roots_renamed():
+            self.rebuild()
+
+    # === CONSULTAS ===
+
+    def roots(self) -> List[Any]:
+        """Roots de separación válidos."""
+        self._ensure()
+        return [root for root in self._roots.values() if _alive(root)]
+
+    def letters_of(self, root) -> List[Any]:
+        """Letras de un root (objeto o nombre), ordenadas por ``letter_index``."""
+        self._ensure()
+        name = root if isinstance(root, str) else root.name
+        return [letter for letter in self._letters_by_root.get(name, ()) if _alive(letter)]
+
+    def all_letters(self, scene=None) -> List[Any]:
+        """Todas las letras (agrupadas por root); con ``scene`` solo las de esa escena."""
+        self._ensure()
+        letters = [letter for root_letters in self._letters_by_root.values() for letter in root_letters]
+        letters.extend(self._orphans)
+        letters = [letter for letter in letters if _alive(letter)]
+        if scene is not None:
+            scene_objects = set(scene.objects)
+            letters = [letter for letter in letters if letter in scene_objects]
+        return letters
+
+    def text_objects(self) -> List[Any]:
+        """Objetos de texto del archivo."""
+        self._ensure()
+        return [text for text in self._texts if _alive(text)]
+
+    def counts(self) -> Dict[str, int]:
+        """Recuentos para diagnóstico y estado de la UI."""
+        self._ensure()
+        return {
+            'text_objects': len(self._texts),
+            'letter_objects': sum(len(letters) for letters in self._letters_by_root.values()) + len(self._orphans),
+            'root_objects': len(self._roots),
+            'animation_groups': len(self._groups),
+            'orphan_letters': len(self._orphans),
+        }
+
+_registry = LetterRegistry()
+
+def get_registry() -> LetterRegistry:
+    """Registro compartido por handlers, UI y utilidades."""
+    return _registry
+
+invalidation.subscribe((InvalidationEvent.LETTERS_CHANGED, InvalidationEvent.FILE_LOADED), _registry.invalidate)
@@ -6,9 +6,10 @@ import logging
 from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, EnumProperty
 from bpy.types import Operator
 from .properties import TA_LetterAnimProperties
-from . import core, presets, icon_loader, utils
+from . import core, presets, icon_loader, utils, geonodes_backend, curve_lut
 from .curves import get_or_create_curve_node
 from .easing_library import serialize_curve
+from .profiler import profiled_execute
 from .constants import (
     CURVE_NODE_GROUP_NAME, LETTER_PROPERTY, ROOT_SUFFIX, 
     ANIMATION_GROUP_SUFFIX, LETTER_PREFIX, MESH_TYPE, EMPTY_TYPE, FONT_TYPE,
@@ -36,6 +37,7 @@ class TA_OT_separate_letters(bpy.types.Operator):
     bl_description = "Separa el texto en letras individuales"
     bl_options = {'REGISTER', 'UNDO'}
     
+    @profiled_execute
     def execute(self, context):
         obj = context.active_object
         if not obj or obj.type != 'FONT':
@@ -45,6 +47,9 @@ class TA_OT_separate_letters(bpy.types.Operator):
         try:
             props = context.scene.ta_letter_anim_props
             root, letters = core.separate_text(obj, props.timing.fragment_mode, props.grouping_tolerance)
+            if root is None or not letters:
+                self.report({'ERROR'}, "No se pudo separar el texto")
+                return {'CANCELLED'}
             
             # Seleccionar el grupo raíz y las letras
             bpy.ops.object.select_all(action='DESELECT')
@@ -53,7 +58,7 @@ class TA_OT_separate_letters(bpy.types.Operator):
                 letter.select_set(True)
             context.view_layer.objects.active = root
             
-            self.report({'INFO'}, f"Texto separado en {len(letters)} letras")
+            self.report({'INFO'}, f"Texto separado en {len(letters)} fragmentos")
             return {'FINISHED'}
             
         except Exception as e:
@@ -67,6 +72,7 @@ class TA_OT_animate_letters(bpy.types.Operator):
     bl_description = "Aplica la animación a las letras seleccionadas"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled_execute
     def execute(self, context):
         props = context.scene.ta_letter_anim_props
         letters = [obj for obj in context.selected_objects 
@@ -91,7 +97,26 @@ class TA_OT_bake_letters(bpy.types.Operator):
     bl_label = "Bake a Keyframes"
     bl_description = "Genera la animación final insertando keyframes en las letras"
     bl_options = {'REGISTER', 'UNDO'}
+
+    simplify: bpy.props.BoolProperty(
+        name="Simplificar Keyframes",
+        description="Reduce los keyframes horneados al mínimo que reproduce la animación dentro de la tolerancia",
+        default=False
+    )
+    simplify_tolerance: bpy.props.FloatProperty(
+        name="Tolerancia",
+        description="Error máximo permitido respecto a los valores horneados",
+        default=0.001,
+        min=0.0,
+        precision=4
+    )
+    shared_action: bpy.props.BoolProperty(
+        name="Acción Compartida (NLA)",
+        description="Hornea una sola acción y la referencia desde cada letra con una tira NLA desplazada por su retardo",
+        default=False
+    )
     
+    @profiled_execute
     def execute(self, context):
         props = context.scene.ta_letter_anim_props
         selected = context.selected_objects
@@ -111,13 +136,54 @@ class TA_OT_bake_letters(bpy.types.Operator):
         try:
             # Eliminar drivers antes de hornear
             core.remove_preview_drivers(letters)
-            core.animate_letters(letters, props, preview=False)
-            self.report({'INFO'}, "Animación horneada a keyframes")
+            stats = core.animate_letters(letters, props, preview=False, simplify=self.simplify,
+                                         simplify_tolerance=self.simplify_tolerance,
+                                         shared_action=self.shared_action)
+            if not stats:
+                self.report({'ERROR'}, "No se pudo hornear la animación")
+                return {'CANCELLED'}
+            self.report({'INFO'}, f"Animación horneada a keyframes: {stats['letters']} letras, "
+                                  f"{stats['frames']} frames, {stats['keyframes']} keyframes "
+                                  f"en {stats['total_time']:.2f}s")
             return {'FINISHED'}
         except Exception as e:
             self.report({'ERROR'}, f"Error al hornear animación: {str(e)}")
             return {'CANCELLED'}
 
+class TA_OT_apply_geonodes_backend(bpy.types.Operator):
+    """Anima el texto como un único objeto con Geometry Nodes"""
+    bl_idname = "typeanimator.apply_geonodes_backend"
+    bl_label = "Animar con Geometry Nodes"
+    bl_description = ("Añade al texto activo un modificador de Geometry Nodes que anima cada carácter "
+                      "sin separar letras ni ejecutar Python por frame")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'FONT':
+            self.report({'ERROR'}, "Selecciona un objeto de texto")
+            return {'CANCELLED'}
+
+        if geonodes_backend.apply_backend(obj, context.scene.ta_letter_anim_props) is None:
+            self.report({'ERROR'}, "No se pudo crear el modificador de Geometry Nodes")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Backend de Geometry Nodes aplicado a {obj.name}")
+        return {'FINISHED'}
+
+class TA_OT_remove_geonodes_backend(bpy.types.Operator):
+    """Quita el modificador de animación de Geometry Nodes del texto"""
+    bl_idname = "typeanimator.remove_geonodes_backend"
+    bl_label = "Quitar Geometry Nodes"
+    bl_description = "Quita el modificador de animación de Geometry Nodes del texto activo"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if not geonodes_backend.remove_backend(context.active_object):
+            self.report({'WARNING'}, "El objeto activo no usa el backend de Geometry Nodes")
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Backend de Geometry Nodes eliminado")
+        return {'FINISHED'}
+
 class TA_OT_reset_anim_props(bpy.types.Operator):
     """Restablece los parámetros de animación a valores por defecto"""
     bl_idname = "typeanimator.reset_anim_props"
@@ -171,6 +237,7 @@ class TA_OT_apply_quick_preset(bpy.types.Operator):
     bl_description = "Aplica el preset rápido seleccionado a toda la animación"
     bl_options = {'REGISTER', 'UNDO'}
     
+    @profiled_execute
     def execute(self, context):
         props = context.scene.ta_letter_anim_props
         
@@ -196,30 +263,20 @@ class TA_OT_apply_animation_preset(bpy.types.Operator):
     bl_description = "Aplica el preset de animación seleccionado a toda la animación"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled_execute
     def execute(self, context):
         props = context.scene.ta_letter_anim_props
         if props.animation_preset == 'NONE':
             self.report({'WARNING'}, "No hay preset de animación seleccionado")
             return {'CANCELLED'}
         try:
-            from .presets import get_all_presets
-            preset_data = get_all_presets().get(props.animation_preset)
+            from .presets import get_preset
+            preset_data = get_preset(props.animation_preset)
             if not preset_data or preset_data.get('subtype') != 'animation':
                 self.report({'ERROR'}, "Preset de animación no válido")
                 return {'CANCELLED'}
-            # Aplicar campos del preset de animación
-            # Ejemplo: duration, overlap, scale_start, amplitude, rot_z, etc.
-            if 'duration' in preset_data:
-                props.timing.duration = preset_data['duration']
-            if 'overlap' in preset_data:
-                props.timing.overlap = preset_data['overlap']
-            if 'scale_start' in preset_data:
-                props.style.text_scale = preset_data['scale_start']
-            if 'amplitude' in preset_data:
-                props.style.amplitude = preset_data['amplitude']
-            if 'rot_z' in preset_data:
-                props.style.text_rotation = preset_data['rot_z']
-            # Puedes añadir más campos según la estructura de tus presets
+            from .preset_manager import apply_preset_data
+            apply_preset_data(props, preset_data)
             self.report({'INFO'}, f"Preset de animación '{props.animation_preset}' aplicado")
             return {'FINISHED'}
         except Exception as e:
@@ -232,6 +289,7 @@ class TA_OT_reload_presets(bpy.types.Operator):
     bl_label = "Recargar Presets"
     bl_description = "Recarga los presets desde los archivos JSON"
     
+    @profiled_execute
     def execute(self, context):
         try:
             presets.load_all_presets()
@@ -328,7 +386,8 @@ class TA_OT_show_cache_stats(bpy.types.Operator):
         stats = get_cache_stats()
         
         if stats:
-            message = f"Cache Stats: {stats['size']}/{stats['max_size']} entradas, {stats['hit_rate']:.1f}% hit rate"
+            message = (f"Cache Stats: {stats['size']}/{stats['max_size']} entradas, {stats['hit_rate']:.1f}% hit rate, "
+                       f"{stats['evictions']} desalojos, {stats['expirations']} expiradas")
             self.report({'INFO'}, message)
         else:
             self.report({'INFO'}, "No hay estadísticas de cache disponibles")
@@ -346,6 +405,85 @@ class TA_OT_optimize_cache(bpy.types.Operator):
         self.report({'INFO'}, f"Cache optimizado, {removed_count} entradas removidas")
         return {'FINISHED'}
 
+class TA_OT_refresh_diagnostics(bpy.types.Operator):
+    """Recalcula ahora la instantánea de diagnóstico"""
+    bl_idname = "typeanimator.refresh_diagnostics"
+    bl_label = "Actualizar Diagnóstico"
+    bl_description = "Recalcula el estado del sistema sin esperar al siguiente refresco automático"
+    
+    def execute(self, context):
+        from .diagnostics import get_diagnostics_service
+        snapshot = get_diagnostics_service().refresh(context)
+        if context.area:
+            context.area.tag_redraw()
+        self.report({'INFO'}, f"Diagnóstico actualizado en {snapshot['compute_time'] * 1000:.1f} ms")
+        return {'FINISHED'}
+
+# === OPERADORES DEL PROFILER ===
+
+class TA_OT_toggle_profiler(bpy.types.Operator):
+    """Activa o desactiva la medición por secciones"""
+    bl_idname = "typeanimator.toggle_profiler"
+    bl_label = "Profiler"
+    bl_description = "Activa o desactiva la medición de tiempos del handler de frame, operadores y presets"
+    
+    def execute(self, context):
+        from .profiler import get_profiler
+        profiler = get_profiler()
+        profiler.enable(not profiler.enabled)
+        if context.area:
+            context.area.tag_redraw()
+        self.report({'INFO'}, f"Profiler {'activado' if profiler.enabled else 'desactivado'}")
+        return {'FINISHED'}
+
+class TA_OT_reset_profiler(bpy.types.Operator):
+    """Descarta las muestras del profiler"""
+    bl_idname = "typeanimator.reset_profiler"
+    bl_label = "Reiniciar Profiler"
+    bl_description = "Descarta los tiempos medidos hasta ahora"
+    
+    def execute(self, context):
+        from .profiler import get_profiler
+        get_profiler().reset()
+        if context.area:
+            context.area.tag_redraw()
+        return {'FINISHED'}
+
+class TA_OT_export_profiler_trace(bpy.types.Operator):
+    """Exporta los tiempos medidos como traza de Chrome"""
+    bl_idname = "typeanimator.export_profiler_trace"
+    bl_label = "Exportar Traza"
+    bl_description = "Guarda los eventos del profiler en JSON para chrome://tracing o Perfetto"
+    
+    filepath: bpy.props.StringProperty(
+        name="Ruta del archivo",
+        description="Archivo JSON de la traza",
+        subtype='FILE_PATH'
+    )
+    
+    @staticmethod
+    def default_filepath():
+        """Traza en la carpeta de configuración; una por proceso en background."""
+        from .constants import PROFILER_TRACE_FILE
+        return utils.get_user_data_path(PROFILER_TRACE_FILE, per_process=bpy.app.background)
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = self.default_filepath()
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        from .profiler import get_profiler
+        filepath = bpy.path.abspath(self.filepath) if self.filepath else self.default_filepath()
+        if not get_profiler().export_chrome_trace(filepath):
+            self.report({'ERROR'}, "No se pudo exportar la traza del profiler")
+            return {'CANCELLED'}
+        for line in get_profiler().report():
+            logger.info(line)
+        self.report({'INFO'}, f"Traza exportada a {filepath}")
+        return {'FINISHED'}
+
 # === OPERADORES DE LOGGING ===
 
 class TA_OT_clear_log_file(bpy.types.Operator):
@@ -677,6 +815,7 @@ class TA_OT_import_preset_bundle(bpy.types.Operator):
                             # Añadir nuevos puntos
                             for x, y in curve_data:
                                 points.new(x, y)
+                            curve_lut.invalidate_curve_lut(curve_node.mapping.curves[0])
                     except Exception as e:
                         logger.warning(f"No se pudo importar curva {stage_name}: {e}")
             
@@ -1602,6 +1741,7 @@ class TA_OT_create_text_from_input(bpy.types.Operator):
     bl_description = "Crea un objeto de texto en la escena con el texto ingresado en el panel"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled_execute
     def execute(self, context):
         props = context.scene.ta_letter_anim_props
         text_value = getattr(props, 'new_text_input', None)
@@ -1626,6 +1766,8 @@ classes = [
     TA_OT_separate_letters,
     TA_OT_animate_letters,
     TA_OT_bake_letters,
+    TA_OT_apply_geonodes_backend,
+    TA_OT_remove_geonodes_backend,
     TA_OT_reset_anim_props,
     
     # Operadores de presets
@@ -1642,6 +1784,12 @@ classes = [
     TA_OT_clear_letter_cache,
     TA_OT_show_cache_stats,
     TA_OT_optimize_cache,
+    TA_OT_refresh_diagnostics,
+    
+    # Operadores del profiler
+    TA_OT_toggle_profiler,
+    TA_OT_reset_profiler,
+    TA_OT_export_profiler_trace,
     
     # Operadores de logging
     TA_OT_clear_log_file,
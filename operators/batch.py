@@ -1,5 +1,6 @@
 import bpy
 from ..properties import TA_LetterAnimProperties
+from .. import core
 
 class OBJECT_OT_batch_apply(bpy.types.Operator):
     """Apply animation to a batch of objects"""
@@ -17,14 +18,33 @@ class OBJECT_OT_batch_apply(bpy.types.Operator):
             targets = [context.active_object] if context.active_object else []
         else:
             targets = list(context.selected_objects)
-        original = props.start_frame
-        for idx, obj in enumerate(targets):
-            if not props.batch_sync:
-                props.start_frame = original + idx * props.batch_offset
-            context.view_layer.objects.active = obj
-            bpy.ops.typeanimator.apply_all()
-        props.start_frame = original
-        return {'FINISHED'}
+        targets = [obj for obj in targets if obj.type == 'FONT']
+        if not targets:
+            self.report({'ERROR'}, "Selecciona al menos un objeto de texto")
+            return {'CANCELLED'}
+
+        timing = props.timing
+        original = timing.start_frame
+        animated = 0
+        try:
+            for idx, obj in enumerate(targets):
+                root, letters = core.separate_text(obj, timing.fragment_mode, props.grouping_tolerance)
+                if root is None or not letters:
+                    self.report({'WARNING'}, f"No se pudo separar '{obj.name}'")
+                    continue
+                if props.batch_sync:
+                    # Mismo timing para todos: drivers de preview compartidos
+                    core.animate_letters(letters, props)
+                else:
+                    # Cada texto desplazado: se hornea para conservar su propio inicio
+                    timing.start_frame = original + idx * props.batch_offset
+                    core.remove_preview_drivers(letters)
+                    core.animate_letters(letters, props, preview=False)
+                animated += 1
+        finally:
+            timing.start_frame = original
+        self.report({'INFO'}, f"Animación aplicada a {animated} textos")
+        return {'FINISHED'} if animated else {'CANCELLED'}
 
 def register():
     bpy.utils.register_class(OBJECT_OT_batch_apply)
@@ -1,46 +1,75 @@
 import bpy
-import re
+import os
 try:
     from bpy_extras.io_utils import ImportHelper
     BASES = (bpy.types.Operator, ImportHelper)
 except Exception:
     BASES = (bpy.types.Operator,)
-from ..properties import TA_LetterAnimProperties
-
-TIME_RE = re.compile(r"(\d\d):(\d\d):(\d\d),(\d\d\d)")
+from ..subtitles import read_cues, frame_range_seconds, SubtitleError
+from .. import subtitle_builder
+from ..profiler import profiled_execute
 
 class OBJECT_OT_import_srt(*BASES):
     bl_idname = "typeanimator.import_srt"
-    bl_label = "Import SRT"
+    bl_label = "Import Subtitles (SRT/VTT/ASS)"
     filename_ext = ".srt"
 
+    filter_glob: bpy.props.StringProperty(
+        default="*.srt;*.vtt;*.ass;*.ssa",
+        options={'HIDDEN'}
+    )
+    with_background: bpy.props.BoolProperty(
+        name="Fondo",
+        description="Añade el fondo de tercio inferior (una malla compartida por todos los cues)",
+        default=True
+    )
+    scene_range_only: bpy.props.BoolProperty(
+        name="Solo rango de la escena",
+        description="Importa solo los cues que se ven entre el frame inicial y final de la escena",
+        default=False
+    )
+    pooled: bpy.props.BoolProperty(
+        name="Reutilizar objetos",
+        description="Crea solo tantos textos como cues se ven a la vez y cambia su texto en cada cue",
+        default=False
+    )
+    shards: bpy.props.IntProperty(
+        name="Procesos",
+        description="Construir los cues en varios procesos de Blender, cada uno en su propio .blend enlazado",
+        default=1,
+        min=1,
+        max=32
+    )
+
+    @profiled_execute
     def execute(self, context):
-        text = open(self.filepath, 'r', encoding='utf-8').read()
-        pattern = re.compile(r"\d+\s+([0-9:,]+)\s+-->\s+([0-9:,]+)\s+(.*?)(?=\n\n|$)", re.S)
-        entries = pattern.findall(text)
         scene = context.scene
-        fps = scene.render.fps
-        for i, (start, end, body) in enumerate(entries, 1):
-            in_frame = self._time_to_frame(start, fps)
-            out_frame = self._time_to_frame(end, fps)
-            curve = bpy.data.curves.new(body=body.replace('\n', ' '), type='FONT')
-            obj = bpy.data.objects.new(f"SRT_{i}", curve)
-            scene.collection.objects.link(obj)
-            obj.location.y = -1.0
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.typeanimator.apply_in(start_frame=in_frame)
-            bpy.ops.typeanimator.apply_out(start_frame=out_frame)
-            # lower third background
-            bpy.ops.mesh.primitive_plane_add(size=3, location=(0, -1.1, 0))
-            bg = context.active_object
-            bpy.ops.typeanimator.apply_in(start_frame=in_frame)
-            bpy.ops.typeanimator.apply_out(start_frame=out_frame)
-        return {'FINISHED'}
+        name = os.path.splitext(os.path.basename(self.filepath))[0]
+        time_range = None
+        if self.scene_range_only:
+            fps = scene.render.fps / scene.render.fps_base
+            time_range = frame_range_seconds(scene.frame_start, scene.frame_end, fps)
+        try:
+            if self.shards > 1 and not self.pooled:
+                cue_count = sum(1 for _cue in read_cues(self.filepath, time_range=time_range))
+                stats = subtitle_builder.build_sharded(scene, self.filepath, cue_count, self.shards, name,
+                                                       self.with_background, time_range=time_range)
+                if stats['errors']:
+                    self.report({'WARNING'}, f"{len(stats['errors'])} procesos fallaron; ver el log")
+                self.report({'INFO'}, f"{cue_count} subtítulos en {stats['linked']} archivos enlazados")
+                return {'FINISHED'} if stats['linked'] else {'CANCELLED'}
 
-    def _time_to_frame(self, t, fps):
-        h, m, s, ms = TIME_RE.match(t).groups()
-        total = int(h)*3600 + int(m)*60 + int(s) + int(ms)/1000.0
-        return int(round(total*fps))
+            cues = list(read_cues(self.filepath, time_range=time_range))
+            _collection, stats = subtitle_builder.import_subtitles(scene, cues, name, self.with_background,
+                                                                   self.pooled)
+        except (OSError, SubtitleError) as e:
+            self.report({'ERROR'}, f"No se pudieron importar los subtítulos: {e}")
+            return {'CANCELLED'}
+        if self.pooled:
+            self.report({'INFO'}, f"{stats['cues']} subtítulos en {stats['pool']} textos ({stats['time']:.2f}s)")
+            return {'FINISHED'}
+        self.report({'INFO'}, f"{stats['cues']} subtítulos importados ({stats['time']:.2f}s)")
+        return {'FINISHED'}
 
 def register():
     bpy.utils.register_class(OBJECT_OT_import_srt)
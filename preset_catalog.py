@@ -0,0 +1,255 @@
+"""
+Catálogo indexado de presets de TypeAnimator.
+
+En lugar de parsear todos los JSON de presets al registrar el addon, el
+catálogo mantiene un manifiesto pequeño (id, nombre, descripción, categoría,
+subtipo y archivo de cada preset, más mtime/tamaño de cada archivo) cacheado
+en disco. Al refrescar solo se vuelven a leer los archivos cuyo mtime o
+tamaño cambió; el cuerpo completo de un preset se carga bajo demanda la
+primera vez que se pide con ``get``.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+ANIMATION_FILE = 'animations.json'
+FIELD_MAP = {'len': 'duration', 'overlap_frames': 'overlap'}
+DEFAULT_DURATION = 50
+DEFAULT_OVERLAP = 5
+
+def normalize_preset(preset_id: str, preset_data: Dict[str, Any], category: str, filepath: str) -> Dict[str, Any]:
+    """Añade categoría/origen, normaliza claves antiguas y completa duración y overlap."""
+    preset_data['category'] = category
+    preset_data['filepath'] = filepath
+    if os.path.basename(filepath) == ANIMATION_FILE:
+        preset_data['subtype'] = 'animation'
+    for old, new in FIELD_MAP.items():
+        if old in preset_data and new not in preset_data:
+            preset_data[new] = preset_data[old]
+    if 'duration' not in preset_data:
+        preset_data['duration'] = DEFAULT_DURATION
+        logger.warning(f"Preset {preset_id} missing 'duration', set to default {DEFAULT_DURATION}")
+    if 'overlap' not in preset_data:
+        preset_data['overlap'] = DEFAULT_OVERLAP
+        logger.warning(f"Preset {preset_id} missing 'overlap', set to default {DEFAULT_OVERLAP}")
+    return preset_data
+
+def catalog_entry(preset_id: str, preset_data: Dict[str, Any], category: str,
+                  filepath: Optional[str]) -> Dict[str, Any]:
+    """Metadatos ligeros de un preset (lo que necesitan enums y listas)."""
+    entry = {
+        'name': preset_data.get('name', preset_id),
+        'description': preset_data.get('description', ""),
+        'category': preset_data.get('category', category),
+        'filepath': filepath,
+    }
+    if filepath and os.path.basename(filepath) == ANIMATION_FILE:
+        entry['subtype'] = 'animation'
+    elif 'subtype' in preset_data:
+        entry['subtype'] = preset_data['subtype']
+    return entry
+
+def _read_json(filepath: str) -> Dict[str, Any]:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {}
+
+class PresetCatalog:
+    """
+    Índice de presets en disco con carga perezosa de cuerpos.
+
+    Args:
+        sources: Tuplas ``(directorio, categoría, prefijo_excluido)`` en orden
+            de prioridad creciente (un id repetido lo define el último origen)
+        manifest_path: Archivo donde cachear el manifiesto (None: solo memoria)
+    """
+
+    def __init__(self, sources: Iterable[Tuple[str, str, Optional[str]]], manifest_path: Optional[str] = None):
+        self.sources = list(sources)
+        self.manifest_path = manifest_path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._bodies: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        self.stats = {'refreshes': 0, 'parsed': 0, 'reused': 0, 'bodies_loaded': 0}
+
+    # === MANIFIESTO ===
+
+    def _load_manifest(self) -> None:
+        if not self.manifest_path or not os.path.exists(self.manifest_path):
+            return
+        try:
+            manifest = _read_json(self.manifest_path)
+            if manifest.get('version') == MANIFEST_VERSION:
+                self._files = manifest.get('files', {})
+        except Exception as e:
+            logger.warning(f"Manifiesto de presets ilegible, se reconstruye: {e}")
+            self._files = {}
+
+    def _save_manifest(self) -> None:
+        if not self.manifest_path:
+            return
+        # Escritura atómica: otra sesión de Blender puede estar leyendo el mismo manifiesto
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': self._files}, f, ensure_ascii=False)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            logger.warning(f"No se pudo guardar el manifiesto de presets: {e}")
+
+    # === INDEXADO ===
+
+    def _scan(self):
+        """Archivos de presets de todos los orígenes: (ruta, categoría, stat)."""
+        for directory, category, excluded_prefix in self.sources:
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                files = sorted((entry for entry in entries if entry.is_file()), key=lambda entry: entry.name)
+            for entry in files:
+                if not entry.name.endswith('.json'):
+                    continue
+                if excluded_prefix and entry.name.startswith(excluded_prefix):
+                    continue
+                yield entry.path, category, entry.stat()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Actualiza el índice releyendo solo los archivos nuevos o modificados.
+
+        Returns:
+            Dict[str, int]: archivos indexados, parseados, reutilizados y eliminados
+        """
+        if not self._loaded:
+            self._load_manifest()
+            self._loaded = True
+
+        result = {'files': 0, 'parsed': 0, 'reused': 0, 'removed': 0}
+        files = {}
+        for filepath, category, stat in self._scan():
+            result['files'] += 1
+            record = self._files.get(filepath)
+            if (record is not None and record.get('mtime') == stat.st_mtime_ns
+                    and record.get('size') == stat.st_size and record.get('category') == category):
+                files[filepath] = record
+                result['reused'] += 1
+                continue
+            try:
+                data = _read_json(filepath)
+            except Exception as e:
+                logger.error(f"Error loading preset file {filepath}: {e}")
+                continue
+            files[filepath] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'category': category,
+                'presets': {preset_id: catalog_entry(preset_id, preset_data, category, filepath)
+                            for preset_id, preset_data in data.items() if isinstance(preset_data, dict)},
+            }
+            self._bodies.pop(filepath, None)
+            result['parsed'] += 1
+
+        removed = set(self._files) - set(files)
+        for filepath in removed:
+            self._bodies.pop(filepath, None)
+        result['removed'] = len(removed)
+
+        changed = result['parsed'] or removed or files.keys() != self._files.keys()
+        self._files = files
+        self._rebuild_entries()
+        if changed:
+            self._save_manifest()
+
+        self.stats['refreshes'] += 1
+        self.stats['parsed'] += result['parsed']
+        self.stats['reused'] += result['reused']
+        logger.info(f"Catálogo de presets: {len(self._entries)} presets en {result['files']} archivos "
+                    f"({result['parsed']} releídos)")
+        return result
+
+    def _rebuild_entries(self) -> None:
+        entries = {}
+        for record in self._files.values():
+            entries.update(record['presets'])
+        for preset_id, data in self._memory.items():
+            entries[preset_id] = catalog_entry(preset_id, data, data.get('category', ''), None)
+        self._entries = entries
+
+    def _ensure(self) -> None:
+        if not self._loaded:
+            self.refresh()
+
+    # === CONSULTAS ===
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Metadatos de todos los presets (sin cargar sus cuerpos)."""
+        self._ensure()
+        return dict(self._entries)
+
+    def entry(self, preset_id: str) -> Optional[Dict[str, Any]]:
+        """Metadatos de un preset."""
+        self._ensure()
+        return self._entries.get(preset_id)
+
+    def __contains__(self, preset_id: str) -> bool:
+        return self.entry(preset_id) is not None
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self._entries)
+
+    def get(self, preset_id: str) -> Optional[Dict[str, Any]]:
+        """Cuerpo completo de un preset; lee su archivo la primera vez."""
+        self._ensure()
+        if preset_id in self._memory:
+            return self._memory[preset_id]
+        entry = self._entries.get(preset_id)
+        if entry is None or not entry.get('filepath'):
+            return None
+        filepath = entry['filepath']
+        body = self._bodies.get(filepath)
+        if body is None:
+            body = self._bodies[filepath] = self._load_bodies(filepath, entry['category'])
+        return body.get(preset_id)
+
+    def _load_bodies(self, filepath: str, category: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = _read_json(filepath)
+        except Exception as e:
+            logger.error(f"Error loading preset file {filepath}: {e}")
+            return {}
+        self.stats['bodies_loaded'] += 1
+        return {preset_id: normalize_preset(preset_id, preset_data, category, filepath)
+                for preset_id, preset_data in data.items() if isinstance(preset_data, dict)}
+
+    # === ALTAS Y BAJAS ===
+
+    def add(self, preset_id: str, preset_data: Dict[str, Any]) -> None:
+        """
+        Registra un preset en memoria (comunidad, bundles importados o recién creados).
+
+        No fuerza el indexado: si el catálogo aún no se ha consultado, el
+        preset se incorpora al índice en el primer ``refresh``.
+        """
+        self._memory[preset_id] = preset_data
+        if self._loaded:
+            self._entries[preset_id] = catalog_entry(preset_id, preset_data, preset_data.get('category', ''), None)
+
+    def remove(self, preset_id: str) -> bool:
+        """Olvida un preset en memoria o del índice (el archivo lo borra quien llama)."""
+        self._ensure()
+        self._memory.pop(preset_id, None)
+        entry = self._entries.pop(preset_id, None)
+        if entry is not None and entry.get('filepath'):
+            record = self._files.get(entry['filepath'])
+            if record is not None:
+                record['presets'].pop(preset_id, None)
+            self._bodies.pop(entry['filepath'], None)
+        return entry is not None
@@ -137,11 +137,7 @@ def load_preset(name: str, props: Any, dir_path: Optional[Path] = None) -> None:
         _dict_to_props(data, props)
         if curve and hasattr(props, "easing_curve"):
             try:
-                mapping = props.easing_curve
-                points = mapping.curves[0].points
-                points.clear()
-                for x, y in curve:
-                    points.new(x, y)
+                easing_library.deserialize_curve(props.easing_curve, curve)
             except Exception:
                 pass
 
@@ -156,8 +152,7 @@ def export_preset_file(path: Path, props: Any) -> Path:
         curve = getattr(props, curve_name, None)
         if curve and hasattr(curve, "curves"):
             try:
-                pts = curve.curves[0].points
-                data[curve_name] = [(float(p.location[0]), float(p.location[1])) for p in pts]
+                data[curve_name] = easing_library.serialize_curve(curve)
             except Exception:
                 pass
     if not path.parent.exists():
@@ -180,10 +175,7 @@ def import_preset_file(path: Path, props: Any) -> None:
             mapping = getattr(props, curve_name)
             if hasattr(mapping, "curves"):
                 try:
-                    points = mapping.curves[0].points
-                    points.clear()
-                    for x, y in curve_data:
-                        points.new(x, y)
+                    easing_library.deserialize_curve(mapping, curve_data)
                 except Exception:
                     pass
     # Importar el resto de propiedades
@@ -191,11 +183,7 @@ def import_preset_file(path: Path, props: Any) -> None:
     _dict_to_props(data, props)
     if curve and hasattr(props, "easing_curve"):
         try:
-            mapping = props.easing_curve
-            points = mapping.curves[0].points
-            points.clear()
-            for x, y in curve:
-                points.new(x, y)
+            easing_library.deserialize_curve(props.easing_curve, curve)
         except Exception:
             pass
 
@@ -450,10 +438,7 @@ def _apply_curves(props, curves_data):
             if hasattr(props, curve_name):
                 curve_mapping = getattr(props, curve_name)
                 if hasattr(curve_mapping, 'curves'):
-                    points = curve_mapping.curves[0].points
-                    points.clear()
-                    for x, y in curve_points:
-                        points.new(x, y)
+                    easing_library.deserialize_curve(curve_mapping, curve_points)
     except Exception as e:
         logger.warning(f"Error aplicando curvas: {e}")
 
@@ -490,6 +475,31 @@ def apply_preset_hierarchy(props):
         logger.error(f"Error aplicando jerarquía de presets: {e}")
         return False
 
+# Campos planos de los presets de animación (animations.json) -> (grupo, propiedad)
+FLAT_PRESET_FIELDS = {
+    'duration': ('timing', 'duration'),
+    'overlap': ('timing', 'overlap'),
+    'scale_start': ('style', 'text_scale'),
+    'amplitude': ('style', 'amplitude'),
+    'rot_z': ('style', 'text_rotation'),
+}
+
+def apply_preset_data(props, preset_data):
+    """
+    Aplica un preset ya cargado, sea por categorías o de campos planos.
+    
+    Args:
+        props: Propiedades del objeto
+        preset_data: Cuerpo del preset (``get_preset``)
+    """
+    if 'categories' in preset_data or 'curves' in preset_data:
+        return apply_preset_with_priority(props, preset_data, PresetPriority.QUICK_PRESET)
+    for key, (group_name, attr) in FLAT_PRESET_FIELDS.items():
+        group = getattr(props, group_name, None)
+        if key in preset_data and group is not None and hasattr(group, attr):
+            setattr(group, attr, preset_data[key])
+    return True
+
 # Funciones dummy para completar el flujo
 def load_preset_by_name(name):
     """Busca y carga el preset por nombre desde la carpeta presets/."""
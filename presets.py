@@ -7,8 +7,10 @@ import json
 import os
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from .constants import PRESETS_DIR, USER_PRESETS_DIR, CURVE_NODE_GROUP_NAME
-from .utils import validate_animation_properties
+from .constants import PRESETS_DIR, USER_PRESETS_DIR, PRESET_CATALOG_FILE, CURVE_NODE_GROUP_NAME
+from .preset_catalog import PresetCatalog
+from .profiler import profiled
+from .utils import validate_animation_properties, get_user_data_path
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +68,6 @@ class AdvancedPresetManager:
     """Advanced preset manager with enhanced functionality."""
     
     def __init__(self):
-        self.presets_cache = {}
         self.user_presets = {}
         self.preset_categories = {
             'quick': 'Quick Presets',
@@ -75,49 +76,26 @@ class AdvancedPresetManager:
             'user': 'User Presets',
             'community': 'Community'
         }
-        self.load_all_presets()
+        # El índice se construye en la primera consulta, no al registrar el addon.
+        # En background (workers en paralelo) el manifiesto queda solo en memoria.
+        self.catalog = PresetCatalog(
+            [(PRESETS_DIR, 'builtin', 'user_'), (USER_PRESETS_DIR, 'user', None)],
+            manifest_path=None if bpy.app.background else get_user_data_path(PRESET_CATALOG_FILE)
+        )
+        self._load_community_presets()
     
     def load_all_presets(self):
-        """Load all presets from various sources."""
+        """Refresh the preset index (only new or modified files are parsed)."""
         try:
-            # Load built-in presets
-            self._load_builtin_presets()
-            # Load user presets
-            self._load_user_presets()
-            # Load community presets
-            self._load_community_presets()
-            logger.info(f"Loaded {len(self.presets_cache)} presets from {len(self.preset_categories)} categories")
-            # Mostrar en consola los nombres de presets detectados
-            print(f"[TypeAnimator] Presets detectados: {list(self.presets_cache.keys())}")
-            print(f"[TypeAnimator] Presets cache: {self.presets_cache}")
-            if not self.presets_cache:
-                print("[TypeAnimator] ERROR: No presets cargados. Verifica la estructura de los archivos .json en la carpeta presets/")
+            result = self.catalog.refresh()
+            logger.info(f"Indexed {len(self.catalog)} presets ({result['parsed']} files parsed, "
+                        f"{result['reused']} unchanged)")
+            if not len(self.catalog):
+                logger.error("No presets indexed. Check the .json files in the presets/ folder")
+            return self.catalog.entries()
         except Exception as e:
             logger.error(f"Error loading presets: {e}")
-    
-    def _load_builtin_presets(self):
-        """Load built-in presets from all JSON files in the presets directory."""
-        try:
-            for filename in os.listdir(PRESETS_DIR):
-                if filename.endswith('.json') and not filename.startswith('user_'):
-                    filepath = os.path.join(PRESETS_DIR, filename)
-                    if os.path.exists(filepath):
-                        self._load_preset_file(filepath, 'builtin')
-        except Exception as e:
-            logger.error(f"Error loading built-in presets: {e}")
-    
-    def _load_user_presets(self):
-        """Load user-created presets."""
-        try:
-            user_preset_dir = USER_PRESETS_DIR
-            if os.path.exists(user_preset_dir):
-                for filename in os.listdir(user_preset_dir):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(user_preset_dir, filename)
-                        self._load_preset_file(filepath, 'user')
-                        
-        except Exception as e:
-            logger.error(f"Error loading user presets: {e}")
+            return {}
     
     def _load_community_presets(self):
         """Load community-contributed presets."""
@@ -155,57 +133,30 @@ class AdvancedPresetManager:
                 }
             }
             
-            self.presets_cache.update(community_presets)
+            for preset_id, preset_data in community_presets.items():
+                self.catalog.add(preset_id, preset_data)
             
         except Exception as e:
             logger.error(f"Error loading community presets: {e}")
     
-    def _load_preset_file(self, filepath: str, category: str):
-        """Load presets from a JSON file."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Process presets and add category information
-            is_animation_file = os.path.basename(filepath) == 'animations.json'
-            field_map = {'len': 'duration', 'overlap_frames': 'overlap'}
-            for preset_id, preset_data in data.items():
-                if isinstance(preset_data, dict):
-                    preset_data['category'] = category
-                    preset_data['filepath'] = filepath
-                    if is_animation_file:
-                        preset_data['subtype'] = 'animation'
-                    # Normalizar claves
-                    for old, new in field_map.items():
-                        if old in preset_data and new not in preset_data:
-                            preset_data[new] = preset_data[old]
-                    # Validar y poner defaults
-                    if 'duration' not in preset_data:
-                        preset_data['duration'] = 50
-                        logger.warning(f"Preset {preset_id} missing 'duration', set to default 50")
-                    if 'overlap' not in preset_data:
-                        preset_data['overlap'] = 5
-                        logger.warning(f"Preset {preset_id} missing 'overlap', set to default 5")
-                    self.presets_cache[preset_id] = preset_data
-                    
-        except Exception as e:
-            logger.error(f"Error loading preset file {filepath}: {e}")
-    
     def get_preset(self, preset_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific preset by ID."""
-        return self.presets_cache.get(preset_id)
+        """Get a specific preset by ID (its file is read on first use)."""
+        return self.catalog.get(preset_id)
     
     def get_presets_by_category(self, category: str) -> Dict[str, Any]:
         """Get all presets in a specific category."""
         return {
-            preset_id: preset_data 
-            for preset_id, preset_data in self.presets_cache.items()
-            if preset_data.get('category') == category
+            preset_id: entry
+            for preset_id, entry in self.catalog.entries().items()
+            if entry.get('category') == category
         }
     
     def get_all_presets(self) -> Dict[str, Any]:
-        """Get all available presets."""
-        return self.presets_cache.copy()
+        """Get the catalog entries (id -> name, description, category, subtype, filepath).
+
+        Use ``get_preset`` for the full preset settings.
+        """
+        return self.catalog.entries()
     
     def create_user_preset(self, name: str, description: str, settings: Dict[str, Any]) -> str:
         """Create a new user preset."""
@@ -225,8 +176,8 @@ class AdvancedPresetManager:
             # Save to user presets directory
             self._save_user_preset(preset_id, preset_data)
             
-            # Add to cache
-            self.presets_cache[preset_id] = preset_data
+            # Add to catalog
+            self.catalog.add(preset_id, preset_data)
             
             logger.info(f"Created user preset: {preset_id}")
             return preset_id
@@ -252,11 +203,9 @@ class AdvancedPresetManager:
     def delete_user_preset(self, preset_id: str) -> bool:
         """Delete a user preset."""
         try:
-            if preset_id in self.presets_cache:
-                preset_data = self.presets_cache[preset_id]
-                
-                # Remove from cache
-                del self.presets_cache[preset_id]
+            if preset_id in self.catalog:
+                # Remove from catalog
+                self.catalog.remove(preset_id)
                 
                 # Remove file
                 filepath = os.path.join(USER_PRESETS_DIR, f"{preset_id}.json")
@@ -285,8 +234,9 @@ class AdvancedPresetManager:
             }
             
             for preset_id in preset_ids:
-                if preset_id in self.presets_cache:
-                    bundle_data['presets'][preset_id] = self.presets_cache[preset_id]
+                preset_data = self.get_preset(preset_id)
+                if preset_data is not None:
+                    bundle_data['presets'][preset_id] = preset_data
             
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(bundle_data, f, indent=2, ensure_ascii=False)
@@ -306,8 +256,8 @@ class AdvancedPresetManager:
             
             imported_count = 0
             for preset_id, preset_data in bundle_data.get('presets', {}).items():
-                if preset_id not in self.presets_cache:
-                    self.presets_cache[preset_id] = preset_data
+                if preset_id not in self.catalog:
+                    self.catalog.add(preset_id, preset_data)
                     imported_count += 1
             
             logger.info(f"Imported {imported_count} presets from bundle: {filepath}")
@@ -421,8 +371,9 @@ class AdvancedPresetManager:
     def get_preset_statistics(self) -> Dict[str, Any]:
         """Get statistics about loaded presets."""
         try:
+            entries = self.catalog.entries()
             stats = {
-                'total_presets': len(self.presets_cache),
+                'total_presets': len(entries),
                 'categories': {},
                 'validation': {
                     'valid': 0,
@@ -432,12 +383,12 @@ class AdvancedPresetManager:
             }
             
             # Count by category
-            for preset_id, preset_data in self.presets_cache.items():
-                category = preset_data.get('category', 'unknown')
+            for preset_id, entry in entries.items():
+                category = entry.get('category', 'unknown')
                 stats['categories'][category] = stats['categories'].get(category, 0) + 1
             
             # Validate all presets
-            for preset_id in self.presets_cache.keys():
+            for preset_id in entries:
                 is_valid, errors = self.validate_preset(preset_id)
                 if is_valid:
                     stats['validation']['valid'] += 1
@@ -456,10 +407,12 @@ _preset_manager = AdvancedPresetManager()
 
 # === PUBLIC API ===
 
+@profiled('presets.load_all')
 def load_all_presets():
     """Load all presets."""
     return _preset_manager.load_all_presets()
 
+@profiled('presets.get_preset')
 def get_preset(preset_id: str):
     """Get a specific preset."""
     return _preset_manager.get_preset(preset_id)
@@ -0,0 +1,229 @@
+"""
+Drivers de preview agrupados para TypeAnimator.
+
+Cada canal animado de cada letra lleva un driver, pero todos llaman a una
+única función registrada en ``bpy.app.driver_namespace``. Esa función evalúa
+el grupo completo de letras una sola vez por frame con el motor vectorizado
+de ``evaluation`` y memoriza el resultado: cada driver solo lee su casilla.
+N letras cuestan una evaluación por frame en lugar de N × canales.
+
+Blender solo evalúa drivers con expresiones de Python si "Auto Run Python
+Scripts" está activado; si no, las letras conservan su transform y el
+preview sigue disponible a través del handler de frame.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from .constants import PREVIEW_DRIVER_CONFIG, ROOT_NAME
+    from .curves import get_stage_curves
+    from .animation_plan import DEFAULT_BASE_NAME
+    from .letter_registry import get_registry
+    from . import evaluation
+    from . import invalidation
+    from .invalidation import InvalidationEvent
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    from constants import PREVIEW_DRIVER_CONFIG, ROOT_NAME
+    from animation_plan import DEFAULT_BASE_NAME  # get_stage_curves lo inyectan los tests
+    from letter_registry import get_registry
+    import evaluation
+    import invalidation
+    from invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+FUNCTION_NAME = PREVIEW_DRIVER_CONFIG['FUNCTION_NAME']
+
+# Flag de canal -> (data_path, índice del array, clave en compute_transforms, eje)
+DRIVER_CHANNELS = {
+    'loc': (('location', 0, 'location', 0),),
+    'rot': (('rotation_euler', 2, 'rotation', 2),),
+    'scale': (('scale', 0, 'scale', 0), ('scale', 1, 'scale', 1), ('scale', 2, 'scale', 2)),
+    'vis': (('hide_viewport', -1, 'hidden', 0),),
+}
+
+# Transform base que devuelve un driver cuyo canal está desactivado
+_BASE_ATTRS = {'location': 'base_location', 'rotation': 'base_rotation', 'scale': 'base_scale'}
+
+def _letter_order(letter):
+    return letter.get("letter_index", 0)
+
+def group_key(letter) -> str:
+    """Grupo de drivers de una letra: su root (o la propia letra si no tiene)."""
+    parent = getattr(letter, 'parent', None)
+    if parent is not None:
+        return parent.name
+    return letter.get(ROOT_NAME) or letter.name
+
+class PreviewGroup:
+    """Letras de un root con sus entradas de evaluación y el memo del último frame."""
+
+    def __init__(self, key: str, letters: Iterable[Any], props):
+        self.key = key
+        self.load(letters, props)
+
+    def load(self, letters: Iterable[Any], props) -> None:
+        """(Re)lee letras, transforms base, timing, canales y curvas."""
+        self.letters = sorted(letters, key=_letter_order)
+        self.count = len(self.letters)
+        self.batch = evaluation.LetterBatch(self.letters)
+        self.timing = evaluation.read_timing(props)
+        self.channels = evaluation.read_channel_settings(props)
+        self.curves = get_stage_curves(getattr(props, 'base_name', DEFAULT_BASE_NAME))
+        self._frame = None
+        self._transforms = None
+
+    def transforms_at(self, frame: float) -> Dict[str, Optional[Any]]:
+        """Transforms de todo el grupo en ``frame``, calculados una vez por frame."""
+        key = round(frame, PREVIEW_DRIVER_CONFIG['PRECISION'])
+        if key != self._frame:
+            if self.curves is None:
+                self._transforms = {'location': None, 'rotation': None, 'scale': None, 'hidden': None}
+            else:
+                values = evaluation.evaluate_frame(frame, self.count, self.timing, self.curves)
+                self._transforms = evaluation.compute_transforms(values, self.batch, self.channels)
+            self._frame = key
+            _stats['evaluations'] += 1
+        return self._transforms
+
+    def value(self, frame: float, index: int, channel: str, axis: int) -> float:
+        """Valor de un canal de una letra (el base si el canal está desactivado)."""
+        data = self.transforms_at(frame)[channel]
+        if data is None:
+            base = getattr(self.batch, _BASE_ATTRS[channel], None) if channel in _BASE_ATTRS else None
+            return float(base[index, axis]) if base is not None else 0.0
+        if data.ndim == 1:
+            return float(data[index])
+        return float(data[index, axis])
+
+_groups: Dict[str, PreviewGroup] = {}
+_stale = False
+_stats = {'calls': 0, 'evaluations': 0}
+
+def _scene_props():
+    scene = getattr(bpy.context, 'scene', None) if bpy is not None else None
+    return getattr(scene, 'ta_letter_anim_props', None)
+
+def _alive(letter) -> bool:
+    try:
+        return letter.name is not None
+    except ReferenceError:
+        return False
+
+def _reload_groups() -> None:
+    """Relee las entradas de los grupos tras un cambio de timing, curvas o archivo."""
+    global _stale
+    _stale = False
+    props = _scene_props()
+    for key in list(_groups):
+        group = _groups[key]
+        letters = get_registry().letters_of(key) or [letter for letter in group.letters if _alive(letter)]
+        if props is None or not letters:
+            del _groups[key]
+            continue
+        group.load(letters, props)
+
+def _get_group(key: str) -> Optional[PreviewGroup]:
+    if _stale:
+        _reload_groups()
+    group = _groups.get(key)
+    if group is None:
+        # Archivo recién abierto: reconstruir el grupo desde el registro de letras
+        letters = get_registry().letters_of(key)
+        props = _scene_props()
+        if letters and props is not None:
+            group = _groups[key] = PreviewGroup(key, letters, props)
+    return group
+
+def preview_value(frame: float, group: str, index: int, channel: str, axis: int = 0) -> float:
+    """
+    Función del driver namespace: valor de un canal de una letra en ``frame``.
+
+    La expresión de cada driver es ``ta_preview(frame, "<root>", i, "<canal>", eje)``.
+    """
+    _stats['calls'] += 1
+    try:
+        state = _get_group(group)
+        if state is None or index >= state.count:
+            return 0.0
+        return state.value(frame, index, channel, axis)
+    except Exception as e:
+        logger.error(f"Error evaluando driver de preview ({group}[{index}].{channel}): {e}")
+        return 0.0
+
+def mark_stale(_payload=None) -> None:
+    """Relee los grupos en la próxima evaluación de drivers."""
+    global _stale
+    _stale = True
+
+def get_driver_stats() -> Dict[str, int]:
+    """Llamadas a la función de drivers frente a evaluaciones reales de grupo."""
+    return dict(_stats, groups=len(_groups))
+
+# === REGISTRO EN EL DRIVER NAMESPACE ===
+
+def register_namespace() -> None:
+    """Publica ``preview_value`` en ``bpy.app.driver_namespace``."""
+    if bpy is not None:
+        bpy.app.driver_namespace[FUNCTION_NAME] = preview_value
+
+def unregister_namespace() -> None:
+    """Retira la función del driver namespace y descarta los grupos."""
+    if bpy is not None and bpy.app.driver_namespace.get(FUNCTION_NAME) is preview_value:
+        del bpy.app.driver_namespace[FUNCTION_NAME]
+    _groups.clear()
+
+# === CREACIÓN Y BORRADO DE DRIVERS ===
+
+def _driver_expression(key: str, index: int, channel: str, axis: int) -> str:
+    return f"{FUNCTION_NAME}(frame, {key!r}, {index}, {channel!r}, {axis})"
+
+def _remove_letter_drivers(letter) -> None:
+    for targets in DRIVER_CHANNELS.values():
+        for data_path, array_index, _channel, _axis in targets:
+            try:
+                letter.driver_remove(data_path, array_index)
+            except TypeError:
+                pass
+
+def setup_preview_drivers(letters: Iterable[Any], props) -> int:
+    """
+    Crea los drivers de preview de las letras agrupadas por root.
+
+    Returns:
+        int: Número de drivers creados
+    """
+    register_namespace()
+    by_key: Dict[str, List[Any]] = {}
+    for letter in letters:
+        by_key.setdefault(group_key(letter), []).append(letter)
+
+    created = 0
+    for key, group_letters in by_key.items():
+        group = _groups[key] = PreviewGroup(key, group_letters, props)
+        for index, letter in enumerate(group.letters):
+            _remove_letter_drivers(letter)
+            for flag, targets in DRIVER_CHANNELS.items():
+                if not group.channels[flag]:
+                    continue
+                for data_path, array_index, channel, axis in targets:
+                    driver = letter.driver_add(data_path, array_index).driver
+                    driver.type = 'SCRIPTED'
+                    driver.expression = _driver_expression(key, index, channel, axis)
+                    created += 1
+    return created
+
+def remove_preview_drivers(letters: Iterable[Any]) -> None:
+    """Elimina los drivers de preview de las letras y olvida sus grupos."""
+    for letter in letters:
+        _remove_letter_drivers(letter)
+        _groups.pop(group_key(letter), None)
+
+invalidation.subscribe((InvalidationEvent.TIMING_CHANGED, InvalidationEvent.CURVE_EDITED,
+                        InvalidationEvent.FILE_LOADED), mark_stale)
@@ -0,0 +1,215 @@
+"""
+Profiler por secciones de TypeAnimator.
+
+Las secciones instrumentadas (handler de frame, operadores, carga de
+presets...) se miden con ``section`` o el decorador ``profiled`` y cada
+duración se guarda en un buffer circular por sección, además de en un
+buffer de eventos para exportar una traza de Chrome (``chrome://tracing``
+o Perfetto). Con el profiler apagado, ``section`` devuelve un contexto
+vacío compartido y ``profiled`` llama directamente a la función, así que
+el coste es una comprobación de un booleano.
+
+Módulo sin dependencias de ``bpy``.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 95, 99)
+TRACE_CATEGORY = 'typeanimator'
+
+class _NullSection:
+    """Contexto vacío para el profiler apagado."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+class _Section:
+    """Mide un bloque y lo registra en el profiler al salir."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, self.profiler.clock() - self.start)
+        return False
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por rango más cercano de una lista ya ordenada (0.0 si está vacía)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(-(-pct * len(sorted_values) // 100)), 1)  # ceil(pct/100 * n)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+class Profiler:
+    """Duraciones recientes por sección y eventos para la traza."""
+
+    def __init__(self, capacity: int = 1024, trace_capacity: int = 20000, slow_threshold: float = 0.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = False
+        self.capacity = capacity
+        self.trace_capacity = trace_capacity
+        self.slow_threshold = slow_threshold
+        self.clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Descarta todas las muestras."""
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._events: Deque[Tuple[str, float, float, int]] = deque(maxlen=self.trace_capacity)
+        self._origin = self.clock()
+
+    def enable(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+    def section(self, name: str):
+        """Contexto que mide su bloque como ``name`` (vacío si el profiler está apagado)."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """Añade una medición (``start`` en el reloj del profiler, segundos)."""
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.capacity)
+            self._counts[name] = 0
+        samples.append(duration)
+        self._counts[name] += 1
+        self._events.append((name, start, duration, threading.get_ident()))
+        if self.slow_threshold and duration > self.slow_threshold:
+            _log_slow(name, start, start + duration)
+
+    # === INFORMES ===
+
+    def sections(self) -> List[str]:
+        return list(self._samples)
+
+    def stats(self, name: str) -> Dict[str, Any]:
+        """Percentiles, media y máximo de las muestras recientes de una sección."""
+        values = sorted(self._samples.get(name, ()))
+        result = {'name': name, 'count': self._counts.get(name, 0), 'samples': len(values),
+                  'mean': sum(values) / len(values) if values else 0.0,
+                  'max': values[-1] if values else 0.0, 'total': sum(values)}
+        for pct in PERCENTILES:
+            result[f'p{pct}'] = percentile(values, pct)
+        return result
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Estadísticas de todas las secciones, de mayor a menor tiempo acumulado."""
+        return sorted((self.stats(name) for name in self._samples), key=lambda s: -s['total'])
+
+    def report(self) -> List[str]:
+        """Líneas legibles del resumen, una sección por línea (tiempos en ms)."""
+        lines = [f"Profiler de TypeAnimator: {len(self._samples)} secciones, {len(self._events)} eventos"]
+        for s in self.summary():
+            lines.append(f"  {s['name']:<28} n={s['count']:<6} p50={s['p50'] * 1000:7.3f} "
+                         f"p95={s['p95'] * 1000:7.3f} p99={s['p99'] * 1000:7.3f} max={s['max'] * 1000:7.3f}")
+        return lines
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Eventos completos (``"ph": "X"``) en el formato de traza de Chrome (microsegundos)."""
+        pid = os.getpid()
+        events = [{'name': name, 'cat': TRACE_CATEGORY, 'ph': 'X', 'pid': pid, 'tid': tid,
+                   'ts': (start - self._origin) * 1e6, 'dur': duration * 1e6}
+                  for name, start, duration, tid in self._events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> bool:
+        """Guarda la traza de Chrome como JSON."""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.chrome_trace(), f)
+            return True
+        except Exception as e:
+            logger.error(f"No se pudo exportar la traza del profiler: {e}")
+            return False
+
+def _log_slow(name: str, start: float, end: float) -> None:
+    """Sección más lenta que el umbral: al log de rendimiento del addon."""
+    try:
+        from .logging_config import log_performance
+    except Exception:  # pragma: no cover - fuera del paquete del addon
+        return
+    log_performance(logger, name, start, end)
+
+_profiler = Profiler()
+
+def get_profiler() -> Profiler:
+    """Profiler compartido por el addon."""
+    return _profiler
+
+def configure(config: Dict[str, Any]) -> Profiler:
+    """Aplica ``PROFILER_CONFIG`` al profiler compartido (vacía las muestras si cambia la capacidad)."""
+    capacity = config.get('CAPACITY', _profiler.capacity)
+    trace_capacity = config.get('TRACE_CAPACITY', _profiler.trace_capacity)
+    if (capacity, trace_capacity) != (_profiler.capacity, _profiler.trace_capacity):
+        _profiler.capacity, _profiler.trace_capacity = capacity, trace_capacity
+        _profiler.reset()
+    _profiler.slow_threshold = config.get('SLOW_SECTION', _profiler.slow_threshold)
+    _profiler.enable(config.get('ENABLED', _profiler.enabled))
+    return _profiler
+
+def section(name: str):
+    """``with section('frame.evaluate'):`` sobre el profiler compartido."""
+    if not _profiler.enabled:
+        return _NULL_SECTION
+    return _Section(_profiler, name)
+
+def profiled(name: Optional[str] = None):
+    """
+    Decorador que mide cada llamada como ``name`` (por defecto ``Clase.metodo``).
+
+    Con el profiler apagado se llama a la función sin más.
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _Section(_profiler, label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def profiled_execute(func):
+    """
+    ``profiled`` para ``Operator.execute``.
+
+    El envoltorio conserva la firma ``(self, context)``: Blender cuenta los
+    argumentos de ``execute`` al registrar la clase.
+    """
+    label = func.__qualname__
+
+    @functools.wraps(func)
+    def execute(self, context):
+        if not _profiler.enabled:
+            return func(self, context)
+        with _Section(_profiler, label):
+            return func(self, context)
+    return execute
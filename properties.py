@@ -1,6 +1,6 @@
 import bpy
 import logging
-from . import presets, icon_loader, easing_library
+from . import presets, icon_loader, easing_library, invalidation
 from .presets import get_all_presets, PresetItem
 
 logger = logging.getLogger(__name__)
@@ -58,12 +58,16 @@ def get_animation_preset_items(self, context):
 # Property Groups
 # ----------------------------------------------------------------
 
+def on_change_animation_input(self, context):
+    """Las propiedades que usa el preview publican un cambio de timing."""
+    invalidation.on_timing_changed(self, context)
+
 def on_change_stage_preset(self, context):
-    from .presets import get_all_presets
+    from .presets import get_preset
     preset_id = self.preset
     if preset_id == 'NONE':
         return
-    preset = get_all_presets().get(preset_id)
+    preset = get_preset(preset_id)
     if not preset:
         print(f"[typeanimator] No se encontró el preset de stage '{preset_id}'")
         return
@@ -76,11 +80,11 @@ def on_change_stage_preset(self, context):
     # Añadir más campos según tu estructura de presets
 
 def on_change_style_preset(self, context):
-    from .presets import get_all_presets
+    from .presets import get_preset
     preset_id = self.style_preset
     if preset_id == 'NONE':
         return
-    preset = get_all_presets().get(preset_id)
+    preset = get_preset(preset_id)
     if not preset:
         print(f"[typeanimator] No se encontró el style preset '{preset_id}'")
         return
@@ -91,11 +95,11 @@ def on_change_style_preset(self, context):
     # Añadir más campos según tu estructura de presets
 
 def on_change_material_preset(self, context):
-    from .presets import get_all_presets
+    from .presets import get_preset
     preset_id = self.material_preset
     if preset_id == 'NONE':
         return
-    preset = get_all_presets().get(preset_id)
+    preset = get_preset(preset_id)
     if not preset:
         print(f"[typeanimator] No se encontró el material preset '{preset_id}'")
         return
@@ -157,7 +161,8 @@ class TA_TimingProperties(bpy.types.PropertyGroup):
         name="Start Frame",
         description="Starting frame for animation",
         default=1,
-        min=1
+        min=1,
+        update=on_change_animation_input
     )
     end_frame = bpy.props.IntProperty(
         name="End Frame",
@@ -169,13 +174,15 @@ class TA_TimingProperties(bpy.types.PropertyGroup):
         name="Duration",
         description="Duration of animation per letter",
         default=50,
-        min=1
+        min=1,
+        update=on_change_animation_input
     )
     overlap = bpy.props.IntProperty(
         name="Overlap",
         description="Overlap between letters",
         default=5,
-        min=0
+        min=0,
+        update=on_change_animation_input
     )
     animation_mode = bpy.props.EnumProperty(
         name="Animation Mode",
@@ -193,6 +200,7 @@ class TA_TimingProperties(bpy.types.PropertyGroup):
         items=[
             ('LETTERS', "Letters", "Separate by letters"),
             ('WORDS', "Words", "Separate by words"),
+            ('LINES', "Lines", "Separate by lines"),
             ('SYLLABLES', "Syllables", "Separate by syllables")
         ],
         default='LETTERS'
@@ -422,7 +430,8 @@ class TA_LetterAnimProperties(bpy.types.PropertyGroup):
     base_name = bpy.props.StringProperty(
         name="Base Name",
         description="Base name for curve nodes",
-        default=""
+        default="",
+        update=on_change_animation_input
     )
     grouping_tolerance = bpy.props.FloatProperty(
         name="Grouping Tolerance",
@@ -498,11 +507,11 @@ class TA_LetterAnimProperties(bpy.types.PropertyGroup):
     )
     # Preset duplicado removido (se usará quick_preset / animation_preset)
     def on_change_animation_preset(self, context):
-        from .presets import get_all_presets
+        from .presets import get_preset
         preset_id = self.animation_preset
         if preset_id == 'NONE':
             return
-        preset = get_all_presets().get(preset_id)
+        preset = get_preset(preset_id)
         if not preset:
             print(f"[typeanimator] No se encontró el preset de animación '{preset_id}'")
             return
@@ -6,9 +6,10 @@ from .logging_config import setup_logging
 from .handlers import register_handler, unregister_handler
 from .constants import (
     CURVE_NODE_GROUP_NAME, SCENE_PROPERTIES, WM_PROPERTIES, 
-    INFO_MESSAGES, ERROR_MESSAGES
+    INFO_MESSAGES, ERROR_MESSAGES, STARTUP_CONFIG, STARTUP_PROFILE_FILE
 )
 from .curves import get_or_create_curve_node_group
+from .startup import DeferredTasks, get_startup_profile
 
 try:
     logger = setup_logging()
@@ -56,48 +57,127 @@ _registration_flags = {
     'handlers_registered': False
 }
 
+# Módulos cuyo register() se ejecutó (los diferidos u omitidos no se desregistran)
+_registered_modules = set()
+
+# Módulos necesarios también en modo background (render y scripts headless)
+CORE_MODULES = (
+    ('utils', utils),
+    ('operators', operators),
+    ('styles', styles),
+    ('preset_manager', preset_manager),
+    ('core', core),
+    ('preview', preview),
+)
+
+_profile = get_startup_profile()
+_deferred = DeferredTasks(_profile)
+
+def _register_module(module_name, module, optional=False):
+    """Registra un módulo midiendo su paso en el perfil de arranque."""
+    if not hasattr(module, 'register'):
+        logger.warning(f"Módulo '{module_name}' no tiene método register")
+        return
+    try:
+        with _profile.step(module_name):
+            module.register()
+        _registered_modules.add(module_name)
+        logger.debug(f"Módulo {'opcional ' if optional else ''}'{module_name}' registrado")
+    except Exception as e:
+        if not optional:
+            logger.error(f"Error registrando módulo '{module_name}': {e}")
+            raise
+        logger.warning(f"Error registrando módulo opcional '{module_name}': {e}")
+
+def _deferred_module(module_name, module):
+    """Tarea diferida que registra un módulo de UI (medida como paso diferido)."""
+    def _register():
+        module.register()
+        _registered_modules.add(module_name)
+    return _register
+
+def _refresh_preset_enums():
+    properties.update_preset_enums()
+    properties.update_anim_preset_enum()
+
+def _restore_settings():
+    load_last_settings()
+    from bpy import context
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def _start_diagnostics():
+    from .diagnostics import get_diagnostics_service
+    get_diagnostics_service().start()
+
+def _queue_ui_step(name, func, background):
+    """Encola un paso solo de UI; en background queda omitido."""
+    if background:
+        _profile.skip(name, "background")
+    else:
+        _deferred.add(name, func)
+
+def _finish_profile():
+    """
+    Escribe el perfil de arranque en el log y, en sesiones con UI, en disco.
+
+    En background (workers de render en paralelo) solo va al log.
+    """
+    for line in _profile.report():
+        logger.info(line)
+    for step in _profile.steps:
+        if step['duration'] > STARTUP_CONFIG['SLOW_STEP']:
+            logger.warning(f"Paso de arranque lento: {step['name']} ({step['duration'] * 1000:.1f} ms)")
+    if bpy.app.background:
+        return
+    _profile.save(utils.get_user_data_path(STARTUP_PROFILE_FILE))
+
+def _run_deferred():
+    """Timer: ejecuta el trabajo aplazado en el primer tick con la UI activa."""
+    _deferred.run_all()
+    _finish_profile()
+    return None
+
 def register():
     """Registro robusto y ordenado del addon con manejo de errores mejorado."""
     global _registration_flags
     
+    background = bool(getattr(bpy.app, 'background', False))
+    _profile.reset(background)
+    _deferred.clear()
+    
     try:
         logger.info("Iniciando registro de TypeAnimator...")
         
         # === PASO 1: Registrar preferencias ===
         if not _registration_flags['preferences_registered']:
-            try:
-                bpy.utils.unregister_class(TAAddonPreferences)
-            except Exception:
-                pass
-            bpy.utils.register_class(TAAddonPreferences)
+            with _profile.step('preferences'):
+                try:
+                    bpy.utils.unregister_class(TAAddonPreferences)
+                except Exception:
+                    pass
+                bpy.utils.register_class(TAAddonPreferences)
             _registration_flags['preferences_registered'] = True
             logger.debug("Preferencias registradas")
         
         # === PASO 2: Registrar propiedades COMPLETAMENTE antes que UI ===
         if not _registration_flags['properties_registered']:
             try:
-                # Primero registrar presets
-                presets.register()
-                
-                # Luego registrar propiedades
-                properties.register()
-                
-                # VERIFICAR que el PointerProperty está asignado
-                if not hasattr(bpy.types.Scene, 'ta_letter_anim_props'):
-                    raise RuntimeError("ta_letter_anim_props no está asignada a bpy.types.Scene tras registrar properties")
-                
-                # Forzar inicialización en todas las escenas
-                properties.force_init_ta_stages_all_scenes()
-                
-                # Cargar presets de stage si existen
-                if hasattr(presets, 'load_stage_presets'):
-                    presets.load_stage_presets()
-                
-                # Actualizar enums ANTES de registrar UI
-                if hasattr(properties, 'update_preset_enums'):
-                    properties.update_preset_enums()
-                if hasattr(properties, 'update_anim_preset_enum'):
-                    properties.update_anim_preset_enum()
+                with _profile.step('properties'):
+                    # Primero registrar presets (el catálogo se indexa en el primer uso)
+                    presets.register()
+                    
+                    # Luego registrar propiedades
+                    properties.register()
+                    
+                    # VERIFICAR que el PointerProperty está asignado
+                    if not hasattr(bpy.types.Scene, 'ta_letter_anim_props'):
+                        raise RuntimeError("ta_letter_anim_props no está asignada a bpy.types.Scene tras registrar properties")
+                    
+                    # Inicialización de stages en todas las escenas (programada)
+                    properties.force_init_ta_stages_all_scenes()
                 
                 _registration_flags['properties_registered'] = True
                 logger.debug("Propiedades completamente registradas y verificadas")
@@ -108,7 +188,8 @@ def register():
         
         # === PASO 3: Crear Node Group central de curvas ===
         try:
-            node_group = get_or_create_curve_node_group()
+            with _profile.step('node_group'):
+                node_group = get_or_create_curve_node_group()
             if node_group:
                 logger.debug(f"Node Group '{CURVE_NODE_GROUP_NAME}' verificado/creado")
             else:
@@ -126,28 +207,16 @@ def register():
         
         # === PASO 4: Registrar módulos principales SOLO si propiedades están listas ===
         if hasattr(bpy.types.Scene, 'ta_letter_anim_props') and _registration_flags['properties_registered']:
-            modules_to_register = [
-                ('icon_loader', icon_loader),
-                ('utils', utils),
-                ('operators', operators),
-                ('ui', ui),  # UI va DESPUÉS de que propiedades estén completamente listas
-                ('styles', styles),
-                ('preset_manager', preset_manager),
-                ('core', core),
-                ('preview', preview),
-                ('fonts', fonts),
-            ]
+            for module_name, module in CORE_MODULES:
+                _register_module(module_name, module)
+            _registration_flags['operators_registered'] = True
             
-            for module_name, module in modules_to_register:
-                try:
-                    if hasattr(module, 'register'):
-                        module.register()
-                        logger.debug(f"Módulo '{module_name}' registrado")
-                    else:
-                        logger.warning(f"Módulo '{module_name}' no tiene método register")
-                except Exception as e:
-                    logger.error(f"Error registrando módulo '{module_name}': {e}")
-                    raise
+            # UI va DESPUÉS de que propiedades estén completamente listas; en background no hay UI
+            if background:
+                _profile.skip('ui', "background")
+            else:
+                _register_module('ui', ui)
+                _registration_flags['ui_registered'] = True
         else:
             logger.error("No se registró la UI porque ta_letter_anim_props no existe en Scene o propiedades no están completamente registradas.")
             raise RuntimeError("Propiedades no disponibles para UI")
@@ -165,51 +234,20 @@ def register():
         
         for module_name, module in optional_modules:
             if module is not None:
-                try:
-                    if hasattr(module, 'register'):
-                        module.register()
-                        logger.debug(f"Módulo opcional '{module_name}' registrado")
-                except Exception as e:
-                    logger.warning(f"Error registrando módulo opcional '{module_name}': {e}")
+                _register_module(module_name, module, optional=True)
         
-        # === PASO 6: Actualizar enums y cargar configuración ===
-        try:
-            if hasattr(bpy.app, 'timers'):
-                def deferred_updates():
-                    try:
-                        properties.update_preset_enums()
-                        properties.update_anim_preset_enum()
-                        from bpy import context
-                        for window in context.window_manager.windows:
-                            for area in window.screen.areas:
-                                if area.type == 'VIEW_3D':
-                                    area.tag_redraw()
-                        load_last_settings()
-                        logger.debug("Enums actualizados, UI refrescada y configuración cargada")
-                    except Exception as e:
-                        logger.warning(f"Error en actualizaciones diferidas: {e}")
-                    return None
-                bpy.app.timers.register(deferred_updates, first_interval=0.5)
-            else:
-                try:
-                    properties.update_preset_enums()
-                    properties.update_anim_preset_enum()
-                    from bpy import context
-                    for window in context.window_manager.windows:
-                        for area in window.screen.areas:
-                            if area.type == 'VIEW_3D':
-                                area.tag_redraw()
-                    load_last_settings()
-                    logger.debug("Enums actualizados, UI refrescada y configuración cargada")
-                except Exception as e:
-                    logger.warning(f"Error actualizando enums: {e}")
-        except Exception as e:
-            logger.warning(f"Error configurando actualizaciones diferidas: {e}")
+        # === PASO 6: Aplazar el trabajo que solo necesita la UI ===
+        _queue_ui_step('icon_loader', _deferred_module('icon_loader', icon_loader), background)
+        _queue_ui_step('fonts', _deferred_module('fonts', fonts), background)
+        _queue_ui_step('preset_enums', _refresh_preset_enums, background)
+        _queue_ui_step('last_settings', _restore_settings, background)
+        _queue_ui_step('diagnostics', _start_diagnostics, background)
         
         # === PASO 7: Registrar handlers ===
         if not _registration_flags['handlers_registered']:
             try:
-                register_handler()
+                with _profile.step('handlers'):
+                    register_handler()
                 _registration_flags['handlers_registered'] = True
                 logger.debug("Handlers registrados")
             except Exception as e:
@@ -217,28 +255,39 @@ def register():
         
         # === PASO 8: Registrar propiedades adicionales ===
         try:
-            # Propiedades de escena
-            for prop_name, prop_value in SCENE_PROPERTIES.items():
-                if not hasattr(bpy.types.Scene, prop_value):
-                    setattr(bpy.types.Scene, prop_value, bpy.props.StringProperty(
-                        name=f"Texto en Foco" if prop_name == 'FOCUSED_TEXT' else f"Propiedad {prop_name}",
-                        description=f"Propiedad {prop_name} de TypeAnimator",
-                        default=""
-                    ))
-            
-            # Propiedades de WindowManager
-            for prop_name, prop_value in WM_PROPERTIES.items():
-                if not hasattr(bpy.types.WindowManager, prop_value):
-                    setattr(bpy.types.WindowManager, prop_value, bpy.props.StringProperty(
-                        name=f"Estado del Sistema" if prop_name == 'STATUS' else f"Propiedad {prop_name}",
-                        description=f"Propiedad {prop_name} de TypeAnimator",
-                        default=""
-                    ))
+            with _profile.step('extra_properties'):
+                # Propiedades de escena
+                for prop_name, prop_value in SCENE_PROPERTIES.items():
+                    if not hasattr(bpy.types.Scene, prop_value):
+                        setattr(bpy.types.Scene, prop_value, bpy.props.StringProperty(
+                            name=f"Texto en Foco" if prop_name == 'FOCUSED_TEXT' else f"Propiedad {prop_name}",
+                            description=f"Propiedad {prop_name} de TypeAnimator",
+                            default=""
+                        ))
+                
+                # Propiedades de WindowManager
+                for prop_name, prop_value in WM_PROPERTIES.items():
+                    if not hasattr(bpy.types.WindowManager, prop_value):
+                        setattr(bpy.types.WindowManager, prop_value, bpy.props.StringProperty(
+                            name=f"Estado del Sistema" if prop_name == 'STATUS' else f"Propiedad {prop_name}",
+                            description=f"Propiedad {prop_name} de TypeAnimator",
+                            default=""
+                        ))
             
             logger.debug("Propiedades adicionales registradas")
         except Exception as e:
             logger.error(f"Error registrando propiedades adicionales: {e}")
         
+        # === PASO 9: Ejecutar lo diferido con la UI activa y reportar el perfil ===
+        if not _deferred.pending():
+            _finish_profile()
+        elif hasattr(bpy.app, 'timers'):
+            # Persistente: abrir un .blend justo después del registro no debe descartarlo
+            bpy.app.timers.register(_run_deferred, first_interval=STARTUP_CONFIG['DEFER_INTERVAL'],
+                                    persistent=True)
+        else:
+            _run_deferred()
+        
         logger.info("TypeAnimator registrado exitosamente")
         
     except Exception as e:
@@ -257,6 +306,11 @@ def unregister():
     try:
         logger.info("Iniciando desregistro de TypeAnimator...")
         
+        # Cancelar el trabajo diferido que no llegó a ejecutarse
+        _deferred.clear()
+        if hasattr(bpy.app, 'timers') and bpy.app.timers.is_registered(_run_deferred):
+            bpy.app.timers.unregister(_run_deferred)
+        
         # === PASO 1: Desregistrar handlers ===
         if _registration_flags['handlers_registered']:
             try:
@@ -280,6 +334,8 @@ def unregister():
         ]
         
         for module_name, module in modules_to_unregister:
+            if module_name not in _registered_modules:
+                continue
             try:
                 if hasattr(module, 'unregister'):
                     module.unregister()
@@ -301,7 +357,7 @@ def unregister():
         ]
         
         for module_name, module in optional_modules:
-            if module is not None:
+            if module is not None and module_name in _registered_modules:
                 try:
                     if hasattr(module, 'unregister'):
                         module.unregister()
@@ -360,6 +416,7 @@ def unregister():
             'ui_registered': False,
             'handlers_registered': False
         }
+        _registered_modules.clear()
         
         logger.info("TypeAnimator desregistrado exitosamente")
         
@@ -0,0 +1,267 @@
+"""
+Render farm headless de TypeAnimator.
+
+Lee un manifiesto de trabajos (ver ``farm_manifest``) y, para cada trabajo,
+crea el texto, aplica preset/fuente/timing, lo separa, hornea la animación y
+guarda el ``.blend`` o renderiza la animación, sin UI ni selección.
+
+Coordinador (reparte los trabajos entre N procesos ``blender -b``; no
+necesita ``bpy``)::
+
+    python render_farm.py --manifest jobs.ndjson --workers 4 --blender /opt/blender/blender --report farm.json
+
+Un solo proceso dentro de Blender::
+
+    blender -b --python render_farm.py -- --manifest jobs.ndjson
+
+Cada worker escribe el informe JSON de su shard; el coordinador los une y
+muestra los tiempos por trabajo y por fase.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+if __package__:
+    from .farm_manifest import (
+        BLEND_OUTPUT, ManifestError, format_summary, load_manifest, parse_shard, shard_jobs, summarize
+    )
+else:
+    # Ejecutado como script: el coordinador solo necesita el módulo puro del manifiesto
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from farm_manifest import (  # type: ignore
+        BLEND_OUTPUT, ManifestError, format_summary, load_manifest, parse_shard, shard_jobs, summarize
+    )
+
+logger = logging.getLogger(__name__)
+
+SCRIPT_PATH = os.path.abspath(__file__)
+ADDON_MODULE = os.path.basename(os.path.dirname(SCRIPT_PATH))
+
+# === EJECUCIÓN DE TRABAJOS (dentro de Blender) ===
+
+@contextmanager
+def _phase(timings: Dict[str, float], name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+def _load_base_file(job: Dict[str, Any]) -> None:
+    """Empieza cada trabajo desde el ``.blend`` base o desde un archivo vacío."""
+    if job['blend']:
+        bpy.ops.wm.open_mainfile(filepath=job['blend'])
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+    from .curves import get_or_create_curve_node_group
+    get_or_create_curve_node_group()
+
+def _configure(job: Dict[str, Any], scene):
+    """Aplica preset, timing y modo de fragmento, y crea el objeto de texto."""
+    from .presets import get_preset
+    from .preset_manager import apply_preset_data
+    from .fonts import load_font
+
+    props = scene.ta_letter_anim_props
+    if job['preset']:
+        preset_data = get_preset(job['preset'])
+        if not preset_data:
+            raise ManifestError(f"Preset '{job['preset']}' no encontrado")
+        apply_preset_data(props, preset_data)
+    for key, value in job['timing'].items():
+        setattr(props.timing, key, value)
+    props.timing.fragment_mode = job['fragment_mode']
+
+    curve = bpy.data.curves.new(job['id'], 'FONT')
+    curve.body = job['text']
+    curve.align_x = 'CENTER'
+    curve.align_y = 'CENTER'
+    if job['font']:
+        curve.font = load_font(job['font'])
+    text_obj = bpy.data.objects.new(job['id'], curve)
+    scene.collection.objects.link(text_obj)
+    return props, text_obj
+
+def _write_output(job: Dict[str, Any], scene, props) -> None:
+    from .baking import bake_frame_range
+    from .evaluation import read_timing
+
+    directory = os.path.dirname(job['output'])
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if job['output_type'] == BLEND_OUTPUT:
+        bpy.ops.wm.save_as_mainfile(filepath=job['output'], copy=True)
+        return
+    scene.frame_start, scene.frame_end = bake_frame_range(read_timing(props))
+    scene.render.filepath = job['output']
+    bpy.ops.render.render(animation=True, scene=scene.name)
+
+def run_job(job: Dict[str, Any], worker: int = 0) -> Dict[str, Any]:
+    """
+    Ejecuta un trabajo completo y devuelve su resultado con tiempos por fase.
+
+    Un error no interrumpe al worker: queda en ``status``/``error`` del resultado.
+    """
+    from . import core
+
+    result = {'id': job['id'], 'index': job['index'], 'worker': worker, 'status': 'ok',
+              'output': job['output'], 'letters': 0, 'keyframes': 0, 'timings': {}}
+    timings = result['timings']
+    start = time.perf_counter()
+    try:
+        with _phase(timings, 'load'):
+            _load_base_file(job)
+            scene = bpy.context.scene
+        with _phase(timings, 'setup'):
+            props, text_obj = _configure(job, scene)
+        with _phase(timings, 'separate'):
+            root, letters = core.separate_text(text_obj, job['fragment_mode'], props.grouping_tolerance)
+            if root is None or not letters:
+                raise RuntimeError("El texto no produjo letras")
+        with _phase(timings, 'bake'):
+            stats = core.animate_letters(letters, props, preview=False, simplify=job['simplify'],
+                                         shared_action=job['shared_action'])
+            if not stats:
+                raise RuntimeError("No se pudo hornear la animación")
+        with _phase(timings, 'output'):
+            _write_output(job, scene, props)
+        result['letters'] = stats['letters']
+        result['keyframes'] = stats['keyframes']
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+        logger.error(f"Trabajo {job['id']} falló: {e}")
+    timings['total'] = time.perf_counter() - start
+    return result
+
+def run_jobs(jobs: List[Dict[str, Any]], worker: int = 0) -> List[Dict[str, Any]]:
+    """Ejecuta los trabajos en orden en este proceso de Blender."""
+    results = []
+    for job in jobs:
+        result = run_job(job, worker)
+        print(f"[typeanimator farm {worker}] {job['id']}: {result['status']} "
+              f"({result['timings']['total']:.2f}s)", flush=True)
+        results.append(result)
+    return results
+
+# === COORDINADOR ===
+
+def _worker_command(args, index: int, count: int, report_path: str) -> List[str]:
+    return [args.blender, '-b', '--python', SCRIPT_PATH, '--',
+            '--manifest', os.path.abspath(args.manifest), '--shard', f"{index}/{count}",
+            '--report', report_path, '--addon-module', args.addon_module]
+
+def coordinate(jobs: List[Dict[str, Any]], args) -> Dict[str, Any]:
+    """Lanza un proceso de Blender por shard, espera a todos y une sus informes."""
+    start = time.perf_counter()
+    shards = shard_jobs(jobs, args.workers)
+    results: List[Dict[str, Any]] = []
+    # Los logs se conservan para diagnosticar workers caídos
+    log_dir = args.log_dir or tempfile.mkdtemp(prefix='typeanimator_farm_logs_')
+    os.makedirs(log_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix='typeanimator_farm_') as work_dir:
+        workers = []
+        for index, shard in enumerate(shards):
+            if not shard:
+                continue
+            report_path = os.path.join(work_dir, f"shard_{index}.json")
+            log_path = os.path.join(log_dir, f"worker_{index}.log")
+            log_file = open(log_path, 'w', encoding='utf-8')
+            process = subprocess.Popen(_worker_command(args, index, len(shards), report_path),
+                                       stdout=log_file, stderr=subprocess.STDOUT)
+            workers.append((index, shard, process, report_path, log_file, log_path))
+
+        for index, shard, process, report_path, log_file, log_path in workers:
+            returncode = process.wait()
+            log_file.close()
+            try:
+                with open(report_path, 'r', encoding='utf-8') as f:
+                    results.extend(json.load(f))
+            except Exception:
+                # El worker murió antes de escribir su informe: todos sus trabajos fallan
+                error = f"Worker {index} terminó con código {returncode} (log: {log_path})"
+                results.extend({'id': job['id'], 'index': job['index'], 'worker': index,
+                                'status': 'error', 'error': error, 'timings': {}} for job in shard)
+    return summarize(results, wall_time=time.perf_counter() - start)
+
+# === LÍNEA DE COMANDOS ===
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='render_farm', description="Render farm headless de TypeAnimator")
+    parser.add_argument('--manifest', required=True, help="Manifiesto de trabajos (.json o .ndjson)")
+    parser.add_argument('--workers', type=int, default=1, help="Procesos de Blender en paralelo")
+    parser.add_argument('--blender', default=os.environ.get('BLENDER', 'blender'),
+                        help="Ejecutable de Blender para los workers")
+    parser.add_argument('--report', help="Archivo JSON con el resumen (o el informe del shard)")
+    parser.add_argument('--log-dir', help="Directorio para los logs de cada worker (por defecto uno temporal)")
+    parser.add_argument('--shard', help="Ejecutar solo el shard 'i/N' (modo worker)")
+    parser.add_argument('--addon-module', default=ADDON_MODULE, help="Nombre del módulo del addon")
+    return parser
+
+def _script_args(argv: Optional[List[str]]) -> List[str]:
+    """Argumentos propios: dentro de Blender van después de ``--``."""
+    if argv is None:
+        argv = sys.argv[1:]
+    return argv[argv.index('--') + 1:] if '--' in argv else argv
+
+def _write_json(path: str, data: Any) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _addon_farm(addon_module: str):
+    """Este módulo importado dentro del paquete del addon (habilitándolo si hace falta)."""
+    import addon_utils  # type: ignore
+    addon_utils.enable(addon_module, default_set=False)
+    return importlib.import_module(f"{addon_module}.render_farm")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada; devuelve 0 si todos los trabajos terminaron bien."""
+    args = build_parser().parse_args(_script_args(argv))
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ManifestError) as e:
+        print(f"[typeanimator farm] Manifiesto inválido: {e}", file=sys.stderr)
+        return 2
+
+    run_here = args.shard is not None or (args.workers <= 1 and bpy is not None)
+    if run_here and not __package__:
+        # Script lanzado con ``blender --python``: trabajar desde el paquete del addon
+        return _addon_farm(args.addon_module).main(argv)
+
+    if args.shard is not None:
+        index, count = parse_shard(args.shard)
+        results = run_jobs(shard_jobs(jobs, count)[index], worker=index)
+        if args.report:
+            _write_json(args.report, results)
+        return 0 if all(result['status'] == 'ok' for result in results) else 1
+
+    if run_here:
+        start = time.perf_counter()
+        summary = summarize(run_jobs(jobs), wall_time=time.perf_counter() - start)
+    else:
+        summary = coordinate(jobs, args)
+
+    for line in format_summary(summary):
+        print(line)
+    if args.report:
+        _write_json(args.report, summary)
+    return 0 if summary['failed'] == 0 else 1
+
+if __name__ == "__main__":
+    code = main()
+    if bpy is None or bpy.app.background:
+        sys.exit(code)
@@ -0,0 +1,490 @@
+"""
+Motor de separación de texto en letras, palabras o líneas para TypeAnimator.
+
+El objeto de texto se convierte a malla una sola vez. Las islas de la malla se
+detectan en bloque sobre arrays de vértices y aristas, se agrupan en glifos
+según ``grouping_tolerance`` y se ordenan en orden de lectura. El resultado es
+un ``SeparationLayout`` (solo arrays, cacheable y sin referencias a objetos) a
+partir del cual se crean en lote la raíz y los objetos de cada fragmento.
+
+Las etapas de cálculo solo dependen de NumPy y pueden probarse fuera de Blender.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+try:
+    from . import spatial_index
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    import spatial_index
+
+logger = logging.getLogger(__name__)
+
+SEPARATION_MODES = ('LETTERS', 'WORDS', 'LINES')
+
+# Propiedades guardadas en la raíz para reutilizar una separación existente
+SEPARATION_KEY_PROPERTY = "ta_separation_key"
+SOURCE_TEXT_PROPERTY = "ta_source_text"
+FRAGMENT_TEXT_PROPERTY = "ta_fragment_text"
+
+# Solapamiento horizontal mínimo (fracción del ancho menor) para unir dos islas en un glifo
+MIN_GLYPH_OVERLAP = 0.3
+# Un hueco mayor que este múltiplo de la mediana de huecos separa palabras
+WORD_GAP_FACTOR = 2.5
+
+# === ISLAS ===
+
+def label_islands(vertex_count: int, edges: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Componentes conexas de una malla a partir de sus aristas.
+
+    Enganche de raíces + salto de punteros sobre arrays completos: cada pasada
+    procesa todas las aristas a la vez, sin bucles de Python por vértice.
+
+    Returns:
+        Tuple[np.ndarray, int]: isla de cada vértice (0..n-1) y número de islas
+    """
+    labels = np.arange(vertex_count, dtype=np.int64)
+    if vertex_count == 0:
+        return labels, 0
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    a, b = edges[:, 0], edges[:, 1]
+
+    while True:
+        la, lb = labels[a], labels[b]
+        pending = la != lb
+        if not pending.any():
+            break
+        la, lb = la[pending], lb[pending]
+        # Cada raíz mayor se engancha a la menor de sus vecinas
+        np.minimum.at(labels, np.maximum(la, lb), np.minimum(la, lb))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+    _, labels = np.unique(labels, return_inverse=True)
+    labels = labels.reshape(-1)
+    return labels, int(labels.max()) + 1
+
+def island_bounds(coords: np.ndarray, labels: np.ndarray, count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Caja envolvente XY (mínimos y máximos) de cada isla."""
+    order = np.argsort(labels, kind='stable')
+    starts = np.searchsorted(labels[order], np.arange(count))
+    xy = coords[order, :2]
+    return np.minimum.reduceat(xy, starts, axis=0), np.maximum.reduceat(xy, starts, axis=0)
+
+# === GLIFOS ===
+
+def group_islands(mins: np.ndarray, maxs: np.ndarray, tolerance: float,
+                  min_overlap: float = MIN_GLYPH_OVERLAP) -> Tuple[np.ndarray, int]:
+    """
+    Agrupa islas en glifos (punto de la "i", tildes, partes de "%").
+
+    Dos islas forman un glifo si se solapan en X al menos ``min_overlap`` del
+    ancho menor y su hueco vertical no supera ``tolerance``. Los candidatos
+    salen del índice espacial, así que el coste es casi lineal.
+
+    Returns:
+        Tuple[np.ndarray, int]: glifo de cada isla y número de glifos
+    """
+    count = len(mins)
+    pairs = np.asarray(spatial_index.pairs_within_gap(mins, maxs, max_gap=(0.0, tolerance)),
+                       dtype=np.int64).reshape(-1, 2)
+    first, second = pairs[:, 0], pairs[:, 1]
+    overlap = np.minimum(maxs[first, 0], maxs[second, 0]) - np.maximum(mins[first, 0], mins[second, 0])
+    narrower = np.minimum(maxs[first, 0] - mins[first, 0], maxs[second, 0] - mins[second, 0])
+    same_glyph = overlap >= min_overlap * narrower
+    return label_islands(count, pairs[same_glyph])
+
+def merge_bounds(mins: np.ndarray, maxs: np.ndarray, groups: np.ndarray, count: int):
+    """Cajas envolventes de cada grupo a partir de las cajas de sus miembros."""
+    group_mins = np.full((count, 2), np.inf)
+    group_maxs = np.full((count, 2), -np.inf)
+    np.minimum.at(group_mins, groups, mins)
+    np.maximum.at(group_maxs, groups, maxs)
+    return group_mins, group_maxs
+
+# === ORDEN DE LECTURA ===
+
+def assign_lines(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """
+    Línea de cada glifo por perfil de proyección vertical.
+
+    Se abre una línea nueva cuando un glifo ya no se solapa en Y con la línea
+    actual. Las líneas se numeran de arriba abajo.
+    """
+    lines = np.zeros(len(mins), dtype=np.int64)
+    current = -1
+    low = np.inf
+    for i in np.argsort(-maxs[:, 1], kind='stable').tolist():
+        if maxs[i, 1] < low:
+            current += 1
+            low = mins[i, 1]
+        else:
+            low = min(low, mins[i, 1])
+        lines[i] = current
+    return lines
+
+def reading_order(mins: np.ndarray, lines: np.ndarray) -> np.ndarray:
+    """Índices de glifo ordenados por línea y luego de izquierda a derecha."""
+    return np.lexsort((mins[:, 0], lines))
+
+def assign_words_by_gaps(mins: np.ndarray, maxs: np.ndarray, lines: np.ndarray,
+                         order: np.ndarray, gap_factor: float = WORD_GAP_FACTOR) -> np.ndarray:
+    """Palabra de cada glifo (en orden de lectura) por huecos horizontales grandes."""
+    ordered_lines = lines[order]
+    gaps = mins[order[1:], 0] - maxs[order[:-1], 0]
+    same_line = ordered_lines[1:] == ordered_lines[:-1]
+    line_gaps = gaps[same_line]
+    positive = line_gaps[line_gaps > 0]
+    threshold = gap_factor * float(np.median(positive)) if len(positive) else np.inf
+    breaks = ~same_line | (gaps > threshold)
+    return np.concatenate(([0], np.cumsum(breaks))).astype(np.int64)
+
+def _body_units(body: str, mode: str) -> List[Tuple[str, int]]:
+    """Unidades de texto del body en orden para un modo, con su número de caracteres visibles."""
+    if mode == 'LINES':
+        units = [line.strip() for line in body.splitlines()]
+    elif mode == 'WORDS':
+        units = body.split()
+    else:
+        units = [char for char in body if not char.isspace()]
+    units = [(unit, sum(1 for char in unit if not char.isspace())) for unit in units]
+    return [unit for unit in units if unit[1]]
+
+def _units_from_body(body: str, mode: str, glyph_count: int) -> Optional[List[Tuple[str, int]]]:
+    """Unidades del body si encajan glifo a glifo con la geometría; None si no."""
+    units = _body_units(body, mode)
+    if sum(size for _unit, size in units) != glyph_count:
+        return None
+    return units
+
+def assign_fragments(glyph_mins: np.ndarray, glyph_maxs: np.ndarray, mode: str,
+                     body: str = "") -> Tuple[np.ndarray, int, Optional[List[str]]]:
+    """
+    Fragmento de cada glifo según el modo (LETTERS, WORDS, LINES).
+
+    Si el número de glifos coincide con los caracteres visibles del body, las
+    palabras y líneas salen del propio body y cada fragmento conoce su texto;
+    si no (ligaduras, comillas de dos trazos...), se deducen de la geometría.
+
+    Returns:
+        Tuple[np.ndarray, int, Optional[List[str]]]: fragmento de cada glifo,
+        número de fragmentos y texto de cada fragmento (o None)
+    """
+    count = len(glyph_mins)
+    if count == 0:
+        return np.zeros(0, dtype=np.int64), 0, None
+
+    lines = assign_lines(glyph_mins, glyph_maxs)
+    order = reading_order(glyph_mins, lines)
+    units = _units_from_body(body, mode, count) if body else None
+    if units is not None and mode == 'LINES' and len(units) != int(lines.max()) + 1:
+        units = None  # Líneas partidas por el ajuste de caja de texto: manda la geometría
+
+    if units is not None:
+        sizes = np.fromiter((size for _unit, size in units), dtype=np.int64, count=len(units))
+        ordered = np.repeat(np.arange(len(units), dtype=np.int64), sizes)
+    elif mode == 'LINES':
+        ordered = lines[order]
+    elif mode == 'WORDS':
+        ordered = assign_words_by_gaps(glyph_mins, glyph_maxs, lines, order)
+    else:
+        ordered = np.arange(count, dtype=np.int64)
+
+    fragments = np.empty(count, dtype=np.int64)
+    fragments[order] = ordered
+    _, fragments = np.unique(fragments, return_inverse=True)
+    fragments = fragments.reshape(-1)
+    texts = [unit for unit, _size in units] if units is not None else None
+    return fragments, int(fragments.max()) + 1, texts
+
+# === LAYOUT ===
+
+class SeparationLayout:
+    """
+    Malla convertida del texto y fragmento de cada vértice.
+
+    Solo contiene arrays, así que puede cachearse y compartirse entre objetos
+    de texto idénticos; los objetos de Blender se crean con ``build_objects``.
+    """
+
+    def __init__(self, coords, edges, loop_vertices, loop_start, loop_total,
+                 material_index, vertex_fragment, fragment_count, mode,
+                 fragment_texts=None, timings=None):
+        self.coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.loop_vertices = np.asarray(loop_vertices, dtype=np.int64)
+        self.loop_start = np.asarray(loop_start, dtype=np.int64)
+        self.loop_total = np.asarray(loop_total, dtype=np.int64)
+        self.material_index = np.asarray(material_index, dtype=np.int64)
+        self.vertex_fragment = np.asarray(vertex_fragment, dtype=np.int64)
+        self.fragment_count = fragment_count
+        self.mode = mode
+        self.fragment_texts = fragment_texts
+        self.timings = timings or {}
+
+    def fragments(self):
+        """
+        Genera los arrays de malla de cada fragmento, con índices locales.
+
+        Yields:
+            Dict: ``coords`` (relativas al centro), ``center``, ``edges``,
+            ``loop_vertices``, ``loop_start``, ``loop_total``, ``material_index``
+        """
+        count = self.fragment_count
+        vertex_fragment = self.vertex_fragment
+
+        # Vértices agrupados por fragmento con su índice local
+        v_order = np.argsort(vertex_fragment, kind='stable')
+        v_bounds = np.searchsorted(vertex_fragment[v_order], np.arange(count + 1))
+        local = np.empty(len(vertex_fragment), dtype=np.int64)
+        local[v_order] = np.arange(len(v_order)) - v_bounds[vertex_fragment[v_order]]
+
+        edge_fragment = vertex_fragment[self.edges[:, 0]]
+        e_order = np.argsort(edge_fragment, kind='stable')
+        e_bounds = np.searchsorted(edge_fragment[e_order], np.arange(count + 1))
+        local_edges = local[self.edges[e_order]]
+
+        poly_fragment = vertex_fragment[self.loop_vertices[self.loop_start]] if len(self.loop_start) else \
+            np.zeros(0, dtype=np.int64)
+        p_order = np.argsort(poly_fragment, kind='stable')
+        p_bounds = np.searchsorted(poly_fragment[p_order], np.arange(count + 1))
+        totals = self.loop_total[p_order]
+        # Loops reordenados para que los polígonos de cada fragmento sean contiguos
+        new_starts = np.concatenate(([0], np.cumsum(totals)))
+        loop_index = np.repeat(self.loop_start[p_order] - new_starts[:-1], totals) + np.arange(new_starts[-1])
+        local_loops = local[self.loop_vertices[loop_index]]
+        materials = self.material_index[p_order]
+
+        for fragment in range(count):
+            vertices = v_order[v_bounds[fragment]:v_bounds[fragment + 1]]
+            coords = self.coords[vertices]
+            center = (coords.min(axis=0) + coords.max(axis=0)) * 0.5
+            p0, p1 = p_bounds[fragment], p_bounds[fragment + 1]
+            l0, l1 = new_starts[p0], new_starts[p1]
+            yield {
+                'coords': coords - center,
+                'center': center,
+                'edges': local_edges[e_bounds[fragment]:e_bounds[fragment + 1]],
+                'loop_vertices': local_loops[l0:l1],
+                'loop_start': new_starts[p0:p1] - l0,
+                'loop_total': totals[p0:p1],
+                'material_index': materials[p0:p1],
+            }
+
+def compute_layout(coords, edges, loop_vertices, loop_start, loop_total, material_index,
+                   mode: str = 'LETTERS', grouping_tolerance: float = 0.1,
+                   body: str = "") -> SeparationLayout:
+    """
+    Calcula la separación a partir de los arrays de la malla convertida.
+
+    Args:
+        coords: Coordenadas de vértices (n, 3) en espacio local del texto
+        edges: Pares de vértices de cada arista (m, 2)
+        loop_vertices, loop_start, loop_total, material_index: Polígonos
+        mode: ``'LETTERS'``, ``'WORDS'`` o ``'LINES'``
+        grouping_tolerance: Hueco vertical máximo entre islas de un glifo
+        body: Texto original, para asignar palabras/líneas y textos de fragmento
+
+    Returns:
+        SeparationLayout: Layout con el fragmento de cada vértice
+    """
+    if mode not in SEPARATION_MODES:
+        logger.info(f"Modo de fragmentación {mode} no soportado por la separación, se usa WORDS")
+        mode = 'WORDS'
+
+    timings = {}
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+    start = time.perf_counter()
+    labels, island_count = label_islands(len(coords), edges)
+    mins, maxs = island_bounds(coords, labels, island_count)
+    timings['islands'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    glyphs, glyph_count = group_islands(mins, maxs, grouping_tolerance)
+    glyph_mins, glyph_maxs = merge_bounds(mins, maxs, glyphs, glyph_count)
+    timings['grouping'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fragments, fragment_count, texts = assign_fragments(glyph_mins, glyph_maxs, mode, body)
+    vertex_fragment = fragments[glyphs[labels]] if len(labels) else labels
+    timings['ordering'] = time.perf_counter() - start
+
+    logger.debug(f"Separación {mode}: {island_count} islas, {glyph_count} glifos, "
+                 f"{fragment_count} fragmentos")
+    return SeparationLayout(coords, edges, loop_vertices, loop_start, loop_total, material_index,
+                            vertex_fragment, fragment_count, mode, texts, timings)
+
+# === BLENDER ===
+
+def read_text_mesh(text_obj, depsgraph=None) -> Dict[str, np.ndarray]:
+    """Convierte el texto a malla una sola vez y lee sus arrays con ``foreach_get``."""
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(text_obj.evaluated_get(depsgraph))
+    try:
+        vertex_count = len(mesh.vertices)
+        edge_count = len(mesh.edges)
+        loop_count = len(mesh.loops)
+        poly_count = len(mesh.polygons)
+
+        arrays = {
+            'coords': np.empty(vertex_count * 3, dtype=np.float32),
+            'edges': np.empty(edge_count * 2, dtype=np.int32),
+            'loop_vertices': np.empty(loop_count, dtype=np.int32),
+            'loop_start': np.empty(poly_count, dtype=np.int32),
+            'loop_total': np.empty(poly_count, dtype=np.int32),
+            'material_index': np.empty(poly_count, dtype=np.int32),
+        }
+        mesh.vertices.foreach_get('co', arrays['coords'])
+        mesh.edges.foreach_get('vertices', arrays['edges'])
+        mesh.loops.foreach_get('vertex_index', arrays['loop_vertices'])
+        mesh.polygons.foreach_get('loop_start', arrays['loop_start'])
+        mesh.polygons.foreach_get('loop_total', arrays['loop_total'])
+        mesh.polygons.foreach_get('material_index', arrays['material_index'])
+        return arrays
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+def separate_text_layout(text_obj, mode: str = 'LETTERS', grouping_tolerance: float = 0.1,
+                         depsgraph=None) -> SeparationLayout:
+    """
+    Convierte un objeto de texto y calcula su layout de separación.
+
+    La tolerancia se expresa para un texto de tamaño 1 y se escala por
+    ``data.size``, igual que la geometría convertida.
+    """
+    start = time.perf_counter()
+    arrays = read_text_mesh(text_obj, depsgraph)
+    convert_time = time.perf_counter() - start
+
+    size = getattr(text_obj.data, 'size', 1.0) or 1.0
+    layout = compute_layout(mode=mode, grouping_tolerance=grouping_tolerance * size,
+                            body=text_obj.data.body, **arrays)
+    layout.timings['convert'] = convert_time
+    return layout
+
+def _fill_mesh(mesh, fragment):
+    """Escribe los arrays de un fragmento en una malla vacía con ``foreach_set``."""
+    coords = fragment['coords']
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', coords.ravel())
+
+    edges = fragment['edges']
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set('vertices', edges.astype(np.int32).ravel())
+
+    loop_vertices = fragment['loop_vertices']
+    if len(loop_vertices):
+        mesh.loops.add(len(loop_vertices))
+        mesh.loops.foreach_set('vertex_index', loop_vertices.astype(np.int32))
+        mesh.polygons.add(len(fragment['loop_start']))
+        mesh.polygons.foreach_set('loop_start', fragment['loop_start'].astype(np.int32))
+        try:
+            mesh.polygons.foreach_set('loop_total', fragment['loop_total'].astype(np.int32))
+        except (AttributeError, TypeError, RuntimeError):
+            pass  # Blender 4.x: loop_total es de solo lectura y se deriva de loop_start
+        mesh.polygons.foreach_set('material_index', fragment['material_index'].astype(np.int32))
+
+    mesh.update()
+
+def build_objects(text_obj, layout: SeparationLayout, separation_key: Optional[str] = None,
+                  collection=None):
+    """
+    Crea la raíz y un objeto de malla por fragmento, en lote y sin ``bpy.ops``.
+
+    La raíz hereda la matriz del texto; cada fragmento queda en su centro
+    dentro del espacio de la raíz, marcado como letra y en orden de lectura.
+
+    Returns:
+        Tuple[bpy.types.Object, List[bpy.types.Object]]: raíz y fragmentos
+    """
+    from .constants import ROOT_SUFFIX
+    from .letter_registry import get_registry
+    from .utils import mark_as_letter
+
+    start = time.perf_counter()
+    if collection is None:
+        collection = text_obj.users_collection[0] if text_obj.users_collection else \
+            bpy.context.scene.collection
+
+    root = bpy.data.objects.new(text_obj.name + ROOT_SUFFIX, None)
+    root.empty_display_type = 'PLAIN_AXES'
+    root.matrix_world = text_obj.matrix_world.copy()
+    root[SOURCE_TEXT_PROPERTY] = text_obj.name
+    if separation_key:
+        root[SEPARATION_KEY_PROPERTY] = separation_key
+    collection.objects.link(root)
+
+    materials = list(text_obj.data.materials)
+    letters = []
+    for index, fragment in enumerate(layout.fragments()):
+        name = f"{text_obj.name}_{index:03d}"
+        mesh = bpy.data.meshes.new(name)
+        _fill_mesh(mesh, fragment)
+        for material in materials:
+            mesh.materials.append(material)
+
+        letter = bpy.data.objects.new(name, mesh)
+        letter.location = fragment['center'].tolist()
+        letter.parent = root
+        collection.objects.link(letter)
+        mark_as_letter(letter, root.name, index)
+        if layout.fragment_texts is not None:
+            letter[FRAGMENT_TEXT_PROPERTY] = layout.fragment_texts[index]
+        letters.append(letter)
+
+    # El texto original queda oculto; sus fragmentos lo reemplazan
+    try:
+        text_obj.hide_set(True)
+    except RuntimeError:
+        pass  # No está en la view layer activa
+    text_obj.hide_render = True
+
+    get_registry().invalidate()
+    layout.timings['build'] = time.perf_counter() - start
+    return root, letters
+
+def get_existing_separation(text_obj, separation_key: str):
+    """Devuelve ``(root, letters)`` si el texto ya está separado con la misma clave."""
+    from .constants import ROOT_SUFFIX
+    from .letter_registry import get_registry
+
+    root = bpy.data.objects.get(text_obj.name + ROOT_SUFFIX)
+    if root is None or root.get(SEPARATION_KEY_PROPERTY) != separation_key:
+        return None
+    # Object.children recorre todo el archivo; el registro ya las tiene ordenadas
+    letters = get_registry().letters_of(root)
+    if not letters:
+        return None
+    return root, letters
+
+def remove_separation(root) -> None:
+    """Elimina la raíz, sus fragmentos y las mallas que queden sin usuarios."""
+    from .constants import LETTER_PROPERTY
+    from .letter_registry import get_registry
+
+    meshes = []
+    for child in list(root.children):
+        if child.get(LETTER_PROPERTY, False):
+            if child.type == 'MESH':
+                meshes.append(child.data)
+            bpy.data.objects.remove(child, do_unlink=True)
+    bpy.data.objects.remove(root, do_unlink=True)
+    for mesh in meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    get_registry().invalidate()
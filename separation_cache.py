@@ -0,0 +1,332 @@
+"""
+Cache de resultados de separación de letras para TypeAnimator.
+
+Las claves son un digest del contenido del texto (cuerpo, fuente y ajustes
+de geometría), no del nombre del objeto. El cache es LRU con expiración por
+TTL y un presupuesto ponderado por número de letras.
+
+Módulo sin dependencias de ``bpy``: puede probarse fuera de Blender.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+try:
+    from . import separation
+    from .constants import CACHE_CONFIG
+except ImportError:  # Ejecutado fuera del paquete (tests y benchmarks)
+    import separation
+    from constants import CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Text curve settings that change the converted geometry (cache key content)
+_TEXT_GEOMETRY_ATTRS = (
+    'size', 'shear', 'space_character', 'space_word', 'space_line',
+    'offset_x', 'offset_y', 'align_x', 'align_y',
+    'extrude', 'offset', 'bevel_depth', 'bevel_resolution', 'resolution_u',
+)
+
+def _object_alive(obj) -> bool:
+    """Default validator without ``bpy``: a removed object raises on attribute access."""
+    try:
+        return obj is not None and obj.name is not None
+    except ReferenceError:
+        return False
+
+class OptimizedLetterSeparationCache:
+    """
+    LRU cache for letter separation results with TTL expiry and a weighted budget.
+
+    Each entry weighs 1 plus the number of letter objects it holds, so a few
+    large texts cannot pin more memory than many small ones. Hits move the
+    entry to the most-recently-used end; eviction always pops from the
+    least-recently-used end.
+
+    ``object_validator`` decides whether cached object references are still
+    usable (the add-on passes ``utils.is_valid_object``).
+    """
+    
+    def __init__(self, max_size=None, cleanup_threshold=None, ttl_seconds=None, max_weight=None,
+                 object_validator=None):
+        # OrderedDict[key] -> {'result', 'weight', 'created'}, oldest use first
+        self.cache = OrderedDict()
+        self.max_size = max_size if max_size is not None else CACHE_CONFIG['MAX_SIZE']
+        self.cleanup_threshold = (cleanup_threshold if cleanup_threshold is not None
+                                  else CACHE_CONFIG['CLEANUP_THRESHOLD'])
+        self.ttl_seconds = (ttl_seconds if ttl_seconds is not None
+                            else CACHE_CONFIG['TTL_HOURS'] * 3600)
+        self.max_weight = max_weight if max_weight is not None else CACHE_CONFIG['MAX_WEIGHT']
+        self.object_validator = object_validator if object_validator is not None else _object_alive
+        self.total_weight = 0
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'clears': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'last_cleanup': time.time()
+        }
+        self.performance_data = {
+            'avg_set_time': 0.0,
+            'avg_get_time': 0.0,
+            'total_operations': 0
+        }
+    
+    def _generate_key(self, text_obj, fragment_mode, grouping_tolerance):
+        """
+        Content digest of everything that shapes the separated geometry.
+        
+        The key covers the full body, the font datablock and the text
+        geometry settings, but not the object name or transform. Identical
+        text setups on different objects or scenes therefore share an entry.
+        """
+        try:
+            data = text_obj.data
+            if data is None:
+                return None
+            font = getattr(data, 'font', None)
+            key_parts = (
+                getattr(font, 'name', ''),
+                getattr(font, 'filepath', ''),
+                tuple(getattr(data, attr, None) for attr in _TEXT_GEOMETRY_ATTRS),
+                str(fragment_mode),
+                float(grouping_tolerance),
+            )
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(data.body.encode('utf-8'))
+            digest.update(b'\0')
+            digest.update(repr(key_parts).encode('utf-8'))
+            return digest.hexdigest()
+        except Exception as e:
+            logger.warning(f"Error generating cache key: {e}")
+            return None
+    
+    @staticmethod
+    def _entry_weight(result):
+        """Weight of a result: 1 for the entry plus one per letter object it holds."""
+        if isinstance(result, separation.SeparationLayout):
+            return 1 + result.fragment_count
+        try:
+            _root, letters = result
+            return 1 + len(letters)
+        except (TypeError, ValueError):
+            return 1
+    
+    def _is_expired(self, entry, now):
+        return self.ttl_seconds > 0 and now - entry['created'] > self.ttl_seconds
+    
+    def _remove(self, key):
+        entry = self.cache.pop(key)
+        self.total_weight -= entry['weight']
+        return entry
+    
+    def get(self, text_obj, fragment_mode, grouping_tolerance):
+        """Get cached result with performance monitoring."""
+        start_time = time.time()
+        
+        try:
+            key = self._generate_key(text_obj, fragment_mode, grouping_tolerance)
+            if key is None:
+                self.stats['misses'] += 1
+                return None
+            
+            entry = self.cache.get(key)
+            if entry is not None and self._is_expired(entry, time.monotonic()):
+                self._remove(key)
+                self.stats['expirations'] += 1
+                entry = None
+            
+            if entry is not None:
+                self.cache.move_to_end(key)
+                self.stats['hits'] += 1
+                self._update_performance_stats('get', time.time() - start_time)
+                return entry['result']
+            
+            self.stats['misses'] += 1
+            self._update_performance_stats('get', time.time() - start_time)
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error in cache get: {e}")
+            self.stats['misses'] += 1
+            return None
+    
+    def set(self, text_obj, fragment_mode, grouping_tolerance, result):
+        """Set cache result with automatic cleanup."""
+        start_time = time.time()
+        
+        try:
+            key = self._generate_key(text_obj, fragment_mode, grouping_tolerance)
+            if key is None:
+                return False
+            
+            if key in self.cache:
+                self._remove(key)
+            
+            weight = self._entry_weight(result)
+            self.cache[key] = {
+                'result': result,
+                'weight': weight,
+                'created': time.monotonic(),
+                'source': getattr(text_obj, 'name', None)
+            }
+            self.total_weight += weight
+            self.stats['sets'] += 1
+            
+            # Check if cleanup is needed
+            if len(self.cache) > self.max_size or self.total_weight > self.max_weight:
+                self._cleanup()
+            
+            self._update_performance_stats('set', time.time() - start_time)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error in cache set: {e}")
+            return False
+    
+    def _expire(self):
+        """Drop every entry older than the TTL."""
+        now = time.monotonic()
+        expired = [key for key, entry in self.cache.items() if self._is_expired(entry, now)]
+        for key in expired:
+            self._remove(key)
+        self.stats['expirations'] += len(expired)
+        return len(expired)
+    
+    def _cleanup(self):
+        """
+        Expire stale entries, then evict least-recently-used ones.
+        
+        Once over budget, eviction continues down to the cleanup threshold
+        (and the same fraction of the weight budget) so that a full cache
+        does not evict on every subsequent set.
+        """
+        try:
+            expired = self._expire()
+            
+            if len(self.cache) <= self.max_size and self.total_weight <= self.max_weight:
+                if expired:
+                    self.stats['last_cleanup'] = time.time()
+                return
+            
+            low_water = min(self.cleanup_threshold, self.max_size)
+            weight_low_water = self.max_weight * low_water / max(self.max_size, 1)
+            
+            evicted = 0
+            # Always keep the most recent entry, even if it alone exceeds the budget
+            while len(self.cache) > 1 and (len(self.cache) > low_water or
+                                           self.total_weight > weight_low_water):
+                self._remove(next(iter(self.cache)))
+                evicted += 1
+            
+            self.stats['evictions'] += evicted
+            self.stats['last_cleanup'] = time.time()
+            
+            logger.debug(f"Cache cleanup: expired {expired}, evicted {evicted} entries "
+                         f"(weight {self.total_weight}/{self.max_weight})")
+            
+        except Exception as e:
+            logger.error(f"Error in cache cleanup: {e}")
+    
+    def _update_performance_stats(self, operation_type, duration):
+        """Update performance statistics."""
+        try:
+            self.performance_data['total_operations'] += 1
+            
+            if operation_type == 'get':
+                current_avg = self.performance_data['avg_get_time']
+                self.performance_data['avg_get_time'] = (
+                    (current_avg * (self.performance_data['total_operations'] - 1) + duration) / 
+                    self.performance_data['total_operations']
+                )
+            elif operation_type == 'set':
+                current_avg = self.performance_data['avg_set_time']
+                self.performance_data['avg_set_time'] = (
+                    (current_avg * (self.performance_data['total_operations'] - 1) + duration) / 
+                    self.performance_data['total_operations']
+                )
+                
+        except Exception as e:
+            logger.warning(f"Error updating performance stats: {e}")
+    
+    def get_stats(self):
+        """Get comprehensive cache statistics."""
+        total_requests = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'size': len(self.cache),
+            'max_size': self.max_size,
+            'hit_rate': hit_rate,
+            'hits': self.stats['hits'],
+            'misses': self.stats['misses'],
+            'sets': self.stats['sets'],
+            'clears': self.stats['clears'],
+            'evictions': self.stats['evictions'],
+            'expirations': self.stats['expirations'],
+            'weight': self.total_weight,
+            'max_weight': self.max_weight,
+            'memory_usage': f"{self.total_weight}/{self.max_weight} letters",
+            'avg_get_time': self.performance_data['avg_get_time'],
+            'avg_set_time': self.performance_data['avg_set_time'],
+            'total_operations': self.performance_data['total_operations'],
+            'last_cleanup': self.stats['last_cleanup']
+        }
+    
+    def invalidate_source(self, source_name):
+        """
+        Drop the entries built from a text object whose body or geometry changed.
+        
+        Keys are content digests, so stale entries would never hit again; this
+        frees them immediately instead of waiting for LRU eviction or the TTL.
+        """
+        stale = [key for key, entry in self.cache.items() if entry.get('source') == source_name]
+        for key in stale:
+            self._remove(key)
+        self.stats['invalidations'] += len(stale)
+        return len(stale)
+    
+    def clear(self):
+        """Clear all cache entries."""
+        self.stats['clears'] += len(self.cache)
+        self.cache.clear()
+        self.total_weight = 0
+        logger.info("Cache cleared")
+    
+    def optimize(self):
+        """Optimize cache performance."""
+        try:
+            # Remove invalid entries
+            invalid_keys = []
+            for key, entry in self.cache.items():
+                if not self._is_valid_cache_entry(entry['result']):
+                    invalid_keys.append(key)
+            
+            for key in invalid_keys:
+                self._remove(key)
+            
+            # Expire stale entries and enforce the budget
+            self._cleanup()
+            
+            logger.info(f"Cache optimized: removed {len(invalid_keys)} invalid entries")
+            return len(invalid_keys)
+            
+        except Exception as e:
+            logger.error(f"Error optimizing cache: {e}")
+            return 0
+    
+    def _is_valid_cache_entry(self, entry):
+        """Check if a cache entry is still valid."""
+        if isinstance(entry, separation.SeparationLayout):
+            return True  # Pure geometry data, no object references to go stale
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+            return False
+        
+        root, letters = entry
+        is_valid = self.object_validator
+        return is_valid(root) and all(is_valid(letter) for letter in letters)
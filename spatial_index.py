@@ -0,0 +1,149 @@
+"""
+Índice espacial de cajas envolventes 2D para TypeAnimator.
+
+Encuentra los pares de cajas cuya separación en cada eje no supera un hueco
+máximo, sin comparar todos contra todos: cada caja (extendida por el hueco) se
+reparte en las celdas de una rejilla uniforme y solo se comparan las cajas que
+comparten celda. La versión NumPy trabaja sobre arrays completos; la versión
+en Python puro sirve de respaldo sin NumPy y de referencia en los tests.
+"""
+
+import logging
+import math
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Blender
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Con celdas del tamaño mediano de caja, casi todas las cajas ocupan 1-4 celdas
+DEFAULT_CELL_FACTOR = 1.0
+MIN_CELL_SIZE = 1e-6
+
+# === TAMAÑO DE CELDA ===
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return 0.5 * (ordered[middle - 1] + ordered[middle])
+
+def choose_cell_size(mins, maxs, max_gap=(0.0, 0.0), factor: float = DEFAULT_CELL_FACTOR) -> Tuple[float, float]:
+    """Tamaño de celda por eje: mediana del tamaño de caja más el hueco permitido."""
+    cell = []
+    for axis in range(2):
+        extents = [hi[axis] - lo[axis] for lo, hi in zip(mins, maxs)]
+        size = (_median(extents) if extents else 0.0) * factor + max_gap[axis]
+        cell.append(max(size, MIN_CELL_SIZE))
+    return cell[0], cell[1]
+
+def _gap_ok(mins, maxs, i, j, max_gap) -> bool:
+    for axis in range(2):
+        gap = max(mins[i][axis], mins[j][axis]) - min(maxs[i][axis], maxs[j][axis])
+        if gap > max_gap[axis]:
+            return False
+    return True
+
+# === PYTHON PURO ===
+
+def pairs_within_gap_python(mins: Sequence[Sequence[float]], maxs: Sequence[Sequence[float]],
+                            max_gap=(0.0, 0.0), cell_size: Optional[Tuple[float, float]] = None
+                            ) -> List[Tuple[int, int]]:
+    """
+    Pares ``(i, j)`` con ``i < j`` cuyas cajas están a menos de ``max_gap`` por eje.
+
+    Implementación con diccionario de celdas, sin dependencias.
+    """
+    mins = [tuple(float(v) for v in box[:2]) for box in mins]
+    maxs = [tuple(float(v) for v in box[:2]) for box in maxs]
+    if cell_size is None:
+        cell_size = choose_cell_size(mins, maxs, max_gap)
+    origin = (min((box[0] for box in mins), default=0.0), min((box[1] for box in mins), default=0.0))
+
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    found: Set[Tuple[int, int]] = set()
+    for i, (lo, hi) in enumerate(zip(mins, maxs)):
+        x0 = int(math.floor((lo[0] - origin[0]) / cell_size[0]))
+        y0 = int(math.floor((lo[1] - origin[1]) / cell_size[1]))
+        x1 = int(math.floor((hi[0] + max_gap[0] - origin[0]) / cell_size[0]))
+        y1 = int(math.floor((hi[1] + max_gap[1] - origin[1]) / cell_size[1]))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                occupants = cells.setdefault((cx, cy), [])
+                for j in occupants:
+                    if (j, i) not in found and _gap_ok(mins, maxs, i, j, max_gap):
+                        found.add((j, i))
+                occupants.append(i)
+    return sorted(found)
+
+# === NUMPY ===
+
+def pairs_within_gap_numpy(mins, maxs, max_gap=(0.0, 0.0),
+                           cell_size: Optional[Tuple[float, float]] = None):
+    """
+    Versión vectorizada de ``pairs_within_gap_python``.
+
+    Returns:
+        np.ndarray: Array (k, 2) de pares ``i < j`` ordenados
+    """
+    mins = np.asarray(mins, dtype=np.float64)[:, :2]
+    maxs = np.asarray(maxs, dtype=np.float64)[:, :2]
+    count = len(mins)
+    if count < 2:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    gap = np.asarray(max_gap, dtype=np.float64)
+    if cell_size is None:
+        extents = np.median(maxs - mins, axis=0) * DEFAULT_CELL_FACTOR + gap
+        cell = np.maximum(extents, MIN_CELL_SIZE)
+    else:
+        cell = np.asarray(cell_size, dtype=np.float64)
+    origin = mins.min(axis=0)
+
+    # Rango de celdas de cada caja extendida por el hueco
+    low = np.floor((mins - origin) / cell).astype(np.int64)
+    high = np.floor((maxs + gap - origin) / cell).astype(np.int64)
+    span = high - low + 1
+    per_box = span[:, 0] * span[:, 1]
+
+    # Una fila (caja, celda) por cada celda que toca cada caja
+    boxes = np.repeat(np.arange(count, dtype=np.int64), per_box)
+    offsets = np.arange(len(boxes)) - np.repeat(np.cumsum(per_box) - per_box, per_box)
+    cell_x = low[boxes, 0] + offsets % span[boxes, 0]
+    cell_y = low[boxes, 1] + offsets // span[boxes, 0]
+    keys = cell_x * (int(high[:, 1].max()) + 1) + cell_y
+
+    order = np.lexsort((boxes, keys))
+    keys = keys[order]
+    boxes = boxes[order]
+
+    # Pares dentro de cada celda: distancia d entre filas de la misma celda
+    candidates = []
+    distance = 1
+    while distance < len(keys):
+        same = keys[distance:] == keys[:-distance]
+        if not same.any():
+            break
+        candidates.append(np.stack((boxes[:-distance][same], boxes[distance:][same]), axis=1))
+        distance += 1
+    if not candidates:
+        return np.zeros((0, 2), dtype=np.int64)
+
+    pairs = np.concatenate(candidates)
+    pairs = np.unique(pairs[:, 0] * count + pairs[:, 1])
+    first, second = pairs // count, pairs % count
+
+    # Comprobación exacta del hueco en ambos ejes
+    separation = np.maximum(mins[first], mins[second]) - np.minimum(maxs[first], maxs[second])
+    keep = np.all(separation <= gap, axis=1)
+    return np.stack((first[keep], second[keep]), axis=1)
+
+def pairs_within_gap(mins, maxs, max_gap=(0.0, 0.0), cell_size: Optional[Tuple[float, float]] = None):
+    """Pares de cajas cercanas con el backend disponible (NumPy o Python puro)."""
+    if np is not None:
+        return pairs_within_gap_numpy(mins, maxs, max_gap, cell_size)
+    return pairs_within_gap_python(mins, maxs, max_gap, cell_size)
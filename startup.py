@@ -0,0 +1,126 @@
+"""
+Perfil de arranque de TypeAnimator.
+
+``registration.register()`` ejecuta cada paso dentro de ``StartupProfile.step``
+para medir su duración; el trabajo que solo hace falta con la UI (iconos,
+enums de presets, fuentes, diagnóstico) se encola en ``DeferredTasks`` y se
+ejecuta en el primer tick del timer, cuando Blender ya tiene la interfaz en
+marcha. En ``bpy.app.background`` esos pasos se marcan como omitidos y no se
+ejecutan nunca. El perfil resultante se escribe en el log y en un JSON.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PHASE_REGISTER = 'register'
+PHASE_DEFERRED = 'deferred'
+
+class StartupProfile:
+    """Duración y estado de cada paso del registro del addon."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.reset()
+
+    def reset(self, background: bool = False) -> None:
+        """Empieza un perfil nuevo (un registro del addon)."""
+        self.background = background
+        self.steps: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def step(self, name: str, phase: str = PHASE_REGISTER):
+        """Mide el bloque; si lanza una excepción el paso queda como ``error`` y se relanza."""
+        record = {'name': name, 'phase': phase, 'status': 'ok', 'duration': 0.0}
+        self.steps.append(record)
+        start = self._clock()
+        try:
+            yield record
+        except Exception as e:
+            record['status'] = 'error'
+            record['error'] = str(e)
+            raise
+        finally:
+            record['duration'] = self._clock() - start
+
+    def skip(self, name: str, reason: str) -> None:
+        """Registra un paso que no se ejecuta en este arranque."""
+        self.steps.append({'name': name, 'phase': PHASE_REGISTER, 'status': 'skipped',
+                           'duration': 0.0, 'reason': reason})
+
+    def total(self, phase: Optional[str] = PHASE_REGISTER) -> float:
+        """Segundos acumulados de una fase (todas si ``phase`` es None)."""
+        return sum(s['duration'] for s in self.steps if phase is None or s['phase'] == phase)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'mode': 'background' if self.background else 'interactive',
+            'register_time': self.total(PHASE_REGISTER),
+            'deferred_time': self.total(PHASE_DEFERRED),
+            'steps': [dict(s) for s in self.steps],
+        }
+
+    def report(self) -> List[str]:
+        """Líneas legibles del perfil, un paso por línea."""
+        lines = [f"Arranque de TypeAnimator ({self.as_dict()['mode']}): "
+                 f"registro {self.total(PHASE_REGISTER) * 1000:.1f} ms, "
+                 f"diferido {self.total(PHASE_DEFERRED) * 1000:.1f} ms"]
+        for s in self.steps:
+            detail = s.get('error') or s.get('reason') or ''
+            lines.append(f"  [{s['phase']}] {s['name']:<24} {s['duration'] * 1000:8.2f} ms  {s['status']}"
+                         + (f" ({detail})" if detail else ''))
+        return lines
+
+    def save(self, path: str) -> bool:
+        """Guarda el perfil como JSON."""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.as_dict(), f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            logger.warning(f"No se pudo guardar el perfil de arranque: {e}")
+            return False
+
+class DeferredTasks:
+    """Cola de pasos de registro aplazados hasta que la UI está en uso."""
+
+    def __init__(self, profile: StartupProfile):
+        self.profile = profile
+        self._tasks: List[tuple] = []
+
+    def add(self, name: str, func: Callable[[], Any]) -> None:
+        self._tasks.append((name, func))
+
+    def pending(self) -> List[str]:
+        return [name for name, _func in self._tasks]
+
+    def clear(self) -> None:
+        self._tasks.clear()
+
+    def run_all(self) -> int:
+        """
+        Ejecuta y vacía la cola; el fallo de una tarea no detiene las siguientes.
+
+        Returns:
+            int: Número de tareas ejecutadas sin error
+        """
+        tasks, self._tasks = self._tasks, []
+        completed = 0
+        for name, func in tasks:
+            try:
+                with self.profile.step(name, PHASE_DEFERRED):
+                    func()
+                completed += 1
+            except Exception as e:
+                logger.error(f"Error en paso diferido '{name}': {e}")
+        return completed
+
+_profile = StartupProfile()
+
+def get_startup_profile() -> StartupProfile:
+    """Perfil del último registro del addon."""
+    return _profile
@@ -0,0 +1,247 @@
+"""
+Construcción en bloque de subtítulos para TypeAnimator.
+
+Cada cue se convierte en una curva de texto y su objeto, creados con
+``bpy.data`` (sin operadores ni cambios de contexto). El fondo de tercio
+inferior es una única malla que todos los cues instancian. La visibilidad
+de cada cue se anima con una acción compartida entre su texto y su fondo,
+escrita en bloque. Todos los objetos se enlazan a una colección nueva que
+se añade a la escena de una sola vez.
+
+Con ``build_pooled_subtitles`` solo se crean tantos objetos como cues se
+ven a la vez como máximo; cada uno muestra por turnos varios cues que no
+se solapan (ver ``subtitle_pool``).
+
+Con ``build_sharded`` los cues se reparten en rangos contiguos que otros
+procesos de Blender construyen en paralelo, cada uno en su propio ``.blend``;
+la escena actual enlaza después las colecciones resultantes.
+"""
+
+import logging
+import os
+import subprocess
+import tempfile
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+from .constants import SUBTITLE_CONFIG
+from .baking import INTERPOLATION_CONSTANT, write_fcurve
+from .subtitles import Cue, assign_slots, cue_frames, read_cues, shard_ranges
+from . import subtitle_pool
+
+logger = logging.getLogger(__name__)
+
+ADDON_PACKAGE = __package__
+VISIBILITY_PATHS = ('hide_viewport', 'hide_render')
+
+# === PIEZAS COMPARTIDAS ===
+
+def background_mesh(size: float = None):
+    """Malla del fondo de tercio inferior (una sola para todos los cues)."""
+    name = SUBTITLE_CONFIG['BACKGROUND_MESH']
+    mesh = bpy.data.meshes.get(name)
+    if mesh is None:
+        half = (size or SUBTITLE_CONFIG['BACKGROUND_SIZE']) / 2.0
+        mesh = bpy.data.meshes.new(name)
+        mesh.from_pydata([(-half, -half, 0.0), (half, -half, 0.0), (half, half, 0.0), (-half, half, 0.0)],
+                         [], [(0, 1, 2, 3)])
+        mesh.update()
+    return mesh
+
+def visibility_keys(intervals: Sequence[Tuple[int, int]]):
+    """
+    Keyframes constantes (frames, oculto) para ver solo los intervalos ``[entrada, salida)``.
+
+    Si un intervalo empieza en el frame en que acaba otro, gana la entrada.
+    """
+    keys = {intervals[0][0] - 1: 1.0}
+    for _in_frame, out_frame in intervals:
+        keys[out_frame] = 1.0
+    for in_frame, _out_frame in intervals:
+        keys[in_frame] = 0.0
+    frames = sorted(keys)
+    return np.array(frames, dtype=np.float64), np.array([keys[frame] for frame in frames])
+
+def visibility_action(name: str, intervals: Sequence[Tuple[int, int]]):
+    """Acción que oculta un objeto fuera de sus intervalos ``[entrada, salida)``."""
+    action = bpy.data.actions.new(name)
+    frames, hidden = visibility_keys(sorted(intervals))
+    for data_path in VISIBILITY_PATHS:
+        write_fcurve(action, data_path, -1, frames, hidden, INTERPOLATION_CONSTANT)
+    return action
+
+# === CONSTRUCCIÓN ===
+
+def build_subtitles(cues: Sequence[Cue], fps: float, name: str, with_background: bool = True):
+    """
+    Crea los objetos de los cues en una colección nueva (aún sin enlazar a la escena).
+
+    Returns:
+        tuple: (colección, estadísticas)
+    """
+    start_time = time.perf_counter()
+    collection = bpy.data.collections.new(SUBTITLE_CONFIG['COLLECTION_PREFIX'] + name)
+    mesh = background_mesh() if with_background else None
+    text_y = SUBTITLE_CONFIG['TEXT_Y']
+    background_location = (0.0, SUBTITLE_CONFIG['BACKGROUND_Y'], 0.0)
+
+    objects = []
+    for cue, (in_frame, out_frame) in zip(cues, cue_frames(cues, fps)):
+        label = f"SRT_{cue.index}"
+        curve = bpy.data.curves.new(label, 'FONT')
+        curve.body = cue.text.replace('\n', ' ')
+        curve.align_x = 'CENTER'
+        text_obj = bpy.data.objects.new(label, curve)
+        text_obj.location.y = text_y
+        action = visibility_action(label + "_Vis", [(in_frame, out_frame)])
+        text_obj.animation_data_create().action = action
+        objects.append(text_obj)
+        if mesh is not None:
+            background = bpy.data.objects.new(label + "_BG", mesh)
+            background.location = background_location
+            background.animation_data_create().action = action
+            objects.append(background)
+
+    link = collection.objects.link
+    for obj in objects:
+        link(obj)
+
+    stats = {'cues': len(cues), 'objects': len(objects), 'time': time.perf_counter() - start_time}
+    logger.info(f"Subtítulos '{name}': {stats['cues']} cues, {stats['objects']} objetos en {stats['time']:.2f}s")
+    return collection, stats
+
+def build_pooled_subtitles(cues: Sequence[Cue], fps: float, name: str, with_background: bool = True):
+    """
+    Crea un pool de objetos de texto que se reparten los cues (aún sin enlazar a la escena).
+
+    Cada objeto del pool tiene una sola acción de visibilidad con todos sus
+    cues; el texto lo cambia el handler de frame a partir del horario guardado.
+
+    Returns:
+        tuple: (colección, estadísticas)
+    """
+    start_time = time.perf_counter()
+    collection = bpy.data.collections.new(SUBTITLE_CONFIG['COLLECTION_PREFIX'] + name)
+    mesh = background_mesh() if with_background else None
+    text_y = SUBTITLE_CONFIG['TEXT_Y']
+    background_location = (0.0, SUBTITLE_CONFIG['BACKGROUND_Y'], 0.0)
+
+    frames = cue_frames(cues, fps)
+    slots, count = assign_slots(frames)
+    schedules: List[List[Tuple[int, int, str]]] = [[] for _ in range(count)]
+    for cue, (in_frame, out_frame), slot in zip(cues, frames, slots):
+        schedules[slot].append((in_frame, out_frame, cue.text.replace('\n', ' ')))
+
+    objects = []
+    for slot, schedule in enumerate(schedules):
+        label = f"SRT_{name}_Pool{slot}"
+        schedule.sort()
+        curve = bpy.data.curves.new(label, 'FONT')
+        curve.body = schedule[0][2]
+        curve.align_x = 'CENTER'
+        text_obj = bpy.data.objects.new(label, curve)
+        text_obj.location.y = text_y
+        subtitle_pool.write_schedule(text_obj, schedule)
+        action = visibility_action(label + "_Vis", [(in_frame, out_frame) for in_frame, out_frame, _ in schedule])
+        text_obj.animation_data_create().action = action
+        objects.append(text_obj)
+        if mesh is not None:
+            background = bpy.data.objects.new(label + "_BG", mesh)
+            background.location = background_location
+            background.animation_data_create().action = action
+            objects.append(background)
+
+    link = collection.objects.link
+    for obj in objects:
+        link(obj)
+
+    stats = {'cues': len(cues), 'objects': len(objects), 'pool': count, 'time': time.perf_counter() - start_time}
+    logger.info(f"Subtítulos '{name}' en pool: {stats['cues']} cues con {count} textos "
+                f"({stats['objects']} objetos) en {stats['time']:.2f}s")
+    return collection, stats
+
+def import_subtitles(scene, cues: Sequence[Cue], name: str, with_background: bool = True, pooled: bool = False):
+    """Construye los cues (en pool si ``pooled``) y enlaza su colección a la escena."""
+    build = build_pooled_subtitles if pooled else build_subtitles
+    collection, stats = build(cues, scene.render.fps / scene.render.fps_base, name, with_background)
+    scene.collection.children.link(collection)
+    return collection, stats
+
+# === CONSTRUCCIÓN EN PARALELO ===
+
+def build_shard_file(path: str, first: int, last: int, fps: float, name: str, output: str,
+                     with_background: bool = True, fmt: Optional[str] = None,
+                     time_range: Optional[Tuple[float, float]] = None) -> None:
+    """Worker: construye los cues ``[first, last)`` de ``path`` (ya filtrados) y los guarda en ``output``."""
+    cues = list(islice(read_cues(path, fmt, time_range), first, last))
+    collection, _stats = build_subtitles(cues, fps, name, with_background)
+    bpy.data.libraries.write(output, {collection}, fake_user=True)
+
+def _worker_command(path: str, shard: range, fps: float, name: str, output: str, with_background: bool,
+                    fmt: Optional[str], time_range: Optional[Tuple[float, float]]):
+    expression = (
+        "import addon_utils, sys\n"
+        f"addon_utils.enable({ADDON_PACKAGE!r}, default_set=False)\n"
+        f"from {ADDON_PACKAGE}.subtitle_builder import build_shard_file\n"
+        f"build_shard_file({path!r}, {shard.start}, {shard.stop}, {fps!r}, {name!r}, {output!r}, "
+        f"{with_background!r}, {fmt!r}, {time_range!r})\n"
+        "sys.exit(0)\n"
+    )
+    return [bpy.app.binary_path, '-b', '--python-expr', expression]
+
+def build_sharded(scene, path: str, cue_count: int, shards: int, name: str,
+                  with_background: bool = True, output_dir: Optional[str] = None, fmt: Optional[str] = None,
+                  time_range: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+    """
+    Construye los cues en ``shards`` procesos de Blender en paralelo y enlaza sus colecciones.
+
+    ``cue_count`` es el número de cues tras filtrar por ``time_range``; cada
+    worker vuelve a leer el archivo en streaming y se queda con su rango.
+    Cada shard queda en ``<output_dir>/<name>_partN.blend``; la escena enlaza
+    (no copia) las colecciones, así que el archivo actual apenas crece.
+    """
+    start_time = time.perf_counter()
+    fps = scene.render.fps / scene.render.fps_base
+    output_dir = output_dir or os.path.dirname(os.path.abspath(path))
+    ranges = shard_ranges(cue_count, min(shards, SUBTITLE_CONFIG['MAX_SHARDS']))
+
+    workers = []
+    for number, shard in enumerate(ranges):
+        part_name = f"{name}_part{number}"
+        output = os.path.join(output_dir, part_name + ".blend")
+        command = _worker_command(path, shard, fps, part_name, output, with_background, fmt, time_range)
+        log = tempfile.TemporaryFile()
+        workers.append((part_name, output, log, subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)))
+
+    linked: List[Any] = []
+    errors = []
+    for part_name, output, log, process in workers:
+        process.wait()
+        log.seek(0)
+        tail = log.read()[-300:].decode(errors='replace')
+        log.close()
+        if process.returncode != 0 or not os.path.exists(output):
+            errors.append(f"{part_name}: código {process.returncode} {tail}")
+            continue
+        collection_name = SUBTITLE_CONFIG['COLLECTION_PREFIX'] + part_name
+        with bpy.data.libraries.load(output, link=True) as (data_from, data_to):
+            data_to.collections = [c for c in data_from.collections if c == collection_name]
+        for collection in data_to.collections:
+            scene.collection.children.link(collection)
+            linked.append(collection)
+
+    stats = {'cues': cue_count, 'shards': len(ranges), 'linked': len(linked), 'errors': errors,
+             'time': time.perf_counter() - start_time}
+    for error in errors:
+        logger.error(f"Shard de subtítulos falló: {error}")
+    logger.info(f"Subtítulos '{name}' en {stats['shards']} procesos: {stats['linked']} colecciones "
+                f"enlazadas en {stats['time']:.2f}s")
+    return stats
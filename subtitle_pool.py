@@ -0,0 +1,115 @@
+"""
+Pool de objetos de subtítulos para TypeAnimator.
+
+En modo pool cada objeto de texto muestra varios cues que no se solapan.
+Su horario (frames de entrada/salida y texto de cada cue) se guarda como
+JSON en una propiedad del objeto. La visibilidad va horneada en keyframes;
+el texto no se puede animar en Blender, así que el handler de cambio de
+frame cambia ``data.body`` solo cuando empieza un cue nuevo en ese objeto.
+"""
+
+import json
+import logging
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import bpy  # type: ignore
+except Exception:  # pragma: no cover - bpy not available in tests
+    bpy = None
+
+from . import invalidation
+from .invalidation import InvalidationEvent
+
+logger = logging.getLogger(__name__)
+
+POOL_PROPERTY = "ta_subtitle_pool"
+
+class PoolSchedule:
+    """Cues de un objeto del pool ordenados por entrada y el cue que muestra ahora."""
+
+    def __init__(self, name: str, ins: Sequence[int], outs: Sequence[int], texts: Sequence[str]):
+        self.name = name
+        self.ins = list(ins)
+        self.outs = list(outs)
+        self.texts = list(texts)
+        self.current = -1
+
+    def active_at(self, frame: float) -> int:
+        """Índice del cue visible en ``frame`` o -1."""
+        index = bisect_right(self.ins, frame) - 1
+        if index >= 0 and frame < self.outs[index]:
+            return index
+        return -1
+
+_pools: Dict[str, PoolSchedule] = {}
+_scanned = False
+
+def write_schedule(text_obj, cues: Sequence[Tuple[int, int, str]]) -> PoolSchedule:
+    """Guarda el horario ``(entrada, salida, texto)`` en el objeto y lo activa."""
+    cues = sorted(cues)
+    ins = [cue[0] for cue in cues]
+    outs = [cue[1] for cue in cues]
+    texts = [cue[2] for cue in cues]
+    text_obj[POOL_PROPERTY] = json.dumps({'in': ins, 'out': outs, 'text': texts}, ensure_ascii=False)
+    schedule = _pools[text_obj.name] = PoolSchedule(text_obj.name, ins, outs, texts)
+    return schedule
+
+def _load(obj) -> Optional[PoolSchedule]:
+    try:
+        data = json.loads(obj[POOL_PROPERTY])
+        return PoolSchedule(obj.name, data['in'], data['out'], data['text'])
+    except Exception as e:
+        logger.error(f"Horario de subtítulos ilegible en {obj.name}: {e}")
+        return None
+
+def _scan() -> None:
+    global _scanned
+    _pools.clear()
+    for obj in bpy.data.objects:
+        if POOL_PROPERTY in obj:
+            schedule = _load(obj)
+            if schedule is not None:
+                _pools[obj.name] = schedule
+    _scanned = True
+
+def invalidate(_payload=None) -> None:
+    """Vuelve a leer los horarios desde los objetos en el próximo frame."""
+    global _scanned
+    _scanned = False
+    _pools.clear()
+
+def update_pools(scene) -> int:
+    """
+    Pone en cada objeto del pool el texto del cue que empieza a verse.
+
+    Returns:
+        int: Objetos cuyo texto cambió
+    """
+    if bpy is None:
+        return 0
+    if not _scanned:
+        _scan()
+    if not _pools:
+        return 0
+    frame = scene.frame_current
+    changed = 0
+    for name in list(_pools):
+        schedule = _pools[name]
+        active = schedule.active_at(frame)
+        if active < 0 or active == schedule.current:
+            continue  # Oculto por sus keyframes o sin cambio de cue
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            del _pools[name]
+            continue
+        obj.data.body = schedule.texts[active]
+        schedule.current = active
+        changed += 1
+    return changed
+
+def get_pool_stats() -> Dict[str, int]:
+    """Objetos del pool activos y cues que reparten."""
+    return {'pools': len(_pools), 'cues': sum(len(schedule.ins) for schedule in _pools.values())}
+
+invalidation.subscribe(InvalidationEvent.FILE_LOADED, invalidate)
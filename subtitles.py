@@ -0,0 +1,248 @@
+"""
+Lectura de subtítulos en streaming para TypeAnimator.
+
+Los cues se leen línea a línea de un archivo abierto y se entregan con un
+generador: nunca se carga el archivo completo ni se aplica una regex sobre
+todo el texto, y los finales de línea CRLF/LF dan igual. Se admiten SRT,
+WebVTT y ASS/SSA; con un rango de tiempo solo se entregan los cues que lo
+tocan. Módulo sin dependencias de ``bpy``.
+"""
+
+import heapq
+import os
+import re
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Tiempos en segundos; ``index`` es la posición del cue en el archivo (desde 1)
+Cue = namedtuple('Cue', 'index start end text')
+
+TIMESTAMP_RE = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{1,2})[,.](\d{1,3})")
+ARROW = '-->'
+# Línea de tiempos habitual en un solo match (el resto de casos usa parse_timestamp)
+TIMING_LINE_RE = re.compile(r"\s*" + TIMESTAMP_RE.pattern + r"\s*-->\s*" + TIMESTAMP_RE.pattern)
+VTT_TAG_RE = re.compile(r"<[^>]*>")
+VTT_BLOCKS = ('WEBVTT', 'NOTE', 'STYLE', 'REGION')
+ASS_OVERRIDE_RE = re.compile(r"\{[^}]*\}")
+
+FORMATS = ('srt', 'vtt', 'ass')
+EXTENSIONS = {'.srt': 'srt', '.vtt': 'vtt', '.ass': 'ass', '.ssa': 'ass'}
+
+class SubtitleError(ValueError):
+    """Línea de tiempos ilegible (el mensaje incluye el número de línea)."""
+
+def parse_timestamp(value: str) -> float:
+    """``"01:02:03,450"`` (o ``"02:03.450"``) -> segundos."""
+    match = TIMESTAMP_RE.search(value)
+    if match is None:
+        raise SubtitleError(f"Tiempo inválido: {value!r}")
+    return _seconds(*match.groups())
+
+def _seconds(hours, minutes, seconds, fraction) -> float:
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction.ljust(3, '0')) / 1000.0
+
+def _timing_line(line: str, line_number: int):
+    match = TIMING_LINE_RE.match(line)
+    if match is not None:
+        groups = match.groups()
+        return _seconds(*groups[:4]), _seconds(*groups[4:])
+    start, _, end = line.partition(ARROW)
+    try:
+        return parse_timestamp(start), parse_timestamp(end)
+    except SubtitleError as e:
+        raise SubtitleError(f"Línea {line_number}: {e}") from e
+
+def iter_srt(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Genera los cues de un SRT a partir de sus líneas (un archivo abierto sirve).
+
+    Se toleran índices ausentes o desordenados, líneas en blanco extra y un
+    último cue sin línea en blanco final.
+    """
+    count = 0
+    timing = None
+    text: List[str] = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if timing is None:
+            if ARROW in line:
+                timing = _timing_line(line, line_number)
+            continue
+        if line.strip():
+            text.append(line.strip())
+            continue
+        count += 1
+        yield Cue(count, timing[0], timing[1], "\n".join(text))
+        timing, text = None, []
+    if timing is not None:
+        yield Cue(count + 1, timing[0], timing[1], "\n".join(text))
+
+def iter_vtt(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Genera los cues de un WebVTT: ignora la cabecera y los bloques NOTE,
+    STYLE y REGION, los identificadores de cue, los ajustes tras el tiempo
+    y las etiquetas (``<b>``, ``<v Nombre>``, ``<00:01.000>``...).
+    """
+    count = 0
+    timing = None
+    skipping = False
+    text: List[str] = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if line_number == 1:
+            line = line.lstrip('\ufeff')
+        if timing is None:
+            if skipping or line.startswith(VTT_BLOCKS):
+                # Cabecera y bloques sin cue: se saltan hasta la siguiente línea en blanco
+                skipping = bool(line.strip())
+            elif ARROW in line:
+                timing = _timing_line(line, line_number)
+            continue
+        if line.strip():
+            text.append(VTT_TAG_RE.sub('', line).strip())
+            continue
+        count += 1
+        yield Cue(count, timing[0], timing[1], "\n".join(text))
+        timing, text = None, []
+    if timing is not None:
+        yield Cue(count + 1, timing[0], timing[1], "\n".join(text))
+
+def _ass_text(text: str) -> str:
+    text = ASS_OVERRIDE_RE.sub('', text)
+    return text.replace('\\N', '\n').replace('\\n', '\n').replace('\\h', ' ').strip()
+
+def iter_ass(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Genera los cues ``Dialogue`` de la sección ``[Events]`` de un ASS/SSA,
+    en el orden del archivo, respetando su línea ``Format``.
+    """
+    count = 0
+    in_events = False
+    fields = ['layer', 'start', 'end', 'style', 'name', 'marginl', 'marginr', 'marginv', 'effect', 'text']
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip().lstrip('\ufeff')
+        if line.startswith('['):
+            in_events = line.lower() == '[events]'
+            continue
+        if not in_events or ':' not in line:
+            continue
+        kind, _, rest = line.partition(':')
+        kind = kind.strip().lower()
+        if kind == 'format':
+            fields = [field.strip().lower() for field in rest.split(',')]
+            continue
+        if kind != 'dialogue':
+            continue
+        values = dict(zip(fields, (value.strip() for value in rest.split(',', len(fields) - 1))))
+        try:
+            start, end = parse_timestamp(values['start']), parse_timestamp(values['end'])
+        except (KeyError, SubtitleError) as e:
+            raise SubtitleError(f"Línea {line_number}: {e}") from e
+        count += 1
+        yield Cue(count, start, end, _ass_text(values.get('text', '')))
+
+PARSERS = {'srt': iter_srt, 'vtt': iter_vtt, 'ass': iter_ass}
+
+def detect_format(path: str, first_line: str = '') -> str:
+    """Formato por la extensión o, si no se reconoce, por la primera línea."""
+    fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if fmt:
+        return fmt
+    head = first_line.lstrip('\ufeff').strip()
+    if head.startswith('WEBVTT'):
+        return 'vtt'
+    if head.lower() == '[script info]':
+        return 'ass'
+    return 'srt'
+
+def filter_cues(cues: Iterable[Cue], time_range: Optional[Tuple[float, float]] = None) -> Iterator[Cue]:
+    """Solo los cues que se solapan con ``time_range`` (segundos, ambos extremos incluidos)."""
+    if time_range is None:
+        yield from cues
+        return
+    start, end = time_range
+    for cue in cues:
+        if cue.end >= start and cue.start <= end:
+            yield cue
+
+def iter_cues(lines: Iterable[str], fmt: str = 'srt',
+              time_range: Optional[Tuple[float, float]] = None) -> Iterator[Cue]:
+    """Cues de unas líneas en el formato indicado, filtrados por tiempo."""
+    if fmt not in PARSERS:
+        raise SubtitleError(f"Formato de subtítulos no soportado: {fmt}")
+    return filter_cues(PARSERS[fmt](lines), time_range)
+
+def read_cues(path: str, fmt: Optional[str] = None,
+              time_range: Optional[Tuple[float, float]] = None) -> Iterator[Cue]:
+    """Cues de un archivo, leídos bajo demanda (formato detectado si no se indica)."""
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        if fmt is None:
+            first_line = f.readline()
+            fmt = detect_format(path, first_line)
+            f.seek(0)
+        yield from iter_cues(f, fmt, time_range)
+
+def iter_srt_file(path: str) -> Iterator[Cue]:
+    """Cues de un archivo SRT, leídos bajo demanda."""
+    return read_cues(path, 'srt')
+
+def frame_range_seconds(frame_start: int, frame_end: int, fps: float) -> Tuple[float, float]:
+    """Rango de frames de la escena en segundos (incluye el último frame completo)."""
+    return frame_start / fps, (frame_end + 1) / fps
+
+def to_frame(seconds: float, fps: float) -> int:
+    """Segundos -> frame más cercano."""
+    return int(round(seconds * fps))
+
+def shard_ranges(count: int, shards: int) -> List[range]:
+    """Divide ``count`` cues en ``shards`` rangos contiguos de tamaño parecido."""
+    shards = max(min(int(shards), count), 1)
+    size, extra = divmod(count, shards)
+    ranges, start = [], 0
+    for shard in range(shards):
+        end = start + size + (1 if shard < extra else 0)
+        ranges.append(range(start, end))
+        start = end
+    return ranges
+
+def cue_frames(cues: Sequence[Cue], fps: float):
+    """Frames de entrada/salida de cada cue (la salida siempre después de la entrada)."""
+    frames = []
+    for cue in cues:
+        in_frame = to_frame(cue.start, fps)
+        frames.append((in_frame, max(to_frame(cue.end, fps), in_frame + 1)))
+    return frames
+
+# === POOL DE OBJETOS ===
+
+def max_overlap(frames: Sequence[Tuple[int, int]]) -> int:
+    """Máximo de cues visibles a la vez (barrido de intervalos ``[entrada, salida)``)."""
+    events = sorted([(in_frame, 1) for in_frame, _out in frames] + [(out, -1) for _in, out in frames])
+    active = peak = 0
+    for _frame, delta in events:  # a igual frame, las salidas (-1) van antes que las entradas
+        active += delta
+        peak = max(peak, active)
+    return peak
+
+def assign_slots(frames: Sequence[Tuple[int, int]]) -> Tuple[List[int], int]:
+    """
+    Asigna cada cue a un objeto del pool sin que dos cues del mismo objeto se solapen.
+
+    Se reutiliza el objeto que quedó libre antes; el número de objetos
+    resultante es igual a ``max_overlap``.
+
+    Returns:
+        tuple: (objeto asignado a cada cue, número de objetos)
+    """
+    slots = [0] * len(frames)
+    free: List[Tuple[int, int]] = []  # (frame en que queda libre, objeto)
+    count = 0
+    for cue in sorted(range(len(frames)), key=lambda cue: frames[cue]):
+        in_frame, out_frame = frames[cue]
+        if free and free[0][0] <= in_frame:
+            _free_at, slot = heapq.heappop(free)
+        else:
+            slot, count = count, count + 1
+        slots[cue] = slot
+        heapq.heappush(free, (out_frame, slot))
+    return slots, count
@@ -0,0 +1,172 @@
+"""
+Script de verificación de las ventanas de actividad de TypeAnimator.
+Comprueba los bordes por letra, las letras que el tracker marca como
+sucias y que escribir solo esas letras deja el mismo estado que evaluar
+todas en cada frame.
+"""
+
+import numpy as np
+
+
+class _Letter(dict):
+    """Objeto mínimo con los transforms que escribe ``LetterBatch``."""
+
+    def __init__(self, name, x=0.0):
+        super().__init__()
+        self.name = name
+        self.location = np.array([x, 0.0, 0.0])
+        self.rotation_euler = np.zeros(3)
+        self.scale = np.ones(3)
+        self.hide_viewport = False
+
+    def update_tag(self):
+        pass
+
+
+CHANNELS = {'loc': True, 'loc_amplitude': 1.5, 'rot': True, 'rot_amplitude': 0.4,
+            'scale': True, 'scale_amplitude': 0.2, 'vis': True}
+
+
+def _curves(static_mid):
+    from curve_lut import CurveLUT
+    mid = CurveLUT([1.0, 1.0]) if static_mid else CurveLUT.bake(lambda t: 1.0 - 0.2 * t, 64)
+    return {'in': CurveLUT.bake(lambda t: t * t, 64), 'mid': mid,
+            'out': CurveLUT.bake(lambda t: 1.0 - t, 64)}
+
+
+def _timing(**overrides):
+    timing = {'start_frame': 10, 'duration': 40, 'overlap': 0.5, 'loop_count': 1,
+              'in_end': 0.25, 'out_start': 0.75}
+    timing.update(overrides)
+    return timing
+
+
+def _state(letters):
+    return np.array([np.concatenate((l.location, l.rotation_euler, l.scale, [l.hide_viewport]))
+                     for l in letters])
+
+
+def test_activity_edges():
+    """Bordes crecientes por letra, con dos ventanas si MID es constante."""
+    print("=== TEST: BORDES DE ACTIVIDAD ===")
+    from evaluation import activity_edges, is_static_curve
+
+    timing = _timing()
+    edges = activity_edges(4, timing)
+    print(f"📊 Bordes (MID variable): {edges.tolist()}")
+    assert edges.shape == (4, 2), "bordes incorrectos con MID variable"
+    assert edges[:, 0].tolist() == [10.0, 15.0, 20.0, 25.0], "bordes incorrectos con MID variable"
+    assert np.all(edges[:, 1] == 50.0), "bordes incorrectos con MID variable"
+
+    edges = activity_edges(4, timing, static_mid=True)
+    print(f"📊 Bordes (MID constante): {edges[1].tolist()}")
+    assert edges.shape == (4, 4), "bordes incorrectos con MID constante"
+    assert edges[1].tolist() == [15.0, 25.0, 45.0, 50.0], "bordes incorrectos con MID constante"
+    assert np.all(np.diff(edges, axis=1) >= 0), "bordes no crecientes"
+    assert edges.max() <= 50.0, "bordes fuera de la animación"
+
+    curves = _curves(static_mid=True)
+    assert is_static_curve(curves['mid']), "detección de curva constante incorrecta"
+    assert not is_static_curve(curves['in']), "detección de curva constante incorrecta"
+    assert not is_static_curve(object()), "detección de curva constante incorrecta"
+
+    print("✅ Bordes de actividad correctos")
+
+
+def test_dirty_indices():
+    """Primera llamada completa, letras quietas omitidas y firma nueva = escritura completa."""
+    print("=== TEST: LETRAS SUCIAS ===")
+    from evaluation import ActivityTracker
+
+    tracker = ActivityTracker()
+    timing = _timing()
+    assert tracker.dirty_indices(0, 4, timing, False, 'a').tolist() == [0, 1, 2, 3], \
+        "la primera llamada no escribe todas las letras"
+    assert tracker.dirty_indices(1, 4, timing, False, 'a').size == 0, "letras antes de su ventana marcadas como sucias"
+    # Frame 16: las letras 0 y 1 han empezado (bordes 10 y 15)
+    dirty = tracker.dirty_indices(16, 4, timing, False, 'a').tolist()
+    print(f"📊 Sucias en el frame 16: {dirty}")
+    assert dirty == [0, 1], "letras activas incorrectas"
+    # Final de la animación: todas cruzan el último borde una vez y luego quedan quietas
+    assert tracker.dirty_indices(60, 4, timing, False, 'a').tolist() == [0, 1, 2, 3], \
+        "el cruce del borde final no marca las letras"
+    assert tracker.dirty_indices(61, 4, timing, False, 'a').size == 0, "letras terminadas marcadas como sucias"
+    assert tracker.dirty_indices(61, 4, timing, False, 'b').tolist() == [0, 1, 2, 3], \
+        "un cambio de firma no fuerza la escritura completa"
+    assert tracker.dirty_indices(62, 5, timing, False, 'b').tolist() == [0, 1, 2, 3, 4], \
+        "un cambio en el número de letras no fuerza la escritura completa"
+
+    print("✅ Letras sucias correctas")
+
+
+def test_dirty_writes_match_full_evaluation():
+    """Reproducir escribiendo solo letras sucias deja el mismo estado que evaluar todo."""
+    print("=== TEST: ESCRITURA PARCIAL EQUIVALENTE ===")
+    from evaluation import ActivityTracker, LetterBatch, evaluate_frame, apply_frame, is_static_curve
+
+    count = 12
+    frames = list(range(0, 70)) + [30, 5, 66, 20] + list(range(20, 30))  # reproducción, saltos y retroceso
+    scenarios = [(_timing(), False), (_timing(), True),
+                 (_timing(loop_count=3, overlap=0.9), True), (_timing(in_end=0.0, out_start=1.0), False)]
+    written_total = 0
+    for timing, static_mid in scenarios:
+        curves = _curves(static_mid)
+        partial = [_Letter(f"P{i}", float(i)) for i in range(count)]
+        full = [_Letter(f"F{i}", float(i)) for i in range(count)]
+        partial_batch, full_batch = LetterBatch(partial), LetterBatch(full)
+        tracker = ActivityTracker()
+        assert is_static_curve(curves['mid']) == static_mid, "escenario mal construido"
+        for frame in frames:
+            dirty = tracker.dirty_indices(frame, count, timing, static_mid, 'sig')
+            if dirty.size:
+                apply_frame(partial_batch, evaluate_frame(frame, count, timing, curves, dirty), CHANNELS, dirty)
+            apply_frame(full_batch, evaluate_frame(frame, count, timing, curves), CHANNELS)
+            written_total += dirty.size
+            assert np.allclose(_state(partial), _state(full)), \
+                f"estado distinto en el frame {frame} (timing {timing}, MID constante: {static_mid})"
+
+    full_total = count * len(frames) * len(scenarios)
+    print(f"📊 Letras escritas: {written_total} de {full_total} ({written_total / full_total:.0%})")
+    assert written_total < full_total, "el tracker no omitió ninguna escritura"
+
+    print("✅ Escritura parcial equivalente a la completa")
+
+
+def run_all_activity_tracker_tests():
+    """Ejecutar todas las pruebas de las ventanas de actividad."""
+    print("🚀 INICIANDO VERIFICACIÓN DE LAS VENTANAS DE ACTIVIDAD")
+    print("=" * 60)
+
+    tests = [
+        test_activity_edges,
+        test_dirty_indices,
+        test_dirty_writes_match_full_evaluation
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE LAS VENTANAS DE ACTIVIDAD PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE LAS VENTANAS DE ACTIVIDAD FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_activity_tracker_tests()
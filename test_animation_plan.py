@@ -0,0 +1,156 @@
+"""
+Script de verificación del plan de animación de TypeAnimator.
+Comprueba que el plan del preview se resuelve una sola vez y solo se
+reconstruye cuando el bus de invalidación o sus entradas lo piden, sin
+necesidad de Blender.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class _Letter(dict):
+    """Objeto mínimo con los transforms que lee ``LetterBatch``."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.location = np.zeros(3)
+        self.rotation_euler = np.zeros(3)
+        self.scale = np.ones(3)
+        self.hide_viewport = False
+
+
+class _CurveLookup:
+    """Proveedor de curvas (``curves.get_stage_curves`` en el addon) que cuenta las resoluciones."""
+
+    def __init__(self, static_mid=False):
+        from curve_lut import CurveLUT
+        mid = CurveLUT([1.0, 1.0]) if static_mid else CurveLUT([0.5, 1.0])
+        self.curves = {'in': CurveLUT([0.0, 1.0]), 'mid': mid, 'out': CurveLUT([1.0, 0.0])}
+        self.calls = []
+
+    def __call__(self, base_name):
+        self.calls.append(base_name)
+        return self.curves
+
+
+def _props(count=5, **overrides):
+    props = SimpleNamespace(
+        enable_live_preview=True, base_name='Titulo',
+        individual_letters=[_Letter(f"L{i}") for i in range(count)],
+        timing=SimpleNamespace(start_frame=5, duration=30, overlap=0.4, loop_count=2),
+        stages=SimpleNamespace(in_end=0.3, out_start=0.7),
+        flags_loc=True, amplitude_loc_x=2.0, flags_rot=False, amplitude_rot_z=0.0,
+        flags_scale=True, amplitude_scale=0.5, flags_vis=False,
+    )
+    for key, value in overrides.items():
+        setattr(props, key, value)
+    return props
+
+
+def test_plan_contents():
+    """El plan resuelve letras, curvas, timing y canales de las propiedades."""
+    print("=== TEST: CONTENIDO DEL PLAN ===")
+    import animation_plan
+
+    lookup = _CurveLookup(static_mid=True)
+    try:
+        animation_plan.clear_plan()
+        props = _props()
+        plan = animation_plan.get_plan(props, lookup)
+        print(f"📊 Plan #{plan.version}: {plan.count} letras, listo={plan.ready}, MID constante={plan.static_mid}")
+        assert plan.ready and plan.count == 5 and plan.batch is not None, "plan incompleto"
+        assert lookup.calls == ['Titulo'], "curvas resueltas con otro nombre base"
+        assert plan.timing == {'start_frame': 5, 'duration': 30, 'overlap': 0.4, 'loop_count': 2,
+                               'in_end': 0.3, 'out_start': 0.7}, f"timing incorrecto: {plan.timing}"
+        assert plan.channels['loc'] and plan.channels['scale'] and not plan.channels['rot'], "canales incorrectos"
+        assert plan.static_mid, "MID constante no detectado"
+
+        animation_plan.clear_plan()
+        disabled = animation_plan.get_plan(_props(enable_live_preview=False), lookup)
+        empty = animation_plan.build_plan(_props(count=0), lookup)
+        assert not disabled.ready and not empty.ready and len(lookup.calls) == 1, \
+            "se resolvieron curvas para un preview desactivado o sin letras"
+        assert not animation_plan.build_plan(_props(), lambda _name: None).ready, "plan listo sin curvas"
+    finally:
+        animation_plan.clear_plan()
+
+    print("✅ Contenido del plan correcto")
+
+
+def test_plan_rebuilds_only_on_invalidation():
+    """Frames repetidos reutilizan el plan; los eventos del bus y las entradas nuevas lo rehacen."""
+    print("=== TEST: RECONSTRUCCIÓN DEL PLAN ===")
+    import animation_plan
+    from invalidation import InvalidationEvent, publish
+
+    lookup = _CurveLookup()
+    try:
+        animation_plan.clear_plan()
+        props = _props()
+        first = animation_plan.get_plan(props, lookup)
+        for _frame in range(250):
+            assert animation_plan.get_plan(props, lookup) is first, "el plan se reconstruyó sin invalidación"
+        assert len(lookup.calls) == 1, "las curvas se resolvieron en cada frame"
+
+        versions = [first.version]
+        publish(InvalidationEvent.TEXT_CHANGED, "Titulo")
+        assert animation_plan.get_plan(props, lookup) is first, "TEXT_CHANGED reconstruyó el plan"
+        for event in (InvalidationEvent.TIMING_CHANGED, InvalidationEvent.CURVE_EDITED,
+                      InvalidationEvent.LETTERS_CHANGED, InvalidationEvent.FILE_LOADED):
+            publish(event)
+            plan = animation_plan.get_plan(props, lookup)
+            assert plan.version != versions[-1], f"{event.value} no reconstruyó el plan"
+            versions.append(plan.version)
+
+        props.individual_letters.append(_Letter("L5"))
+        plan = animation_plan.get_plan(props, lookup)
+        assert plan.count == 6, "un cambio en el número de letras no reconstruyó el plan"
+        assert animation_plan.get_plan(_props(), lookup) is not plan, "otras propiedades reutilizaron el plan"
+        print(f"📊 Resoluciones de curvas: {len(lookup.calls)} para 257 frames")
+        assert len(lookup.calls) == 7, "número de reconstrucciones incorrecto"
+    finally:
+        animation_plan.clear_plan()
+
+    print("✅ Reconstrucción del plan correcta")
+
+
+def run_all_animation_plan_tests():
+    """Ejecutar todas las pruebas del plan de animación."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL PLAN DE ANIMACIÓN")
+    print("=" * 60)
+
+    tests = [
+        test_plan_contents,
+        test_plan_rebuilds_only_on_invalidation
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL PLAN DE ANIMACIÓN PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL PLAN DE ANIMACIÓN FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_animation_plan_tests()
@@ -0,0 +1,176 @@
+"""
+Script de verificación de los helpers de horneado de TypeAnimator.
+Comprueba los canales horneados, la acción compartida sobre canales delta,
+el escalonado de las tiras NLA y la acción propia de cada letra, sin
+necesidad de Blender.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+CHANNELS = {'loc': True, 'loc_amplitude': 2.0, 'rot': True, 'rot_amplitude': 0.5,
+            'scale': True, 'scale_amplitude': 0.25, 'vis': True}
+
+
+class _FCurves(list):
+    """``Action.fcurves`` mínimo."""
+
+    def new(self, data_path, index=0, action_group=""):
+        fcurve = SimpleNamespace(data_path=data_path, array_index=index, group=action_group)
+        self.append(fcurve)
+        return fcurve
+
+
+class _Actions(dict):
+    """``bpy.data.actions`` mínimo."""
+
+    def new(self, name):
+        action = self[name] = SimpleNamespace(name=name, fcurves=_FCurves(), use_fake_user=False)
+        return action
+
+
+class _Letter:
+    def __init__(self, name):
+        self.name = name
+        self.animation_data = None
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = SimpleNamespace(action=None)
+        return self.animation_data
+
+
+def test_channel_tracks():
+    """Un track por componente animado, con la visibilidad en interpolación constante."""
+    print("=== TEST: CANALES HORNEADOS ===")
+    from baking import channel_tracks, INTERPOLATION_BEZIER, INTERPOLATION_CONSTANT
+
+    frames, letters = 5, 3
+    transforms = {'location': np.random.rand(frames, letters, 3), 'rotation': np.random.rand(frames, letters, 3),
+                  'scale': np.random.rand(frames, letters, 3),
+                  'hidden': np.arange(frames * letters).reshape(frames, letters) % 2 == 0}
+    tracks = channel_tracks(transforms)
+    keys = [(path, index) for path, index, _values, _interp in tracks]
+    print(f"📊 Tracks: {keys}")
+    assert keys == [('location', 0), ('rotation_euler', 2), ('scale', 0), ('scale', 1), ('scale', 2),
+                    ('hide_viewport', -1), ('hide_render', -1)], "tracks incorrectos"
+    assert all(values.shape == (frames, letters) for _p, _i, values, _t in tracks), "forma de valores incorrecta"
+    assert np.array_equal(tracks[1][2], transforms['rotation'][..., 2]), "rotación tomada del eje equivocado"
+    assert tracks[5][2].dtype == np.float64 and tracks[5][2][0, 0] == 1.0, "visibilidad no convertida a float"
+    assert [t[3] for t in tracks] == [INTERPOLATION_BEZIER] * 5 + [INTERPOLATION_CONSTANT] * 2, "interpolación incorrecta"
+
+    transforms['rotation'] = transforms['hidden'] = None
+    keys = [(path, index) for path, index, _values, _interp in channel_tracks(transforms)]
+    assert keys == [('location', 0), ('scale', 0), ('scale', 1), ('scale', 2)], "canales desactivados horneados"
+
+    print("✅ Canales horneados correctos")
+
+
+def test_shared_tracks():
+    """La acción compartida anima los canales delta sin transform base."""
+    print("=== TEST: ACCIÓN COMPARTIDA ===")
+    from baking import shared_tracks
+
+    values = np.array([0.0, 0.5, 1.0, 0.005])
+    tracks = {(path, index): track for path, index, track, _interp in shared_tracks(values, CHANNELS)}
+    print(f"📊 Canales: {sorted(tracks)}")
+    assert set(tracks) == {('delta_location', 0), ('delta_rotation_euler', 2), ('delta_scale', 0),
+                           ('delta_scale', 1), ('delta_scale', 2), ('hide_viewport', -1),
+                           ('hide_render', -1)}, "canales delta incorrectos"
+    assert np.allclose(tracks[('delta_location', 0)], values * 2.0), "delta de posición incorrecto"
+    assert np.allclose(tracks[('delta_rotation_euler', 2)], values * 0.5), "delta de rotación incorrecto"
+    assert np.allclose(tracks[('delta_scale', 1)], 1.0 + values * 0.25), "delta de escala incorrecto"
+    assert tracks[('hide_viewport', -1)].tolist() == [1.0, 0.0, 0.0, 1.0], "visibilidad incorrecta"
+
+    print("✅ Acción compartida correcta")
+
+
+def test_stagger_offsets():
+    """Retardos en frames iguales al escalonado de la evaluación en vivo."""
+    print("=== TEST: ESCALONADO NLA ===")
+    from baking import stagger_offsets
+    from evaluation import activity_edges
+
+    timing = {'start_frame': 10, 'duration': 40, 'overlap': 0.5, 'loop_count': 1, 'in_end': 0.2, 'out_start': 0.8}
+    offsets = stagger_offsets(4, timing)
+    print(f"📊 Retardos: {offsets.tolist()}")
+    assert offsets.tolist() == [0.0, 5.0, 10.0, 15.0], "retardos incorrectos"
+    assert np.allclose(timing['start_frame'] + offsets, activity_edges(4, timing)[:, 0]), \
+        "el escalonado NLA no coincide con el de la evaluación"
+    assert stagger_offsets(3, dict(timing, overlap=0.0)).tolist() == [0.0, 0.0, 0.0], "retardo sin overlap"
+    assert stagger_offsets(0, timing).size == 0, "retardos para cero letras"
+
+    print("✅ Escalonado correcto")
+
+
+def test_letter_action_is_owned_and_cleared():
+    """El horneado usa su propia acción, la vacía y conserva la del usuario."""
+    print("=== TEST: ACCIÓN PROPIA DE LA LETRA ===")
+    import baking
+
+    original = baking.bpy
+    actions = _Actions()
+    baking.bpy = SimpleNamespace(data=SimpleNamespace(actions=actions))
+    try:
+        letter = _Letter("Hola_0")
+        user_action = actions.new("MiAccion")
+        user_action.fcurves.new('location', 1)
+        letter.animation_data_create().action = user_action
+
+        action, previous = baking._letter_action(letter)
+        assert action.name == "Hola_0_TA_Bake" and letter.animation_data.action is action, "acción de horneado no asignada"
+        assert previous == set(), "acción nueva con canales previos"
+        assert user_action.use_fake_user and len(user_action.fcurves) == 1, "la acción del usuario se modificó o se perderá"
+
+        for path, index in (('location', 0), ('rotation_euler', 2), ('hide_viewport', 0)):
+            action.fcurves.new(path, index, baking.BAKE_GROUP_NAME)
+        again, previous = baking._letter_action(letter)
+        print(f"📊 Canales del horneado anterior: {sorted(previous)}")
+        assert again is action and len(action.fcurves) == 0, "la acción de horneado no se vació"
+        assert previous == {'location', 'rotation_euler', 'hide_viewport'}, "canales anteriores incorrectos"
+    finally:
+        baking.bpy = original
+
+    print("✅ Acción propia y vaciada antes de hornear")
+
+
+def run_all_baking_tests():
+    """Ejecutar todas las pruebas de los helpers de horneado."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL HORNEADO")
+    print("=" * 60)
+
+    tests = [
+        test_channel_tracks,
+        test_shared_tracks,
+        test_stagger_offsets,
+        test_letter_action_is_owned_and_cleared
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL HORNEADO PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL HORNEADO FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_baking_tests()
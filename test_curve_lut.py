@@ -0,0 +1,179 @@
+"""
+Script de verificación de las LUTs de curvas para TypeAnimator.
+Verifica que las tablas horneadas reproduzcan la curva original y que el cache
+no vuelva a leer la curva hasta que se invalida.
+"""
+
+import math
+import time
+
+
+class _FakePoint:
+    def __init__(self, x, y, handle_type='AUTO'):
+        self.location = (x, y)
+        self.handle_type = handle_type
+
+
+class _FakePoints(list):
+    """Colección con la interfaz de CurveMapPoints usada por ``write_points``."""
+
+    def new(self, x, y):
+        point = _FakePoint(x, y)
+        self.append(point)
+        return point
+
+    def foreach_set(self, attr, buffer):
+        for i, point in enumerate(self):
+            setattr(point, attr, tuple(buffer[i * 2:i * 2 + 2]))
+
+
+class _FakeCurve:
+    """Curva mínima con la misma interfaz que un CurveMap (points + evaluate)."""
+
+    def __init__(self, func):
+        self.func = func
+        self._points = _FakePoints([_FakePoint(0.0, func(0.0)), _FakePoint(1.0, func(1.0))])
+        self.calls = 0
+        self.point_reads = 0
+
+    @property
+    def points(self):
+        self.point_reads += 1
+        return self._points
+
+    def evaluate(self, t):
+        self.calls += 1
+        return self.func(t)
+
+
+def _smooth(t):
+    return 0.5 - 0.5 * math.cos(math.pi * t)
+
+
+def test_lut_accuracy():
+    """La LUT reproduce la curva dentro de tolerancia en ambos modos."""
+    print("=== TEST: PRECISIÓN DE LUT ===")
+    from curve_lut import CurveLUT
+
+    samples = [i / 1000.0 for i in range(1001)]
+    for interpolation, tolerance in (('LINEAR', 1e-4), ('CUBIC', 1e-5)):
+        lut = CurveLUT.bake(_smooth, resolution=256, interpolation=interpolation)
+        error = max(abs(lut.evaluate(t) - _smooth(t)) for t in samples)
+        print(f"📊 {interpolation}: error máximo {error:.2e}")
+        assert error <= tolerance, f"error de {interpolation} fuera de tolerancia ({tolerance:.0e})"
+
+    lut = CurveLUT.bake(_smooth)
+    assert lut.evaluate(-1.0) == _smooth(0.0) and lut.evaluate(2.0) == _smooth(1.0), \
+        "los valores fuera de [0, 1] no se recortan"
+
+    print("✅ LUT dentro de tolerancia")
+
+
+def test_lut_array_matches_scalar():
+    """La evaluación vectorizada coincide con la escalar."""
+    print("=== TEST: EVALUACIÓN VECTORIZADA ===")
+    import numpy as np
+    from curve_lut import CurveLUT
+
+    lut = CurveLUT.bake(_smooth, interpolation='CUBIC')
+    ts = np.linspace(0.0, 1.0, 97)
+    vectorized = lut.evaluate_array(ts)
+    scalar = [lut.evaluate(t) for t in ts]
+    assert np.allclose(vectorized, scalar), "evaluate_array difiere de evaluate"
+
+    print("✅ evaluate_array coincide con evaluate")
+
+
+def test_lut_cache_invalidation():
+    """Los aciertos no leen la curva; se re-hornea solo tras invalidar."""
+    print("=== TEST: INVALIDACIÓN DE CACHE ===")
+    from curve_lut import get_curve_lut, invalidate_curve_lut, clear_lut_cache, get_lut_cache_stats
+    from easing_library import write_points
+
+    clear_lut_cache()
+    curve = _FakeCurve(_smooth)
+
+    first = get_curve_lut(curve)
+    for _ in range(1000):
+        assert get_curve_lut(curve) is first, "la LUT se volvió a hornear sin invalidación"
+    assert curve.point_reads == 0, "las búsquedas leen los puntos de la curva"
+    assert get_curve_lut(curve, interpolation='CUBIC') is not first, "el modo de interpolación no se respeta"
+
+    invalidate_curve_lut(curve)
+    second = get_curve_lut(curve)
+    assert second is not first, "invalidate_curve_lut no descartó la LUT"
+
+    # Reescribir los puntos desde un preset descarta la LUT sin pasar por el bus
+    write_points(curve, {'location': [0.0, 0.0, 0.5, 0.9, 1.0, 1.0]})
+    assert get_curve_lut(curve) is not second, "write_points no invalidó la LUT"
+
+    stats = get_lut_cache_stats()
+    print(f"📊 Stats: {stats}")
+    clear_lut_cache()
+    assert stats['bakes'] == 4 and stats['hits'] == 1000, "estadísticas inesperadas"
+
+    print("✅ Cache de LUTs correcto")
+
+
+def test_lut_performance():
+    """Comparar la búsqueda en tabla con la evaluación directa."""
+    print("=== TEST: RENDIMIENTO DE LUT ===")
+    import numpy as np
+    from curve_lut import CurveLUT
+
+    curve = _FakeCurve(_smooth)
+    lut = CurveLUT.bake(curve.evaluate)
+    ts = np.random.default_rng(0).random(100000)
+
+    start = time.perf_counter()
+    for t in ts.tolist():
+        curve.evaluate(t)
+    direct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lut.evaluate_array(ts)
+    lut_time = time.perf_counter() - start
+
+    print(f"📊 Directa: {direct_time * 1000:.2f}ms, LUT: {lut_time * 1000:.2f}ms")
+    print("✅ Rendimiento medido")
+
+
+def run_all_curve_lut_tests():
+    """Ejecutar todas las pruebas de LUTs."""
+    print("🚀 INICIANDO VERIFICACIÓN DE LUTs DE CURVAS")
+    print("=" * 60)
+
+    tests = [
+        test_lut_accuracy,
+        test_lut_array_matches_scalar,
+        test_lut_cache_invalidation,
+        test_lut_performance
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE LUTs PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE LUTs FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_curve_lut_tests()
@@ -0,0 +1,124 @@
+"""
+Script de verificación de la serialización de curvas en bloque para TypeAnimator.
+Comprueba el formato plano (location + handle_type) con un CurveMap simulado
+y la lectura de los formatos anteriores de presets.
+"""
+
+
+class _FakePoint:
+    def __init__(self, x, y):
+        self.location = [x, y]
+        self.handle_type = 'AUTO'
+
+
+class _FakePoints(list):
+    """Colección con la interfaz de CurveMapPoints (new/remove/foreach_*)."""
+
+    def __init__(self, pairs):
+        super().__init__(_FakePoint(x, y) for x, y in pairs)
+        self.created = 0
+
+    def new(self, x, y):
+        self.created += 1
+        point = _FakePoint(x, y)
+        self.append(point)
+        return point
+
+    def foreach_get(self, attr, buffer):
+        values = [value for point in self for value in getattr(point, attr)]
+        buffer[:] = values
+
+    def foreach_set(self, attr, buffer):
+        for i, point in enumerate(self):
+            setattr(point, attr, list(buffer[i * 2:i * 2 + 2]))
+
+
+class _FakeCurveMap:
+    def __init__(self, pairs):
+        self.points = _FakePoints(pairs)
+
+
+def test_flat_roundtrip():
+    """Leer y escribir en formato plano conserva puntos y handles."""
+    print("=== TEST: IDA Y VUELTA EN FORMATO PLANO ===")
+    from easing_library import read_points, write_points
+
+    source = _FakeCurveMap([(0.0, 0.0), (0.25, 0.1), (0.5, 0.6), (1.0, 1.0)])
+    source.points[1].handle_type = 'VECTOR'
+    data = read_points(source)
+    print(f"📊 Datos: {data}")
+
+    assert data['location'] == [0.0, 0.0, 0.25, 0.1, 0.5, 0.6, 1.0, 1.0], "arrays planos incorrectos"
+    assert data['handle_type'] == [0, 2, 0, 0], "arrays planos incorrectos"
+
+    target = _FakeCurveMap([(0.0, 0.0), (1.0, 1.0)])
+    write_points(target, data)
+    assert [point.location for point in target.points] == [point.location for point in source.points], \
+        "coordenadas distintas tras escribir"
+    assert [point.handle_type for point in target.points] == ['AUTO', 'VECTOR', 'AUTO', 'AUTO'], \
+        "tipos de handle distintos tras escribir"
+
+    shrink = _FakeCurveMap([(0.0, 0.0), (0.3, 0.3), (0.6, 0.6), (1.0, 1.0)])
+    write_points(shrink, {'location': [0.0, 1.0, 1.0, 0.0]})
+    assert len(shrink.points) == 2, "no se redujo el número de puntos"
+    assert shrink.points[1].location == [1.0, 0.0], "no se redujo el número de puntos"
+
+    print("✅ Ida y vuelta correcta")
+
+
+def test_legacy_formats():
+    """Los formatos anteriores se convierten al mismo par de arrays."""
+    print("=== TEST: FORMATOS ANTERIORES ===")
+    from easing_library import points_to_arrays
+
+    expected = ([0.0, 0.0, 1.0, 1.0], [0, 2])
+    formats = {
+        'pares': [(0.0, 0.0), (1.0, 1.0, 'VECTOR')],
+        'dicts location': [{'location': [0.0, 0.0]}, {'location': [1.0, 1.0], 'handle_type': 'VECTOR'}],
+        'nodo de curva': {'points': [{'x': 0.0, 'y': 0.0}, {'x': 1.0, 'y': 1.0, 'handle_type': 'VECTOR'}]},
+        'plano': {'format': 'flat', 'location': [0, 0, 1, 1], 'handle_type': [0, 2]},
+    }
+    for name, data in formats.items():
+        result = points_to_arrays(data)
+        assert result == expected, f"formato '{name}': {result}"
+
+    print(f"✅ {len(formats)} formatos reconocidos")
+
+
+def run_all_curve_serialization_tests():
+    """Ejecutar todas las pruebas de serialización de curvas."""
+    print("🚀 INICIANDO VERIFICACIÓN DE SERIALIZACIÓN DE CURVAS")
+    print("=" * 60)
+
+    tests = [
+        test_flat_roundtrip,
+        test_legacy_formats
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE SERIALIZACIÓN DE CURVAS PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE SERIALIZACIÓN DE CURVAS FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_curve_serialization_tests()
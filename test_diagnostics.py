@@ -0,0 +1,114 @@
+"""
+Script de verificación del servicio de diagnóstico de TypeAnimator.
+Comprueba que las instantáneas solo se marcan como cambiadas (y solo
+redibujan la UI) cuando cambia su contenido, sin necesidad de Blender.
+"""
+
+import time
+
+
+class _FakeSnapshots:
+    """Sustituto de ``compute_snapshot``: mismo contenido con tiempos nuevos en cada llamada."""
+
+    def __init__(self):
+        self.preset_count = 3
+        self.calls = 0
+
+    def __call__(self, context):
+        self.calls += 1
+        return {'status': {'scene_valid': True, 'letter_objects': 12, 'errors': []},
+                'cache_stats': {'hits': 4}, 'node_group_present': True,
+                'preset_count': self.preset_count, 'operators': {'validate_properties': True},
+                'errors': [], 'compute_time': 0.001 * self.calls, 'created': time.monotonic()}
+
+
+def test_identical_snapshots_unchanged():
+    """Dos instantáneas con el mismo contenido dan ``changed == False``."""
+    print("=== TEST: INSTANTÁNEAS IDÉNTICAS ===")
+    import diagnostics
+
+    original = diagnostics.compute_snapshot
+    snapshots = diagnostics.compute_snapshot = _FakeSnapshots()
+    try:
+        service = diagnostics.DiagnosticsService(interval=60.0, poll_interval=1.0)
+        first = service.refresh(context=object())
+        assert first['changed'], "la primera instantánea debe marcarse como cambiada"
+        second = service.refresh(context=object())
+        print(f"📊 changed: {first['changed']} -> {second['changed']}")
+        assert second['changed'] is False, "dos instantáneas idénticas se marcaron como cambiadas"
+        snapshots.preset_count = 4
+        assert service.refresh(context=object())['changed'], "un cambio de contenido no se detectó"
+        assert service.refresh(context=object())['changed'] is False, "el flag 'changed' previo cuenta como contenido"
+    finally:
+        diagnostics.compute_snapshot = original
+
+    print("✅ Solo cambian las instantáneas con contenido nuevo")
+
+
+def test_tick_redraws_only_on_change():
+    """El timer refresca cuando toca pero solo redibuja si el contenido cambió."""
+    print("=== TEST: REDIBUJADO DEL TIMER ===")
+    import diagnostics
+
+    redraws = []
+    original = diagnostics.compute_snapshot, diagnostics._tag_redraw, diagnostics.bpy
+    snapshots = diagnostics.compute_snapshot = _FakeSnapshots()
+    diagnostics._tag_redraw = lambda: redraws.append(True)
+    diagnostics.bpy = type('bpy', (), {'context': object()})
+    try:
+        service = diagnostics.DiagnosticsService(interval=0.0, poll_interval=0.5)
+        service._running = True
+        for _ in range(10):
+            assert service._tick() == 0.5, "el timer no devolvió su intervalo"
+        snapshots.preset_count = 7
+        service.mark_stale()
+        service._tick()
+        service._tick()
+        print(f"📊 {snapshots.calls} refrescos, {len(redraws)} redibujados")
+        assert snapshots.calls == 12, "el timer no refrescó en cada tick vencido"
+        assert len(redraws) == 2, "se redibujó sin cambios de contenido"
+        service._running = False
+        assert service._tick() is None, "el timer sigue tras detener el servicio"
+    finally:
+        diagnostics.compute_snapshot, diagnostics._tag_redraw, diagnostics.bpy = original
+
+    print("✅ Redibujado solo con contenido nuevo")
+
+
+def run_all_diagnostics_tests():
+    """Ejecutar todas las pruebas del servicio de diagnóstico."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL DIAGNÓSTICO")
+    print("=" * 60)
+
+    tests = [
+        test_identical_snapshots_unchanged,
+        test_tick_redraws_only_on_change
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL DIAGNÓSTICO PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL DIAGNÓSTICO FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_diagnostics_tests()
@@ -0,0 +1,108 @@
+"""
+Script de verificación de las variantes vectorizadas de easing para TypeAnimator.
+Comprueba que cada función array-in/array-out reproduzca la versión escalar y
+que los easings in-out sean continuos en t = 0.5.
+"""
+
+
+def _samples(count=2001):
+    return [i / (count - 1) for i in range(count)]
+
+
+def test_array_matches_scalar():
+    """Cada variante vectorizada coincide con su función escalar."""
+    print("=== TEST: VECTORIZADO VS ESCALAR ===")
+    import numpy as np
+    from easing_library import easings, easings_array
+
+    assert set(easings) == set(easings_array), f"faltan variantes: {sorted(set(easings) ^ set(easings_array))}"
+
+    samples = _samples()
+    ts = np.asarray(samples)
+    failures = []
+    for name, scalar in easings.items():
+        expected = np.array([scalar(t) for t in samples])
+        error = float(np.max(np.abs(easings_array[name](ts) - expected)))
+        if error > 1e-12:
+            failures.append((name, error))
+
+    assert not failures, f"diferencias: {failures}"
+
+    print(f"✅ {len(easings)} easings coinciden con la versión escalar")
+
+
+def test_in_out_continuity():
+    """Los easings in-out no saltan en el cambio de rama."""
+    print("=== TEST: CONTINUIDAD IN-OUT ===")
+    from easing_library import easings
+
+    jumps = []
+    for name, function in easings.items():
+        if not name.startswith('ease_in_out') or 'elastic' in name:
+            continue
+        jump = abs(function(0.5) - function(0.5 - 1e-9))
+        if jump > 1e-3:  # circ tiene pendiente infinita en 0.5
+            jumps.append((name, jump))
+
+    assert not jumps, f"saltos en t=0.5: {jumps}"
+
+    print("✅ Easings in-out continuos")
+
+
+def test_scalar_fallback():
+    """Sin NumPy se usa la función escalar muestra a muestra."""
+    print("=== TEST: FALLBACK ESCALAR ===")
+    import easing_library
+
+    original = easing_library.np
+    easing_library.np = None
+    try:
+        result = easing_library.ease_array('ease_out_bounce', [0.0, 0.5, 1.0])
+    finally:
+        easing_library.np = original
+
+    expected = [easing_library.ease_out_bounce(t) for t in (0.0, 0.5, 1.0)]
+    print(f"📊 Resultado: {result}")
+    assert result == expected, "el fallback no reproduce la función escalar"
+
+    print("✅ Fallback escalar correcto")
+
+
+def run_all_easing_array_tests():
+    """Ejecutar todas las pruebas de easings vectorizados."""
+    print("🚀 INICIANDO VERIFICACIÓN DE EASINGS VECTORIZADOS")
+    print("=" * 60)
+
+    tests = [
+        test_array_matches_scalar,
+        test_in_out_continuity,
+        test_scalar_fallback
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE EASINGS VECTORIZADOS PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE EASINGS VECTORIZADOS FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_easing_array_tests()
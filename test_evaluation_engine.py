@@ -0,0 +1,267 @@
+"""
+Script de verificación del motor de evaluación vectorizado de TypeAnimator.
+Compara el motor con el cálculo escalar por letra que reemplazó y comprueba
+la escritura de transforms en archivos con muchos otros objetos, sin
+necesidad de Blender.
+"""
+
+import math
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class _Curve:
+    """Curva de etapa con ``evaluate(t)``, como ``CurveMapping.curves[0]``."""
+
+    def __init__(self, func):
+        self.func = func
+
+    def evaluate(self, t):
+        return self.func(t)
+
+
+CURVES = {
+    'in': _Curve(lambda t: t * t),
+    'mid': _Curve(lambda t: 1.0 + 0.1 * math.sin(t * math.pi)),
+    'out': _Curve(lambda t: 1.0 - t ** 3),
+}
+CHANNELS = {'loc': True, 'loc_amplitude': 2.0, 'rot': True, 'rot_amplitude': 0.5,
+            'scale': True, 'scale_amplitude': -0.3, 'vis': True}
+
+
+def _scalar_frame(frame, bases, timing, curves, channels):
+    """Cálculo por letra del handler anterior al motor vectorizado (referencia)."""
+    start_at, duration = timing['start_frame'], max(timing['duration'], 1)
+    t_global = max(0.0, min(1.0, (frame - start_at) / duration))
+    if timing['loop_count'] > 1:
+        t_global = ((frame - start_at) % duration) / duration
+    per_char_delay = timing['overlap'] / max(len(bases), 1)
+    in_end, out_start = timing['in_end'], timing['out_start']
+    results = []
+    for idx, (base_pos, base_rot, base_scale) in enumerate(bases):
+        t_letra = max(0.0, min(1.0, t_global - (idx * per_char_delay)))
+        if t_letra < in_end:
+            stage, t_stage = 'in', t_letra / in_end if in_end > 0 else 0.0
+        elif t_letra > out_start:
+            stage, t_stage = 'out', (t_letra - out_start) / (1.0 - out_start) if out_start < 1.0 else 0.0
+        else:
+            stage, t_stage = 'mid', (t_letra - in_end) / (out_start - in_end) if out_start > in_end else 0.0
+        value = curves[stage].evaluate(max(0.0, min(1.0, t_stage)))
+        location = list(base_pos)
+        rotation = list(base_rot)
+        if channels['loc']:
+            location[0] = base_pos[0] + value * channels['loc_amplitude']
+        if channels['rot']:
+            rotation[2] = base_rot[2] + value * channels['rot_amplitude']
+        scale = [axis * (1 + value * channels['scale_amplitude']) for axis in base_scale]
+        results.append((location, rotation, scale, value < 0.01))
+    return results
+
+
+class _Letter(dict):
+    """Objeto mínimo: propiedades ``ORIG_*`` como claves y transforms como atributos."""
+
+    def __init__(self, name, location=(0.0, 0.0, 0.0)):
+        super().__init__()
+        self.name = name
+        self.location = np.array(location, dtype=np.float64)
+        self.rotation_euler = np.zeros(3)
+        self.scale = np.ones(3)
+        self.hide_viewport = False
+        self.tags = 0
+
+    def update_tag(self):
+        self.tags += 1
+
+
+class _Objects:
+    """``bpy.data.objects`` mínimo con ``foreach_get``/``foreach_set`` contados."""
+
+    def __init__(self, objects):
+        self._objects = list(objects)
+        self.bulk_calls = 0
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+    def keys(self):
+        return [obj.name for obj in self._objects]
+
+    def foreach_get(self, attr, buffer):
+        self.bulk_calls += 1
+        if attr == 'hide_viewport':
+            buffer[:] = [obj.hide_viewport for obj in self._objects]
+        else:
+            buffer[:] = np.concatenate([getattr(obj, attr) for obj in self._objects])
+
+    def foreach_set(self, attr, buffer):
+        self.bulk_calls += 1
+        if attr == 'hide_viewport':
+            for obj, flag in zip(self._objects, buffer):
+                obj.hide_viewport = bool(flag)
+            return
+        for obj, values in zip(self._objects, np.asarray(buffer).reshape(-1, 3)):
+            setattr(obj, attr, np.array(values, dtype=np.float64))
+
+
+def _random_timing(rng):
+    in_end = rng.choice([0.0, 0.2, 0.35])
+    return {
+        'start_frame': rng.randint(-10, 20),
+        'duration': rng.randint(1, 80),
+        'overlap': rng.choice([0.0, 0.3, 0.9]),
+        'loop_count': rng.choice([1, 1, 3]),
+        'in_end': in_end,
+        'out_start': rng.choice([in_end, 0.8, 1.0]),
+    }
+
+
+def test_global_times_and_stages():
+    """Tiempo global vectorizado y selección de etapa en los bordes."""
+    print("=== TEST: TIEMPO Y ETAPAS ===")
+    from evaluation import (global_time, global_times, split_stages,
+                            STAGE_IN, STAGE_MID, STAGE_OUT)
+
+    frames = np.arange(-20, 150, 0.5)
+    for start, duration, loops in ((1, 50, 1), (10, 24, 3), (0, 0, 1)):
+        expected = [global_time(f, start, duration, loops) for f in frames]
+        assert np.allclose(global_times(frames, start, duration, loops), expected), \
+            f"global_times difiere de global_time ({start}, {duration}, {loops})"
+
+    t = np.array([0.0, 0.1, 0.2, 0.5, 0.8, 0.9, 1.0])
+    stages, t_stage = split_stages(t, 0.2, 0.8)
+    print(f"📊 Etapas: {stages.tolist()}, t: {np.round(t_stage, 3).tolist()}")
+    assert stages.tolist() == [STAGE_IN, STAGE_IN, STAGE_MID, STAGE_MID, STAGE_MID, STAGE_OUT, STAGE_OUT], \
+        "etapas incorrectas"
+    assert np.allclose(t_stage, [0.0, 0.5, 0.0, 0.5, 1.0, 0.5, 1.0]), "t local de etapa incorrecto"
+    # Etapas degeneradas: sin IN ni OUT el t local queda en 0
+    stages, t_stage = split_stages(np.array([0.0, 1.0]), 0.0, 1.0)
+    assert stages.tolist() == [STAGE_MID, STAGE_MID], "etapas degeneradas incorrectas"
+    assert np.allclose(t_stage, [0.0, 1.0]), "etapas degeneradas incorrectas"
+
+    print("✅ Tiempo y etapas correctos")
+
+
+def test_scalar_equivalence():
+    """El motor vectorizado reproduce el cálculo escalar por letra."""
+    print("=== TEST: EQUIVALENCIA CON EL CÁLCULO ESCALAR ===")
+    from evaluation import LetterBatch, evaluate_frame, compute_transforms
+
+    rng = random.Random(3)
+    checked = 0
+    for _case in range(40):
+        count = rng.randint(1, 30)
+        letters = [_Letter(f"L{i}", (rng.uniform(-5, 5), rng.uniform(-1, 1), 0.0)) for i in range(count)]
+        for letter in letters:
+            letter.rotation_euler = np.array([0.0, 0.0, rng.uniform(-1, 1)])
+            letter.scale = np.full(3, rng.uniform(0.5, 2.0))
+        batch = LetterBatch(letters)
+        bases = [(tuple(l.location), tuple(l.rotation_euler), tuple(l.scale)) for l in letters]
+        timing = _random_timing(rng)
+        for frame in range(timing['start_frame'] - 5, timing['start_frame'] + timing['duration'] * 2, 3):
+            values = evaluate_frame(frame, count, timing, CURVES)
+            transforms = compute_transforms(values, batch, CHANNELS)
+            expected = _scalar_frame(frame, bases, timing, CURVES, CHANNELS)
+            assert (np.allclose(transforms['location'], [e[0] for e in expected]) and
+                    np.allclose(transforms['rotation'], [e[1] for e in expected]) and
+                    np.allclose(transforms['scale'], [e[2] for e in expected]) and
+                    transforms['hidden'].tolist() == [e[3] for e in expected]), \
+                f"diferencia en el frame {frame} con timing {timing}"
+            checked += 1
+
+    print(f"📊 {checked} frames comparados")
+    print("✅ Motor equivalente al cálculo escalar")
+
+
+def test_write_with_many_other_objects():
+    """Pocas letras entre muchos objetos: sin foreach sobre todo el archivo ni tocar el resto."""
+    print("=== TEST: ESCRITURA CON MUCHOS OBJETOS ===")
+    import evaluation
+    from evaluation import LetterBatch
+
+    original_bpy = evaluation.bpy
+    try:
+        others = [_Letter(f"Other{i}", (float(i), 0.0, 0.0)) for i in range(2000)]
+        letters = [_Letter(f"Letter{i}") for i in range(10)]
+        objects = _Objects(others[:1000] + letters + others[1000:])
+        evaluation.bpy = SimpleNamespace(data=SimpleNamespace(objects=objects))
+
+        batch = LetterBatch(letters)
+        location = np.tile([1.0, 2.0, 3.0], (10, 1))
+        hidden = np.array([True] * 5 + [False] * 5)
+        start = time.perf_counter()
+        batch.write(location=location, hidden=hidden)
+        elapsed = time.perf_counter() - start
+        print(f"📊 10 letras entre 2000 objetos: {objects.bulk_calls} llamadas foreach, {elapsed * 1000:.2f} ms")
+        assert objects.bulk_calls == 0, "se recorrió todo bpy.data.objects para 10 letras"
+        assert all(np.allclose(l.location, [1.0, 2.0, 3.0]) for l in letters), "letras no escritas"
+        assert letters[0].hide_viewport, "letras no escritas"
+        assert not any(o.hide_viewport or o.location[0] != float(i) for i, o in enumerate(others)), \
+            "se modificaron objetos ajenos"
+
+        # Solo las letras sucias
+        batch.write(location=np.zeros((2, 3)), indices=np.array([3, 7]))
+        assert np.allclose(letters[3].location, 0.0) and np.allclose(letters[4].location, [1.0, 2.0, 3.0]), \
+            "escritura por índices incorrecta"
+
+        # Letras mayoritarias: escritura en bloque sin alterar el resto
+        many = [_Letter(f"Many{i}") for i in range(300)]
+        objects = _Objects(others[:100] + many)
+        evaluation.bpy = SimpleNamespace(data=SimpleNamespace(objects=objects))
+        batch = LetterBatch(many)
+        batch.write(location=np.tile([0.5, 0.0, 0.0], (300, 1)))
+        print(f"📊 300 letras entre 400 objetos: {objects.bulk_calls} llamadas foreach")
+        assert objects.bulk_calls == 2, "escritura en bloque incorrecta"
+        assert all(np.allclose(l.location, [0.5, 0.0, 0.0]) for l in many), "escritura en bloque incorrecta"
+        assert all(np.allclose(o.location, [float(i), 0.0, 0.0]) for i, o in enumerate(others[:100])), \
+            "la escritura en bloque alteró objetos ajenos"
+    finally:
+        evaluation.bpy = original_bpy
+
+    print("✅ Escritura limitada a las letras")
+
+
+def run_all_evaluation_engine_tests():
+    """Ejecutar todas las pruebas del motor de evaluación."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL MOTOR DE EVALUACIÓN")
+    print("=" * 60)
+
+    tests = [
+        test_global_times_and_stages,
+        test_scalar_equivalence,
+        test_write_with_many_other_objects
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL MOTOR DE EVALUACIÓN PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL MOTOR DE EVALUACIÓN FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_evaluation_engine_tests()
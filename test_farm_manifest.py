@@ -0,0 +1,115 @@
+"""
+Script de verificación de los manifiestos del render farm de TypeAnimator.
+Comprueba el parseo JSON/NDJSON, la validación, el reparto en shards y el resumen.
+"""
+
+import json
+
+
+def test_parse_manifests():
+    """JSON con defaults y NDJSON producen los mismos trabajos normalizados."""
+    print("=== TEST: PARSEO DE MANIFIESTOS ===")
+    from farm_manifest import parse_manifest, ManifestError
+
+    jobs = [{'id': 'a', 'text': 'Hola', 'output': 'out/a.blend', 'timing': {'duration': 30}},
+            {'text': 'Mundo', 'output': '/renders/b_####.png', 'preset': 'Wave'}]
+    as_json = parse_manifest(json.dumps({'defaults': {'timing': {'overlap': 4}, 'fragment_mode': 'words'},
+                                         'jobs': jobs}), base_dir='/farm')
+    as_ndjson = parse_manifest("# títulos\n" + "\n".join(json.dumps(job) for job in jobs) + "\n\n",
+                               ndjson=True, base_dir='/farm')
+
+    first = as_json[0]
+    print(f"📊 Trabajo normalizado: {first}")
+    assert first['output'] == '/farm/out/a.blend', "ruta o tipo de salida incorrectos"
+    assert first['output_type'] == 'blend', "ruta o tipo de salida incorrectos"
+    assert first['timing'] == {'overlap': 4, 'duration': 30}, "defaults no aplicados"
+    assert first['fragment_mode'] == 'WORDS', "defaults no aplicados"
+    assert as_json[1]['id'] == 'job_0001', "id por defecto o salida de render incorrectos"
+    assert as_json[1]['output_type'] == 'render', "id por defecto o salida de render incorrectos"
+    assert [job['text'] for job in as_ndjson] == ['Hola', 'Mundo'], "NDJSON parseado incorrectamente"
+    assert as_ndjson[0]['timing'] == {'duration': 30}, "NDJSON parseado incorrectamente"
+
+    invalid = [
+        ('[{"output": "x.blend"}]', False),
+        ('[{"text": "a", "output": "x.blend", "timing": {"speed": 2}}]', False),
+        ('[{"id": "a", "text": "a", "output": "x"}, {"id": "a", "text": "b", "output": "y"}]', False),
+        ('{"text": "a", "output": "x"}\n{"text": ', True),
+    ]
+    for content, ndjson in invalid:
+        try:
+            parse_manifest(content, ndjson=ndjson)
+        except ManifestError as e:
+            print(f"📊 Rechazado: {e}")
+        else:
+            raise AssertionError(f"manifiesto inválido aceptado: {content}")
+
+    print("✅ Manifiestos parseados y validados")
+
+
+def test_sharding_and_summary():
+    """El reparto equilibra el coste y el resumen suma tiempos por fase."""
+    print("=== TEST: SHARDS Y RESUMEN ===")
+    from farm_manifest import parse_manifest, shard_jobs, parse_shard, summarize, format_summary, job_cost
+
+    texts = ['A' * n for n in (40, 5, 30, 12, 8, 25, 3, 18, 22, 9)]
+    jobs = parse_manifest(json.dumps([{'text': text, 'output': f"o{i}.blend"} for i, text in enumerate(texts)]))
+    shards = shard_jobs(jobs, 3)
+    loads = [sum(job_cost(job) for job in shard) for shard in shards]
+    print(f"📊 Carga por shard: {loads}")
+    ids = sorted(job['id'] for shard in shards for job in shard)
+    assert ids == sorted(job['id'] for job in jobs), "reparto incompleto o desequilibrado"
+    assert max(loads) - min(loads) <= 5, "reparto incompleto o desequilibrado"
+    assert shard_jobs(jobs, 3) == shards, "reparto no determinista"
+    assert parse_shard('2/3') == (2, 3), "reparto no determinista"
+
+    results = [{'id': job['id'], 'index': job['index'], 'worker': 0, 'status': 'ok', 'letters': 4,
+                'keyframes': 100, 'timings': {'separate': 0.5, 'bake': 1.0, 'total': 2.0}} for job in jobs[:3]]
+    results.append({'id': jobs[3]['id'], 'index': 3, 'worker': 1, 'status': 'error',
+                    'error': 'sin fuente', 'timings': {'total': 0.1}})
+    summary = summarize(results, wall_time=2.5)
+    for line in format_summary(summary):
+        print(line)
+    assert (summary['succeeded'], summary['failed'], summary['keyframes']) == (3, 1, 300), \
+        "totales del resumen incorrectos"
+    assert summary['phase_time'] == {'separate': 1.5, 'bake': 3.0}, "tiempos por fase incorrectos"
+
+    print("✅ Reparto y resumen correctos")
+
+
+def run_all_farm_manifest_tests():
+    """Ejecutar todas las pruebas de manifiestos del render farm."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL RENDER FARM")
+    print("=" * 60)
+
+    tests = [
+        test_parse_manifests,
+        test_sharding_and_summary
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL RENDER FARM PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL RENDER FARM FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_farm_manifest_tests()
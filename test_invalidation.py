@@ -0,0 +1,207 @@
+"""
+Script de verificación del bus de invalidación para TypeAnimator.
+Comprueba la suscripción a eventos y la clasificación de actualizaciones
+del depsgraph sin necesidad de Blender.
+"""
+
+
+class _Datablock:
+    def __init__(self, name, type_=None):
+        self.name = name
+        if type_ is not None:
+            self.type = type_
+
+
+class _NodeTree(_Datablock):
+    """Node group mínimo: ``nodes`` lo distingue de otros datablocks."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.nodes = []
+
+
+class _Update:
+    def __init__(self, datablock, geometry=False):
+        self.id = datablock
+        self.is_updated_geometry = geometry
+
+
+class _Object(dict):
+    """Objeto mínimo: ``parent`` lo distingue de otros datablocks; propiedades como claves."""
+
+    def __init__(self, name, type_='MESH', parent=None, **props):
+        super().__init__(props)
+        self.name = name
+        self.type = type_
+        self.parent = parent
+
+
+def test_publish_subscribe():
+    """Cada suscriptor recibe solo sus eventos, una vez y con el payload."""
+    print("=== TEST: PUBLICAR Y SUSCRIBIR ===")
+    import invalidation
+    from invalidation import InvalidationEvent
+
+    received = []
+    callback = received.append
+    invalidation.subscribe((InvalidationEvent.TEXT_CHANGED, InvalidationEvent.FILE_LOADED), callback)
+    invalidation.subscribe(InvalidationEvent.TEXT_CHANGED, callback)  # duplicado: sin efecto
+
+    invalidation.publish(InvalidationEvent.TEXT_CHANGED, "Texto")
+    invalidation.publish(InvalidationEvent.CURVE_EDITED, "Curvas")
+    invalidation.publish(InvalidationEvent.FILE_LOADED)
+    invalidation.unsubscribe((InvalidationEvent.TEXT_CHANGED, InvalidationEvent.FILE_LOADED), callback)
+    invalidation.publish(InvalidationEvent.TEXT_CHANGED, "Otro")
+
+    print(f"📊 Recibidos: {received}")
+    assert received == ["Texto", None], "eventos recibidos incorrectos"
+
+    print("✅ Suscripción correcta")
+
+
+def test_failing_subscriber():
+    """Un suscriptor que falla no impide notificar al resto."""
+    print("=== TEST: SUSCRIPTOR CON ERROR ===")
+    import invalidation
+    from invalidation import InvalidationEvent
+
+    received = []
+
+    def broken(_payload):
+        raise RuntimeError("fallo de prueba")
+
+    invalidation.subscribe(InvalidationEvent.TIMING_CHANGED, broken)
+    invalidation.subscribe(InvalidationEvent.TIMING_CHANGED, received.append)
+    invalidation.publish(InvalidationEvent.TIMING_CHANGED)
+    invalidation.unsubscribe(InvalidationEvent.TIMING_CHANGED, broken)
+    invalidation.unsubscribe(InvalidationEvent.TIMING_CHANGED, received.append)
+
+    assert received == [None], "el error cortó la notificación"
+
+    print("✅ Errores aislados por suscriptor")
+
+
+def test_classify_updates():
+    """Texto editado y altas/bajas de objetos se traducen a eventos."""
+    print("=== TEST: CLASIFICACIÓN DEL DEPSGRAPH ===")
+    import invalidation
+    from invalidation import InvalidationEvent
+
+    text = _Datablock("Titulo", 'FONT')
+    letter = _Datablock("Titulo_L0", 'MESH')
+
+    invalidation.classify_updates([], 10)  # primera llamada: solo fija el recuento
+    events = invalidation.classify_updates([_Update(text, True), _Update(text, True), _Update(letter, True)], 10)
+    print(f"📊 Eventos: {events}")
+    assert events == [(InvalidationEvent.TEXT_CHANGED, "Titulo")], "edición de texto mal clasificada"
+    assert invalidation.classify_updates([_Update(text)], 10) == [], "un cambio sin geometría invalidó el texto"
+    assert invalidation.classify_updates([], 12) == [(InvalidationEvent.LETTERS_CHANGED, None)], \
+        "alta de objetos no detectada"
+
+    print("✅ Clasificación correcta")
+
+
+def test_letter_records():
+    """Renombrados, cambios de padre, marcas y altas+bajas sin cambio de recuento invalidan el índice."""
+    print("=== TEST: REGISTRO DE OBJETOS INDEXADOS ===")
+    import invalidation
+    from invalidation import InvalidationEvent
+
+    changed = [(InvalidationEvent.LETTERS_CHANGED, None)]
+    invalidation.file_changed_handler()
+    root = _Object("Hola_Root", 'EMPTY')
+    letters = [_Object(f"Hola_{i}", parent=root, is_letter=True, letter_index=i) for i in range(3)]
+    cube = _Object("Cube")
+    invalidation.classify_updates([_Update(obj) for obj in [root, cube] + letters], 20)
+
+    # Solo transforms (preview en cada frame): sin cambios
+    assert invalidation.classify_updates([_Update(obj) for obj in [root, cube] + letters], 20) == [], \
+        "una actualización de transform invalidó el índice"
+
+    root.name = "Adios_Root"
+    assert invalidation.classify_updates([_Update(root)], 20) == changed, "renombrado del root no detectado"
+
+    other = _Object("Otro_Root", 'EMPTY')
+    letters[0].parent = other
+    events = invalidation.classify_updates([_Update(letters[0]), _Update(other)], 20)
+    assert events == changed, "cambio de padre no detectado"
+
+    cube['is_letter'] = True
+    assert invalidation.classify_updates([_Update(cube)], 20) == changed, "marca de letra no detectada"
+    del cube['is_letter']
+    assert invalidation.classify_updates([_Update(cube)], 20) == changed, "letra desmarcada no detectada"
+    assert invalidation.classify_updates([_Update(cube)], 20) == [], "un objeto no indexado invalidó el índice"
+
+    # Alta de una letra y baja de otra en la misma actualización: mismo recuento
+    added = _Object("Hola_3", parent=root, is_letter=True, letter_index=3)
+    events = invalidation.classify_updates([_Update(added), _Update(letters[1])], 20)
+    print(f"📊 Eventos tras alta y baja simultáneas: {events}")
+    assert events == changed, "alta y baja simultáneas no detectadas"
+
+    invalidation.file_changed_handler()
+    assert not invalidation._object_records, "los registros sobrevivieron a la carga del archivo"
+
+    print("✅ Cambios del índice detectados sin depender del recuento")
+
+
+def test_curve_node_group_only():
+    """Solo el node group de las curvas publica CURVE_EDITED."""
+    print("=== TEST: NODE GROUP DE CURVAS ===")
+    import invalidation
+    from invalidation import InvalidationEvent
+    from constants import CURVE_NODE_GROUP_NAME
+
+    invalidation.classify_updates([], 5)
+    others = [_NodeTree("Shader Nodetree"), _NodeTree("TA_GeoNodes_Titulo"), _NodeTree("Animated Tree"),
+              _Datablock(CURVE_NODE_GROUP_NAME, 'MESH')]
+    events = invalidation.classify_updates([_Update(tree) for tree in others], 5)
+    assert not events, f"otros árboles invalidan las curvas: {events}"
+
+    curves = _NodeTree(CURVE_NODE_GROUP_NAME)
+    events = invalidation.classify_updates([_Update(curves), _Update(others[0]), _Update(curves)], 5)
+    print(f"📊 Eventos: {events}")
+    assert events == [(InvalidationEvent.CURVE_EDITED, CURVE_NODE_GROUP_NAME)], "edición de curvas mal clasificada"
+
+    print("✅ Solo las curvas de etapa invalidan")
+
+
+def run_all_invalidation_tests():
+    """Ejecutar todas las pruebas del bus de invalidación."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL BUS DE INVALIDACIÓN")
+    print("=" * 60)
+
+    tests = [
+        test_publish_subscribe,
+        test_failing_subscriber,
+        test_classify_updates,
+        test_letter_records,
+        test_curve_node_group_only
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL BUS DE INVALIDACIÓN PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL BUS DE INVALIDACIÓN FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_invalidation_tests()
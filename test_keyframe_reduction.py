@@ -0,0 +1,124 @@
+"""
+Script de verificación de la reducción de keyframes para TypeAnimator.
+Comprueba que los keyframes reducidos reproducen las muestras horneadas
+dentro de la tolerancia, sin necesidad de Blender.
+"""
+
+import time
+
+import numpy as np
+
+
+def _ease_samples(count=200):
+    """Entrada, pausa y salida con easing, como un canal horneado típico."""
+    frames = np.arange(count, dtype=np.float64)
+    u = frames / (count - 1)
+    values = np.where(u < 0.3, np.sin(u / 0.3 * np.pi / 2) ** 2, 1.0)
+    values = np.where(u > 0.7, 1.0 - ((u - 0.7) / 0.3) ** 3, values)
+    return frames, values
+
+
+def test_error_within_tolerance():
+    """Las curvas reducidas no se alejan de las muestras más que la tolerancia."""
+    print("=== TEST: ERROR DENTRO DE LA TOLERANCIA ===")
+    from keyframe_reduction import evaluate_bezier_keys, reduce_bezier
+
+    frames, values = _ease_samples()
+    for tolerance in (1e-2, 1e-3, 1e-4):
+        keep, co, handle_left, handle_right = reduce_bezier(frames, values, tolerance)
+        error = np.max(np.abs(evaluate_bezier_keys(co, handle_left, handle_right, frames) - values))
+        print(f"📊 Tolerancia {tolerance}: {len(keep)}/{len(frames)} keyframes, error {error:.2e}")
+        assert error <= tolerance, "error por encima de la tolerancia"
+
+    print("✅ Error dentro de la tolerancia")
+
+
+def test_constant_spans():
+    """Una curva constante desaparece y un escalón conserva sus bordes."""
+    print("=== TEST: TRAMOS CONSTANTES ===")
+    from keyframe_reduction import evaluate_bezier_keys, is_constant, reduce_bezier
+
+    flat = np.full(100, 2.5)
+    assert is_constant(flat, 1e-3), "detección de curva constante incorrecta"
+    assert not is_constant(np.linspace(0, 1, 10), 1e-3), "detección de curva constante incorrecta"
+
+    frames = np.arange(60, dtype=np.float64)
+    step = np.where(frames < 30, 0.0, 1.0)
+    keep, co, handle_left, handle_right = reduce_bezier(frames, step, 1e-3)
+    error = np.max(np.abs(evaluate_bezier_keys(co, handle_left, handle_right, frames) - step))
+    print(f"📊 Escalón: keyframes en {keep.tolist()}, error {error:.2e}")
+    assert error <= 1e-3, "el escalón no se conserva"
+    assert {29, 30} <= set(keep.tolist()), "el escalón no se conserva"
+
+    print("✅ Tramos constantes correctos")
+
+
+def test_reduce_constant_interpolation():
+    """Los canales CONSTANT guardan solo el primer frame y los cambios."""
+    print("=== TEST: CANALES CONSTANT ===")
+    from keyframe_reduction import reduce_constant
+
+    keep = reduce_constant([0, 0, 1, 1, 1, 0, 0])
+    print(f"📊 Índices conservados: {keep.tolist()}")
+    assert keep.tolist() == [0, 2, 5], "índices incorrectos"
+    assert reduce_constant([]).tolist() == [], "índices incorrectos"
+
+    print("✅ Canales CONSTANT correctos")
+
+
+def test_reduction_performance():
+    """Mide la reducción de muchas curvas horneadas."""
+    print("=== TEST: RENDIMIENTO DE LA REDUCCIÓN ===")
+    from keyframe_reduction import reduce_bezier
+
+    frames, values = _ease_samples()
+    curves = 200
+    kept = 0
+    start = time.perf_counter()
+    for offset in range(curves):
+        kept += len(reduce_bezier(frames, np.roll(values, offset % 20), 1e-3)[0])
+    elapsed = time.perf_counter() - start
+
+    print(f"📊 {curves} curvas: {kept}/{curves * len(frames)} keyframes en {elapsed * 1000:.1f}ms")
+    print("✅ Rendimiento medido")
+
+
+def run_all_keyframe_reduction_tests():
+    """Ejecutar todas las pruebas de reducción de keyframes."""
+    print("🚀 INICIANDO VERIFICACIÓN DE REDUCCIÓN DE KEYFRAMES")
+    print("=" * 60)
+
+    tests = [
+        test_error_within_tolerance,
+        test_constant_spans,
+        test_reduce_constant_interpolation,
+        test_reduction_performance
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE REDUCCIÓN DE KEYFRAMES PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE REDUCCIÓN DE KEYFRAMES FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_keyframe_reduction_tests()
@@ -0,0 +1,188 @@
+"""
+Script de verificación del registro de letras de TypeAnimator.
+Comprueba el índice de roots, letras, textos y grupos construido a partir
+de objetos falsos y su reconstrucción perezosa a través del bus de
+invalidación, sin necesidad de Blender.
+"""
+
+from types import SimpleNamespace
+
+
+class _Object(dict):
+    """Objeto mínimo: propiedades personalizadas como claves, identidad como en ``bpy``."""
+
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+
+    def __init__(self, name, obj_type='MESH', parent=None, **props):
+        super().__init__(props)
+        self._name = name
+        self.type = obj_type
+        self.parent = parent
+        self.removed = False
+
+    @property
+    def name(self):
+        if self.removed:
+            raise ReferenceError("StructRNA of type Object has been removed")
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+
+def _build_file():
+    """Un root con letras desordenadas, una letra enlazada por nombre, una huérfana, texto y grupo."""
+    root = _Object("Hola_Root", 'EMPTY')
+    letters = [_Object(f"Hola_{i}", 'MESH', parent=root, is_letter=True, letter_index=i) for i in (2, 0, 1)]
+    by_name = _Object("Hola_3", 'MESH', is_letter=True, letter_index=3, root_name="Hola_Root")
+    orphan = _Object("Suelta", 'MESH', is_letter=True)
+    text = _Object("Hola", 'FONT')
+    group = _Object("Grupo", 'EMPTY', is_animation_group=True)
+    others = [_Object(f"Cube{i}") for i in range(50)]
+    return [text, root, group, orphan, by_name] + letters + others
+
+
+def test_rebuild_and_queries():
+    """Roots, letras ordenadas por ``letter_index``, huérfanas, textos y recuentos."""
+    print("=== TEST: ÍNDICE DE LETRAS ===")
+    from letter_registry import LetterRegistry
+
+    registry = LetterRegistry()
+    objects = _build_file()
+    registry.rebuild(objects)
+
+    names = [letter.name for letter in registry.letters_of("Hola_Root")]
+    print(f"📊 Letras de Hola_Root: {names}")
+    assert names == ["Hola_0", "Hola_1", "Hola_2", "Hola_3"], "letras del root incorrectas o desordenadas"
+    assert [root.name for root in registry.roots()] == ["Hola_Root"], "roots incorrectos"
+    assert registry.letters_of(registry.roots()[0]) == registry.letters_of("Hola_Root"), "consulta por objeto distinta"
+
+    other_scene = SimpleNamespace(objects=[objects[3]] + objects[-50:])
+    assert [letter.name for letter in registry.all_letters(scene=other_scene)] == ["Suelta"], \
+        "filtro por escena incorrecto"
+    counts = registry.counts()
+    print(f"📊 Recuentos: {counts}")
+    assert counts == {'text_objects': 1, 'letter_objects': 5, 'root_objects': 1,
+                      'animation_groups': 1, 'orphan_letters': 1}, "recuentos incorrectos"
+
+    # Objetos eliminados en Blender: sus referencias ya no se devuelven
+    objects[-51].removed = True
+    assert "Hola_1" not in [letter.name for letter in registry.all_letters()], "se devolvió una letra eliminada"
+    assert len(registry.letters_of("Hola_Root")) == 3, "se devolvió una letra eliminada del root"
+
+    print("✅ Índice de letras correcto")
+
+
+def test_lazy_rebuild_on_invalidation():
+    """Las consultas no recorren los objetos hasta que el bus invalida el índice."""
+    print("=== TEST: RECONSTRUCCIÓN PEREZOSA ===")
+    import letter_registry
+    from invalidation import InvalidationEvent, publish
+
+    registry = letter_registry.get_registry()
+    original_bpy = letter_registry.bpy
+    objects = _build_file()
+    letter_registry.bpy = SimpleNamespace(data=SimpleNamespace(objects=objects))
+    try:
+        registry.invalidate()
+        rebuilds = registry.stats['rebuilds']
+        for _ in range(100):
+            registry.all_letters()
+            registry.counts()
+        assert registry.stats['rebuilds'] == rebuilds + 1, "las consultas repetidas recorrieron los objetos"
+
+        objects.append(_Object("Hola_4", 'MESH', parent=objects[1], is_letter=True, letter_index=4))
+        assert len(registry.letters_of("Hola_Root")) == 4, "el índice cambió sin invalidación"
+        publish(InvalidationEvent.LETTERS_CHANGED)
+        assert len(registry.letters_of("Hola_Root")) == 5, "LETTERS_CHANGED no reconstruyó el índice"
+        publish(InvalidationEvent.TEXT_CHANGED, "Hola")
+        registry.counts()
+        publish(InvalidationEvent.FILE_LOADED)
+        registry.counts()
+        print(f"📊 Reconstrucciones: {registry.stats['rebuilds'] - rebuilds} en {registry.stats['queries']} consultas")
+        assert registry.stats['rebuilds'] == rebuilds + 3, "reconstrucciones incorrectas tras TEXT_CHANGED/FILE_LOADED"
+    finally:
+        letter_registry.bpy = original_bpy
+        registry.invalidate()
+
+    print("✅ Reconstrucción perezosa correcta")
+
+
+def test_rebuild_on_rename_and_marking():
+    """Renombrar el root o marcar una letra sin cambiar el recuento reconstruye el índice."""
+    print("=== TEST: RENOMBRADOS Y MARCAS ===")
+    import letter_registry
+    import invalidation
+
+    registry = letter_registry.get_registry()
+    original_bpy = letter_registry.bpy
+    objects = _build_file()
+    letter_registry.bpy = SimpleNamespace(data=SimpleNamespace(objects=objects))
+    try:
+        invalidation.file_changed_handler()
+        invalidation.classify_updates([SimpleNamespace(id=obj) for obj in objects], len(objects))
+        assert len(registry.letters_of("Hola_Root")) == 4, "índice inicial incorrecto"
+        rebuilds = registry.stats['rebuilds']
+
+        # Sin pasar por el depsgraph: la consulta detecta la clave caducada
+        objects[1].name = "Adios_Root"
+        assert len(registry.letters_of("Adios_Root")) == 3, "el root renombrado perdió sus letras"
+        assert registry.letters_of("Hola_Root") == [], "el nombre anterior sigue indexado"
+        assert registry.stats['rebuilds'] == rebuilds + 1, "el renombrado no reconstruyó el índice"
+
+        # Un cubo marcado como letra con el mismo número de objetos
+        cube = objects[-1]
+        cube.parent, cube['is_letter'], cube['letter_index'] = objects[1], True, 7
+        for event, payload in invalidation.classify_updates([SimpleNamespace(id=cube)], len(objects)):
+            invalidation.publish(event, payload)
+        names = [letter.name for letter in registry.letters_of(objects[1])]
+        print(f"📊 Letras de Adios_Root: {names}")
+        assert names[-1] == cube.name and len(names) == 4, "la letra marcada no entró en el índice"
+        assert registry.stats['rebuilds'] == rebuilds + 2, "reconstrucciones incorrectas"
+    finally:
+        letter_registry.bpy = original_bpy
+        invalidation.file_changed_handler()
+
+    print("✅ Renombrados y marcas reconstruyen el índice")
+
+
+def run_all_letter_registry_tests():
+    """Ejecutar todas las pruebas del registro de letras."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL REGISTRO DE LETRAS")
+    print("=" * 60)
+
+    tests = [
+        test_rebuild_and_queries,
+        test_lazy_rebuild_on_invalidation,
+        test_rebuild_on_rename_and_marking
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL REGISTRO DE LETRAS PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL REGISTRO DE LETRAS FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_letter_registry_tests()
@@ -0,0 +1,139 @@
+"""
+Script de verificación del catálogo indexado de presets para TypeAnimator.
+Comprueba que el manifiesto evite releer archivos sin cambios y que los
+cuerpos de los presets solo se carguen al pedirlos.
+"""
+
+import json
+import os
+import tempfile
+
+
+def _write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def _make_presets(directory, file_count=50):
+    for i in range(file_count):
+        _write(os.path.join(directory, f"pack_{i:03d}.json"), {
+            f"preset_{i}_{j}": {'name': f"Preset {i}.{j}", 'duration': 10 + j, 'overlap': 2}
+            for j in range(4)
+        })
+    _write(os.path.join(directory, "animations.json"), {'Wave': {'duration': 40, 'overlap': 8}})
+    _write(os.path.join(directory, "user_ignored.json"), {'ignored': {'duration': 1}})
+
+
+def test_manifest_reuse():
+    """Un segundo catálogo reutiliza el manifiesto y no parsea nada."""
+    print("=== TEST: REUTILIZACIÓN DEL MANIFIESTO ===")
+    from preset_catalog import PresetCatalog
+
+    with tempfile.TemporaryDirectory() as directory:
+        presets_dir = os.path.join(directory, 'presets')
+        os.makedirs(presets_dir)
+        _make_presets(presets_dir)
+        manifest = os.path.join(directory, 'catalog.json')
+        sources = [(presets_dir, 'builtin', 'user_')]
+
+        first = PresetCatalog(sources, manifest)
+        result = first.refresh()
+        print(f"📊 Primera indexación: {result}")
+        assert result['parsed'] == 51, "indexación inicial incorrecta"
+        assert len(first) == 201, "indexación inicial incorrecta"
+        assert 'ignored' not in first, "indexación inicial incorrecta"
+
+        second = PresetCatalog(sources, manifest)
+        result = second.refresh()
+        print(f"📊 Con manifiesto: {result}")
+        assert result['parsed'] == 0, "se releyeron archivos sin cambios"
+        assert result['reused'] == 51, "se releyeron archivos sin cambios"
+
+        path = os.path.join(presets_dir, "pack_007.json")
+        _write(path, {'changed': {'name': 'Changed', 'duration': 5, 'overlap': 1}})
+        os.remove(os.path.join(presets_dir, "pack_008.json"))
+        result = second.refresh()
+        print(f"📊 Tras modificar/borrar: {result}")
+        assert result['parsed'] == 1, "cambios de archivos no detectados"
+        assert result['removed'] == 1, "cambios de archivos no detectados"
+        assert 'changed' in second, "cambios de archivos no detectados"
+        assert 'preset_7_0' not in second, "cambios de archivos no detectados"
+
+    print("✅ Solo se releen archivos nuevos o modificados")
+
+
+def test_lazy_bodies():
+    """El índice no carga cuerpos; get() lee el archivo una vez y normaliza."""
+    print("=== TEST: CARGA PEREZOSA DE CUERPOS ===")
+    from preset_catalog import PresetCatalog
+
+    with tempfile.TemporaryDirectory() as directory:
+        _make_presets(directory, file_count=3)
+        catalog = PresetCatalog([(directory, 'builtin', 'user_')])
+
+        # Como los presets de comunidad al crear el gestor: sin escanear nada
+        catalog.add('early', {'name': 'Temprano', 'category': 'community', 'duration': 3})
+        assert catalog.stats['refreshes'] == 0, "add() indexó los directorios antes de la primera consulta"
+
+        entry = catalog.entry('preset_1_2')
+        assert entry == {'name': 'Preset 1.2', 'description': '', 'category': 'builtin',
+                         'filepath': os.path.join(directory, 'pack_001.json')}, f"entrada incorrecta: {entry}"
+        assert catalog.stats['bodies_loaded'] == 0, "se cargaron cuerpos al indexar"
+
+        body = catalog.get('preset_1_2')
+        catalog.get('preset_1_3')
+        wave = catalog.get('Wave')
+        print(f"📊 Cuerpos cargados: {catalog.stats['bodies_loaded']}")
+        assert body['duration'] == 12, "carga bajo demanda incorrecta"
+        assert catalog.stats['bodies_loaded'] == 2, "carga bajo demanda incorrecta"
+        assert catalog.entry('Wave').get('subtype') == 'animation', "subtipo de animación perdido"
+        assert wave.get('subtype') == 'animation', "subtipo de animación perdido"
+
+        assert catalog.entry('early') is not None, "preset añadido antes del indexado perdido"
+        assert catalog.get('early')['duration'] == 3, "preset añadido antes del indexado perdido"
+        assert catalog.stats['refreshes'] == 1, "preset añadido antes del indexado perdido"
+
+        catalog.add('memory', {'name': 'En memoria', 'category': 'community', 'duration': 1})
+        assert catalog.get('memory')['name'] == 'En memoria', "presets en memoria no registrados"
+        assert catalog.entry('memory')['category'] == 'community', "presets en memoria no registrados"
+
+    print("✅ Cuerpos cargados solo al pedirlos")
+
+
+def run_all_preset_catalog_tests():
+    """Ejecutar todas las pruebas del catálogo de presets."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL CATÁLOGO DE PRESETS")
+    print("=" * 60)
+
+    tests = [
+        test_manifest_reuse,
+        test_lazy_bodies
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL CATÁLOGO DE PRESETS PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL CATÁLOGO DE PRESETS FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_preset_catalog_tests()
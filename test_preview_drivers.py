@@ -0,0 +1,192 @@
+"""
+Script de verificación de los drivers de preview agrupados de TypeAnimator.
+Comprueba que todos los drivers de un root comparten una evaluación por
+frame, que sus valores coinciden con el motor vectorizado y que los grupos
+se releen al invalidarse, sin necesidad de Blender.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class _Letter(dict):
+    """Letra mínima con ``driver_add``/``driver_remove`` como en ``bpy.types.Object``."""
+
+    def __init__(self, name, index, parent=None):
+        super().__init__(letter_index=index)
+        self.name = name
+        self.parent = parent
+        self.location = np.array([float(index), 0.0, 0.0])
+        self.rotation_euler = np.array([0.0, 0.0, 0.1 * index])
+        self.scale = np.ones(3)
+        self.hide_viewport = False
+        self.drivers = {}
+
+    def driver_add(self, data_path, index=-1):
+        fcurve = self.drivers[(data_path, index)] = SimpleNamespace(driver=SimpleNamespace())
+        return fcurve
+
+    def driver_remove(self, data_path, index=-1):
+        return self.drivers.pop((data_path, index), None) is not None
+
+
+def _stage_curves(_base_name):
+    from curve_lut import CurveLUT
+    return {'in': CurveLUT.bake(lambda t: t * t, 64), 'mid': CurveLUT([1.0, 0.8]),
+            'out': CurveLUT.bake(lambda t: 1.0 - t, 64)}
+
+
+def _props():
+    return SimpleNamespace(
+        base_name='Titulo',
+        timing=SimpleNamespace(start_frame=1, duration=40, overlap=0.5, loop_count=1),
+        stages=SimpleNamespace(in_end=0.25, out_start=0.75),
+        flags_loc=True, amplitude_loc_x=2.0, flags_rot=False, amplitude_rot_z=0.0,
+        flags_scale=True, amplitude_scale=0.5, flags_vis=True,
+    )
+
+
+def _setup(preview_drivers, props):
+    """
+    Dos roots con 8 y 4 letras; ``bpy`` falso solo con escena y driver namespace.
+
+    Fuera del paquete ``preview_drivers`` no importa ``curves`` (necesita nodos
+    de Blender): el test inyecta ``get_stage_curves`` y ``_teardown`` lo retira.
+    """
+    preview_drivers.bpy = SimpleNamespace(app=SimpleNamespace(driver_namespace={}),
+                                          context=SimpleNamespace(scene=SimpleNamespace(ta_letter_anim_props=props)))
+    preview_drivers.get_stage_curves = _stage_curves
+    roots = [SimpleNamespace(name="Hola_Root"), SimpleNamespace(name="Adios_Root")]
+    letters = [_Letter(f"Hola_{i}", i, roots[0]) for i in reversed(range(8))]
+    letters += [_Letter(f"Adios_{i}", i, roots[1]) for i in range(4)]
+    created = preview_drivers.setup_preview_drivers(letters, props)
+    return letters, created
+
+
+def _teardown(preview_drivers, letters, original_bpy):
+    preview_drivers.remove_preview_drivers(letters)
+    preview_drivers.bpy = original_bpy
+    del preview_drivers.get_stage_curves
+
+
+def _evaluate_drivers(preview_drivers, letters, frame):
+    """Evalúa las expresiones de todos los drivers como lo haría Blender."""
+    namespace = dict(preview_drivers.bpy.app.driver_namespace, frame=frame)
+    return {(letter.name, path): eval(fcurve.driver.expression, namespace)
+            for letter in letters for path, fcurve in letter.drivers.items()}
+
+
+def test_one_evaluation_per_frame():
+    """N letras × canales cuestan una evaluación de grupo por frame con valores del motor."""
+    print("=== TEST: UNA EVALUACIÓN POR FRAME ===")
+    import preview_drivers
+    from evaluation import LetterBatch, evaluate_frame, compute_transforms, read_timing, read_channel_settings
+
+    original = preview_drivers.bpy
+    props = _props()
+    letters = []
+    try:
+        letters, created = _setup(preview_drivers, props)
+        # loc (1) + scale (3) + vis (1) por letra; rot desactivado
+        assert created == 12 * 5, f"drivers creados incorrectos: {created}"
+        assert preview_drivers.bpy.app.driver_namespace.get('ta_preview') is preview_drivers.preview_value, \
+            "la función no está en el driver namespace"
+        before = preview_drivers.get_driver_stats()
+        frames = range(0, 50)
+        hola = sorted(letters[:8], key=lambda l: l['letter_index'])
+        batch = LetterBatch(hola)
+        for frame in frames:
+            values = _evaluate_drivers(preview_drivers, letters, frame)
+            expected = compute_transforms(evaluate_frame(frame, 8, read_timing(props), _stage_curves(None)),
+                                          batch, read_channel_settings(props))
+            for index, letter in enumerate(hola):
+                assert (np.isclose(values[(letter.name, ('location', 0))], expected['location'][index, 0]) and
+                        np.isclose(values[(letter.name, ('scale', 2))], expected['scale'][index, 2]) and
+                        bool(values[(letter.name, ('hide_viewport', -1))]) == bool(expected['hidden'][index])), \
+                    f"valor de driver distinto del motor en {letter.name}, frame {frame}"
+        stats = preview_drivers.get_driver_stats()
+        calls = stats['calls'] - before['calls']
+        evaluations = stats['evaluations'] - before['evaluations']
+        print(f"📊 {calls} llamadas de drivers, {evaluations} evaluaciones de grupo en {len(frames)} frames")
+        assert calls == created * len(frames) and evaluations == 2 * len(frames), \
+            "los drivers no comparten la evaluación del frame"
+
+        group = preview_drivers._get_group("Hola_Root")
+        assert np.isclose(group.value(10, 3, 'rotation', 2), 0.3), "un canal desactivado no devuelve el transform base"
+        assert preview_drivers.preview_value(10, "Nadie_Root", 0, 'location', 0) == 0.0, "grupo desconocido distinto de 0.0"
+        assert preview_drivers.preview_value(10, "Hola_Root", 99, 'location', 0) == 0.0, "índice desconocido distinto de 0.0"
+    finally:
+        _teardown(preview_drivers, letters, original)
+
+    print("✅ Una evaluación por grupo y frame")
+
+
+def test_groups_reload_on_invalidation():
+    """Tras TIMING_CHANGED los grupos releen el timing; quitar los drivers olvida los grupos."""
+    print("=== TEST: RELECTURA DE GRUPOS ===")
+    import preview_drivers
+    from invalidation import InvalidationEvent, publish
+
+    original = preview_drivers.bpy
+    props = _props()
+    letters = []
+    try:
+        letters, _created = _setup(preview_drivers, props)
+        before = preview_drivers.preview_value(20, "Hola_Root", 2, 'location', 0)
+        props.timing.start_frame = 15
+        assert preview_drivers.preview_value(20, "Hola_Root", 2, 'location', 0) == before, "el grupo se releyó sin invalidación"
+        publish(InvalidationEvent.TIMING_CHANGED)
+        after = preview_drivers.preview_value(20, "Hola_Root", 2, 'location', 0)
+        print(f"📊 Valor en el frame 20: {before:.3f} -> {after:.3f}")
+        assert after != before and preview_drivers._get_group("Hola_Root").timing['start_frame'] == 15, \
+            "TIMING_CHANGED no releyó el grupo"
+
+        preview_drivers.remove_preview_drivers(letters)
+        assert not any(letter.drivers for letter in letters), "quedaron drivers tras quitarlos"
+        assert preview_drivers.get_driver_stats()['groups'] == 0, "quedaron grupos tras quitar los drivers"
+        preview_drivers.unregister_namespace()
+        assert 'ta_preview' not in preview_drivers.bpy.app.driver_namespace, "la función sigue en el driver namespace"
+    finally:
+        _teardown(preview_drivers, letters, original)
+
+    print("✅ Relectura de grupos correcta")
+
+
+def run_all_preview_drivers_tests():
+    """Ejecutar todas las pruebas de los drivers de preview."""
+    print("🚀 INICIANDO VERIFICACIÓN DE LOS DRIVERS DE PREVIEW")
+    print("=" * 60)
+
+    tests = [
+        test_one_evaluation_per_frame,
+        test_groups_reload_on_invalidation
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE LOS DRIVERS DE PREVIEW PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE LOS DRIVERS DE PREVIEW FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_preview_drivers_tests()
@@ -0,0 +1,166 @@
+"""
+Script de verificación del profiler por secciones de TypeAnimator.
+Comprueba los percentiles, el buffer circular, la traza de Chrome y el
+coste con el profiler apagado.
+"""
+
+import json
+import os
+import tempfile
+import time
+
+
+class FakeClock:
+    """Reloj manual: cada lectura avanza ``step`` segundos."""
+
+    def __init__(self, step=0.001):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def test_sections_and_percentiles():
+    """Percentiles por sección y buffer circular de muestras."""
+    print("=== TEST: SECCIONES Y PERCENTILES ===")
+    from profiler import Profiler, percentile
+
+    profiler = Profiler(capacity=100, clock=FakeClock())
+    with profiler.section('frame.evaluate'):
+        pass
+    assert not profiler.sections(), "el profiler apagado registró muestras"
+
+    profiler.enable()
+    for duration in range(1, 201):  # 1..200 ms; solo quedan los 100 últimos
+        profiler.record('frame.apply', 0.0, duration / 1000.0)
+    with profiler.section('frame.evaluate'):
+        pass
+    stats = profiler.stats('frame.apply')
+    print(f"📊 n={stats['count']} muestras={stats['samples']} p50={stats['p50']:.3f} "
+          f"p95={stats['p95']:.3f} p99={stats['p99']:.3f}")
+    assert stats['count'] == 200, "buffer circular incorrecto"
+    assert stats['samples'] == 100, "buffer circular incorrecto"
+    assert (round(stats['p50'], 3), round(stats['p95'], 3), round(stats['p99'], 3)) == (0.15, 0.195, 0.199), \
+        "percentiles incorrectos"
+    assert abs(profiler.stats('frame.evaluate')['p50'] - 0.001) <= 1e-9, "duración de la sección incorrecta"
+    assert percentile([], 95) == 0.0, "percentil en listas pequeñas incorrecto"
+    assert percentile([1.0], 99) == 1.0, "percentil en listas pequeñas incorrecto"
+    assert [s['name'] for s in profiler.summary()] == ['frame.apply', 'frame.evaluate'], "resumen mal ordenado"
+    for line in profiler.report():
+        print(line)
+
+    print("✅ Secciones y percentiles correctos")
+
+
+def test_chrome_trace_and_decorators():
+    """Traza de Chrome exportada y decoradores sobre el profiler compartido."""
+    print("=== TEST: TRAZA Y DECORADORES ===")
+    import profiler as profiler_module
+    from profiler import Profiler, profiled, profiled_execute, get_profiler
+
+    profiler = Profiler(trace_capacity=3, clock=FakeClock())
+    profiler.enable()
+    for index in range(5):
+        with profiler.section(f"step{index}"):
+            pass
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'trace.json')
+        assert profiler.export_chrome_trace(path), "no se exportó la traza"
+        with open(path, 'r', encoding='utf-8') as f:
+            trace = json.load(f)
+    events = trace['traceEvents']
+    print(f"📊 Eventos: {[(e['name'], round(e['ts']), round(e['dur'])) for e in events]}")
+    assert [e['name'] for e in events] == ['step2', 'step3', 'step4'], "eventos de la traza incorrectos"
+    assert all(e['ph'] == 'X' for e in events), "eventos de la traza incorrectos"
+    assert abs(events[0]['dur'] - 1000.0) <= 1e-6, "tiempos de la traza incorrectos"
+    assert events[1]['ts'] > events[0]['ts'], "tiempos de la traza incorrectos"
+
+    class Operator:
+        @profiled_execute
+        def execute(self, context):
+            return {'FINISHED'}
+
+    @profiled('core.work')
+    def work(value):
+        return value * 2
+
+    shared = get_profiler()
+    shared.reset()
+    shared.enable(False)
+    work(1)
+    shared.enable()
+    try:
+        assert work(2) == 4, "los decoradores cambiaron el resultado"
+        assert Operator().execute(None) == {'FINISHED'}, "los decoradores cambiaron el resultado"
+    finally:
+        shared.enable(False)
+    # Blender cuenta los argumentos de execute al registrar el operador
+    assert Operator.execute.__code__.co_argcount == 2, "execute no conserva la firma (self, context)"
+    counts = {s['name']: s['count'] for s in shared.summary()}
+    print(f"📊 Secciones compartidas: {counts}")
+    assert counts == {'core.work': 1, 'test_chrome_trace_and_decorators.<locals>.Operator.execute': 1}, \
+        "secciones de los decoradores incorrectas"
+    assert profiler_module.section('x') is profiler_module.section('y'), \
+        "el profiler apagado crea contextos nuevos"
+
+    print("✅ Traza y decoradores correctos")
+
+
+def test_disabled_overhead():
+    """Con el profiler apagado una sección cuesta poco más que un bloque vacío."""
+    print("=== TEST: COSTE APAGADO ===")
+    from profiler import section, get_profiler
+
+    get_profiler().enable(False)
+    iterations = 200000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with section('frame.evaluate'):
+            pass
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"📊 {per_call * 1e9:.0f} ns por sección apagada")
+    assert per_call <= 5e-6, "sección apagada demasiado cara"
+
+    print("✅ Coste apagado despreciable")
+
+
+def run_all_profiler_tests():
+    """Ejecutar todas las pruebas del profiler."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL PROFILER")
+    print("=" * 60)
+
+    tests = [
+        test_sections_and_percentiles,
+        test_chrome_trace_and_decorators,
+        test_disabled_overhead
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL PROFILER PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL PROFILER FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_profiler_tests()
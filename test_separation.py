@@ -0,0 +1,156 @@
+"""
+Script de verificación de la separación de texto para TypeAnimator.
+Verifica islas, agrupado de glifos y fragmentación LETTERS/WORDS/LINES sobre
+mallas sintéticas, sin necesidad de convertir texto en Blender.
+"""
+
+import numpy as np
+
+
+def _make_mesh(body):
+    """Un quad por carácter visible; la "i" lleva el punto como isla aparte."""
+    coords, edges, loops, starts = [], [], [], []
+    for row, line in enumerate(body.split("\n")):
+        y = -1.2 * row
+        for column, char in enumerate(line):
+            if char.isspace():
+                continue
+            x = 0.6 * column
+            boxes = [(x, y, x + 0.5, y + 0.7)]
+            if char == "i":
+                boxes = [(x, y, x + 0.5, y + 0.5), (x, y + 0.58, x + 0.5, y + 0.7)]
+            for x0, y0, x1, y1 in boxes:
+                first = len(coords)
+                coords += [(x0, y0, 0.0), (x1, y0, 0.0), (x1, y1, 0.0), (x0, y1, 0.0)]
+                edges += [(first + k, first + (k + 1) % 4) for k in range(4)]
+                starts.append(len(loops))
+                loops += [first, first + 1, first + 2, first + 3]
+    return {
+        'coords': np.array(coords),
+        'edges': np.array(edges),
+        'loop_vertices': np.array(loops),
+        'loop_start': np.array(starts),
+        'loop_total': np.full(len(starts), 4),
+        'material_index': np.zeros(len(starts), dtype=np.int64),
+    }
+
+
+def test_island_labels():
+    """Las islas se detectan a partir de las aristas."""
+    print("=== TEST: DETECCIÓN DE ISLAS ===")
+    from separation import label_islands
+
+    edges = np.array([(0, 1), (1, 2), (3, 4), (6, 5)])
+    labels, count = label_islands(7, edges)
+    print(f"📊 Islas: {count}, etiquetas: {labels.tolist()}")
+    assert count == 3, "islas incorrectas"
+    assert labels[0] == labels[2], "islas incorrectas"
+    assert labels[3] == labels[4], "islas incorrectas"
+    assert labels[5] == labels[6], "islas incorrectas"
+
+    print("✅ Islas correctas")
+
+
+def test_glyph_grouping():
+    """El punto de la "i" se une a su trazo y las letras vecinas no se unen."""
+    print("=== TEST: AGRUPADO DE GLIFOS ===")
+    from separation import compute_layout
+
+    layout = compute_layout(mode='LETTERS', grouping_tolerance=0.1, body="hi il", **_make_mesh("hi il"))
+    print(f"📊 Fragmentos: {layout.fragment_count}, textos: {layout.fragment_texts}")
+    assert layout.fragment_count == 4, "agrupado de glifos incorrecto"
+    assert layout.fragment_texts == ['h', 'i', 'i', 'l'], "agrupado de glifos incorrecto"
+
+    layout = compute_layout(mode='LETTERS', grouping_tolerance=0.01, body="", **_make_mesh("i"))
+    assert layout.fragment_count == 2, "la tolerancia no limita el agrupado"
+
+    print("✅ Agrupado de glifos correcto")
+
+
+def test_fragment_modes():
+    """Palabras y líneas en orden de lectura, con y sin body."""
+    print("=== TEST: MODOS DE FRAGMENTACIÓN ===")
+    from separation import compute_layout
+
+    body = "hola mundo\nadios"
+    mesh = _make_mesh(body)
+    expected = {
+        'LETTERS': list("holamundoadios"),
+        'WORDS': ['hola', 'mundo', 'adios'],
+        'LINES': ['hola mundo', 'adios'],
+    }
+    for mode, texts in expected.items():
+        layout = compute_layout(mode=mode, grouping_tolerance=0.1, body=body, **mesh)
+        print(f"📊 {mode}: {layout.fragment_texts}")
+        assert layout.fragment_texts == texts, f"fragmentos {mode} incorrectos"
+
+    # Sin body: palabras y líneas se deducen de la geometría
+    for mode, count in (('WORDS', 3), ('LINES', 2)):
+        layout = compute_layout(mode=mode, grouping_tolerance=0.1, body="", **mesh)
+        assert layout.fragment_count == count, f"fragmentos {mode} por geometría incorrectos: {layout.fragment_count}"
+        assert layout.fragment_texts is None, f"fragmentos {mode} por geometría incorrectos: {layout.fragment_count}"
+
+    print("✅ Modos de fragmentación correctos")
+
+
+def test_fragment_meshes():
+    """Cada fragmento conserva sus vértices y polígonos con índices locales."""
+    print("=== TEST: MALLAS POR FRAGMENTO ===")
+    from separation import compute_layout
+
+    mesh = _make_mesh("ab ci")
+    layout = compute_layout(mode='WORDS', grouping_tolerance=0.1, body="ab ci", **mesh)
+    fragments = list(layout.fragments())
+
+    assert sum(len(fragment['coords']) for fragment in fragments) == len(mesh['coords']), \
+        "se perdieron vértices al particionar"
+    for fragment in fragments:
+        vertex_count = len(fragment['coords'])
+        assert fragment['loop_vertices'].max() < vertex_count, "índices fuera del fragmento"
+        assert fragment['edges'].max() < vertex_count, "índices fuera del fragmento"
+        assert np.allclose(fragment['coords'].min(axis=0) + fragment['coords'].max(axis=0), 0.0, atol=1e-5), \
+            "el fragmento no está centrado en su origen"
+
+    print(f"📊 Vértices por fragmento: {[len(fragment['coords']) for fragment in fragments]}")
+    print("✅ Mallas por fragmento correctas")
+
+
+def run_all_separation_tests():
+    """Ejecutar todas las pruebas de separación."""
+    print("🚀 INICIANDO VERIFICACIÓN DE SEPARACIÓN DE TEXTO")
+    print("=" * 60)
+
+    tests = [
+        test_island_labels,
+        test_glyph_grouping,
+        test_fragment_modes,
+        test_fragment_meshes
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE SEPARACIÓN PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE SEPARACIÓN FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_separation_tests()
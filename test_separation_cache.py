@@ -0,0 +1,221 @@
+"""
+Script de verificación del cache de separación de letras para TypeAnimator.
+Verifica las claves por contenido, el desalojo LRU, la expiración por TTL y
+el presupuesto ponderado.
+"""
+
+import time
+
+
+class _FakeFont:
+    def __init__(self, name, filepath=""):
+        self.name = name
+        self.filepath = filepath
+
+
+class _FakeData:
+    def __init__(self, body):
+        self.body = body
+        self.font = _FakeFont("Bfont")
+        self.size = 1.0
+        self.extrude = 0.0
+
+
+class _FakeTextObject:
+    """Objeto de texto mínimo con los atributos que lee el cache."""
+
+    def __init__(self, name, body=None):
+        self.name = name
+        self.data = _FakeData(body if body is not None else name)
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+
+
+class _Removable:
+    """Referencia a un objeto de Blender que puede eliminarse."""
+
+    def __init__(self, name):
+        self._name = name
+        self.removed = False
+
+    @property
+    def name(self):
+        if self.removed:
+            raise ReferenceError("StructRNA of type Object has been removed")
+        return self._name
+
+
+def _result(letter_count):
+    return (None, list(range(letter_count)))
+
+
+def test_content_keys():
+    """Las claves dependen del contenido, no del nombre del objeto."""
+    print("=== TEST: CLAVES POR CONTENIDO ===")
+    from separation_cache import OptimizedLetterSeparationCache
+
+    cache = OptimizedLetterSeparationCache()
+    prefix = "x" * 200
+    first = _FakeTextObject("TextA", prefix + "A")
+    renamed = _FakeTextObject("TextB", prefix + "A")
+    other = _FakeTextObject("TextA", prefix + "B")
+
+    key = cache._generate_key(first, 'LETTERS', 0.1)
+    assert key == cache._generate_key(renamed, 'LETTERS', 0.1), "el mismo texto en otro objeto genera otra clave"
+    assert key != cache._generate_key(other, 'LETTERS', 0.1), "textos largos con el mismo prefijo colisionan"
+    assert key != cache._generate_key(first, 'WORDS', 0.1), "la clave ignora el modo de fragmentación o la tolerancia"
+    assert key != cache._generate_key(first, 'LETTERS', 0.2), "la clave ignora el modo de fragmentación o la tolerancia"
+
+    # Transformaciones distintas tampoco cambian la clave
+    renamed.location = (5.0, 0.0, 0.0)
+    assert key == cache._generate_key(renamed, 'LETTERS', 0.1), "la transformación del objeto cambia la clave"
+
+    cache.set(first, 'LETTERS', 0.1, _result(1))
+    assert cache.get(renamed, 'LETTERS', 0.1) is not None, "el resultado no se comparte entre objetos idénticos"
+    assert cache.get(other, 'LETTERS', 0.1) is None, "un cuerpo distinto acierta en el cache"
+
+    other_font = _FakeTextObject("TextC", prefix + "A")
+    other_font.data.font = _FakeFont("Inter", "//fonts/Inter.ttf")
+    assert cache.get(other_font, 'LETTERS', 0.1) is None, "otra fuente acierta en el cache"
+    for attr, value in (('size', 2.0), ('extrude', 0.1)):
+        changed = _FakeTextObject("TextD", prefix + "A")
+        setattr(changed.data, attr, value)
+        assert cache.get(changed, 'LETTERS', 0.1) is None, f"cambiar '{attr}' acierta en el cache"
+    stats = cache.get_stats()
+    print(f"📊 Aciertos: {stats['hits']}, fallos: {stats['misses']}")
+    assert stats['hits'] == 1, "estadísticas de aciertos incorrectas"
+    assert stats['misses'] == 4, "estadísticas de aciertos incorrectas"
+
+    print("✅ Claves por contenido correctas")
+
+
+def test_lru_keeps_recent_hits():
+    """Una entrada consultada recientemente sobrevive al desalojo."""
+    print("=== TEST: DESALOJO LRU ===")
+    from separation_cache import OptimizedLetterSeparationCache
+
+    cache = OptimizedLetterSeparationCache(max_size=4, cleanup_threshold=3, max_weight=1000)
+    objs = [_FakeTextObject(f"Text{i}") for i in range(5)]
+    for obj in objs[:4]:
+        cache.set(obj, 'LETTERS', 0.1, _result(2))
+
+    cache.get(objs[0], 'LETTERS', 0.1)  # Text0 pasa a ser la más reciente
+    cache.set(objs[4], 'LETTERS', 0.1, _result(2))
+
+    stats = cache.get_stats()
+    print(f"📊 Stats: size={stats['size']}, evictions={stats['evictions']}")
+    assert cache.get(objs[0], 'LETTERS', 0.1) is not None, "se desalojó una entrada usada recientemente"
+    assert cache.get(objs[1], 'LETTERS', 0.1) is None, "no se desalojó la entrada menos usada"
+    assert stats['size'] == 3, "el desalojo no bajó hasta el umbral de limpieza"
+    assert stats['evictions'] == 2, "el desalojo no bajó hasta el umbral de limpieza"
+
+    print("✅ Desalojo LRU correcto")
+
+
+def test_weighted_budget():
+    """Las entradas con muchas letras consumen más presupuesto."""
+    print("=== TEST: PRESUPUESTO PONDERADO ===")
+    from separation_cache import OptimizedLetterSeparationCache
+
+    cache = OptimizedLetterSeparationCache(max_size=100, cleanup_threshold=100, max_weight=50)
+    small = _FakeTextObject("Small")
+    large = _FakeTextObject("Large")
+    cache.set(small, 'LETTERS', 0.1, _result(10))
+    cache.set(large, 'LETTERS', 0.1, _result(45))
+
+    stats = cache.get_stats()
+    print(f"📊 Peso: {stats['weight']}/{stats['max_weight']}")
+    assert stats['weight'] <= stats['max_weight'], "no se respetó el presupuesto de peso"
+    assert cache.get(small, 'LETTERS', 0.1) is None, "no se respetó el presupuesto de peso"
+
+    print("✅ Presupuesto ponderado correcto")
+
+
+def test_ttl_expiry():
+    """Las entradas caducadas no se devuelven y se cuentan como expiradas."""
+    print("=== TEST: EXPIRACIÓN TTL ===")
+    from separation_cache import OptimizedLetterSeparationCache
+
+    cache = OptimizedLetterSeparationCache(ttl_seconds=0.01)
+    obj = _FakeTextObject("Expiring")
+    cache.set(obj, 'LETTERS', 0.1, _result(3))
+    time.sleep(0.02)
+
+    assert cache.get(obj, 'LETTERS', 0.1) is None, "se devolvió una entrada caducada"
+    stats = cache.get_stats()
+    assert stats['expirations'] == 1, f"estadísticas inesperadas: {stats}"
+    assert stats['weight'] == 0, f"estadísticas inesperadas: {stats}"
+
+    print("✅ Expiración TTL correcta")
+
+
+def test_optimize_checks_object_references():
+    """Fuera de Blender ``optimize`` conserva las entradas vivas y retira las eliminadas."""
+    print("=== TEST: VALIDACIÓN DE REFERENCIAS ===")
+    from separation_cache import OptimizedLetterSeparationCache
+
+    cache = OptimizedLetterSeparationCache()
+    texts = [_FakeTextObject(f"Text{i}") for i in range(3)]
+    results = [(_Removable(f"Root{i}"), [_Removable(f"L{i}_{j}") for j in range(3)]) for i in range(3)]
+    for text, result in zip(texts, results):
+        cache.set(text, 'LETTERS', 0.1, result)
+    results[1][1][2].removed = True
+
+    removed = cache.optimize()
+    print(f"📊 Entradas retiradas: {removed}, restantes: {cache.get_stats()['size']}")
+    assert removed == 1, "optimize no retiró solo la entrada con una letra eliminada"
+    assert cache.get(texts[0], 'LETTERS', 0.1) is results[0], "se retiró una entrada válida"
+    assert cache.get(texts[1], 'LETTERS', 0.1) is None, "se conservó una entrada con una letra eliminada"
+
+    checked = []
+    custom = OptimizedLetterSeparationCache(object_validator=lambda obj: checked.append(obj) or obj.name != "Root2")
+    for text, result in zip(texts, results):
+        custom.set(text, 'LETTERS', 0.1, result)
+    results[1][1][2].removed = False
+    assert custom.optimize() == 1 and custom.get(texts[2], 'LETTERS', 0.1) is None, "validador propio ignorado"
+    assert len(checked) == 9, "el validador no recibió el root y las letras"
+
+    print("✅ Referencias validadas sin Blender")
+
+
+def run_all_separation_cache_tests():
+    """Ejecutar todas las pruebas del cache de separación."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL CACHE DE SEPARACIÓN")
+    print("=" * 60)
+
+    tests = [
+        test_content_keys,
+        test_lru_keeps_recent_hits,
+        test_weighted_budget,
+        test_ttl_expiry,
+        test_optimize_checks_object_references
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL CACHE PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL CACHE FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_separation_cache_tests()
@@ -0,0 +1,136 @@
+"""
+Script de verificación del índice espacial para TypeAnimator.
+Compara las versiones NumPy y Python puro con una búsqueda por fuerza bruta.
+"""
+
+import random
+import time
+
+
+def _random_boxes(count, seed=0):
+    rng = random.Random(seed)
+    mins, maxs = [], []
+    for _ in range(count):
+        x, y = rng.uniform(0, 50), rng.uniform(0, 20)
+        w, h = rng.uniform(0.1, 0.8), rng.uniform(0.1, 0.8)
+        mins.append((x, y))
+        maxs.append((x + w, y + h))
+    return mins, maxs
+
+
+def _brute_force(mins, maxs, max_gap):
+    pairs = []
+    for i in range(len(mins)):
+        for j in range(i + 1, len(mins)):
+            gap_x = max(mins[i][0], mins[j][0]) - min(maxs[i][0], maxs[j][0])
+            gap_y = max(mins[i][1], mins[j][1]) - min(maxs[i][1], maxs[j][1])
+            if gap_x <= max_gap[0] and gap_y <= max_gap[1]:
+                pairs.append((i, j))
+    return pairs
+
+
+def test_python_matches_brute_force():
+    """La rejilla en Python puro encuentra exactamente los mismos pares."""
+    print("=== TEST: REJILLA PYTHON PURO ===")
+    from spatial_index import pairs_within_gap_python
+
+    mins, maxs = _random_boxes(400)
+    for max_gap in ((0.0, 0.0), (0.0, 0.3), (0.2, 0.2)):
+        expected = _brute_force(mins, maxs, max_gap)
+        found = pairs_within_gap_python(mins, maxs, max_gap)
+        print(f"📊 Hueco {max_gap}: {len(found)} pares")
+        assert found == expected, "pares distintos a la fuerza bruta"
+
+    print("✅ Rejilla en Python puro correcta")
+
+
+def test_numpy_matches_python():
+    """La versión NumPy coincide con la de Python puro."""
+    print("=== TEST: REJILLA NUMPY ===")
+    from spatial_index import pairs_within_gap_numpy, pairs_within_gap_python
+
+    mins, maxs = _random_boxes(1000, seed=1)
+    for max_gap in ((0.0, 0.0), (0.0, 0.3), (0.5, 0.1)):
+        expected = pairs_within_gap_python(mins, maxs, max_gap)
+        found = [tuple(pair) for pair in pairs_within_gap_numpy(mins, maxs, max_gap).tolist()]
+        assert found == expected, f"pares distintos con hueco {max_gap}"
+
+    print("✅ Rejilla NumPy correcta")
+
+
+def test_edge_cases():
+    """Entradas vacías, una sola caja y cajas mucho mayores que la celda."""
+    print("=== TEST: CASOS LÍMITE ===")
+    from spatial_index import pairs_within_gap_numpy, pairs_within_gap_python
+
+    assert pairs_within_gap_python([], []) == [], "entradas triviales incorrectas"
+    assert len(pairs_within_gap_numpy([(0, 0)], [(1, 1)])) == 0, "entradas triviales incorrectas"
+
+    # Una caja grande que contiene a muchas pequeñas
+    mins = [(0.0, 0.0)] + [(x + 0.1, 0.1) for x in range(20)]
+    maxs = [(21.0, 1.0)] + [(x + 0.5, 0.5) for x in range(20)]
+    expected = _brute_force(mins, maxs, (0.0, 0.0))
+    found = [tuple(pair) for pair in pairs_within_gap_numpy(mins, maxs).tolist()]
+    assert found == expected, "caja grande mal indexada"
+    assert pairs_within_gap_python(mins, maxs) == expected, "caja grande mal indexada"
+
+    print("✅ Casos límite correctos")
+
+
+def test_index_performance():
+    """El índice escala casi linealmente frente a la fuerza bruta."""
+    print("=== TEST: RENDIMIENTO DEL ÍNDICE ===")
+    from spatial_index import pairs_within_gap_numpy, pairs_within_gap_python
+
+    mins, maxs = _random_boxes(20000, seed=2)
+    start = time.perf_counter()
+    pairs_within_gap_numpy(mins, maxs, (0.0, 0.1))
+    numpy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs_within_gap_python(mins, maxs, (0.0, 0.1))
+    python_time = time.perf_counter() - start
+
+    print(f"📊 20000 cajas: NumPy {numpy_time * 1000:.1f}ms, Python {python_time * 1000:.1f}ms")
+    print("✅ Rendimiento medido")
+
+
+def run_all_spatial_index_tests():
+    """Ejecutar todas las pruebas del índice espacial."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL ÍNDICE ESPACIAL")
+    print("=" * 60)
+
+    tests = [
+        test_python_matches_brute_force,
+        test_numpy_matches_python,
+        test_edge_cases,
+        test_index_performance
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL ÍNDICE ESPACIAL PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL ÍNDICE ESPACIAL FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_spatial_index_tests()
@@ -0,0 +1,126 @@
+"""
+Script de verificación del perfil de arranque de TypeAnimator.
+Comprueba la medición de pasos, los pasos omitidos y la cola diferida.
+"""
+
+import json
+import os
+import tempfile
+
+
+class FakeClock:
+    """Reloj manual: cada lectura avanza ``step`` segundos."""
+
+    def __init__(self, step=0.01):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def test_step_timing():
+    """Cada paso guarda su duración y los errores quedan registrados."""
+    print("=== TEST: MEDICIÓN DE PASOS ===")
+    from startup import StartupProfile
+
+    profile = StartupProfile(clock=FakeClock())
+    with profile.step('preferences'):
+        pass
+    try:
+        with profile.step('properties'):
+            raise RuntimeError("sin props")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("la excepción del paso no se relanzó")
+    profile.skip('ui', "background")
+
+    statuses = [(s['name'], s['status']) for s in profile.steps]
+    print(f"📊 Pasos: {statuses}")
+    assert statuses == [('preferences', 'ok'), ('properties', 'error'), ('ui', 'skipped')], \
+        "estados de pasos incorrectos"
+    assert abs(profile.total() - 0.02) <= 1e-9, "duraciones o error no registrados"
+    assert profile.steps[1]['error'] == "sin props", "duraciones o error no registrados"
+
+    print("✅ Pasos medidos correctamente")
+
+
+def test_deferred_tasks():
+    """La cola diferida se ejecuta una vez y un fallo no detiene al resto."""
+    print("=== TEST: TAREAS DIFERIDAS ===")
+    from startup import StartupProfile, DeferredTasks
+
+    profile = StartupProfile(clock=FakeClock())
+    profile.reset(background=False)
+    deferred = DeferredTasks(profile)
+    calls = []
+
+    def failing():
+        raise ValueError("iconos")
+
+    deferred.add('icon_loader', failing)
+    deferred.add('fonts', lambda: calls.append('fonts'))
+    deferred.add('preset_enums', lambda: calls.append('preset_enums'))
+
+    completed = deferred.run_all()
+    print(f"📊 Completadas: {completed}, llamadas: {calls}")
+    assert completed == 2, "ejecución diferida incorrecta"
+    assert calls == ['fonts', 'preset_enums'], "ejecución diferida incorrecta"
+    assert not deferred.pending(), "ejecución diferida incorrecta"
+    assert deferred.run_all() == 0, "las tareas se ejecutaron dos veces"
+    assert len(calls) == 2, "las tareas se ejecutaron dos veces"
+    assert profile.total('deferred') > 0, "fases del perfil mezcladas"
+    assert profile.total('register') == 0, "fases del perfil mezcladas"
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'profile.json')
+        profile.save(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    assert data['mode'] == 'interactive', "perfil guardado incorrecto"
+    assert len(data['steps']) == 3, "perfil guardado incorrecto"
+    for line in profile.report():
+        print(line)
+
+    print("✅ Cola diferida correcta")
+
+
+def run_all_startup_profile_tests():
+    """Ejecutar todas las pruebas del perfil de arranque."""
+    print("🚀 INICIANDO VERIFICACIÓN DEL PERFIL DE ARRANQUE")
+    print("=" * 60)
+
+    tests = [
+        test_step_timing,
+        test_deferred_tasks
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DEL PERFIL DE ARRANQUE PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DEL PERFIL DE ARRANQUE FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_startup_profile_tests()
@@ -0,0 +1,214 @@
+"""
+Script de verificación del lector de subtítulos de TypeAnimator.
+Comprueba el parseo en streaming de SRT, WebVTT y ASS, el filtrado por
+tiempo, los finales de línea y el reparto de cues.
+"""
+
+import io
+import os
+import tempfile
+
+SRT_SAMPLE = (
+    "1\n"
+    "00:00:01,000 --> 00:00:02,500\n"
+    "Primera línea\n"
+    "segunda línea\n"
+    "\n"
+    "\n"
+    "2\n"
+    "00:00:03,200 --> 00:00:04,000 X1:10 X2:20\n"
+    "Con posición\n"
+    "\n"
+    "00:01:00,000 --> 00:01:01,040\n"
+    "Sin índice ni línea final"
+)
+
+VTT_SAMPLE = (
+    "WEBVTT - Títulos\n"
+    "Kind: captions\n"
+    "\n"
+    "NOTE revisar --> más tarde\n"
+    "\n"
+    "STYLE\n"
+    "::cue { color: yellow }\n"
+    "\n"
+    "intro\n"
+    "00:01.000 --> 00:02.500 align:start position:10%\n"
+    "<v Ana>Hola</v> <b>mundo</b>\n"
+    "\n"
+    "00:00:03.200 --> 00:00:04.000\n"
+    "Segundo\n"
+)
+
+ASS_SAMPLE = (
+    "[Script Info]\n"
+    "Title: Prueba\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize\n"
+    "Style: Default,Arial,20\n"
+    "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    "Dialogue: 0,0:00:01.00,0:00:02.50,Default,,0,0,0,,{\\i1}Hola,{\\i0} mundo\\Nsegunda\n"
+    "Comment: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,no se importa\n"
+    "Dialogue: 0,0:00:03.20,0:00:04.00,Default,,0,0,0,,Segundo\n"
+)
+
+
+def test_srt_stream():
+    """Cues correctos con LF, CRLF y BOM, sin leer el archivo completo."""
+    print("=== TEST: LECTURA SRT ===")
+    from subtitles import iter_srt, Cue
+
+    expected = [
+        Cue(1, 1.0, 2.5, "Primera línea\nsegunda línea"),
+        Cue(2, 3.2, 4.0, "Con posición"),
+        Cue(3, 60.0, 61.04, "Sin índice ni línea final"),
+    ]
+    for label, content in (('LF', SRT_SAMPLE), ('CRLF', SRT_SAMPLE.replace("\n", "\r\n")),
+                           ('BOM', "\ufeff" + SRT_SAMPLE)):
+        cues = list(iter_srt(io.StringIO(content, newline='')))
+        assert cues == expected, f"cues incorrectos con {label}: {cues}"
+        print(f"📊 {label}: {len(cues)} cues")
+
+    # El generador entrega el primer cue sin consumir el resto de líneas
+    lines = iter(SRT_SAMPLE.splitlines(keepends=True))
+    first = next(iter_srt(lines))
+    remaining = sum(1 for _line in lines)
+    assert first == expected[0], "el lector no es incremental"
+    assert remaining != 0, "el lector no es incremental"
+
+    print("✅ SRT leído en streaming")
+
+
+def test_vtt_and_ass():
+    """WebVTT y ASS producen cues limpios de etiquetas y overrides."""
+    print("=== TEST: WEBVTT Y ASS ===")
+    from subtitles import iter_vtt, iter_ass, Cue
+
+    vtt = list(iter_vtt(io.StringIO(VTT_SAMPLE.replace("\n", "\r\n"), newline='')))
+    ass = list(iter_ass(io.StringIO(ASS_SAMPLE)))
+    print(f"📊 VTT: {vtt}")
+    print(f"📊 ASS: {ass}")
+    assert vtt == [Cue(1, 1.0, 2.5, "Hola mundo"), Cue(2, 3.2, 4.0, "Segundo")], "WebVTT mal interpretado"
+    assert ass == [Cue(1, 1.0, 2.5, "Hola, mundo\nsegunda"), Cue(2, 3.2, 4.0, "Segundo")], "ASS mal interpretado"
+
+    print("✅ WebVTT y ASS correctos")
+
+
+def test_files_and_time_range():
+    """Detección de formato desde archivo y filtrado por rango de tiempo."""
+    print("=== TEST: ARCHIVOS Y RANGO DE TIEMPO ===")
+    from subtitles import read_cues, frame_range_seconds
+
+    with tempfile.TemporaryDirectory() as directory:
+        samples = {'a.srt': SRT_SAMPLE, 'b.vtt': VTT_SAMPLE, 'c.ass': ASS_SAMPLE, 'd.txt': VTT_SAMPLE}
+        counts = {}
+        for filename, content in samples.items():
+            path = os.path.join(directory, filename)
+            with open(path, 'w', encoding='utf-8', newline='\r\n') as f:
+                f.write(content)
+            counts[filename] = [cue.index for cue in read_cues(path, time_range=(3.0, 59.0))]
+    print(f"📊 Cues en 3s-59s: {counts}")
+    assert counts == {'a.srt': [2], 'b.vtt': [2], 'c.ass': [2], 'd.txt': [2]}, \
+        "filtrado o detección de formato incorrectos"
+    assert frame_range_seconds(1, 250, 25) == (0.04, 10.04), "rango de la escena mal convertido"
+
+    print("✅ Archivos y rango de tiempo correctos")
+
+
+def test_frames_and_shards():
+    """Conversión a frames y rangos contiguos para los procesos paralelos."""
+    print("=== TEST: FRAMES Y SHARDS ===")
+    from subtitles import Cue, cue_frames, shard_ranges, parse_timestamp, SubtitleError, iter_srt
+
+    frames = cue_frames([Cue(1, 1.0, 2.5, "a"), Cue(2, 3.0, 3.0, "b")], 24)
+    assert frames == [(24, 60), (72, 73)], f"frames incorrectos: {frames}"
+    assert parse_timestamp("1:02:03.4") == 3723.4, "timestamp corto mal interpretado"
+
+    ranges = shard_ranges(10, 3)
+    print(f"📊 Rangos: {[(r.start, r.stop) for r in ranges]}")
+    assert [len(r) for r in ranges] == [4, 3, 3], "reparto incorrecto"
+    assert ranges[-1].stop == 10, "reparto incorrecto"
+    assert len(shard_ranges(2, 8)) == 2, "reparto incorrecto"
+
+    try:
+        list(iter_srt(["1\n", "00:00:xx --> 00:00:02,000\n"]))
+    except SubtitleError as e:
+        print(f"📊 Rechazado: {e}")
+    else:
+        raise AssertionError("tiempo inválido aceptado")
+
+    print("✅ Frames y shards correctos")
+
+
+def test_pool_slots():
+    """Barrido de solapes y reparto de cues entre los objetos del pool."""
+    print("=== TEST: POOL DE OBJETOS ===")
+    from subtitles import max_overlap, assign_slots
+
+    # Dos cues se solapan en 10-15; el tercero empieza justo cuando acaba el primero
+    frames = [(0, 15), (10, 20), (15, 30), (40, 50)]
+    slots, count = assign_slots(frames)
+    print(f"📊 Objetos: {count}, asignación: {slots}")
+    assert max_overlap(frames) == 2, "pool incorrecto"
+    assert count == 2, "pool incorrecto"
+    assert slots == [0, 1, 0, 1], "pool incorrecto"
+
+    import random
+    rng = random.Random(7)
+    for _ in range(100):
+        frames = []
+        for _cue in range(rng.randint(0, 40)):
+            start = rng.randint(0, 200)
+            frames.append((start, start + rng.randint(1, 30)))
+        slots, count = assign_slots(frames)
+        for slot in range(count):
+            used = sorted(frame for frame, s in zip(frames, slots) if s == slot)
+            assert all(a[1] <= b[0] for a, b in zip(used, used[1:])), f"cues solapados en el objeto {slot}: {used}"
+        assert count == max_overlap(frames), f"{count} objetos para un solape máximo de {max_overlap(frames)}"
+
+    print("✅ Pool con el mínimo de objetos")
+
+
+def run_all_subtitle_tests():
+    """Ejecutar todas las pruebas de subtítulos."""
+    print("🚀 INICIANDO VERIFICACIÓN DE SUBTÍTULOS")
+    print("=" * 60)
+
+    tests = [
+        test_srt_stream,
+        test_vtt_and_ass,
+        test_files_and_time_range,
+        test_frames_and_shards,
+        test_pool_slots
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ FALLO en test {test.__name__}: {e}")
+            results.append(False)
+        except Exception as e:
+            print(f"❌ ERROR en test {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"✅ Tests pasados: {passed}/{total}")
+
+    if passed == total:
+        print("🎉 TODAS LAS PRUEBAS DE SUBTÍTULOS PASARON")
+        return True
+    print("❌ ALGUNAS PRUEBAS DE SUBTÍTULOS FALLARON")
+    return False
+
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    run_all_subtitle_tests()
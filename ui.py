@@ -16,9 +16,12 @@ from .constants import (
     REQUIRED_PROPERTY_GROUPS, BLEND_WIDTH, BLEND_MODE, OVERSHOOT_ENABLED,
     OVERSHOOT_LIMIT, AUDIT_AUTO_REPAIR, AUDIT_LOG_DETAILS, AUDIT_VALIDATE_ON_STARTUP,
     LIVE_PREVIEW_ENABLED, LIVE_PREVIEW_UPDATE_RATE, LIVE_PREVIEW_FRAME_SKIP,
-    PRESETS_DIR, USER_PRESETS_DIR, get_text, get_current_language
+    PRESETS_DIR, USER_PRESETS_DIR, PROFILER_CONFIG, get_text, get_current_language
 )
 from .utils import is_valid_object, get_valid_letters_from_selection, validate_scene_state
+from .diagnostics import get_snapshot, get_diagnostics_service
+from .startup import get_startup_profile
+from .profiler import get_profiler
 from .properties import TA_StyleProperties, TA_TimingProperties, TA_PreviewProperties, TA_StagesProperties, TA_AnimStageProperties
 
 # Helper functions
@@ -50,54 +53,8 @@ def get_or_create_curve_node(context, stage):
         return None
 
 def get_system_status(context):
-    """Get current system status for UI feedback."""
-    status = {
-        'scene_valid': False,
-        'text_objects': 0,
-        'letter_objects': 0,
-        'root_objects': 0,
-        'animation_active': False,
-        'focus_active': False,
-        'errors': [],
-        'warnings': []
-    }
-    
-    try:
-        # Validar escena
-        scene_valid, scene_msg = validate_scene_state(context)
-        status['scene_valid'] = scene_valid
-        
-        if not scene_valid:
-            status['errors'].append(scene_msg)
-        
-        # Contar objetos
-        for obj in bpy.data.objects:
-            if obj.type == FONT_TYPE:
-                status['text_objects'] += 1
-            elif is_valid_object(obj) and hasattr(obj, LETTER_PROPERTY) and getattr(obj, LETTER_PROPERTY, False):
-                status['letter_objects'] += 1
-            elif is_valid_object(obj) and obj.name.endswith(ROOT_SUFFIX):
-                status['root_objects'] += 1
-        
-        # Verificar foco activo
-        if context.scene.ta_focused_text:
-            status['focus_active'] = True
-        
-        # Verificar animación activa (simplificado)
-        if context.scene.frame_current > 1:
-            status['animation_active'] = True
-        
-        # Verificar consistencia
-        if status['letter_objects'] > 0 and status['root_objects'] == 0:
-            status['warnings'].append("Letras sin root asociado")
-        
-        if status['root_objects'] > 0 and status['letter_objects'] == 0:
-            status['warnings'].append("Roots sin letras asociadas")
-            
-    except Exception as e:
-        status['errors'].append(f"Error obteniendo estado: {e}")
-    
-    return status
+    """Get current system status for UI feedback (from the diagnostics snapshot)."""
+    return get_snapshot(context)['status']
 
 def draw_status_indicator(layout, status, icon='INFO'):
     """Draw a status indicator with appropriate icon and color."""
@@ -545,8 +502,35 @@ class VIEW3D_PT_ta_main_improved(bpy.types.Panel):
         # === SYSTEM STATUS ===
         status_box = layout.box()
         status_box.label(text="System Status", icon='INFO')
-        status = get_system_status(context)
+        snapshot = get_snapshot(context)
+        status = snapshot['status']
         draw_status_indicator(status_box, status)
+        row = status_box.row()
+        row.label(text=f"Actualizado hace {get_diagnostics_service().age():.1f}s "
+                       f"({snapshot['compute_time'] * 1000:.1f} ms)", icon='TIME')
+        row.operator("typeanimator.refresh_diagnostics", text="", icon='FILE_REFRESH')
+        startup = get_startup_profile()
+        status_box.label(text=f"Arranque: {startup.total('register') * 1000:.0f} ms "
+                              f"(+{startup.total('deferred') * 1000:.0f} ms diferido)", icon='SORTTIME')
+
+        # === PROFILER ===
+        profiler_box = layout.box()
+        profiler = get_profiler()
+        row = profiler_box.row()
+        row.label(text="Profiler", icon='SORTTIME')
+        row.operator("typeanimator.toggle_profiler", text="On" if profiler.enabled else "Off",
+                     icon='REC' if profiler.enabled else 'PAUSE', depress=profiler.enabled)
+        row.operator("typeanimator.reset_profiler", text="", icon='X')
+        row.operator("typeanimator.export_profiler_trace", text="", icon='EXPORT')
+        summary = profiler.summary()
+        if summary:
+            col = profiler_box.column(align=True)
+            col.label(text="Sección: p50 / p95 / p99 ms")
+            for stats in summary[:PROFILER_CONFIG['UI_ROWS']]:
+                col.label(text=f"{stats['name']}: {stats['p50'] * 1000:.2f} / {stats['p95'] * 1000:.2f} / "
+                               f"{stats['p99'] * 1000:.2f} (n={stats['count']})")
+        elif profiler.enabled:
+            profiler_box.label(text="Sin muestras todavía")
 
         # === UI CHECKLIST ===
         checklist_box = layout.box()
@@ -577,9 +561,10 @@ class VIEW3D_PT_ta_main_improved(bpy.types.Panel):
         checklist_box.label(text=f"Stage Preset Combo (IN): {'✅' if check_attr(props.stages.anim_stage_in, 'preset') else '❌'}")
         checklist_box.label(text=f"Stage Preset Combo (MID): {'✅' if check_attr(props.stages.anim_stage_middle, 'preset') else '❌'}")
         checklist_box.label(text=f"Stage Preset Combo (OUT): {'✅' if check_attr(props.stages.anim_stage_out, 'preset') else '❌'}")
-        checklist_box.label(text=f"Crear Texto desde Input: {'✅' if hasattr(bpy.ops.typeanimator, 'create_text_from_input') else '❌'}")
-        checklist_box.label(text=f"Validar Propiedades: {'✅' if hasattr(bpy.ops.typeanimator, 'validate_properties') else '❌'}")
-        checklist_box.label(text=f"Comprehensive Test: {'✅' if hasattr(bpy.ops.typeanimator, 'comprehensive_test') else '❌'}")
+        operators = snapshot['operators']
+        checklist_box.label(text=f"Crear Texto desde Input: {'✅' if operators.get('create_text_from_input') else '❌'}")
+        checklist_box.label(text=f"Validar Propiedades: {'✅' if operators.get('validate_properties') else '❌'}")
+        checklist_box.label(text=f"Comprehensive Test: {'✅' if operators.get('comprehensive_test') else '❌'}")
 
         # === DETAILED STATISTICS ===
         stats_box = layout.box()
@@ -596,44 +581,36 @@ class VIEW3D_PT_ta_main_improved(bpy.types.Panel):
         cache_box = layout.box()
         cache_box.label(text="Cache Information", icon='MEMORY')
         
-        try:
-            from .core import get_cache_stats
-            cache_stats = get_cache_stats()
-            if cache_stats:
-                col = cache_box.column()
-                col.label(text=f"Cache Size: {cache_stats['size']}/{cache_stats['max_size']}")
-                col.label(text=f"Hit Rate: {cache_stats['hit_rate']:.1f}%")
-                col.label(text=f"Memory Usage: {cache_stats.get('memory_usage', 'N/A')}")
-            else:
-                cache_box.label(text="No cache statistics available")
-        except Exception as e:
-            cache_box.label(text=f"Cache error: {e}")
+        cache_stats = snapshot['cache_stats']
+        if cache_stats:
+            col = cache_box.column()
+            col.label(text=f"Cache Size: {cache_stats['size']}/{cache_stats['max_size']}")
+            col.label(text=f"Hit Rate: {cache_stats['hit_rate']:.1f}%")
+            col.label(text=f"Memory Usage: {cache_stats.get('memory_usage', 'N/A')}")
+            col.label(text=f"Evictions: {cache_stats.get('evictions', 0)} LRU, {cache_stats.get('expirations', 0)} TTL")
+        else:
+            cache_box.label(text="No cache statistics available")
 
         # === NODE GROUPS ===
         node_box = layout.box()
         node_box.label(text="Node Groups", icon='NODETREE')
         
-        try:
-            from .constants import CURVE_NODE_GROUP_NAME
-            if CURVE_NODE_GROUP_NAME in bpy.data.node_groups:
-                node_box.label(text=f"✅ {CURVE_NODE_GROUP_NAME} - Present")
-            else:
-                node_box.label(text=f"❌ {CURVE_NODE_GROUP_NAME} - Missing")
-        except Exception as e:
-            node_box.label(text=f"Node group error: {e}")
+        from .constants import CURVE_NODE_GROUP_NAME
+        if snapshot['node_group_present']:
+            node_box.label(text=f"✅ {CURVE_NODE_GROUP_NAME} - Present")
+        else:
+            node_box.label(text=f"❌ {CURVE_NODE_GROUP_NAME} - Missing")
 
         # === PRESETS STATUS ===
         preset_box = layout.box()
         preset_box.label(text="Presets Status", icon='PRESET')
-        try:
-            from .presets import get_all_presets
-            presets_data = get_all_presets()
-            if presets_data:
-                preset_box.label(text=f"✅ {len(presets_data)} presets loaded")
-            else:
-                preset_box.label(text="⚠️ No presets available")
-        except Exception as e:
-            preset_box.label(text=f"❌ Preset error: {e}")
+        if snapshot['preset_count']:
+            preset_box.label(text=f"✅ {snapshot['preset_count']} presets loaded")
+        else:
+            preset_box.label(text="⚠️ No presets available")
+
+        for error in snapshot['errors']:
+            layout.label(text=f"❌ {error}", icon='ERROR')
 
         # === ACTION BUTTONS ===
         actions_box = layout.box()
@@ -803,6 +780,13 @@ class VIEW3D_PT_ta_advanced_improved(bpy.types.Panel):
         col.operator("typeanimator.cleanup_references", text="Cleanup References", icon='BRUSH_DATA')
         col.operator("typeanimator.validate_properties", text="Validate Properties", icon='CHECKMARK')
 
+        # Backend de Geometry Nodes (texto como un único objeto)
+        backend_box = layout.box()
+        backend_box.label(text="Geometry Nodes Backend", icon='GEOMETRY_NODES')
+        row = backend_box.row()
+        row.operator("typeanimator.apply_geonodes_backend", text="Apply", icon='MODIFIER')
+        row.operator("typeanimator.remove_geonodes_backend", text="Remove", icon='X')
+
 class VIEW3D_PT_ta_stage_in_improved(bpy.types.Panel):
     bl_label = "Stage IN"
     bl_idname = "VIEW3D_PT_ta_stage_in_improved"
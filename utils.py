@@ -4,6 +4,7 @@ Utilidades centralizadas para TypeAnimator
 
 import bpy
 import logging
+import os
 from mathutils import Vector
 from typing import List, Tuple, Any, Optional
 
@@ -12,8 +13,10 @@ from .constants import (
     ORIG_LOCATION, ORIG_ROTATION, ORIG_SCALE, ROOT_NAME,
     MESH_TYPE, EMPTY_TYPE, FONT_TYPE, LOG_FILENAME,
     MIN_FRAME, MAX_FRAME, MIN_DURATION, MAX_DURATION, MIN_OVERLAP, MAX_OVERLAP,
-    ERROR_MESSAGES, DEFAULT_DURATION
+    ERROR_MESSAGES, DEFAULT_DURATION, ADDON_DATA_DIR
 )
+from .letter_registry import get_registry
+from .invalidation import InvalidationEvent, publish
 
 # Configurar logger
 logger = logging.getLogger(__name__)
@@ -44,6 +47,21 @@ def safe_execute(func):
             return None
     return wrapper
 
+def get_user_data_path(filename: str, per_process: bool = False) -> str:
+    """
+    Ruta para un archivo generado por el addon (perfiles, índices, trazas).
+
+    Va en la carpeta de configuración del usuario de Blender y no junto al
+    addon, que en nodos de render suele ser de solo lectura o compartido.
+    Con ``per_process`` el nombre lleva el PID para que varios ``blender -b``
+    en paralelo no escriban el mismo archivo.
+    """
+    directory = bpy.utils.user_resource('CONFIG', path=ADDON_DATA_DIR, create=True)
+    if per_process:
+        root, extension = os.path.splitext(filename)
+        filename = f"{root}.{os.getpid()}{extension}"
+    return os.path.join(directory, filename)
+
 def clamp_value(value, min_val, max_val):
     """Clampa un valor entre un mínimo y máximo."""
     return max(min_val, min(value, max_val))
@@ -285,16 +303,10 @@ def get_scene_diagnostics(context):
         else:
             diagnostics['errors'].append("Propiedades de TypeAnimator no inicializadas")
         
-        # Contar objetos
-        for obj in bpy.data.objects:
-            if obj.type == FONT_TYPE:
-                diagnostics['text_objects'] += 1
-            elif is_letter_object(obj):
-                diagnostics['letter_objects'] += 1
-            elif is_root_object(obj):
-                diagnostics['root_objects'] += 1
-            elif is_animation_group(obj):
-                diagnostics['animation_groups'] += 1
+        # Contar objetos (registro de letras, sin recorrer bpy.data.objects)
+        counts = get_registry().counts()
+        for key in ('text_objects', 'letter_objects', 'root_objects', 'animation_groups'):
+            diagnostics[key] = counts[key]
         
         # Verificar consistencia
         if diagnostics['letter_objects'] > 0 and diagnostics['root_objects'] == 0:
@@ -332,8 +344,8 @@ def find_letters(context, search_selected=True, search_scene=False):
                 letters.extend(find_letter_children(obj))
 
     if search_scene and not letters:
-        # Buscar en toda la escena
-        for obj in context.scene.objects:
+        # Buscar en toda la escena a través del registro de letras
+        for obj in get_registry().all_letters(context.scene):
             if is_letter_empty(obj):
                 letters.append(obj)
 
@@ -422,6 +434,9 @@ def mark_as_letter(obj, root_name=None, letter_index=None):
     # Almacenar transformaciones originales
     store_original_transforms(obj)
 
+    # Las propiedades personalizadas no siempre llegan al depsgraph
+    publish(InvalidationEvent.LETTERS_CHANGED)
+
     logger.debug(f"Marcado {obj.name} como letra")
 
 def store_original_transforms(obj):